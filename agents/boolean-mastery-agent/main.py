@@ -23,6 +23,7 @@ from agents.shared import (
     MessageType,
     ServiceClients,
     Topics,
+    create_message_bus,
     get_config,
 )
 
@@ -42,7 +43,9 @@ async def lifespan(app: FastAPI):
     global message_bus, service_clients
 
     logger.info("Starting Boolean Mastery Agent...")
-    message_bus = MessageBus(config.redis_url)
+    message_bus = create_message_bus(
+        config.redis_url, backend=config.message_bus_backend, consumer_group="boolean-mastery"
+    )
     await message_bus.connect()
 
     service_clients = ServiceClients(
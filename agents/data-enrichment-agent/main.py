@@ -46,6 +46,7 @@ import sys
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", "shared"))
 from message_bus import MessageBus
+from profile_cache import ProfileCache
 
 # ============================
 # Logging Setup
@@ -113,7 +114,7 @@ class AuditLog(BaseModel):
 # Global State
 # ============================
 
-profile_cache: dict[str, dict] = {}
+profile_cache = ProfileCache(namespace="enrichment")
 audit_logs: list[AuditLog] = []
 user_credits: dict[str, float] = {}
 message_bus = MessageBus()
@@ -629,27 +630,27 @@ async def enrich_profile_auto(url: str, user_id: str) -> dict:
     """
     Auto-enrich using best available method
     Priority: Cache → GitHub → Stack Overflow → Google X-Ray → Fallback
+
+    The persistent profile cache serves fresh entries directly and returns
+    stale ones immediately while refreshing them in the background.
+    """
+
+    async def fetch(_etag: str | None) -> tuple[dict, None]:
+        return await enrich_profile_uncached(url, user_id), None
+
+    return await profile_cache.get_or_fetch(url, fetch)
+
+
+async def enrich_profile_uncached(url: str, user_id: str) -> dict:
+    """
+    Enrich a profile without consulting the cache
+    Priority: GitHub → Stack Overflow → Google X-Ray → Fallback
     """
-    # Check cache first
-    cache_key = f"profile:{url}"
-    if cache_key in profile_cache:
-        cached = profile_cache[cache_key]
-        if cached["expires_at"] > datetime.now():
-            logger.info(f"✅ Cache HIT: {url}")
-            return cached["data"]
 
     # Try GitHub
     if "github.com" in url:
         try:
             profile = await enrich_via_github(url)
-            # Cache it
-            profile_cache[cache_key] = {
-                "data": profile,
-                "tier": "free",
-                "cost": 0.0,
-                "cached_at": datetime.now(),
-                "expires_at": datetime.now() + timedelta(days=30),
-            }
             log_enrichment(
                 user_id, url, SourceMethod.GITHUB_PUBLIC, success=True, data_extracted=True
             )
@@ -673,14 +674,6 @@ async def enrich_profile_auto(url: str, user_id: str) -> dict:
             else:
                 # Not a user URL, search by the URL as name
                 profile = await enrich_via_stackoverflow(url)
-
-            profile_cache[cache_key] = {
-                "data": profile,
-                "tier": "free",
-                "cost": 0.0,
-                "cached_at": datetime.now(),
-                "expires_at": datetime.now() + timedelta(days=30),
-            }
             log_enrichment(
                 user_id, url, SourceMethod.STACKOVERFLOW, success=True, data_extracted=True
             )
@@ -692,13 +685,6 @@ async def enrich_profile_auto(url: str, user_id: str) -> dict:
     if not url.startswith("http"):
         try:
             profile = await enrich_via_stackoverflow(url)
-            profile_cache[cache_key] = {
-                "data": profile,
-                "tier": "free",
-                "cost": 0.0,
-                "cached_at": datetime.now(),
-                "expires_at": datetime.now() + timedelta(days=30),
-            }
             log_enrichment(
                 user_id, url, SourceMethod.STACKOVERFLOW, success=True, data_extracted=True
             )
@@ -720,13 +706,6 @@ async def enrich_profile_auto(url: str, user_id: str) -> dict:
             name = url  # Use as search term
 
         profile = await enrich_via_google_xray(name)
-        profile_cache[cache_key] = {
-            "data": profile,
-            "tier": "free",
-            "cost": 0.0,
-            "cached_at": datetime.now(),
-            "expires_at": datetime.now() + timedelta(days=30),
-        }
         log_enrichment(user_id, url, SourceMethod.GOOGLE_XRAY, success=True, data_extracted=True)
         return profile
     except Exception as e:
@@ -740,14 +719,6 @@ async def enrich_profile_auto(url: str, user_id: str) -> dict:
         "enrichment_timestamp": datetime.now().isoformat(),
     }
 
-    profile_cache[cache_key] = {
-        "data": profile,
-        "tier": "free",
-        "cost": 0.0,
-        "cached_at": datetime.now(),
-        "expires_at": datetime.now() + timedelta(days=30),
-    }
-
     log_enrichment(user_id, url, SourceMethod.LINKEDIN_PUBLIC, success=False, data_extracted=False)
     return profile
 
@@ -1288,6 +1259,7 @@ async def lifespan(app: FastAPI):
                 task.cancel()
 
     await message_bus.disconnect()
+    profile_cache.close()
 
 
 async def pipeline_cleanup_worker():
@@ -1310,6 +1282,11 @@ async def pipeline_cleanup_worker():
                 del active_pipelines[req_id]
                 logger.info(f"🧹 Cleaned up pipeline {req_id}")
 
+            # Sweep profiles past their stale-while-revalidate window
+            purged = profile_cache.purge_expired()
+            if purged:
+                logger.info(f"🧹 Purged {purged} expired cached profiles")
+
             await asyncio.sleep(60)  # Check every minute
 
         except Exception as e:
@@ -1550,7 +1527,7 @@ async def get_audit_logs(user_id: str | None = None, limit: int = 100):
 @app.get("/cache/stats")
 async def cache_stats():
     """Cache statistics"""
-    return {"cached_profiles": len(profile_cache), "total_savings_usd": 0.0, "tier": "free"}
+    return {**profile_cache.stats(), "total_savings_usd": 0.0, "tier": "free"}
 
 
 @app.get("/pipeline/{request_id}/status")
@@ -243,6 +243,88 @@ Format as JSON with score, reasoning, and qualityLevel fields.`;
   }
 );
 
+// Flow 4b: Score Candidate Quality (batch)
+// Scores up to 50 candidates with a single model call so agents scoring
+// whole pipelines do not pay one round trip per candidate.
+export const scoreCandidateQualityBatch = ai.defineFlow(
+  {
+    name: 'scoreCandidateQualityBatch',
+    inputSchema: z.object({
+      candidates: z.array(CandidateProfileSchema).max(50),
+    }),
+    outputSchema: z.object({
+      results: z.array(
+        z.object({
+          score: z.number(),
+          reasoning: z.string(),
+          qualityLevel: z.string(),
+        })
+      ),
+    }),
+  },
+  async (input) => {
+    const heuristic = (candidate: z.infer<typeof CandidateProfileSchema>) => {
+      const score = Math.min(
+        100,
+        candidate.skills.length * 10 + (candidate.experience.length > 200 ? 40 : 20)
+      );
+      const qualityLevel = score >= 70 ? 'high' : score >= 40 ? 'medium' : 'low';
+      const reasoning = `Based on ${candidate.skills.length} skills and experience description length.`;
+      return { score, reasoning, qualityLevel };
+    };
+
+    if (input.candidates.length === 0) {
+      return { results: [] };
+    }
+
+    const profiles = input.candidates
+      .map(
+        (candidate, i) =>
+          `[${i}] Name: ${candidate.name}\nSkills: ${candidate.skills.join(', ')}\nExperience: ${candidate.experience}`
+      )
+      .join('\n\n');
+
+    const prompt = `Evaluate the quality of each candidate profile below for technical roles:
+
+${profiles}
+
+For each candidate provide a quality score from 0-100 based on:
+- Relevance and number of technical skills
+- Depth of experience described
+- Overall profile completeness
+
+Also provide reasoning and categorize as 'low', 'medium', or 'high' quality.
+
+Format as a JSON array with one object per candidate, in the same order,
+each with score, reasoning, and qualityLevel fields.`;
+
+    const response = await ai.generate({
+      model: 'googleai/gemini-1.5-flash',
+      prompt: prompt,
+      config: {
+        temperature: 0.2,
+        maxOutputTokens: 150 * input.candidates.length,
+      },
+    });
+
+    try {
+      const parsed = JSON.parse(response.text);
+      if (!Array.isArray(parsed)) {
+        throw new Error('Expected a JSON array');
+      }
+      // Fall back per candidate for any entry the model dropped
+      return {
+        results: input.candidates.map((candidate, i) =>
+          parsed[i] && typeof parsed[i].score === 'number' ? parsed[i] : heuristic(candidate)
+        ),
+      };
+    } catch (e) {
+      // Fallback
+      return { results: input.candidates.map(heuristic) };
+    }
+  }
+);
+
 // Flow 5: Generate Single Interview Question
 export const generateInterviewQuestion = ai.defineFlow(
   {
@@ -439,6 +521,7 @@ export const flows = {
   generateBooleanQuery,
   generateEngagementMessage,
   scoreCandidateQuality,
+  scoreCandidateQualityBatch,
   generateInterviewQuestion,
   evaluateInterviewResponse,
   generateFinalAssessment,
@@ -474,6 +557,7 @@ if (process.env.NODE_ENV !== 'test') {
       generateBooleanQuery,
       generateEngagementMessage,
       scoreCandidateQuality,
+      scoreCandidateQualityBatch,
       generateInterviewQuestion,
       evaluateInterviewResponse,
       generateFinalAssessment,
@@ -34,6 +34,12 @@ describe('Genkit AI Flows', () => {
     expect(typeof flows.scoreCandidateQuality).toBe('function');
   });
 
+  // Test for scoreCandidateQualityBatch flow
+  it('should define scoreCandidateQualityBatch flow', () => {
+    expect(flows.scoreCandidateQualityBatch).toBeDefined();
+    expect(typeof flows.scoreCandidateQualityBatch).toBe('function');
+  });
+
   // Test for generateInterviewQuestions flow
   it('should define generateInterviewQuestions flow', () => {
     expect(flows.generateInterviewQuestions).toBeDefined();
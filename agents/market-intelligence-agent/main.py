@@ -25,6 +25,7 @@ from agents.shared import (
     SalaryTrend,
     SkillDemand,
     Topics,
+    create_message_bus,
     get_config,
 )
 
@@ -43,7 +44,9 @@ async def lifespan(app: FastAPI):
     global message_bus
 
     logger.info("Starting Market Intelligence Agent...")
-    message_bus = MessageBus(config.redis_url)
+    message_bus = create_message_bus(
+        config.redis_url, backend=config.message_bus_backend, consumer_group="market-intelligence"
+    )
     await message_bus.connect()
 
     # Subscribe to market intel requests
@@ -33,6 +33,7 @@ from agents.shared import (
     MessageType,
     SocialProfile,
     Topics,
+    create_message_bus,
     get_config,
 )
 
@@ -82,7 +83,9 @@ async def lifespan(app: FastAPI):
     global message_bus
 
     logger.info("Starting Proactive Scanning Agent...")
-    message_bus = MessageBus(config.redis_url)
+    message_bus = create_message_bus(
+        config.redis_url, backend=config.message_bus_backend, consumer_group="proactive-scanning"
+    )
     await message_bus.connect()
 
     # Subscribe to scanning requests
@@ -241,6 +244,193 @@ def validate_sourcing_methods(methods: list[str]) -> list[SourcingMethod]:
     return validated
 
 
+class ScanHit(BaseModel):
+    """A candidate returned by a platform scanner, ready to publish"""
+
+    candidate: CandidateProfile
+    compliance_record: ComplianceRecord
+    event_payload: dict
+    priority: MessagePriority = MessagePriority.MEDIUM
+
+
+class PlatformBudget(BaseModel):
+    """Per-platform request budget"""
+
+    requests_per_second: float
+    batch_size: int
+
+
+# Rate budgets follow each platform's documented API limits
+PLATFORM_BUDGETS: dict[str, PlatformBudget] = {
+    "linkedin": PlatformBudget(requests_per_second=100 / 60, batch_size=5),  # 100 req/min
+    "github": PlatformBudget(requests_per_second=30 / 60, batch_size=5),  # 30 req/min
+    "stackoverflow": PlatformBudget(requests_per_second=1.0, batch_size=5),  # 10k req/day
+}
+
+
+class RateLimiter:
+    """Spaces requests to one platform at its allowed rate (shared by all pipelines)"""
+
+    def __init__(self, requests_per_second: float):
+        self.interval = 1.0 / requests_per_second
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        """Wait for the next request slot"""
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+platform_limiters: dict[str, RateLimiter] = {
+    platform: RateLimiter(budget.requests_per_second)
+    for platform, budget in PLATFORM_BUDGETS.items()
+}
+
+
+class QuotaPool:
+    """Shares a pipeline's target_count between platforms scanned in parallel
+
+    Each platform starts with an equal share. When a platform runs dry its
+    unused share becomes spare quota that platforms still producing
+    candidates can claim once their own share is used up.
+    """
+
+    def __init__(self, target_count: int, platforms: list[str]):
+        share, extra = divmod(max(target_count, 0), max(len(platforms), 1))
+        self.allocations = {
+            platform: share + (1 if i < extra else 0) for i, platform in enumerate(platforms)
+        }
+        self.in_flight = dict.fromkeys(platforms, 0)
+        self.active = set(platforms)
+        self.spare = 0
+        self._changed = asyncio.Condition()
+
+    def _others_may_release(self, platform: str) -> bool:
+        return any(
+            self.allocations[p] > 0 or self.in_flight[p] > 0 for p in self.active if p != platform
+        )
+
+    async def take(self, platform: str, wanted: int) -> int:
+        """Claim up to `wanted` slots; returns 0 when no more quota can appear"""
+        async with self._changed:
+            while True:
+                if self.allocations[platform] > 0:
+                    granted = min(self.allocations[platform], wanted)
+                    self.allocations[platform] -= granted
+                    break
+                if self.spare > 0:
+                    granted = min(self.spare, wanted)
+                    self.spare -= granted
+                    break
+                if not self._others_may_release(platform):
+                    return 0
+                await self._changed.wait()
+            self.in_flight[platform] += granted
+            return granted
+
+    async def settle(self, platform: str, granted: int, used: int) -> None:
+        """Return the unused part of a claim to the spare pool"""
+        async with self._changed:
+            self.in_flight[platform] -= granted
+            self.spare += max(granted - used, 0)
+            self._changed.notify_all()
+
+    async def retire(self, platform: str) -> None:
+        """Release a finished platform's remaining share to the others"""
+        async with self._changed:
+            self.spare += self.allocations[platform]
+            self.allocations[platform] = 0
+            self.active.discard(platform)
+            self._changed.notify_all()
+
+
+async def publish_hits(pipeline_id: str, platform: str, hits: list[ScanHit]) -> None:
+    """Publish CANDIDATE_FOUND events for one batch (pipelined by the message bus)"""
+    await asyncio.gather(
+        *(
+            message_bus.publish_event(
+                topic=Topics.CANDIDATE_EVENTS,
+                source_agent="proactive-scanning",
+                message_type=MessageType.CANDIDATE_FOUND,
+                payload={
+                    "pipeline_id": pipeline_id,
+                    "candidate": hit.candidate.model_dump(),
+                    "platform": platform,
+                    "timestamp": datetime.utcnow().isoformat(),
+                    **hit.event_payload,
+                },
+                priority=hit.priority,
+                correlation_id=pipeline_id,
+            )
+            for hit in hits
+        )
+    )
+
+
+async def scan_platform(
+    platform: str,
+    pool: QuotaPool,
+    pipeline_id: str,
+    job_description: str,
+    sourcing_methods: list[SourcingMethod],
+    require_explicit_consent: bool,
+) -> tuple[int, list[ComplianceRecord]]:
+    """
+    Scan one platform batch by batch until its quota or its results run out
+
+    Each batch is published as soon as it arrives so downstream scoring can
+    start while other platforms are still scanning.
+
+    Returns:
+        Tuple of (candidates_found, compliance_records)
+    """
+    fetch_batch = PLATFORM_SCANNERS[platform]
+    budget = PLATFORM_BUDGETS[platform]
+    limiter = platform_limiters[platform]
+    compliance_records: list[ComplianceRecord] = []
+    offset = 0
+
+    try:
+        while True:
+            granted = await pool.take(platform, budget.batch_size)
+            if granted == 0:
+                break
+
+            hits: list[ScanHit] = []
+            try:
+                await limiter.wait()
+                hits = await fetch_batch(
+                    pipeline_id,
+                    job_description,
+                    offset,
+                    granted,
+                    sourcing_methods,
+                    require_explicit_consent,
+                )
+            finally:
+                await pool.settle(platform, granted, len(hits))
+
+            if hits:
+                await publish_hits(pipeline_id, platform, hits)
+                compliance_records.extend(hit.compliance_record for hit in hits)
+                offset += len(hits)
+
+            if len(hits) < granted:
+                logger.info(f"[{platform.upper()}] Ran dry after {offset} candidates")
+                break
+    except Exception as e:
+        logger.error(f"[{platform.upper()}] Scan failed after {offset} candidates: {e}")
+    finally:
+        await pool.retire(platform)
+
+    return offset, compliance_records
+
+
 async def scan_platforms(
     pipeline_id: str,
     job_description: str,
@@ -260,6 +450,10 @@ async def scan_platforms(
     - Implements data retention policies
     - Supports GDPR, CCPA, and other regulations
 
+    Platforms are scanned concurrently, each under its own rate budget.
+    The target count is split between them and re-distributed when one
+    runs dry, and candidates are published batch by batch.
+
     Args:
         pipeline_id: Pipeline ID
         job_description: Job description for matching
@@ -276,54 +470,46 @@ async def scan_platforms(
     logger.info(f"Sourcing methods: {[m.value for m in sourcing_methods]}")
     logger.info(f"Compliance level: {compliance_level}")
 
-    candidates_found = 0
-    compliance_records = []
-
-    for platform in platforms:
-        if platform == "linkedin":
-            count, records = await scan_linkedin(
+    supported = [p for p in dict.fromkeys(platforms) if p in PLATFORM_SCANNERS]
+    for platform in set(platforms) - set(supported):
+        logger.warning(f"Unsupported platform skipped: {platform}")
+    if not supported:
+        return
+
+    pool = QuotaPool(target_count, supported)
+    results = await asyncio.gather(
+        *(
+            scan_platform(
+                platform,
+                pool,
                 pipeline_id,
                 job_description,
-                target_count // len(platforms),
                 sourcing_methods,
                 require_explicit_consent,
             )
-            candidates_found += count
-            compliance_records.extend(records)
-        elif platform == "github":
-            count, records = await scan_github(
-                pipeline_id,
-                job_description,
-                target_count // len(platforms),
-                sourcing_methods,
-                require_explicit_consent,
-            )
-            candidates_found += count
-            compliance_records.extend(records)
-        elif platform == "stackoverflow":
-            count, records = await scan_stackoverflow(
-                pipeline_id,
-                job_description,
-                target_count // len(platforms),
-                sourcing_methods,
-                require_explicit_consent,
-            )
-            candidates_found += count
-            compliance_records.extend(records)
+            for platform in supported
+        )
+    )
+
+    candidates_found = sum(count for count, _ in results)
+    compliance_records = [record for _, records in results for record in records]
+    per_platform = dict(zip(supported, (count for count, _ in results), strict=True))
 
     logger.info(f"Scanning complete: {candidates_found} candidates found with valid consent")
+    logger.info(f"Per-platform results: {per_platform}")
     logger.info(f"Compliance records created: {len(compliance_records)}")
 
 
-async def scan_linkedin(
+async def fetch_linkedin_batch(
     pipeline_id: str,
     job_description: str,
-    target: int,
+    offset: int,
+    limit: int,
     sourcing_methods: list[SourcingMethod] = None,
     require_explicit_consent: bool = True,
-) -> tuple[int, list[ComplianceRecord]]:
+) -> list[ScanHit]:
     """
-    Scan LinkedIn for candidates using OFFICIAL API
+    Fetch one batch of LinkedIn candidates using OFFICIAL API
 
     COMPLIANCE:
     - Uses LinkedIn Official API (OAuth2 + API credentials)
@@ -335,15 +521,15 @@ async def scan_linkedin(
     Args:
         pipeline_id: Pipeline ID
         job_description: Job description for matching
-        target: Target count
+        offset: Index of the first result to fetch
+        limit: Maximum results to fetch
         sourcing_methods: Allowed sourcing methods
         require_explicit_consent: Require explicit opt-in
 
     Returns:
-        Tuple of (candidates_found, compliance_records)
+        Candidates found (fewer than `limit` when results run out)
     """
-    logger.info(f"[LINKEDIN OFFICIAL API] Scanning for {target} candidates")
-    logger.info("Method: OAuth2 + LinkedIn Recruiter API (highest compliance)")
+    logger.info(f"[LINKEDIN OFFICIAL API] Fetching {limit} candidates from offset {offset}")
 
     if not sourcing_methods:
         sourcing_methods = [SourcingMethod.OFFICIAL_API, SourcingMethod.OPT_IN_DIRECTORY]
@@ -361,9 +547,9 @@ async def scan_linkedin(
     # Rate limit: 5,000 requests/day
     await asyncio.sleep(2)  # Simulate API call latency
 
-    compliance_records = []
+    hits = []
 
-    for i in range(min(target, 10)):
+    for i in range(offset, min(offset + limit, 10)):
         # In production, fetch real candidate from LinkedIn API
         # Only include candidates with:
         # - Recruitment notification enabled (explicit opt-in)
@@ -411,42 +597,34 @@ async def scan_linkedin(
             terms_accepted=True,  # LinkedIn TOS accepted by user
             data_retention_days=730,  # Keep for 2 years per GDPR
         )
-        compliance_records.append(compliance_record)
-
-        # Publish candidate found event with compliance metadata
-        await message_bus.publish_event(
-            topic=Topics.CANDIDATE_EVENTS,
-            source_agent="proactive-scanning",
-            message_type=MessageType.CANDIDATE_FOUND,
-            payload={
-                "pipeline_id": pipeline_id,
-                "candidate": candidate.model_dump(),
-                "platform": "linkedin",
-                "timestamp": datetime.utcnow().isoformat(),
-                # NEW: Compliance metadata
-                "sourcing_method": sourcing_method.value,
-                "consent_type": ConsentType.EXPLICIT_OPT_IN.value,
-                "can_contact": True,  # Verified recruitment flag enabled
-                "compliance_verified": True,
-            },
-            priority=MessagePriority.MEDIUM,
-        )
 
-        await asyncio.sleep(0.5)  # Rate limiting (LinkedIn: 100 requests/minute)
+        hits.append(
+            ScanHit(
+                candidate=candidate,
+                compliance_record=compliance_record,
+                event_payload={
+                    # NEW: Compliance metadata
+                    "sourcing_method": sourcing_method.value,
+                    "consent_type": ConsentType.EXPLICIT_OPT_IN.value,
+                    "can_contact": True,  # Verified recruitment flag enabled
+                    "compliance_verified": True,
+                },
+            )
+        )
 
-    logger.info(f"[LINKEDIN] Successfully scanned with {len(compliance_records)} compliant records")
-    return min(target, 10), compliance_records
+    return hits
 
 
-async def scan_github(
+async def fetch_github_batch(
     pipeline_id: str,
     job_description: str,
-    target: int,
+    offset: int,
+    limit: int,
     sourcing_methods: list[SourcingMethod] = None,
     require_explicit_consent: bool = True,
-) -> tuple[int, list[ComplianceRecord]]:
+) -> list[ScanHit]:
     """
-    Scan GitHub for candidates using OFFICIAL API
+    Fetch one batch of GitHub candidates using OFFICIAL API
 
     COMPLIANCE:
     - Uses GitHub Official REST API v3 (OAuth2)
@@ -459,15 +637,15 @@ async def scan_github(
     Args:
         pipeline_id: Pipeline ID
         job_description: Job description for matching
-        target: Target count
+        offset: Index of the first result to fetch
+        limit: Maximum results to fetch
         sourcing_methods: Allowed sourcing methods
         require_explicit_consent: Require explicit opt-in
 
     Returns:
-        Tuple of (candidates_found, compliance_records)
+        Candidates found (fewer than `limit` when results run out)
     """
-    logger.info(f"[GITHUB OFFICIAL API] Scanning for {target} candidates")
-    logger.info("Method: GitHub REST API v3 (public data, explicit opt-in)")
+    logger.info(f"[GITHUB OFFICIAL API] Fetching {limit} candidates from offset {offset}")
 
     if not sourcing_methods:
         sourcing_methods = [SourcingMethod.OFFICIAL_API, SourcingMethod.PUBLIC_PROFILE]
@@ -483,9 +661,9 @@ async def scan_github(
     # Rate limit: 30 requests/minute (authenticated)
     await asyncio.sleep(2)
 
-    compliance_records = []
+    hits = []
 
-    for i in range(min(target, 10)):
+    for i in range(offset, min(offset + limit, 10)):
         # In production, fetch real candidate from GitHub API
         # Only include candidates with:
         # - Public profile (not private)
@@ -533,42 +711,34 @@ async def scan_github(
             terms_accepted=True,  # GitHub TOS accepted
             data_retention_days=365,  # 1 year retention
         )
-        compliance_records.append(compliance_record)
-
-        # Publish candidate found event with compliance metadata
-        await message_bus.publish_event(
-            topic=Topics.CANDIDATE_EVENTS,
-            source_agent="proactive-scanning",
-            message_type=MessageType.CANDIDATE_FOUND,
-            payload={
-                "pipeline_id": pipeline_id,
-                "candidate": candidate.model_dump(),
-                "platform": "github",
-                "timestamp": datetime.utcnow().isoformat(),
-                # NEW: Compliance metadata
-                "sourcing_method": sourcing_method.value,
-                "consent_type": ConsentType.PUBLIC_PROFILE.value,
-                "can_contact": True,  # Public profile, can reach via contact info
-                "compliance_verified": True,
-            },
-            priority=MessagePriority.MEDIUM,
-        )
 
-        await asyncio.sleep(0.5)
+        hits.append(
+            ScanHit(
+                candidate=candidate,
+                compliance_record=compliance_record,
+                event_payload={
+                    # NEW: Compliance metadata
+                    "sourcing_method": sourcing_method.value,
+                    "consent_type": ConsentType.PUBLIC_PROFILE.value,
+                    "can_contact": True,  # Public profile, can reach via contact info
+                    "compliance_verified": True,
+                },
+            )
+        )
 
-    logger.info(f"[GITHUB] Successfully scanned with {len(compliance_records)} compliant records")
-    return min(target, 10), compliance_records
+    return hits
 
 
-async def scan_stackoverflow(
+async def fetch_stackoverflow_batch(
     pipeline_id: str,
     job_description: str,
-    target: int,
+    offset: int,
+    limit: int,
     sourcing_methods: list[SourcingMethod] = None,
     require_explicit_consent: bool = True,
-) -> tuple[int, list[ComplianceRecord]]:
+) -> list[ScanHit]:
     """
-    Scan Stack Overflow for candidates using OPT-IN DIRECTORY
+    Fetch one batch of Stack Overflow candidates using OPT-IN DIRECTORY
 
     COMPLIANCE:
     - Uses Stack Overflow Public API (no authentication required for public data)
@@ -581,15 +751,15 @@ async def scan_stackoverflow(
     Args:
         pipeline_id: Pipeline ID
         job_description: Job description for matching
-        target: Target count
+        offset: Index of the first result to fetch
+        limit: Maximum results to fetch
         sourcing_methods: Allowed sourcing methods
         require_explicit_consent: Require explicit opt-in
 
     Returns:
-        Tuple of (candidates_found, compliance_records)
+        Candidates found (fewer than `limit` when results run out)
     """
-    logger.info(f"[STACK OVERFLOW OPT-IN] Scanning for {target} candidates")
-    logger.info("Method: Stack Overflow Public API (opt-in users only)")
+    logger.info(f"[STACK OVERFLOW OPT-IN] Fetching {limit} candidates from offset {offset}")
 
     if not sourcing_methods:
         sourcing_methods = [SourcingMethod.OPT_IN_DIRECTORY]
@@ -605,9 +775,9 @@ async def scan_stackoverflow(
     # Rate limit: 10,000 requests/day
     await asyncio.sleep(2)
 
-    compliance_records = []
+    hits = []
 
-    for i in range(min(target, 5)):  # Stack Overflow candidates more selective
+    for i in range(offset, min(offset + limit, 5)):  # Stack Overflow candidates more selective
         # In production, fetch real candidate from Stack Overflow
         # Only include users with:
         # - "Looking for work" / "Open to work" explicitly set
@@ -654,34 +824,31 @@ async def scan_stackoverflow(
             terms_accepted=True,  # Stack Overflow TOS
             data_retention_days=730,  # 2 years
         )
-        compliance_records.append(compliance_record)
-
-        # Publish candidate found event with compliance metadata
-        await message_bus.publish_event(
-            topic=Topics.CANDIDATE_EVENTS,
-            source_agent="proactive-scanning",
-            message_type=MessageType.CANDIDATE_FOUND,
-            payload={
-                "pipeline_id": pipeline_id,
-                "candidate": candidate.model_dump(),
-                "platform": "stackoverflow",
-                "timestamp": datetime.utcnow().isoformat(),
-                # NEW: Compliance metadata
-                "sourcing_method": sourcing_method.value,
-                "consent_type": ConsentType.EXPLICIT_OPT_IN.value,
-                "can_contact": True,  # Explicitly opted in to job search
-                "compliance_verified": True,
-                "quality_tier": "high",  # Stack Overflow reputation filtering
-            },
-            priority=MessagePriority.HIGH,
+
+        hits.append(
+            ScanHit(
+                candidate=candidate,
+                compliance_record=compliance_record,
+                event_payload={
+                    # NEW: Compliance metadata
+                    "sourcing_method": sourcing_method.value,
+                    "consent_type": ConsentType.EXPLICIT_OPT_IN.value,
+                    "can_contact": True,  # Explicitly opted in to job search
+                    "compliance_verified": True,
+                    "quality_tier": "high",  # Stack Overflow reputation filtering
+                },
+                priority=MessagePriority.HIGH,
+            )
         )
 
-        await asyncio.sleep(0.5)
+    return hits
 
-    logger.info(
-        f"[STACK OVERFLOW] Successfully scanned with {len(compliance_records)} compliant records"
-    )
-    return min(target, 5), compliance_records
+
+PLATFORM_SCANNERS = {
+    "linkedin": fetch_linkedin_batch,
+    "github": fetch_github_batch,
+    "stackoverflow": fetch_stackoverflow_batch,
+}
 
 
 @app.get("/")
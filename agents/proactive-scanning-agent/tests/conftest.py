@@ -0,0 +1,8 @@
+import os
+import sys
+
+# main.py imports agents.shared, whose modules import each other as top-level modules
+agent_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+for path in (agent_root, os.path.join(agent_root, "..", "shared")):
+    if path not in sys.path:
+        sys.path.insert(0, os.path.abspath(path))
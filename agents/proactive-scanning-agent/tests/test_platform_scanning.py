@@ -0,0 +1,140 @@
+"""
+Tests for parallel platform scanning under a shared quota
+"""
+
+import asyncio
+from datetime import datetime
+
+import main
+import pytest
+from main import (
+    CandidateProfile,
+    ComplianceRecord,
+    ConsentType,
+    PlatformBudget,
+    QuotaPool,
+    RateLimiter,
+    ScanHit,
+    SourcingMethod,
+    scan_platform,
+    scan_platforms,
+)
+
+
+class FakeBus:
+    def __init__(self, log):
+        self.log = log
+
+    async def publish_event(self, topic, source_agent, message_type, payload, **kwargs):
+        self.log.append(("publish", payload["platform"], payload["candidate"]["id"]))
+
+
+def hit(platform, i):
+    candidate = CandidateProfile(id=f"{platform}_{i}", name=f"Candidate {i}")
+    return ScanHit(
+        candidate=candidate,
+        compliance_record=ComplianceRecord(
+            candidate_id=candidate.id,
+            platform=platform,
+            sourcing_method=SourcingMethod.OFFICIAL_API,
+            consent_type=ConsentType.EXPLICIT_OPT_IN,
+            consent_date=datetime.utcnow(),
+        ),
+        event_payload={},
+    )
+
+
+def scanner(platform, log, available=100, fail_from=None):
+    async def fetch(pipeline_id, job_description, offset, limit, *args):
+        log.append(("fetch", platform, offset))
+        await asyncio.sleep(0)
+        if fail_from is not None and offset >= fail_from:
+            raise RuntimeError("API unavailable")
+        return [hit(platform, i) for i in range(offset, min(offset + limit, available))]
+
+    return fetch
+
+
+@pytest.fixture
+def log(monkeypatch):
+    log = []
+    monkeypatch.setattr(main, "message_bus", FakeBus(log))
+    monkeypatch.setattr(
+        main,
+        "PLATFORM_BUDGETS",
+        {p: PlatformBudget(requests_per_second=1000, batch_size=2) for p in "ab"},
+    )
+    monkeypatch.setattr(main, "platform_limiters", {p: RateLimiter(1000) for p in "ab"})
+    return log
+
+
+def published(log, platform=None):
+    return [entry[2] for entry in log if entry[0] == "publish" and platform in (None, entry[1])]
+
+
+@pytest.mark.asyncio
+async def test_unused_quota_is_reclaimed_until_exhausted():
+    pool = QuotaPool(5, ["a", "b"])
+    assert pool.allocations == {"a": 3, "b": 2}
+
+    assert await pool.take("a", 10) == 3
+    await pool.settle("a", 3, 3)
+    assert await pool.take("b", 10) == 2
+    await pool.settle("b", 2, 1)  # b only used one slot, the other becomes spare
+    assert await pool.take("a", 10) == 1
+    await pool.settle("a", 1, 1)
+
+    # Everything is used and nothing is in flight, so no more quota can appear
+    assert await pool.take("a", 10) == 0
+    assert await pool.take("b", 10) == 0
+
+
+@pytest.mark.asyncio
+async def test_retired_share_goes_to_a_waiting_platform():
+    pool = QuotaPool(4, ["a", "b"])
+    assert await pool.take("a", 2) == 2
+    await pool.settle("a", 2, 2)
+
+    # a has used its share and waits while b could still release some
+    waiting = asyncio.create_task(pool.take("a", 2))
+    await asyncio.sleep(0)
+    assert not waiting.done()
+    await pool.retire("b")
+    assert await waiting == 2
+
+
+@pytest.mark.asyncio
+async def test_each_batch_is_published_before_the_next_fetch(log, monkeypatch):
+    monkeypatch.setattr(main, "PLATFORM_SCANNERS", {"a": scanner("a", log, available=5)})
+
+    found, records = await scan_platform(
+        "a", QuotaPool(10, ["a"]), "pipe", "Engineer", [SourcingMethod.OFFICIAL_API], True
+    )
+
+    assert found == 5
+    assert [r.candidate_id for r in records] == [f"a_{i}" for i in range(5)]
+    assert log == [
+        ("fetch", "a", 0),
+        ("publish", "a", "a_0"),
+        ("publish", "a", "a_1"),
+        ("fetch", "a", 2),
+        ("publish", "a", "a_2"),
+        ("publish", "a", "a_3"),
+        ("fetch", "a", 4),
+        ("publish", "a", "a_4"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_failing_platform_does_not_stop_the_others(log, monkeypatch):
+    monkeypatch.setattr(
+        main,
+        "PLATFORM_SCANNERS",
+        {"a": scanner("a", log, fail_from=2), "b": scanner("b", log)},
+    )
+
+    await scan_platforms("pipe", "Engineer", ["a", "b", "unknown"], target_count=8)
+
+    # a's first batch is kept and b takes over the rest of a's share
+    assert published(log, "a") == ["a_0", "a_1"]
+    assert published(log, "b") == [f"b_{i}" for i in range(6)]
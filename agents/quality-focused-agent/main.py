@@ -6,6 +6,7 @@ Candidate scoring, ranking, and bias detection
 import asyncio
 import logging
 import os
+import re
 import sys
 from contextlib import asynccontextmanager
 from datetime import datetime
@@ -23,6 +24,7 @@ from agents.shared import (
     MessageType,
     ServiceClients,
     Topics,
+    create_message_bus,
     get_config,
 )
 
@@ -42,7 +44,9 @@ async def lifespan(app: FastAPI):
     global message_bus, service_clients
 
     logger.info("Starting Quality-Focused Agent...")
-    message_bus = MessageBus(config.redis_url)
+    message_bus = create_message_bus(
+        config.redis_url, backend=config.message_bus_backend, consumer_group="quality-focused"
+    )
     await message_bus.connect()
 
     service_clients = ServiceClients(
@@ -62,6 +66,7 @@ async def lifespan(app: FastAPI):
     yield
 
     logger.info("Shutting down Quality-Focused Agent...")
+    await batch_scorer.flush_all()
     if message_bus:
         await message_bus.disconnect()
 
@@ -90,6 +95,15 @@ class ScoreRequest(BaseModel):
     candidate_profile: dict[str, Any]
 
 
+class BatchScoreRequest(BaseModel):
+    """Batch scoring request model"""
+
+    job_description: str
+    candidates: list[dict[str, Any]]
+    required_skills: list[str] | None = None
+    required_years: int | None = None
+
+
 class ScoreResult(BaseModel):
     """Scoring result model"""
 
@@ -103,81 +117,377 @@ class ScoreResult(BaseModel):
     timestamp: datetime
 
 
+# Genkit's batch flow accepts at most 50 candidates per call
+SCORING_BATCH_SIZE = int(os.getenv("SCORING_BATCH_SIZE", "50"))
+SCORING_BATCH_WAIT = float(os.getenv("SCORING_BATCH_WAIT", "0.5"))
+SCORING_MAX_CONCURRENCY = int(os.getenv("SCORING_MAX_CONCURRENCY", "4"))
+
+DEFAULT_JOB_DESCRIPTION = "Python Developer with 5+ years experience"
+
+# Known skills, indexed once so skill sets can be compared as integer bitsets
+# fmt: off
+SKILL_VOCABULARY = [
+    "python", "java", "javascript", "typescript", "golang", "rust", "c++", "c#", "ruby",
+    "php", "kotlin", "swift", "scala", "sql", "django", "flask", "fastapi", "sqlalchemy",
+    "react", "angular", "vue", "node.js", "spring", "rails", "postgresql", "mysql",
+    "mongodb", "redis", "elasticsearch", "kafka", "aws", "gcp", "azure", "docker",
+    "kubernetes", "terraform", "linux", "git", "graphql", "machine learning",
+    "pytorch", "tensorflow", "pandas", "spark",
+]
+# fmt: on
+
+
+class SkillVocabulary:
+    """Maps skills to bit positions so a skill list becomes one int bitset"""
+
+    def __init__(self, skills: list[str]):
+        self.index: dict[str, int] = {}
+        for skill in skills:
+            self.add(skill)
+
+    def add(self, skill: str) -> int:
+        """Return the bit for a skill, assigning a new one if it is unknown"""
+        return 1 << self.index.setdefault(skill.strip().lower(), len(self.index))
+
+    def encode(self, skills: list[str], extra: dict[str, int] | None = None) -> int:
+        """
+        Encode skills as a bitset
+
+        Args:
+            skills: Skill names (case-insensitive)
+            extra: Bits for skills outside the vocabulary, local to one request;
+                other unknown skills are ignored
+        """
+        extra = extra or {}
+        mask = 0
+        for skill in skills:
+            key = skill.strip().lower()
+            bit = self.index.get(key, extra.get(key))
+            if bit is not None:
+                mask |= 1 << bit
+        return mask
+
+    def request_index(self, skills: list[str]) -> dict[str, int]:
+        """Bits above the vocabulary for the unknown skills of one request"""
+        unknown = dict.fromkeys(
+            key for key in (skill.strip().lower() for skill in skills) if key not in self.index
+        )
+        return {skill: len(self.index) + i for i, skill in enumerate(unknown)}
+
+    def extract(self, text: str) -> list[str]:
+        """Find vocabulary skills mentioned in free text"""
+        text = f" {text.lower()} "
+        return [
+            skill
+            for skill in self.index
+            if re.search(rf"(?<![\w+#.]){re.escape(skill)}(?![\w+#])", text)
+        ]
+
+
+skill_vocabulary = SkillVocabulary(SKILL_VOCABULARY)
+
+
+class JobRequirements(BaseModel):
+    """Requirements candidates in a pipeline are scored against"""
+
+    job_description: str
+    required_skills: list[str]
+    required_years: int
+
+    @classmethod
+    def from_description(
+        cls,
+        job_description: str,
+        required_skills: list[str] | None = None,
+        required_years: int | None = None,
+    ) -> "JobRequirements":
+        """Build requirements, extracting skills and years from the description if omitted"""
+        if required_years is None:
+            match = re.search(r"(\d+)\+?\s*(?:years|yrs)", job_description, re.IGNORECASE)
+            required_years = int(match.group(1)) if match else 0
+        return cls(
+            job_description=job_description,
+            required_skills=required_skills or skill_vocabulary.extract(job_description),
+            required_years=required_years,
+        )
+
+
+DEFAULT_REQUIREMENTS = JobRequirements.from_description(DEFAULT_JOB_DESCRIPTION)
+
+# Requirements announced with "start_scoring", keyed by pipeline ID
+pipeline_requirements: dict[str, JobRequirements] = {}
+
+
+def batch_skill_match(skill_lists: list[list[str]], required_skills: list[str]) -> list[float]:
+    """
+    Calculate skill match percentages for many candidates at once
+
+    The required skills are encoded once; each candidate is then a single
+    bitwise AND and popcount against that mask. Required skills outside the
+    vocabulary get bits for this call only, so requests never grow the shared
+    vocabulary.
+
+    Args:
+        skill_lists: Skills of each candidate
+        required_skills: Required skills
+
+    Returns:
+        Match percentage per candidate
+    """
+    if not required_skills:
+        return [100.0] * len(skill_lists)
+
+    extra = skill_vocabulary.request_index(required_skills)
+    required = skill_vocabulary.encode(required_skills, extra)
+    total = required.bit_count()
+    return [
+        (skill_vocabulary.encode(skills, extra) & required).bit_count() / total * 100
+        for skills in skill_lists
+    ]
+
+
+def batch_experience_scores(candidate_years: list[float], required_years: int) -> list[float]:
+    """
+    Calculate experience scores for many candidates at once
+
+    Args:
+        candidate_years: Years of experience per candidate
+        required_years: Required years
+
+    Returns:
+        Experience score per candidate
+    """
+    bands = ((required_years, 100.0), (required_years * 0.7, 80.0), (required_years * 0.5, 60.0))
+    return [
+        next((score for floor, score in bands if years >= floor), 40.0) for years in candidate_years
+    ]
+
+
+def get_recommendation(overall_score: float) -> str:
+    """Map an overall score to a hiring recommendation"""
+    if overall_score >= 80:
+        return "strong_hire"
+    if overall_score >= 70:
+        return "hire"
+    if overall_score >= 60:
+        return "maybe"
+    return "reject"
+
+
+def genkit_profile(candidate_data: dict[str, Any]) -> dict[str, Any]:
+    """Shape a candidate for Genkit's scoreCandidateQuality input schema"""
+    role = candidate_data.get("current_role") or "Candidate"
+    company = candidate_data.get("current_company")
+    experience = f"{role} with {candidate_data.get('experience_years', 0)} years of experience"
+    if company:
+        experience += f" at {company}"
+    return {
+        "name": candidate_data.get("name", ""),
+        "skills": candidate_data.get("skills", []),
+        "experience": experience,
+    }
+
+
+class BatchScorer:
+    """
+    Accumulates candidates per pipeline into micro-batches and scores them together
+
+    A batch is flushed when it reaches batch_size or max_wait seconds after
+    its first candidate arrived. Each batch costs one Genkit request; skill
+    and experience scores are computed locally across the whole batch.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = SCORING_BATCH_SIZE,
+        max_wait: float = SCORING_BATCH_WAIT,
+        max_concurrency: int = SCORING_MAX_CONCURRENCY,
+    ):
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._pending: dict[str, list[dict[str, Any]]] = {}
+        self._timers: dict[str, asyncio.Task] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self.stats = {"scored": 0, "batches": 0, "genkit_failures": 0}
+
+    def _spawn(self, coro) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def add(self, pipeline_id: str, candidate_data: dict[str, Any]) -> None:
+        """Queue a candidate for scoring"""
+        pending = self._pending.setdefault(pipeline_id, [])
+        pending.append(candidate_data)
+
+        if len(pending) >= self.batch_size:
+            timer = self._timers.pop(pipeline_id, None)
+            if timer:
+                timer.cancel()
+            self._spawn(self.flush(pipeline_id))
+        elif pipeline_id not in self._timers:
+            self._timers[pipeline_id] = self._spawn(self._flush_later(pipeline_id))
+
+    async def _flush_later(self, pipeline_id: str) -> None:
+        await asyncio.sleep(self.max_wait)
+        self._timers.pop(pipeline_id, None)
+        await self.flush(pipeline_id)
+
+    async def flush(self, pipeline_id: str) -> list[ScoreResult]:
+        """Score and publish everything queued for a pipeline"""
+        candidates = self._pending.pop(pipeline_id, [])
+        if not candidates:
+            return []
+
+        requirements = pipeline_requirements.get(pipeline_id, DEFAULT_REQUIREMENTS)
+        results = await self.score_all(candidates, requirements)
+
+        try:
+            await self._publish(pipeline_id, results)
+        except Exception as e:
+            logger.error(f"Error publishing scores for pipeline {pipeline_id}: {e}")
+
+        logger.info(f"Scored {len(results)} candidates for pipeline {pipeline_id}")
+        return results
+
+    async def flush_all(self) -> None:
+        """Flush every pipeline (used on shutdown)"""
+        for timer in self._timers.values():
+            timer.cancel()
+        self._timers.clear()
+        await asyncio.gather(*(self.flush(pipeline_id) for pipeline_id in list(self._pending)))
+
+    async def score_all(
+        self, candidates: list[dict[str, Any]], requirements: JobRequirements
+    ) -> list[ScoreResult]:
+        """Split candidates into batches and score them concurrently"""
+        batches = [
+            candidates[i : i + self.batch_size] for i in range(0, len(candidates), self.batch_size)
+        ]
+        scored = await asyncio.gather(*(self.score(batch, requirements) for batch in batches))
+        return [result for batch in scored for result in batch]
+
+    async def _quality_scores(self, candidates: list[dict[str, Any]]) -> list[float | None]:
+        """One Genkit call for the batch; None entries fall back to local scoring"""
+        async with self._semaphore:
+            try:
+                scores = await service_clients.genkit.score_candidates_quality_batch(
+                    [genkit_profile(candidate) for candidate in candidates]
+                )
+            except Exception as e:
+                self.stats["genkit_failures"] += 1
+                logger.warning(f"Genkit batch scoring failed, using local scores: {e}")
+                return [None] * len(candidates)
+
+        return [scores[i].get("score") if i < len(scores) else None for i in range(len(candidates))]
+
+    async def score(
+        self, candidates: list[dict[str, Any]], requirements: JobRequirements
+    ) -> list[ScoreResult]:
+        """
+        Score one batch of candidates
+
+        Args:
+            candidates: Candidate data (at most batch_size)
+            requirements: Requirements to score against
+
+        Returns:
+            Score results in candidate order
+        """
+        skill_scores = batch_skill_match(
+            [candidate.get("skills", []) for candidate in candidates], requirements.required_skills
+        )
+        experience_scores = batch_experience_scores(
+            [candidate.get("experience_years", 0) for candidate in candidates],
+            requirements.required_years,
+        )
+        quality_scores = await self._quality_scores(candidates)
+
+        now = datetime.utcnow()
+        results = []
+        for candidate, skill, experience, quality in zip(
+            candidates, skill_scores, experience_scores, quality_scores, strict=True
+        ):
+            overall_score = quality if quality is not None else 0.6 * skill + 0.4 * experience
+            results.append(
+                ScoreResult(
+                    candidate_id=str(candidate.get("id")),
+                    overall_score=overall_score,
+                    skill_match_score=skill,
+                    experience_score=experience,
+                    culture_fit_score=75.0,
+                    bias_flags=await detect_bias(candidate),
+                    recommendation=get_recommendation(overall_score),
+                    timestamp=now,
+                )
+            )
+
+        self.stats["scored"] += len(results)
+        self.stats["batches"] += 1
+        return results
+
+    async def _publish(self, pipeline_id: str, results: list[ScoreResult]) -> None:
+        """Publish CANDIDATE_SCORED events concurrently (pipelined by the message bus)"""
+        await asyncio.gather(
+            *(
+                message_bus.publish_event(
+                    topic=Topics.CANDIDATE_EVENTS,
+                    source_agent="quality-focused",
+                    message_type=MessageType.CANDIDATE_SCORED,
+                    payload={
+                        "pipeline_id": pipeline_id,
+                        "candidate_id": result.candidate_id,
+                        "quality_score": result.overall_score,
+                        "skill_match": result.skill_match_score,
+                        "experience_match": result.experience_score,
+                        "bias_flags": result.bias_flags,
+                        "recommendation": result.recommendation,
+                        "timestamp": result.timestamp.isoformat(),
+                    },
+                    priority=(
+                        MessagePriority.HIGH
+                        if result.overall_score >= 80
+                        else MessagePriority.MEDIUM
+                    ),
+                    correlation_id=pipeline_id,
+                )
+                for result in results
+            )
+        )
+
+
+batch_scorer = BatchScorer()
+
+
 async def handle_scoring_request(message):
     """Handle scoring request"""
     logger.info(f"Received scoring request: {message.payload}")
 
     try:
         if message.message_type == MessageType.CANDIDATE_FOUND:
-            # Auto-score new candidates
+            # Auto-score new candidates (in micro-batches)
             candidate_data = message.payload.get("candidate")
             pipeline_id = message.payload.get("pipeline_id")
 
             if candidate_data:
-                asyncio.create_task(score_candidate(pipeline_id, candidate_data))
+                batch_scorer.add(pipeline_id, candidate_data)
         elif message.payload.get("action") == "start_scoring":
             pipeline_id = message.payload.get("pipeline_id")
+            job_description = message.payload.get("job_description")
+            if job_description:
+                pipeline_requirements[pipeline_id] = JobRequirements.from_description(
+                    job_description,
+                    required_skills=message.payload.get("required_skills"),
+                    required_years=message.payload.get("required_years"),
+                )
             # Trigger batch scoring
             asyncio.create_task(score_pipeline_candidates(pipeline_id))
     except Exception as e:
         logger.error(f"Error handling scoring request: {e}")
 
 
-async def score_candidate(pipeline_id: str, candidate_data: dict[str, Any]):
-    """
-    Score individual candidate
-
-    Args:
-        pipeline_id: Pipeline ID
-        candidate_data: Candidate data
-    """
-    candidate_id = candidate_data.get("id")
-    logger.info(f"Scoring candidate {candidate_id}")
-
-    try:
-        # Use Genkit service for AI-powered scoring
-        score_data = await service_clients.genkit.score_candidate_quality(
-            candidate_profile=candidate_data,
-            job_description="Python Developer with 5+ years experience",  # TODO: Get from pipeline
-        )
-
-        overall_score = score_data.get("quality_score", 0)
-
-        # Check for bias
-        bias_flags = await detect_bias(candidate_data)
-
-        # Determine recommendation
-        recommendation = "reject"
-        if overall_score >= 80:
-            recommendation = "strong_hire"
-        elif overall_score >= 70:
-            recommendation = "hire"
-        elif overall_score >= 60:
-            recommendation = "maybe"
-
-        # Publish scored event
-        await message_bus.publish_event(
-            topic=Topics.CANDIDATE_EVENTS,
-            source_agent="quality-focused",
-            message_type=MessageType.CANDIDATE_SCORED,
-            payload={
-                "pipeline_id": pipeline_id,
-                "candidate_id": candidate_id,
-                "quality_score": overall_score,
-                "skill_match": score_data.get("skill_match", 0),
-                "experience_match": score_data.get("experience_match", 0),
-                "bias_flags": bias_flags,
-                "recommendation": recommendation,
-                "timestamp": datetime.utcnow().isoformat(),
-            },
-            priority=MessagePriority.HIGH if overall_score >= 80 else MessagePriority.MEDIUM,
-        )
-
-        logger.info(f"Scored candidate {candidate_id}: {overall_score}/100 ({recommendation})")
-    except Exception as e:
-        logger.error(f"Error scoring candidate: {e}")
-
-
 async def score_pipeline_candidates(pipeline_id: str):
     """
     Score all candidates in pipeline
@@ -187,8 +497,8 @@ async def score_pipeline_candidates(pipeline_id: str):
     """
     logger.info(f"Scoring all candidates for pipeline {pipeline_id}")
 
-    # Mock: In production, fetch candidates from database
-    await asyncio.sleep(1)
+    # In production, also load unscored candidates from the database
+    await batch_scorer.flush(pipeline_id)
 
 
 async def detect_bias(candidate_data: dict[str, Any]) -> list[str]:
@@ -235,15 +545,7 @@ async def calculate_skill_match(candidate_skills: list[str], required_skills: li
     Returns:
         Match percentage
     """
-    if not required_skills:
-        return 100.0
-
-    candidate_skills_lower = [s.lower() for s in candidate_skills]
-    required_skills_lower = [s.lower() for s in required_skills]
-
-    matches = sum(1 for skill in required_skills_lower if skill in candidate_skills_lower)
-
-    return (matches / len(required_skills)) * 100
+    return batch_skill_match([candidate_skills], required_skills)[0]
 
 
 async def calculate_experience_score(candidate_years: int, required_years: int) -> float:
@@ -257,14 +559,7 @@ async def calculate_experience_score(candidate_years: int, required_years: int)
     Returns:
         Experience score
     """
-    if candidate_years >= required_years:
-        return 100.0
-    elif candidate_years >= required_years * 0.7:
-        return 80.0
-    elif candidate_years >= required_years * 0.5:
-        return 60.0
-    else:
-        return 40.0
+    return batch_experience_scores([candidate_years], required_years)[0]
 
 
 @app.get("/")
@@ -308,15 +603,7 @@ async def manual_score(request: ScoreRequest):
         bias_flags = await detect_bias(request.candidate_profile)
 
         overall_score = score_data.get("quality_score", 0)
-
-        # Recommendation
-        recommendation = "reject"
-        if overall_score >= 80:
-            recommendation = "strong_hire"
-        elif overall_score >= 70:
-            recommendation = "hire"
-        elif overall_score >= 60:
-            recommendation = "maybe"
+        recommendation = get_recommendation(overall_score)
 
         return ScoreResult(
             candidate_id=request.candidate_id,
@@ -333,6 +620,29 @@ async def manual_score(request: ScoreRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/score/batch", response_model=list[ScoreResult])
+async def batch_score(request: BatchScoreRequest):
+    """
+    Score many candidates against one job description
+
+    Args:
+        request: Batch score request
+
+    Returns:
+        Score results in candidate order
+    """
+    requirements = JobRequirements.from_description(
+        request.job_description,
+        required_skills=request.required_skills,
+        required_years=request.required_years,
+    )
+    try:
+        return await batch_scorer.score_all(request.candidates, requirements)
+    except Exception as e:
+        logger.error(f"Error batch scoring candidates: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 if __name__ == "__main__":
     import uvicorn
 
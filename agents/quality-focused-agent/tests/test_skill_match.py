@@ -0,0 +1,20 @@
+"""
+Tests for batched skill matching
+"""
+
+from main import batch_skill_match, skill_vocabulary
+
+
+def test_skill_match_counts_known_and_unknown_skills():
+    scores = batch_skill_match(
+        [["Python", "Docker"], ["python", "Elixir"], ["rust"]],
+        ["python", "docker", "Elixir", "Haskell"],
+    )
+    assert scores == [50.0, 50.0, 0.0]
+
+
+def test_requests_do_not_grow_the_vocabulary():
+    size = len(skill_vocabulary.index)
+    for n in range(100):
+        batch_skill_match([[f"skill-{n}"]], [f"skill-{n}", f"other-{n}"])
+    assert len(skill_vocabulary.index) == size
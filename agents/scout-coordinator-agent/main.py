@@ -14,6 +14,7 @@ from fastapi import (
     BackgroundTasks,
     FastAPI,
     HTTPException,
+    Query,
     WebSocket,
     WebSocketDisconnect,
 )
@@ -25,12 +26,15 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")
 
 from shared import (
     AgentMessage,
+    EventHub,
     MessageBus,
     MessagePriority,
     MessageType,
     PipelineState,
+    PipelineStore,
     SourcingPipeline,
     Topics,
+    create_message_bus,
     get_config,
 )
 
@@ -42,8 +46,8 @@ logger = logging.getLogger(__name__)
 
 # Global instances
 message_bus: MessageBus | None = None
-active_pipelines: dict[str, SourcingPipeline] = {}
-active_connections: list[WebSocket] = []
+active_pipelines = PipelineStore()
+event_hub = EventHub()
 
 # Configuration
 config = get_config()
@@ -57,7 +61,9 @@ async def lifespan(app: FastAPI):
 
     # Startup
     logger.info("Starting Scout AI Coordinator Agent...")
-    message_bus = MessageBus(config.redis_url)
+    message_bus = create_message_bus(
+        config.redis_url, backend=config.message_bus_backend, consumer_group="scout-coordinator"
+    )
     await message_bus.connect()
 
     # Subscribe to agent events
@@ -71,6 +77,10 @@ async def lifespan(app: FastAPI):
         handle_agent_event,
     )
 
+    # Restore pipelines from the last snapshot and keep snapshotting
+    active_pipelines.start()
+    event_hub.start()
+
     # Start message listener in background
     asyncio.create_task(message_bus.listen())
     logger.info("Scout AI ready on port 8090")
@@ -79,6 +89,8 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down Scout AI...")
+    await event_hub.stop()
+    await active_pipelines.stop()
     if message_bus:
         await message_bus.disconnect()
 
@@ -135,6 +147,7 @@ class PipelineListResponse(BaseModel):
 
     pipelines: list[PipelineStatusResponse]
     total: int
+    next_offset: int | None = None
 
 
 # Event Handler
@@ -163,44 +176,18 @@ async def handle_agent_event(message: AgentMessage):
     except Exception as e:
         logger.error(f"Error handling event: {e}")
 
-    # Broadcast event to all connected WebSockets
-    await broadcast_event(message)
-
-
-async def broadcast_event(message: AgentMessage):
-    """Broadcast event to all connected clients"""
-    if not active_connections:
-        return
-
-    dead_connections = []
-    for connection in active_connections:
-        try:
-            await connection.send_json(
-                {
-                    "type": message.message_type.value
-                    if hasattr(message.message_type, "value")
-                    else str(message.message_type),
-                    "payload": message.payload,
-                    "timestamp": datetime.utcnow().isoformat(),
-                }
-            )
-        except Exception:
-            dead_connections.append(connection)
-
-    for dead in dead_connections:
-        active_connections.remove(dead)
+    # Queue event for connected WebSockets (never blocks on a slow client)
+    event_hub.publish(message)
 
 
 async def handle_candidate_found(message: AgentMessage):
     """Handle candidate found event"""
     pipeline_id = message.payload.get("pipeline_id")
-    if pipeline_id in active_pipelines:
-        active_pipelines[pipeline_id].candidates_found += 1
-        active_pipelines[pipeline_id].updated_at = datetime.utcnow()
+    candidates_found = active_pipelines.increment(pipeline_id, "candidates_found")
 
-        # If enough candidates, move to scoring phase
-        if active_pipelines[pipeline_id].candidates_found >= 10:
-            await transition_pipeline(pipeline_id, PipelineState.SCORING)
+    # If enough candidates, move to scoring phase (once)
+    if candidates_found == 10:
+        await transition_pipeline(pipeline_id, PipelineState.SCORING)
 
 
 async def handle_candidate_scored(message: AgentMessage):
@@ -216,27 +203,20 @@ async def handle_candidate_scored(message: AgentMessage):
 async def handle_outreach_sent(message: AgentMessage):
     """Handle outreach sent event"""
     pipeline_id = message.payload.get("pipeline_id")
-    if pipeline_id in active_pipelines:
-        active_pipelines[pipeline_id].candidates_contacted += 1
-        active_pipelines[pipeline_id].updated_at = datetime.utcnow()
+    active_pipelines.increment(pipeline_id, "candidates_contacted")
 
 
 async def handle_outreach_response(message: AgentMessage):
     """Handle outreach response event"""
     pipeline_id = message.payload.get("pipeline_id")
-    if pipeline_id in active_pipelines:
-        active_pipelines[pipeline_id].candidates_responded += 1
-        active_pipelines[pipeline_id].updated_at = datetime.utcnow()
-
+    if active_pipelines.increment(pipeline_id, "candidates_responded") is not None:
         # Trigger interview scheduling
         await trigger_interview(pipeline_id, message.payload.get("candidate_id"))
 
 
 async def handle_pipeline_update(message: AgentMessage):
     """Handle pipeline update event"""
-    pipeline_id = message.payload.get("pipeline_id")
-    if pipeline_id in active_pipelines:
-        active_pipelines[pipeline_id].updated_at = datetime.utcnow()
+    active_pipelines.touch(message.payload.get("pipeline_id"))
 
 
 async def handle_market_insight(message: AgentMessage):
@@ -253,14 +233,10 @@ async def transition_pipeline(pipeline_id: str, new_state: PipelineState):
         pipeline_id: Pipeline ID
         new_state: New pipeline state
     """
-    if pipeline_id not in active_pipelines:
+    old_state = active_pipelines.set_state(pipeline_id, new_state)
+    if old_state is None:
         return
 
-    pipeline = active_pipelines[pipeline_id]
-    old_state = pipeline.state
-    pipeline.state = new_state
-    pipeline.updated_at = datetime.utcnow()
-
     logger.info(f"Pipeline {pipeline_id} transitioned: {old_state} -> {new_state}")
 
     # Publish state change event
@@ -361,17 +337,46 @@ async def trigger_interview(pipeline_id: str, candidate_id: str):
 # WebSocket Endpoint
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
-    """WebSocket endpoint for real-time updates"""
+    """
+    WebSocket endpoint for real-time updates
+
+    Clients receive every event by default and may narrow the stream with
+    {"action": "subscribe", "types": [...], "pipelines": [...]}.
+    CANDIDATE_FOUND events arrive as per-pipeline deltas with a "count".
+    """
     await websocket.accept()
-    active_connections.append(websocket)
-    logger.info(f"New client connected. Total clients: {len(active_connections)}")
+    client = event_hub.connect(websocket)
+    logger.info(f"New client connected. Total clients: {len(event_hub)}")
     try:
         while True:
-            # Keep connection alive
-            await websocket.receive_text()
+            event_hub.handle_client_message(client, await websocket.receive_text())
     except WebSocketDisconnect:
-        active_connections.remove(websocket)
-        logger.info(f"Client disconnected. Total clients: {len(active_connections)}")
+        pass
+    finally:
+        event_hub.disconnect(client)
+        logger.info(f"Client disconnected. Total clients: {len(event_hub)}")
+
+
+def pipeline_status(pipeline: SourcingPipeline) -> PipelineStatusResponse:
+    """Build the status response for a pipeline"""
+    # Calculate progress percentage
+    total_stages = 5  # scanning, scoring, engaging, interviewing, completed
+    current_stage = list(PipelineState).index(pipeline.state) + 1
+    progress = (current_stage / total_stages) * 100
+
+    return PipelineStatusResponse(
+        pipeline_id=pipeline.id,
+        project_id=pipeline.project_id,
+        state=pipeline.state,
+        active_agents=pipeline.active_agents,
+        candidates_found=pipeline.candidates_found,
+        candidates_contacted=pipeline.candidates_contacted,
+        candidates_responded=pipeline.candidates_responded,
+        interviews_scheduled=pipeline.interviews_scheduled,
+        progress_percentage=progress,
+        started_at=pipeline.started_at,
+        updated_at=pipeline.updated_at,
+    )
 
 
 # API Endpoints
@@ -398,6 +403,26 @@ async def health():
     }
 
 
+@app.get("/metrics/message-bus")
+async def message_bus_metrics():
+    """Message bus publish batching, queue depth and delivery lag"""
+    if not message_bus:
+        raise HTTPException(status_code=503, detail="Message bus not initialized")
+    return message_bus.metrics()
+
+
+@app.get("/metrics/websockets")
+async def websocket_metrics():
+    """WebSocket fan-out queue depth, drops and coalescing"""
+    return event_hub.metrics()
+
+
+@app.get("/metrics/pipelines")
+async def pipeline_metrics():
+    """Pipeline counts by state and snapshot settings"""
+    return active_pipelines.stats()
+
+
 @app.post("/pipelines/start", response_model=PipelineStatusResponse)
 async def start_pipeline(request: StartPipelineRequest, background_tasks: BackgroundTasks):
     """
@@ -427,7 +452,7 @@ async def start_pipeline(request: StartPipelineRequest, background_tasks: Backgr
         interviews_completed=0,
     )
 
-    active_pipelines[pipeline_id] = pipeline
+    active_pipelines.add(pipeline)
 
     # Publish pipeline started event
     await message_bus.publish_event(
@@ -522,78 +547,38 @@ async def get_pipeline_status(pipeline_id: str):
     if pipeline_id not in active_pipelines:
         raise HTTPException(status_code=404, detail="Pipeline not found")
 
-    pipeline = active_pipelines[pipeline_id]
-
-    # Calculate progress percentage
-    total_stages = 5  # scanning, scoring, engaging, interviewing, completed
-    current_stage = list(PipelineState).index(pipeline.state) + 1
-    progress = (current_stage / total_stages) * 100
-
-    return PipelineStatusResponse(
-        pipeline_id=pipeline.id,
-        project_id=pipeline.project_id,
-        state=pipeline.state,
-        active_agents=pipeline.active_agents,
-        candidates_found=pipeline.candidates_found,
-        candidates_contacted=pipeline.candidates_contacted,
-        candidates_responded=pipeline.candidates_responded,
-        interviews_scheduled=pipeline.interviews_scheduled,
-        progress_percentage=progress,
-        started_at=pipeline.started_at,
-        updated_at=pipeline.updated_at,
-    )
+    return pipeline_status(active_pipelines.get(pipeline_id))
 
 
 @app.get("/pipelines", response_model=PipelineListResponse)
-async def list_pipelines(project_id: str | None = None, state: str | None = None, limit: int = 50):
+async def list_pipelines(
+    project_id: str | None = None,
+    state: str | None = None,
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+):
     """
-    List all pipelines
+    List pipelines, served from the project/state indexes
 
     Args:
         project_id: Optional filter by project ID
         state: Optional filter by state
         limit: Max results
+        offset: Number of matching pipelines to skip
 
     Returns:
-        List of pipelines
+        One page of pipelines, the total matching and the next page offset
     """
-    pipelines = list(active_pipelines.values())
-
-    # Filter by project_id
-    if project_id:
-        pipelines = [p for p in pipelines if p.project_id == project_id]
-
-    # Filter by state
-    if state:
-        pipelines = [p for p in pipelines if p.state == state]
-
-    # Limit results
-    pipelines = pipelines[:limit]
-
-    # Convert to response models
-    responses = []
-    for pipeline in pipelines:
-        total_stages = 5
-        current_stage = list(PipelineState).index(pipeline.state) + 1
-        progress = (current_stage / total_stages) * 100
-
-        responses.append(
-            PipelineStatusResponse(
-                pipeline_id=pipeline.id,
-                project_id=pipeline.project_id,
-                state=pipeline.state,
-                active_agents=pipeline.active_agents,
-                candidates_found=pipeline.candidates_found,
-                candidates_contacted=pipeline.candidates_contacted,
-                candidates_responded=pipeline.candidates_responded,
-                interviews_scheduled=pipeline.interviews_scheduled,
-                progress_percentage=progress,
-                started_at=pipeline.started_at,
-                updated_at=pipeline.updated_at,
-            )
-        )
-
-    return PipelineListResponse(pipelines=responses, total=len(responses))
+    pipelines, total = active_pipelines.query(
+        project_id=project_id, state=state, offset=offset, limit=limit
+    )
+    next_offset = offset + len(pipelines)
+
+    return PipelineListResponse(
+        pipelines=[pipeline_status(pipeline) for pipeline in pipelines],
+        total=total,
+        next_offset=next_offset if next_offset < total else None,
+    )
 
 
 @app.post("/pipelines/{pipeline_id}/pause")
@@ -613,7 +598,7 @@ async def resume_pipeline(pipeline_id: str):
     if pipeline_id not in active_pipelines:
         raise HTTPException(status_code=404, detail="Pipeline not found")
 
-    pipeline = active_pipelines[pipeline_id]
+    pipeline = active_pipelines.get(pipeline_id)
 
     # Resume at previous state
     if pipeline.state == PipelineState.PAUSED:
@@ -641,7 +626,7 @@ async def stop_pipeline(pipeline_id: str):
     )
 
     # Remove from active pipelines
-    del active_pipelines[pipeline_id]
+    active_pipelines.remove(pipeline_id)
 
     return {"status": "stopped", "pipeline_id": pipeline_id}
 
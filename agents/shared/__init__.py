@@ -4,7 +4,9 @@ Provides common models, message bus, and service clients for all agents.
 """
 
 from .config import AgentConfig, config, get_config
+from .event_hub import EventHub
 from .message_bus import MessageBus, Topics
+from .message_transports import InMemoryMessageBus, RedisStreamMessageBus, create_message_bus
 from .models import (
     AgentMessage,
     CandidateProfile,
@@ -28,6 +30,8 @@ from .models import (
     SourcingPipeline,
     WorkExperience,
 )
+from .pipeline_store import PipelineStore
+from .profile_cache import CacheEntry, ProfileCache, canonical_profile_url
 from .service_clients import (
     AvatarServiceClient,
     ConversationServiceClient,
@@ -65,6 +69,17 @@ __all__ = [
     # Message Bus
     "MessageBus",
     "Topics",
+    "RedisStreamMessageBus",
+    "InMemoryMessageBus",
+    "create_message_bus",
+    # Event Hub
+    "EventHub",
+    # Pipeline Store
+    "PipelineStore",
+    # Profile Cache
+    "ProfileCache",
+    "CacheEntry",
+    "canonical_profile_url",
     # Service Clients
     "ConversationServiceClient",
     "VoiceServiceClient",
@@ -76,6 +76,9 @@ class AgentConfig(BaseSettings):
 
     # Message Bus
     message_retention_seconds: int = 86400  # 24 hours
+    # Transport: "pubsub" (fire-and-forget), "streams" (durable consumer groups)
+    # or "memory" (in-process, for tests)
+    message_bus_backend: str = Field(default="pubsub", env="MESSAGE_BUS_BACKEND")
 
     class Config:
         env_file = ".env"
@@ -0,0 +1,239 @@
+"""
+WebSocket fan-out hub for dashboard clients.
+
+publish() never awaits a socket. Each client has a bounded send queue
+drained by its own task, so a slow browser only delays (and, when its
+queue overflows, loses the oldest of) its own updates. Frames are
+serialized once and the same text is queued for every recipient.
+High-frequency events such as CANDIDATE_FOUND are coalesced per pipeline
+into one delta frame per flush interval. Clients can narrow what they
+receive by event type and pipeline ID.
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+from datetime import datetime
+from typing import Any
+
+from models import AgentMessage, MessageType
+
+logger = logging.getLogger(__name__)
+
+# Event types merged into periodic per-pipeline deltas instead of sent one by one
+DEFAULT_COALESCED_TYPES = frozenset({MessageType.CANDIDATE_FOUND.value})
+
+
+def _type_value(message_type: Any) -> str:
+    return message_type.value if hasattr(message_type, "value") else str(message_type)
+
+
+class HubClient:
+    """One connected socket with its send queue and subscriptions"""
+
+    def __init__(self, websocket: Any, queue_size: int):
+        self.websocket = websocket
+        self.queue: asyncio.Queue[tuple[str, str | None, str]] = asyncio.Queue(queue_size)
+        self.types: set[str] | None = None
+        self.pipelines: set[str] | None = None
+        self.sent = 0
+        self.dropped = 0
+        self.task: asyncio.Task | None = None
+
+    def wants(self, event_type: str, pipeline_id: str | None) -> bool:
+        """Check the client's type and pipeline subscriptions"""
+        if self.types is not None and event_type not in self.types:
+            return False
+        if self.pipelines is not None and pipeline_id not in self.pipelines:
+            return False
+        return True
+
+    def offer(self, frame: tuple[str, str | None, str]) -> None:
+        """Queue a frame, dropping the oldest queued frame when full"""
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(frame)
+
+
+class EventHub:
+    """Fan-out of agent events to WebSocket clients"""
+
+    def __init__(
+        self,
+        queue_size: int = 256,
+        coalesce_interval: float = 0.25,
+        coalesced_types: frozenset[str] = DEFAULT_COALESCED_TYPES,
+        send_timeout: float = 10.0,
+    ):
+        """
+        Args:
+            queue_size: Max frames queued per client before the oldest are dropped
+            coalesce_interval: Seconds between coalesced delta flushes
+            coalesced_types: Event types merged into per-pipeline deltas
+            send_timeout: Seconds a single send may take before the client is dropped
+        """
+        self.queue_size = queue_size
+        self.coalesce_interval = coalesce_interval
+        self.coalesced_types = coalesced_types
+        self.send_timeout = send_timeout
+        self.clients: set[HubClient] = set()
+        # (event type, pipeline ID) -> {"count": n, "last": latest payload}
+        self._deltas: dict[tuple[str, str | None], dict[str, Any]] = {}
+        self._flush_task: asyncio.Task | None = None
+        # "dropped" counts frames lost by clients that have since disconnected
+        self._stats = {"published": 0, "coalesced": 0, "frames": 0, "dropped": 0}
+
+    def __len__(self) -> int:
+        return len(self.clients)
+
+    def start(self) -> None:
+        """Start the coalescing flush loop"""
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        """Stop flushing and disconnect every client"""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        for client in list(self.clients):
+            self.disconnect(client)
+            await self._close(client)
+
+    def connect(self, websocket: Any) -> HubClient:
+        """Register an accepted socket and start its sender task"""
+        client = HubClient(websocket, self.queue_size)
+        client.task = asyncio.create_task(self._sender(client))
+        self.clients.add(client)
+        return client
+
+    def disconnect(self, client: HubClient) -> None:
+        """Unregister a client, keeping its drop count, and stop its sender task"""
+        if client in self.clients:
+            self.clients.remove(client)
+            self._stats["dropped"] += client.dropped
+        if client.task is not None and client.task is not asyncio.current_task():
+            client.task.cancel()
+
+    async def _close(self, client: HubClient) -> None:
+        """Close a dropped client's socket, ignoring one that is already gone"""
+        with contextlib.suppress(Exception):
+            await asyncio.wait_for(client.websocket.close(), self.send_timeout)
+
+    def subscribe(
+        self,
+        client: HubClient,
+        types: list[str] | None = None,
+        pipelines: list[str] | None = None,
+    ) -> None:
+        """
+        Restrict a client to event types and/or pipelines (None means all)
+
+        Args:
+            client: Client to update
+            types: Event type values, e.g. ["candidate_found", "pipeline_update"]
+            pipelines: Pipeline IDs
+        """
+        client.types = set(types) if types is not None else None
+        client.pipelines = set(pipelines) if pipelines is not None else None
+
+    def handle_client_message(self, client: HubClient, text: str) -> None:
+        """
+        Apply a subscription request sent by a client
+
+        Accepts {"action": "subscribe", "types": [...], "pipelines": [...]} and
+        {"action": "unsubscribe"}; anything else (e.g. keep-alive pings) is ignored.
+        """
+        try:
+            request = json.loads(text)
+        except ValueError:
+            return
+        if not isinstance(request, dict):
+            return
+        if request.get("action") == "subscribe":
+            self.subscribe(client, request.get("types"), request.get("pipelines"))
+        elif request.get("action") == "unsubscribe":
+            self.subscribe(client)
+
+    def publish(self, message: AgentMessage) -> None:
+        """Queue an agent event for every interested client without awaiting"""
+        self._stats["published"] += 1
+        if not self.clients:
+            return
+
+        event_type = _type_value(message.message_type)
+        pipeline_id = message.payload.get("pipeline_id")
+
+        if event_type in self.coalesced_types:
+            delta = self._deltas.setdefault((event_type, pipeline_id), {"count": 0})
+            delta["count"] += 1
+            delta["last"] = message.payload
+            self._stats["coalesced"] += 1
+            return
+
+        self._fan_out(event_type, pipeline_id, message.payload)
+
+    def _fan_out(
+        self, event_type: str, pipeline_id: str | None, payload: dict[str, Any], **extra: Any
+    ) -> None:
+        recipients = [client for client in self.clients if client.wants(event_type, pipeline_id)]
+        if not recipients:
+            return
+
+        # Serialize once for all recipients
+        text = json.dumps(
+            {
+                "type": event_type,
+                "payload": payload,
+                "timestamp": datetime.utcnow().isoformat(),
+                **extra,
+            },
+            default=str,
+        )
+        frame = (event_type, pipeline_id, text)
+        for client in recipients:
+            client.offer(frame)
+        self._stats["frames"] += 1
+
+    def flush_deltas(self) -> None:
+        """Send one delta frame per (event type, pipeline) accumulated since the last flush"""
+        deltas, self._deltas = self._deltas, {}
+        for (event_type, pipeline_id), delta in deltas.items():
+            payload = {**delta["last"], "pipeline_id": pipeline_id, "count": delta["count"]}
+            self._fan_out(event_type, pipeline_id, payload, coalesced=True)
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.coalesce_interval)
+            try:
+                self.flush_deltas()
+            except Exception as e:
+                logger.error(f"Error flushing coalesced events: {e}")
+
+    async def _sender(self, client: HubClient) -> None:
+        try:
+            while True:
+                event_type, pipeline_id, text = await client.queue.get()
+                # Subscriptions may have changed while the frame was queued
+                if not client.wants(event_type, pipeline_id):
+                    continue
+                await asyncio.wait_for(client.websocket.send_text(text), self.send_timeout)
+                client.sent += 1
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.info(f"Dropping WebSocket client: {e}")
+            self.disconnect(client)
+            await self._close(client)
+
+    def metrics(self) -> dict[str, Any]:
+        """Fan-out statistics"""
+        return {
+            **self._stats,
+            "clients": len(self.clients),
+            "pending_deltas": len(self._deltas),
+            "queued": sum(client.queue.qsize() for client in self.clients),
+            "dropped": self._stats["dropped"] + sum(client.dropped for client in self.clients),
+        }
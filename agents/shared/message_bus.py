@@ -1,30 +1,75 @@
 """
 Redis-based message bus for inter-agent communication.
 Implements pub/sub pattern for event-driven agent collaboration.
+
+Publishing is batched through Redis pipelines; received messages are
+dispatched to per-topic worker pools so one slow callback cannot stall
+other topics, while messages sharing a correlation_id stay in order.
 """
 
 import asyncio
 import logging
-from collections.abc import Callable
+import zlib
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
 from typing import Any
 
 import redis.asyncio as redis
-
 from models import AgentMessage, MessagePriority, MessageType
 
 logger = logging.getLogger(__name__)
 
+# Called once all callbacks for a dispatched message have run; receives
+# whether every callback succeeded (transports use it to acknowledge)
+AckCallback = Callable[[bool], Awaitable[None]]
+
 
 class MessageBus:
     """Redis pub/sub message bus for agent communication"""
 
-    def __init__(self, redis_url: str = "redis://localhost:6379"):
+    def __init__(
+        self,
+        redis_url: str = "redis://localhost:6379",
+        batch_size: int = 100,
+        flush_interval: float = 0.005,
+        max_pending_publishes: int = 10_000,
+        workers_per_topic: int = 8,
+        worker_queue_size: int = 1_000,
+    ):
+        """
+        Args:
+            redis_url: Redis connection URL
+            batch_size: Max messages per pipelined publish (1 disables batching)
+            flush_interval: Seconds to wait for more messages before flushing
+            max_pending_publishes: Outbox size at which publish() waits for a flush
+            workers_per_topic: Concurrent callback workers per subscribed topic
+            worker_queue_size: Per-worker queue bound (listener blocks when full)
+        """
         self.redis_url = redis_url
         self.redis_client: redis.Redis | None = None
         self.pubsub: redis.client.PubSub | None = None
         self.subscriptions: dict[str, list[Callable]] = {}
         self.is_running = False
 
+        # Publish pipeline
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.max_pending_publishes = max_pending_publishes
+        self._outbox: list[tuple[str, str]] = []
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: asyncio.Task | None = None
+
+        # Dispatcher
+        self.workers_per_topic = max(1, workers_per_topic)
+        self.worker_queue_size = worker_queue_size
+        self._topic_queues: dict[str, list[asyncio.Queue]] = {}
+        self._worker_tasks: list[asyncio.Task] = []
+        self._in_flight = 0
+
+        # Metrics
+        self._publish_stats = {"published": 0, "batches": 0, "errors": 0}
+        self._topic_stats: dict[str, dict[str, float]] = {}
+
     async def connect(self):
         """Establish Redis connection"""
         try:
@@ -38,8 +83,19 @@ class MessageBus:
             raise
 
     async def disconnect(self):
-        """Close Redis connection"""
+        """Flush queued publishes, stop workers and close Redis connection"""
         self.is_running = False
+        if self.redis_client:
+            try:
+                await self.flush()
+            except Exception:
+                logger.error(f"Dropping {len(self._outbox)} unpublished messages on disconnect")
+        if self._flush_task and not self._flush_task.done():
+            self._flush_task.cancel()
+        for task in self._worker_tasks:
+            task.cancel()
+        self._worker_tasks.clear()
+        self._topic_queues.clear()
         if self.pubsub:
             await self.pubsub.unsubscribe()
             await self.pubsub.close()
@@ -51,6 +107,13 @@ class MessageBus:
         """
         Publish message to topic
 
+        With batching enabled the message is queued and sent with other
+        pending messages in one Redis pipeline, either when ``batch_size`` is
+        reached or after ``flush_interval``. Use ``flush()`` to wait for
+        delivery to Redis. When a flush triggered by this call (batch full
+        or outbox at ``max_pending_publishes``) fails, the error is raised
+        here and the queued messages are kept for the next flush.
+
         Args:
             topic: Topic/channel name
             message: AgentMessage to publish
@@ -58,13 +121,70 @@ class MessageBus:
         if not self.redis_client:
             await self.connect()
 
+        message_json = message.model_dump_json()
+
+        if self.batch_size == 1:
+            try:
+                await self._send(topic, message_json)
+                self._publish_stats["published"] += 1
+                logger.debug(f"Published to {topic}: {message.message_type}")
+            except Exception as e:
+                self._publish_stats["errors"] += 1
+                logger.error(f"Failed to publish message: {e}")
+                raise
+            return
+
+        # Backpressure: wait for the outbox to drain before queueing more
+        while len(self._outbox) >= self.max_pending_publishes:
+            await self.flush()
+
+        self._outbox.append((topic, message_json))
+        if len(self._outbox) >= self.batch_size:
+            await self.flush()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        """Flush the outbox after the batching window"""
+        await asyncio.sleep(self.flush_interval)
         try:
-            message_json = message.model_dump_json()
-            await self.redis_client.publish(topic, message_json)
-            logger.debug(f"Published to {topic}: {message.message_type}")
-        except Exception as e:
-            logger.error(f"Failed to publish message: {e}")
-            raise
+            await self.flush()
+        except Exception:
+            # Already logged; the batch is retried by the next publish or flush()
+            pass
+
+    async def flush(self) -> None:
+        """Send all queued messages using pipelined PUBLISH commands
+
+        A batch leaves the outbox only once its pipeline has executed. If it
+        fails, the error is raised and the batch stays at the front of the
+        outbox, to be retried by the next flush.
+        """
+        async with self._flush_lock:
+            while self._outbox:
+                batch = self._outbox[: self.batch_size]
+                try:
+                    async with self.redis_client.pipeline(transaction=False) as pipe:
+                        for topic, message_json in batch:
+                            self._queue_send(pipe, topic, message_json)
+                        await pipe.execute()
+                except Exception as e:
+                    self._publish_stats["errors"] += len(batch)
+                    logger.error(f"Failed to publish batch of {len(batch)} messages: {e}")
+                    raise
+                # Only this lock removes from the outbox; publishes while sending appended
+                del self._outbox[: len(batch)]
+                self._publish_stats["published"] += len(batch)
+                self._publish_stats["batches"] += 1
+                logger.debug(f"Published batch of {len(batch)} messages")
+
+    async def _send(self, topic: str, message_json: str) -> None:
+        """Transport hook: send one serialized message"""
+        await self.redis_client.publish(topic, message_json)
+
+    def _queue_send(self, pipe: Any, topic: str, message_json: str) -> None:
+        """Transport hook: add one serialized message to a Redis pipeline"""
+        pipe.publish(topic, message_json)
 
     async def publish_event(
         self,
@@ -141,16 +261,94 @@ class MessageBus:
                     break
 
                 if message["type"] == "message":
-                    await self._handle_message(message)
+                    await self._dispatch(message)
         except asyncio.CancelledError:
             logger.info("Message listener cancelled")
         except Exception as e:
             logger.error(f"Error in message listener: {e}")
             raise
 
+    async def _dispatch(self, raw_message: dict) -> None:
+        """
+        Route a received message to its topic's worker pool
+
+        Messages with a correlation_id always go to the same worker, so they
+        are delivered in order; others go to the least-loaded worker. When
+        the chosen worker queue is full the listener waits (backpressure).
+
+        Args:
+            raw_message: Raw Redis message
+        """
+        channel = raw_message["channel"]
+        if channel not in self.subscriptions:
+            return
+
+        try:
+            message = AgentMessage.model_validate_json(raw_message["data"])
+        except Exception as e:
+            logger.error(f"Error handling message: {e}")
+            return
+
+        await self._enqueue(channel, message)
+
+    async def _enqueue(
+        self, topic: str, message: AgentMessage, ack: AckCallback | None = None
+    ) -> None:
+        """Queue a parsed message on the topic worker chosen by correlation_id"""
+        queues = self._worker_queues(topic)
+        if message.correlation_id:
+            index = zlib.crc32(message.correlation_id.encode()) % len(queues)
+        else:
+            index = min(range(len(queues)), key=lambda i: queues[i].qsize())
+        self._in_flight += 1
+        await queues[index].put((message, ack))
+
+    def _worker_queues(self, topic: str) -> list[asyncio.Queue]:
+        """Get (lazily starting) the worker queues for a topic"""
+        queues = self._topic_queues.get(topic)
+        if queues is None:
+            queues = [
+                asyncio.Queue(maxsize=self.worker_queue_size) for _ in range(self.workers_per_topic)
+            ]
+            self._topic_queues[topic] = queues
+            for queue in queues:
+                self._worker_tasks.append(asyncio.create_task(self._worker(topic, queue)))
+        return queues
+
+    def _stats_for(self, topic: str) -> dict[str, float]:
+        """Get (creating) the dispatch counters for a topic"""
+        if topic not in self._topic_stats:
+            self._topic_stats[topic] = {
+                "delivered": 0,
+                "errors": 0,
+                "last_lag_seconds": 0.0,
+                "max_lag_seconds": 0.0,
+            }
+        return self._topic_stats[topic]
+
+    async def _worker(self, topic: str, queue: asyncio.Queue) -> None:
+        """Deliver queued messages for one topic, one at a time"""
+        stats = self._stats_for(topic)
+        while True:
+            message, ack = await queue.get()
+            try:
+                sent_at = message.timestamp
+                now = datetime.now(UTC) if sent_at.tzinfo else datetime.utcnow()
+                lag = max(0.0, (now - sent_at).total_seconds())
+                stats["last_lag_seconds"] = lag
+                stats["max_lag_seconds"] = max(stats["max_lag_seconds"], lag)
+                succeeded = await self._deliver(topic, message)
+                if ack:
+                    await ack(succeeded)
+            except Exception as e:
+                logger.error(f"Error acknowledging message on {topic}: {e}")
+            finally:
+                self._in_flight -= 1
+                queue.task_done()
+
     async def _handle_message(self, raw_message: dict) -> None:
         """
-        Handle received message
+        Handle received message inline (bypassing the worker pools)
 
         Args:
             raw_message: Raw Redis message
@@ -161,21 +359,62 @@ class MessageBus:
 
             # Parse message
             message = AgentMessage.model_validate_json(data)
-
-            # Call registered callbacks for this channel
-            if channel in self.subscriptions:
-                for callback in self.subscriptions[channel]:
-                    try:
-                        if asyncio.iscoroutinefunction(callback):
-                            await callback(message)
-                        else:
-                            callback(message)
-                    except Exception as e:
-                        logger.error(f"Error in callback for {channel}: {e}")
+            await self._deliver(channel, message)
 
         except Exception as e:
             logger.error(f"Error handling message: {e}")
 
+    async def _deliver(self, channel: str, message: AgentMessage) -> bool:
+        """
+        Call registered callbacks for this channel
+
+        Returns:
+            True if every callback completed without raising
+        """
+        stats = self._stats_for(channel)
+        succeeded = True
+        for callback in self.subscriptions.get(channel, []):
+            try:
+                if asyncio.iscoroutinefunction(callback):
+                    await callback(message)
+                else:
+                    callback(message)
+            except Exception as e:
+                succeeded = False
+                stats["errors"] += 1
+                logger.error(f"Error in callback for {channel}: {e}")
+        stats["delivered"] += 1
+        return succeeded
+
+    async def drain(self) -> None:
+        """Wait until every dispatched message has been delivered"""
+        for queues in list(self._topic_queues.values()):
+            for queue in queues:
+                await queue.join()
+
+    def metrics(self) -> dict[str, Any]:
+        """
+        Publish and dispatch metrics
+
+        Returns:
+            Publish counters, outbox depth, and per-topic queue depth,
+            delivered/error counts and delivery lag (seconds since publish)
+        """
+        topics = {}
+        for topic, stats in self._topic_stats.items():
+            queues = self._topic_queues.get(topic, [])
+            topics[topic] = {
+                **stats,
+                "queue_depth": sum(q.qsize() for q in queues),
+                "workers": len(queues),
+            }
+        return {
+            **self._publish_stats,
+            "pending_publishes": len(self._outbox),
+            "in_flight": self._in_flight,
+            "topics": topics,
+        }
+
     async def get_message_count(self, topic: str) -> int:
         """Get number of subscribers to a topic"""
         if not self.redis_client:
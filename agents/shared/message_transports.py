@@ -0,0 +1,378 @@
+"""
+Alternate MessageBus transports.
+
+- RedisStreamMessageBus: durable delivery on Redis Streams with consumer
+  groups, acknowledgements, pending-entry reclaim and batched reads, so
+  messages survive agent restarts and one agent can scale across processes.
+  Delivery is at-least-once: an entry reclaimed from a consumer that was
+  slow rather than dead is delivered twice, so callbacks should be
+  idempotent (e.g. keyed on message_id).
+- InMemoryMessageBus: in-process stand-in with the same API for tests and
+  single-process development.
+
+Use create_message_bus() to pick a transport from configuration; the
+Topics constants and publish_event() API are shared by all transports.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+from collections import deque
+from typing import Any
+
+from message_bus import MessageBus
+from models import AgentMessage
+
+logger = logging.getLogger(__name__)
+
+BACKEND_PUBSUB = "pubsub"
+BACKEND_STREAMS = "streams"
+BACKEND_MEMORY = "memory"
+
+
+class RedisStreamMessageBus(MessageBus):
+    """Redis Streams message bus with consumer groups"""
+
+    def __init__(
+        self,
+        redis_url: str = "redis://localhost:6379",
+        consumer_group: str = "agents",
+        consumer_name: str | None = None,
+        stream_prefix: str = "stream:",
+        stream_maxlen: int = 100_000,
+        read_count: int = 100,
+        block_ms: int = 1_000,
+        max_in_flight: int = 1_000,
+        claim_idle_ms: int = 60_000,
+        claim_interval: float = 30.0,
+        max_deliveries: int = 5,
+        group_start_id: str = "$",
+        **kwargs: Any,
+    ):
+        """
+        Args:
+            redis_url: Redis connection URL
+            consumer_group: Group shared by all replicas of one agent
+            consumer_name: Unique name of this process within the group
+            stream_prefix: Prefix for stream keys (topic "agents:x" -> "stream:agents:x")
+            stream_maxlen: Approximate max entries retained per stream
+            read_count: Max entries per XREADGROUP call
+            block_ms: XREADGROUP block timeout in milliseconds
+            max_in_flight: Max read-but-unacknowledged entries (backpressure)
+            claim_idle_ms: Idle time after which another consumer's entry is reclaimed
+            claim_interval: Seconds between pending-entry reclaim passes
+            max_deliveries: Deliveries after which an entry is moved to "<stream>:dead"
+            group_start_id: Where a newly created group starts reading. The default
+                "$" only delivers entries published after the group is created, so
+                a new agent does not replay the stream's history; "0" replays
+                everything still retained (up to stream_maxlen). Existing groups
+                keep their position either way
+            **kwargs: Batching/dispatch options passed to MessageBus
+        """
+        super().__init__(redis_url, **kwargs)
+        self.consumer_group = consumer_group
+        self.consumer_name = consumer_name or f"{socket.gethostname()}-{os.getpid()}"
+        self.stream_prefix = stream_prefix
+        self.stream_maxlen = stream_maxlen
+        self.read_count = read_count
+        self.block_ms = block_ms
+        self.max_in_flight = max_in_flight
+        self.claim_idle_ms = claim_idle_ms
+        self.claim_interval = claim_interval
+        self.max_deliveries = max_deliveries
+        self.group_start_id = group_start_id
+        # Entries read by this process and not yet processed; never reclaimed from ourselves
+        self._local_pending: set[str] = set()
+        self._claim_task: asyncio.Task | None = None
+        self._stream_stats = {"read": 0, "acked": 0, "reclaimed": 0, "dead_lettered": 0}
+
+    def _stream(self, topic: str) -> str:
+        return f"{self.stream_prefix}{topic}"
+
+    def _topic(self, stream: str) -> str:
+        return stream[len(self.stream_prefix) :]
+
+    async def _send(self, topic: str, message_json: str) -> None:
+        await self.redis_client.xadd(
+            self._stream(topic),
+            {"data": message_json},
+            maxlen=self.stream_maxlen,
+            approximate=True,
+        )
+
+    def _queue_send(self, pipe: Any, topic: str, message_json: str) -> None:
+        pipe.xadd(
+            self._stream(topic),
+            {"data": message_json},
+            maxlen=self.stream_maxlen,
+            approximate=True,
+        )
+
+    async def disconnect(self):
+        """Stop reclaiming, then flush and close as MessageBus does"""
+        if self._claim_task and not self._claim_task.done():
+            self._claim_task.cancel()
+        await super().disconnect()
+
+    async def subscribe(self, topics: list[str], callback) -> None:
+        """
+        Register callback and join the consumer group of each topic stream
+
+        Args:
+            topics: List of topic names to subscribe to
+            callback: Async function to call with received messages
+        """
+        if not self.redis_client:
+            await self.connect()
+
+        for topic in topics:
+            self.subscriptions.setdefault(topic, []).append(callback)
+            try:
+                await self.redis_client.xgroup_create(
+                    self._stream(topic),
+                    self.consumer_group,
+                    id=self.group_start_id,
+                    mkstream=True,
+                )
+            except Exception as e:
+                if "BUSYGROUP" not in str(e):
+                    raise
+        logger.info(f"Joined group '{self.consumer_group}' on streams: {topics}")
+
+    async def listen(self) -> None:
+        """
+        Read new entries for this consumer with XREADGROUP and dispatch them
+        Should be run as background task
+        """
+        if not self.subscriptions:
+            logger.error("No subscriptions found. Call subscribe() first.")
+            return
+
+        self.is_running = True
+        self._claim_task = asyncio.create_task(self._reclaim_loop())
+        logger.info(f"Starting stream consumer {self.consumer_name}...")
+
+        try:
+            while self.is_running:
+                capacity = min(self.read_count, self.max_in_flight - self._in_flight)
+                if capacity <= 0:
+                    # Backpressure: let workers catch up before reading more
+                    await asyncio.sleep(0.01)
+                    continue
+
+                response = await self.redis_client.xreadgroup(
+                    self.consumer_group,
+                    self.consumer_name,
+                    streams={self._stream(topic): ">" for topic in self.subscriptions},
+                    count=capacity,
+                    block=self.block_ms,
+                )
+                for stream, entries in response or []:
+                    await self._dispatch_entries(self._topic(stream), entries)
+        except asyncio.CancelledError:
+            logger.info("Stream consumer cancelled")
+        except Exception as e:
+            logger.error(f"Error in stream consumer: {e}")
+            raise
+
+    async def _dispatch_entries(self, topic: str, entries: list) -> None:
+        """Parse stream entries and hand them to the topic worker pool"""
+        stream = self._stream(topic)
+        for entry_id, fields in entries:
+            self._stream_stats["read"] += 1
+            try:
+                message = AgentMessage.model_validate_json(fields["data"])
+            except Exception as e:
+                logger.error(f"Dropping malformed entry {entry_id} on {stream}: {e}")
+                await self.redis_client.xack(stream, self.consumer_group, entry_id)
+                continue
+            self._local_pending.add(entry_id)
+            await self._enqueue(topic, message, self._make_ack(stream, entry_id))
+
+    def _make_ack(self, stream: str, entry_id: str):
+        async def ack(succeeded: bool) -> None:
+            self._local_pending.discard(entry_id)
+            # Failed entries stay pending and are redelivered by the reclaim loop
+            if succeeded:
+                await self.redis_client.xack(stream, self.consumer_group, entry_id)
+                self._stream_stats["acked"] += 1
+
+        return ack
+
+    async def _reclaim_loop(self) -> None:
+        """Periodically reclaim entries left pending by dead or failing consumers"""
+        while self.is_running:
+            await asyncio.sleep(self.claim_interval)
+            for topic in list(self.subscriptions):
+                try:
+                    await self.reclaim_pending(topic)
+                except Exception as e:
+                    logger.error(f"Pending reclaim failed for {topic}: {e}")
+
+    async def reclaim_pending(self, topic: str) -> int:
+        """
+        Claim idle pending entries of a topic for this consumer and redeliver them
+
+        Entries delivered more than max_deliveries times are copied to a
+        dead-letter stream and acknowledged instead. Entries still queued in
+        this process are skipped, but an entry claimed from another consumer
+        may also have been processed there (at-least-once delivery).
+
+        Returns:
+            Number of entries redelivered
+        """
+        stream = self._stream(topic)
+        pending = await self.redis_client.xpending_range(
+            stream,
+            self.consumer_group,
+            min="-",
+            max="+",
+            count=self.read_count,
+            idle=self.claim_idle_ms,
+        )
+        pending = [p for p in pending if p["message_id"] not in self._local_pending]
+        if not pending:
+            return 0
+
+        poisoned = [p["message_id"] for p in pending if p["times_delivered"] >= self.max_deliveries]
+        retry = [p["message_id"] for p in pending if p["times_delivered"] < self.max_deliveries]
+
+        if poisoned:
+            claimed = await self.redis_client.xclaim(
+                stream, self.consumer_group, self.consumer_name, self.claim_idle_ms, poisoned
+            )
+            for entry_id, fields in claimed:
+                await self.redis_client.xadd(
+                    f"{stream}:dead", fields, maxlen=self.stream_maxlen, approximate=True
+                )
+                await self.redis_client.xack(stream, self.consumer_group, entry_id)
+                self._stream_stats["dead_lettered"] += 1
+                logger.warning(f"Moved {entry_id} on {stream} to dead-letter stream")
+
+        if not retry:
+            return 0
+
+        claimed = await self.redis_client.xclaim(
+            stream, self.consumer_group, self.consumer_name, self.claim_idle_ms, retry
+        )
+        claimed = [(entry_id, fields) for entry_id, fields in claimed if fields]
+        self._stream_stats["reclaimed"] += len(claimed)
+        await self._dispatch_entries(topic, claimed)
+        return len(claimed)
+
+    async def get_message_count(self, topic: str) -> int:
+        """Get number of entries retained in a topic stream"""
+        if not self.redis_client:
+            await self.connect()
+        return await self.redis_client.xlen(self._stream(topic))
+
+    def metrics(self) -> dict[str, Any]:
+        return {**super().metrics(), "backend": BACKEND_STREAMS, **self._stream_stats}
+
+
+class InMemoryMessageBus(MessageBus):
+    """In-process message bus with the MessageBus API (no Redis required)"""
+
+    def __init__(self, redis_url: str = "memory://", backlog_size: int = 10_000, **kwargs: Any):
+        """
+        Args:
+            redis_url: Ignored; kept for signature compatibility
+            backlog_size: Messages retained per topic until a subscriber appears
+            **kwargs: Dispatch options passed to MessageBus
+        """
+        kwargs["batch_size"] = 1
+        super().__init__(redis_url, **kwargs)
+        self.backlog_size = backlog_size
+        self._backlog: dict[str, deque[str]] = {}
+        self._store: dict[str, str] = {}
+        self.connected = False
+
+    async def connect(self):
+        self.connected = True
+
+    async def disconnect(self):
+        self.is_running = False
+        self.connected = False
+        for task in self._worker_tasks:
+            task.cancel()
+        self._worker_tasks.clear()
+        self._topic_queues.clear()
+
+    async def publish(self, topic: str, message: AgentMessage) -> None:
+        """Deliver to subscribers, or keep in the topic backlog until one subscribes"""
+        message_json = message.model_dump_json()
+        self._publish_stats["published"] += 1
+        if topic in self.subscriptions:
+            await self._enqueue(topic, AgentMessage.model_validate_json(message_json))
+        else:
+            self._backlog.setdefault(topic, deque(maxlen=self.backlog_size)).append(message_json)
+
+    async def flush(self) -> None:
+        return None
+
+    async def subscribe(self, topics: list[str], callback) -> None:
+        for topic in topics:
+            self.subscriptions.setdefault(topic, []).append(callback)
+            for message_json in self._backlog.pop(topic, ()):
+                await self._enqueue(topic, AgentMessage.model_validate_json(message_json))
+
+    async def listen(self) -> None:
+        """Deliveries happen on publish; this only keeps the task API compatible"""
+        self.is_running = True
+        try:
+            while self.is_running:
+                await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            pass
+
+    async def get_message_count(self, topic: str) -> int:
+        return len(self.subscriptions.get(topic, []))
+
+    async def store_message(
+        self, key: str, message: AgentMessage, ttl_seconds: int | None = None
+    ) -> None:
+        self._store[key] = message.model_dump_json()
+
+    async def get_message(self, key: str) -> AgentMessage | None:
+        data = self._store.get(key)
+        return AgentMessage.model_validate_json(data) if data else None
+
+    async def list_active_topics(self) -> list[str]:
+        return list(self.subscriptions)
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            **super().metrics(),
+            "backend": BACKEND_MEMORY,
+            "backlog": {topic: len(items) for topic, items in self._backlog.items()},
+        }
+
+
+def create_message_bus(
+    redis_url: str = "redis://localhost:6379",
+    backend: str | None = None,
+    consumer_group: str = "agents",
+    **kwargs: Any,
+) -> MessageBus:
+    """
+    Create the message bus transport selected by configuration
+
+    Args:
+        redis_url: Redis connection URL
+        backend: "pubsub" (default), "streams" or "memory";
+            falls back to the MESSAGE_BUS_BACKEND environment variable
+        consumer_group: Consumer group for the streams backend (use the agent name)
+        **kwargs: Transport options
+
+    Returns:
+        A MessageBus instance
+    """
+    backend = (backend or os.getenv("MESSAGE_BUS_BACKEND", BACKEND_PUBSUB)).lower()
+    if backend == BACKEND_STREAMS:
+        return RedisStreamMessageBus(redis_url, consumer_group=consumer_group, **kwargs)
+    if backend == BACKEND_MEMORY:
+        return InMemoryMessageBus(redis_url, **kwargs)
+    if backend != BACKEND_PUBSUB:
+        raise ValueError(f"Unknown message bus backend: {backend}")
+    return MessageBus(redis_url, **kwargs)
@@ -0,0 +1,303 @@
+"""
+Indexed in-memory store for sourcing pipeline state.
+
+Keeps secondary indexes by project_id and state so listings touch only the
+matching pipelines, applies counter updates in place without awaiting (so
+they are atomic on the event loop), and periodically writes a JSON snapshot
+that is reloaded on restart.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import tempfile
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from itertools import islice
+from typing import Any
+
+from models import PipelineState, SourcingPipeline
+
+logger = logging.getLogger(__name__)
+
+COUNTER_FIELDS = frozenset(
+    {
+        "candidates_found",
+        "candidates_contacted",
+        "candidates_responded",
+        "interviews_scheduled",
+        "interviews_completed",
+    }
+)
+
+
+def _state_key(state: PipelineState | str) -> str:
+    return state.value if isinstance(state, PipelineState) else PipelineState(state).value
+
+
+class PipelineStore:
+    """
+    Pipeline registry with project/state indexes and snapshot persistence.
+
+    All mutations must go through the store so the indexes stay consistent;
+    pipelines returned by get() and query() should be treated as read-only.
+    """
+
+    def __init__(self, snapshot_path: str | None = None, snapshot_interval: float = 5.0):
+        """
+        Args:
+            snapshot_path: JSON snapshot file (None disables persistence);
+                defaults to the PIPELINE_SNAPSHOT_PATH environment variable
+            snapshot_interval: Seconds between snapshot writes while dirty
+        """
+        self.snapshot_path = snapshot_path or os.getenv("PIPELINE_SNAPSHOT_PATH") or None
+        self.snapshot_interval = snapshot_interval
+        # dicts double as insertion-ordered sets, so pages are stable between calls
+        self._pipelines: dict[str, SourcingPipeline] = {}
+        self._by_project: dict[str, dict[str, None]] = {}
+        self._by_state: dict[str, dict[str, None]] = {}
+        self._dirty = False
+        self._snapshot_task: asyncio.Task | None = None
+
+    def _index(self, pipeline: SourcingPipeline) -> None:
+        self._by_project.setdefault(pipeline.project_id, {})[pipeline.id] = None
+        self._by_state.setdefault(_state_key(pipeline.state), {})[pipeline.id] = None
+
+    def _unindex(self, pipeline: SourcingPipeline) -> None:
+        for index, key in (
+            (self._by_project, pipeline.project_id),
+            (self._by_state, _state_key(pipeline.state)),
+        ):
+            ids = index.get(key)
+            if ids is not None:
+                ids.pop(pipeline.id, None)
+                if not ids:
+                    del index[key]
+
+    def __contains__(self, pipeline_id: object) -> bool:
+        return pipeline_id in self._pipelines
+
+    def __len__(self) -> int:
+        return len(self._pipelines)
+
+    def __iter__(self) -> Iterator[SourcingPipeline]:
+        return iter(self._pipelines.values())
+
+    def get(self, pipeline_id: str) -> SourcingPipeline | None:
+        """Return a pipeline by ID, or None"""
+        return self._pipelines.get(pipeline_id)
+
+    def add(self, pipeline: SourcingPipeline) -> None:
+        """Insert or replace a pipeline"""
+        existing = self._pipelines.get(pipeline.id)
+        if existing is not None:
+            self._unindex(existing)
+        self._pipelines[pipeline.id] = pipeline
+        self._index(pipeline)
+        self._dirty = True
+
+    def remove(self, pipeline_id: str) -> SourcingPipeline | None:
+        """Remove a pipeline, returning it if it existed"""
+        pipeline = self._pipelines.pop(pipeline_id, None)
+        if pipeline is not None:
+            self._unindex(pipeline)
+            self._dirty = True
+        return pipeline
+
+    def touch(self, pipeline_id: str) -> None:
+        """Bump a pipeline's updated_at"""
+        pipeline = self._pipelines.get(pipeline_id)
+        if pipeline is not None:
+            pipeline.updated_at = datetime.utcnow()
+            self._dirty = True
+
+    def increment(self, pipeline_id: str, field: str, amount: int = 1) -> int | None:
+        """
+        Increment a pipeline counter
+
+        Runs without awaiting, so concurrent event handlers cannot interleave
+        between the read and the write.
+
+        Args:
+            pipeline_id: Pipeline ID
+            field: One of COUNTER_FIELDS
+            amount: Increment (may be negative)
+
+        Returns:
+            The new counter value, or None if the pipeline does not exist
+        """
+        if field not in COUNTER_FIELDS:
+            raise ValueError(f"Not a pipeline counter: {field}")
+        pipeline = self._pipelines.get(pipeline_id)
+        if pipeline is None:
+            return None
+        value = getattr(pipeline, field) + amount
+        setattr(pipeline, field, value)
+        pipeline.updated_at = datetime.utcnow()
+        self._dirty = True
+        return value
+
+    def set_state(self, pipeline_id: str, state: PipelineState | str) -> str | None:
+        """
+        Move a pipeline to a new state, keeping the state index current
+
+        Returns:
+            The previous state, or None if the pipeline does not exist
+        """
+        pipeline = self._pipelines.get(pipeline_id)
+        if pipeline is None:
+            return None
+        old_state = _state_key(pipeline.state)
+        new_state = _state_key(state)
+
+        old_ids = self._by_state.get(old_state)
+        if old_ids is not None:
+            old_ids.pop(pipeline_id, None)
+            if not old_ids:
+                del self._by_state[old_state]
+        self._by_state.setdefault(new_state, {})[pipeline_id] = None
+
+        pipeline.state = new_state
+        pipeline.updated_at = datetime.utcnow()
+        if new_state in (PipelineState.COMPLETED.value, PipelineState.FAILED.value):
+            pipeline.completed_at = pipeline.updated_at
+        self._dirty = True
+        return old_state
+
+    def _matching_ids(self, project_id: str | None, state: str | None) -> Iterable[str]:
+        if project_id is None and state is None:
+            return self._pipelines.keys()
+
+        project_ids = self._by_project.get(project_id, {}) if project_id is not None else None
+        state_ids = None
+        if state is not None:
+            try:
+                state_ids = self._by_state.get(_state_key(state), {})
+            except ValueError:
+                return []
+        if project_ids is None:
+            return state_ids.keys()
+        if state_ids is None:
+            return project_ids.keys()
+        # Walk the smaller index and probe the larger one
+        small, large = sorted((project_ids, state_ids), key=len)
+        return [pipeline_id for pipeline_id in small if pipeline_id in large]
+
+    def query(
+        self,
+        project_id: str | None = None,
+        state: PipelineState | str | None = None,
+        offset: int = 0,
+        limit: int = 50,
+    ) -> tuple[list[SourcingPipeline], int]:
+        """
+        Return one page of pipelines matching the filters
+
+        Args:
+            project_id: Optional project filter
+            state: Optional state filter
+            offset: Number of matching pipelines to skip
+            limit: Maximum pipelines to return
+
+        Returns:
+            Tuple of (pipelines on this page, total matching)
+        """
+        ids = self._matching_ids(project_id, state)
+        page = islice(ids, max(offset, 0), max(offset, 0) + max(limit, 0))
+        return [self._pipelines[pipeline_id] for pipeline_id in page], len(ids)
+
+    def count_by_state(self) -> dict[str, int]:
+        """Number of pipelines in each state"""
+        return {state: len(ids) for state, ids in self._by_state.items()}
+
+    def save_snapshot(self) -> bool:
+        """
+        Write all pipelines to the snapshot file if anything changed
+
+        The file is replaced atomically so a crash never leaves a partial snapshot.
+
+        Returns:
+            True if a snapshot was written
+        """
+        if not self.snapshot_path or not self._dirty:
+            return False
+        self._dirty = False
+        data = [pipeline.model_dump(mode="json") for pipeline in self._pipelines.values()]
+
+        directory = os.path.dirname(os.path.abspath(self.snapshot_path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({"saved_at": datetime.utcnow().isoformat(), "pipelines": data}, f)
+            os.replace(tmp_path, self.snapshot_path)
+        except Exception:
+            self._dirty = True
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        return True
+
+    def load_snapshot(self) -> int:
+        """
+        Restore pipelines from the snapshot file
+
+        Returns:
+            Number of pipelines restored
+        """
+        if not self.snapshot_path or not os.path.exists(self.snapshot_path):
+            return 0
+        with open(self.snapshot_path) as f:
+            data = json.load(f)
+
+        restored = 0
+        for item in data.get("pipelines", []):
+            try:
+                pipeline = SourcingPipeline.model_validate(item)
+            except Exception as e:
+                logger.warning(f"Skipping unreadable pipeline in snapshot: {e}")
+                continue
+            self.add(pipeline)
+            restored += 1
+        self._dirty = False
+        logger.info(f"Restored {restored} pipelines from {self.snapshot_path}")
+        return restored
+
+    async def _snapshot_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.snapshot_interval)
+            try:
+                self.save_snapshot()
+            except Exception as e:
+                logger.error(f"Pipeline snapshot failed: {e}")
+
+    def start(self) -> None:
+        """Load the last snapshot and start periodic snapshotting"""
+        if not self.snapshot_path:
+            return
+        try:
+            self.load_snapshot()
+        except Exception as e:
+            logger.error(f"Could not load pipeline snapshot: {e}")
+        if self._snapshot_task is None:
+            self._snapshot_task = asyncio.create_task(self._snapshot_loop())
+
+    async def stop(self) -> None:
+        """Stop snapshotting and write a final snapshot"""
+        if self._snapshot_task is not None:
+            self._snapshot_task.cancel()
+            self._snapshot_task = None
+        try:
+            self.save_snapshot()
+        except Exception as e:
+            logger.error(f"Final pipeline snapshot failed: {e}")
+
+    def stats(self) -> dict[str, Any]:
+        """Store statistics"""
+        return {
+            "pipelines": len(self._pipelines),
+            "projects": len(self._by_project),
+            "by_state": self.count_by_state(),
+            "snapshot_path": self.snapshot_path,
+        }
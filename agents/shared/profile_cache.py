@@ -0,0 +1,337 @@
+"""
+Persistent profile cache shared by sourcing agents and scout-service.
+SQLite-backed, keyed by canonical profile URL, with TTL, ETag revalidation,
+stale-while-revalidate refresh and size-bounded LRU eviction.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "opentalent", "profile_cache.sqlite3"
+)
+
+# Fetch callback: receives the cached ETag (or None) and returns
+# (payload, etag). A None payload means "not modified".
+FetchCallback = Callable[[str | None], Awaitable[tuple[Any | None, str | None]]]
+
+
+@dataclass
+class CacheEntry:
+    """A cached profile payload and its freshness metadata"""
+
+    url: str
+    payload: Any
+    etag: str | None
+    fetched_at: float
+    expires_at: float
+    stale_until: float
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    @property
+    def is_usable(self) -> bool:
+        """Fresh, or stale but still inside the stale-while-revalidate window"""
+        return time.time() < self.stale_until
+
+
+def canonical_profile_url(url: str) -> str:
+    """
+    Normalize a profile URL so equivalent spellings share one cache key.
+
+    Lower-cases scheme and host, forces https, drops "www.", query string,
+    fragment and trailing slashes. Bare identifiers (no scheme) are kept as-is.
+    """
+    url = url.strip()
+    if "://" not in url:
+        if "/" not in url or "." not in url.split("/")[0]:
+            return url
+        url = f"https://{url}"
+
+    parts = urlsplit(url)
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    path = parts.path.rstrip("/")
+    if host in ("github.com", "linkedin.com", "stackoverflow.com"):
+        path = path.lower()
+    return f"https://{host}{path}"
+
+
+class ProfileCache:
+    """
+    Disk-backed profile cache with TTL and ETag revalidation.
+
+    Several processes may share one database file. Each consumer picks a
+    namespace (payload shape) and its own TTL; freshness is evaluated at read
+    time, so different consumers can apply different TTLs to the same store.
+    max_entries bounds each namespace separately, so one busy consumer never
+    evicts another's entries.
+    """
+
+    def __init__(
+        self,
+        path: str | None = None,
+        ttl_seconds: float | None = None,
+        stale_seconds: float | None = None,
+        max_entries: int | None = None,
+        namespace: str = "profile",
+    ):
+        self.namespace = namespace
+        self.path = path or os.getenv("PROFILE_CACHE_PATH", DEFAULT_CACHE_PATH)
+        self.ttl_seconds = (
+            ttl_seconds
+            if ttl_seconds is not None
+            else float(os.getenv("PROFILE_CACHE_TTL_SECONDS", 30 * 24 * 3600))
+        )
+        self.stale_seconds = (
+            stale_seconds
+            if stale_seconds is not None
+            else float(os.getenv("PROFILE_CACHE_STALE_SECONDS", 7 * 24 * 3600))
+        )
+        self.max_entries = (
+            max_entries
+            if max_entries is not None
+            else int(os.getenv("PROFILE_CACHE_MAX_ENTRIES", 100_000))
+        )
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self._lock = threading.Lock()
+        self._refreshing: set[str] = set()
+        self._refresh_tasks: set[asyncio.Task] = set()
+        self._conn = self._open()
+        self._count = self._namespace_size()
+
+    def _open(self) -> sqlite3.Connection:
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS profiles (
+                namespace TEXT NOT NULL,
+                url TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                etag TEXT,
+                fetched_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                PRIMARY KEY (namespace, url)
+            )
+            """
+        )
+        conn.execute("DROP INDEX IF EXISTS idx_profiles_accessed")
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_profiles_namespace_accessed "
+            "ON profiles(namespace, accessed_at)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_profiles_fetched ON profiles(fetched_at)")
+        return conn
+
+    def close(self) -> None:
+        """Cancel pending background refreshes and close the database connection"""
+        for task in list(self._refresh_tasks):
+            task.cancel()
+        with self._lock:
+            self._conn.close()
+
+    def _namespace_size(self) -> int:
+        return self._conn.execute(
+            "SELECT COUNT(*) FROM profiles WHERE namespace = ?", (self.namespace,)
+        ).fetchone()[0]
+
+    def _entry(self, url: str, payload: str, etag: str | None, fetched_at: float) -> CacheEntry:
+        expires_at = fetched_at + self.ttl_seconds
+        return CacheEntry(
+            url=url,
+            payload=json.loads(payload),
+            etag=etag,
+            fetched_at=fetched_at,
+            expires_at=expires_at,
+            stale_until=expires_at + self.stale_seconds,
+        )
+
+    def get(self, url: str) -> CacheEntry | None:
+        """Return the cached entry for a profile URL (fresh or not), or None"""
+        key = canonical_profile_url(url)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, etag, fetched_at FROM profiles WHERE namespace = ? AND url = ?",
+                (self.namespace, key),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE profiles SET accessed_at = ? WHERE namespace = ? AND url = ?",
+                (time.time(), self.namespace, key),
+            )
+        return self._entry(key, *row)
+
+    def set(self, url: str, payload: Any, etag: str | None = None) -> None:
+        """Store (or replace) a profile payload and evict beyond max_entries"""
+        key = canonical_profile_url(url)
+        now = time.time()
+        with self._lock:
+            exists = self._conn.execute(
+                "SELECT 1 FROM profiles WHERE namespace = ? AND url = ?", (self.namespace, key)
+            ).fetchone()
+            self._conn.execute(
+                """
+                INSERT INTO profiles (namespace, url, payload, etag, fetched_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(namespace, url) DO UPDATE SET
+                    payload = excluded.payload,
+                    etag = excluded.etag,
+                    fetched_at = excluded.fetched_at,
+                    accessed_at = excluded.accessed_at
+                """,
+                (self.namespace, key, json.dumps(payload, default=str), etag, now, now),
+            )
+            if not exists:
+                self._count += 1
+                if self._count > self.max_entries:
+                    self._evict()
+
+    def touch(self, url: str) -> None:
+        """Mark a cached entry as revalidated (e.g. after a 304 Not Modified)"""
+        key = canonical_profile_url(url)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE profiles SET fetched_at = ?, accessed_at = ? "
+                "WHERE namespace = ? AND url = ?",
+                (now, now, self.namespace, key),
+            )
+
+    def delete(self, url: str) -> None:
+        """Remove a profile from the cache"""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM profiles WHERE namespace = ? AND url = ?",
+                (self.namespace, canonical_profile_url(url)),
+            )
+            self._count -= cursor.rowcount
+
+    def __len__(self) -> int:
+        """Number of entries in this cache's namespace"""
+        return self._count
+
+    def _evict(self) -> None:
+        """Drop this namespace's least-recently-used rows down to 90% of max_entries
+
+        The caller holds the lock.
+        """
+        # Re-read the real size: other processes may share the same file
+        self._count = self._namespace_size()
+        if self._count <= self.max_entries:
+            return
+        overflow = self._count - int(self.max_entries * 0.9)
+        if overflow > 0:
+            self._conn.execute(
+                """
+                DELETE FROM profiles WHERE rowid IN (
+                    SELECT rowid FROM profiles WHERE namespace = ?
+                    ORDER BY accessed_at ASC LIMIT ?
+                )
+                """,
+                (self.namespace, overflow),
+            )
+            self._count -= overflow
+
+    def purge_expired(self) -> int:
+        """Delete entries past their stale-while-revalidate window"""
+        cutoff = time.time() - self.ttl_seconds - self.stale_seconds
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM profiles WHERE namespace = ? AND fetched_at < ?",
+                (self.namespace, cutoff),
+            )
+            self._count = self._namespace_size()
+            return cursor.rowcount
+
+    async def _revalidate(self, key: str, etag: str | None, fetch: FetchCallback) -> Any | None:
+        self.revalidations += 1
+        payload, new_etag = await fetch(etag)
+        if payload is None:
+            self.touch(key)
+            return None
+        self.set(key, payload, new_etag)
+        return payload
+
+    async def _refresh_in_background(self, key: str, etag: str | None, fetch: FetchCallback):
+        try:
+            await self._revalidate(key, etag, fetch)
+        except Exception as e:
+            logger.warning(f"Background refresh failed for {key}: {e}")
+        finally:
+            self._refreshing.discard(key)
+
+    async def get_or_fetch(self, url: str, fetch: FetchCallback) -> Any | None:
+        """
+        Read-through lookup with stale-while-revalidate semantics.
+
+        Fresh entries are returned without I/O. Stale entries inside the
+        stale window are returned immediately while a single background task
+        revalidates them with the stored ETag. Missing or expired entries are
+        fetched (conditionally, if an ETag is known) before returning.
+
+        Args:
+            url: Profile URL (any spelling; it is canonicalized)
+            fetch: Callback receiving the cached ETag and returning (payload, etag)
+
+        Returns:
+            The profile payload, or None if it could not be fetched
+        """
+        key = canonical_profile_url(url)
+        entry = self.get(key)
+
+        if entry and entry.is_fresh:
+            self.hits += 1
+            return entry.payload
+
+        if entry and entry.is_usable:
+            self.stale_hits += 1
+            if key not in self._refreshing:
+                self._refreshing.add(key)
+                # Keep a reference so the task is not garbage-collected mid-refresh
+                task = asyncio.create_task(self._refresh_in_background(key, entry.etag, fetch))
+                self._refresh_tasks.add(task)
+                task.add_done_callback(self._refresh_tasks.discard)
+            return entry.payload
+
+        self.misses += 1
+        payload = await self._revalidate(key, entry.etag if entry else None, fetch)
+        if payload is None and entry is not None:
+            return entry.payload
+        return payload
+
+    def stats(self) -> dict[str, Any]:
+        """Cache statistics"""
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "cached_profiles": len(self),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "hit_rate": (self.hits + self.stale_hits) / lookups if lookups else 0.0,
+            "max_entries": self.max_entries,
+            "namespace": self.namespace,
+            "path": self.path,
+        }
@@ -342,6 +342,21 @@ class GenkitServiceClient(BaseServiceClient):
             json={"name": name, "skills": skills, "experience": experience},
         )
 
+    async def score_candidates_quality_batch(
+        self, candidates: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """
+        Score a batch of candidates (max 50) with one request
+
+        Args:
+            candidates: Dicts with name, skills and experience
+
+        Returns:
+            One dict with score, reasoning, and qualityLevel per candidate, in order
+        """
+        response = await self.post("/scoreCandidateQualityBatch", json={"candidates": candidates})
+        return response.get("results", [])
+
 
 # Service client factory
 class ServiceClients:
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# The shared modules import each other as top-level modules (``from models import ...``)
+shared_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if shared_root not in sys.path:
+    sys.path.insert(0, shared_root)
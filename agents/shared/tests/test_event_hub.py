@@ -0,0 +1,67 @@
+"""
+Tests for the WebSocket EventHub
+"""
+
+import asyncio
+
+import pytest
+from event_hub import EventHub
+from models import AgentMessage, MessageType
+
+
+class FakeSocket:
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.sent = []
+        self.closed = False
+
+    async def send_text(self, text):
+        if self.fail:
+            raise ConnectionResetError("connection reset")
+        self.sent.append(text)
+
+    async def close(self):
+        self.closed = True
+
+
+def update(pipeline_id):
+    return AgentMessage(
+        source_agent="test",
+        message_type=MessageType.PIPELINE_UPDATE,
+        payload={"pipeline_id": pipeline_id},
+    )
+
+
+@pytest.mark.asyncio
+async def test_failing_socket_is_dropped_and_closed():
+    hub = EventHub()
+    healthy, broken = FakeSocket(), FakeSocket(fail=True)
+    healthy_client = hub.connect(healthy)
+    broken_client = hub.connect(broken)
+
+    hub.publish(update("p1"))
+    await asyncio.wait_for(broken_client.task, 1)
+    while healthy_client.queue.qsize():
+        await asyncio.sleep(0)
+
+    assert broken.closed
+    assert len(hub) == 1
+    assert len(healthy.sent) == 1
+    assert not healthy.closed
+    await hub.stop()
+    assert healthy.closed
+
+
+@pytest.mark.asyncio
+async def test_dropped_frames_are_still_counted_after_disconnect():
+    hub = EventHub(queue_size=1)
+    client = hub.connect(FakeSocket())
+
+    for pipeline_id in ("p1", "p2", "p3"):
+        hub.publish(update(pipeline_id))
+    assert hub.metrics()["dropped"] == 2
+
+    hub.disconnect(client)
+    hub.disconnect(client)
+    assert hub.metrics()["dropped"] == 2
+    await hub.stop()
@@ -0,0 +1,110 @@
+"""
+Tests for batched publishing in MessageBus
+"""
+
+import asyncio
+
+import pytest
+from message_bus import MessageBus
+from models import AgentMessage, MessageType
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def publish(self, topic, message_json):
+        self.commands.append((topic, message_json))
+
+    async def execute(self):
+        await asyncio.sleep(0)
+        if self.redis.fail:
+            raise ConnectionError("redis unavailable")
+        self.redis.batches.append(self.commands)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.batches = []
+        self.fail = False
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+def make_bus(**kwargs):
+    bus = MessageBus(**kwargs)
+    bus.redis_client = FakeRedis()
+    return bus
+
+
+def message(n):
+    return AgentMessage(
+        source_agent="test", message_type=MessageType.PIPELINE_UPDATE, payload={"n": n}
+    )
+
+
+def sent(bus):
+    return [
+        AgentMessage.model_validate_json(data).payload["n"]
+        for batch in bus.redis_client.batches
+        for _, data in batch
+    ]
+
+
+@pytest.mark.asyncio
+async def test_full_batch_is_flushed_by_publish():
+    bus = make_bus(batch_size=3, flush_interval=60)
+    for n in range(3):
+        await bus.publish("agents:system", message(n))
+
+    assert sent(bus) == [0, 1, 2]
+    assert len(bus.redis_client.batches) == 1
+    assert bus.metrics()["pending_publishes"] == 0
+
+
+@pytest.mark.asyncio
+async def test_partial_batch_is_flushed_after_interval():
+    bus = make_bus(batch_size=100, flush_interval=0.01)
+    await bus.publish("agents:system", message(0))
+    await bus.publish("agents:system", message(1))
+    assert sent(bus) == []
+
+    await asyncio.sleep(0.05)
+    assert sent(bus) == [0, 1]
+    assert bus.metrics()["batches"] == 1
+
+
+@pytest.mark.asyncio
+async def test_full_outbox_applies_backpressure():
+    bus = make_bus(batch_size=100, flush_interval=60, max_pending_publishes=2)
+    for n in range(3):
+        await bus.publish("agents:system", message(n))
+
+    # The third publish waited for the first two to be sent
+    assert sent(bus) == [0, 1]
+    assert bus.metrics()["pending_publishes"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_raised_and_kept_for_retry():
+    bus = make_bus(batch_size=2, flush_interval=60)
+    bus.redis_client.fail = True
+    await bus.publish("agents:system", message(0))
+    with pytest.raises(ConnectionError):
+        await bus.publish("agents:system", message(1))
+    assert bus.metrics()["pending_publishes"] == 2
+    assert bus.metrics()["errors"] == 2
+
+    bus.redis_client.fail = False
+    await bus.publish("agents:system", message(2))
+    await bus.flush()
+    assert sent(bus) == [0, 1, 2]
+    assert bus.metrics()["published"] == 3
@@ -0,0 +1,148 @@
+"""
+Tests for the in-memory and Redis Streams MessageBus transports
+"""
+
+import pytest
+from message_transports import InMemoryMessageBus, RedisStreamMessageBus
+from models import AgentMessage, MessageType
+
+
+def message(n, correlation_id=None):
+    return AgentMessage(
+        source_agent="test",
+        message_type=MessageType.PIPELINE_UPDATE,
+        payload={"n": n},
+        correlation_id=correlation_id,
+    )
+
+
+class TestInMemoryMessageBus:
+    @pytest.mark.asyncio
+    async def test_publish_fans_out_to_every_callback(self):
+        bus = InMemoryMessageBus()
+        first, second = [], []
+        await bus.subscribe(["agents:pipeline"], lambda m: first.append(m.payload["n"]))
+        await bus.subscribe(["agents:pipeline"], lambda m: second.append(m.payload["n"]))
+
+        for n in range(3):
+            await bus.publish("agents:pipeline", message(n, correlation_id="c1"))
+        await bus.drain()
+
+        assert first == second == [0, 1, 2]
+        await bus.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_backlog_is_delivered_on_subscribe(self):
+        bus = InMemoryMessageBus(backlog_size=2)
+        for n in range(3):
+            await bus.publish("agents:pipeline", message(n))
+        received = []
+        await bus.subscribe(["agents:pipeline"], lambda m: received.append(m.payload["n"]))
+        await bus.drain()
+
+        assert sorted(received) == [1, 2]
+        await bus.disconnect()
+
+
+class FakeStreamRedis:
+    """Just enough of the Redis Streams API for RedisStreamMessageBus"""
+
+    def __init__(self):
+        self.groups = {}
+        self.entries = {}
+        self.pending = []
+        self.acked = []
+        self.added = []
+
+    async def xgroup_create(self, stream, group, id, mkstream=False):
+        if (stream, group) in self.groups:
+            raise Exception("BUSYGROUP Consumer Group name already exists")
+        self.groups[(stream, group)] = (id, mkstream)
+
+    async def xack(self, stream, group, entry_id):
+        self.acked.append(entry_id)
+
+    async def xadd(self, stream, fields, maxlen=None, approximate=True):
+        self.added.append((stream, fields))
+
+    async def xpending_range(self, stream, group, min, max, count, idle):
+        return self.pending
+
+    async def xclaim(self, stream, group, consumer, min_idle_time, ids):
+        return [(entry_id, self.entries[entry_id]) for entry_id in ids]
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def stream_bus():
+    bus = RedisStreamMessageBus(consumer_group="scout", consumer_name="scout-1")
+    bus.redis_client = FakeStreamRedis()
+    return bus
+
+
+class TestRedisStreamMessageBus:
+    @pytest.mark.asyncio
+    async def test_group_is_created_once_at_the_stream_tail(self, stream_bus):
+        await stream_bus.subscribe(["agents:pipeline"], lambda m: None)
+        await stream_bus.subscribe(["agents:pipeline"], lambda m: None)
+
+        assert stream_bus.redis_client.groups == {("stream:agents:pipeline", "scout"): ("$", True)}
+        assert len(stream_bus.subscriptions["agents:pipeline"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_replaying_history_is_opt_in(self):
+        bus = RedisStreamMessageBus(consumer_group="scout", group_start_id="0")
+        bus.redis_client = FakeStreamRedis()
+        await bus.subscribe(["agents:pipeline"], lambda m: None)
+
+        assert bus.redis_client.groups == {("stream:agents:pipeline", "scout"): ("0", True)}
+
+    @pytest.mark.asyncio
+    async def test_entries_are_acked_only_after_successful_delivery(self, stream_bus):
+        def callback(m):
+            if m.payload["n"] == 1:
+                raise RuntimeError("handler failed")
+
+        await stream_bus.subscribe(["agents:pipeline"], callback)
+        await stream_bus._dispatch_entries(
+            "agents:pipeline",
+            [
+                ("1-0", {"data": message(0).model_dump_json()}),
+                ("2-0", {"data": message(1).model_dump_json()}),
+                ("3-0", {"data": "not json"}),
+            ],
+        )
+        await stream_bus.drain()
+
+        # The malformed entry is acked and dropped; the failed one stays pending
+        assert sorted(stream_bus.redis_client.acked) == ["1-0", "3-0"]
+        await stream_bus.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_reclaim_redelivers_and_dead_letters(self, stream_bus):
+        redis = stream_bus.redis_client
+        received = []
+        await stream_bus.subscribe(["agents:pipeline"], lambda m: received.append(m.payload["n"]))
+        redis.entries = {
+            "1-0": {"data": message(1).model_dump_json()},
+            "2-0": {"data": message(2).model_dump_json()},
+            "3-0": {"data": message(3).model_dump_json()},
+        }
+        redis.pending = [
+            {"message_id": "1-0", "times_delivered": 1},
+            {"message_id": "2-0", "times_delivered": stream_bus.max_deliveries},
+            {"message_id": "3-0", "times_delivered": 1},
+        ]
+        # 3-0 is still queued in this process, so it must not be claimed again
+        stream_bus._local_pending.add("3-0")
+
+        assert await stream_bus.reclaim_pending("agents:pipeline") == 1
+        await stream_bus.drain()
+
+        assert received == [1]
+        assert redis.added == [("stream:agents:pipeline:dead", redis.entries["2-0"])]
+        assert sorted(redis.acked) == ["1-0", "2-0"]
+        assert stream_bus.metrics()["reclaimed"] == 1
+        await stream_bus.disconnect()
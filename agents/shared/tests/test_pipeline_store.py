@@ -0,0 +1,102 @@
+"""
+Tests for the indexed PipelineStore
+"""
+
+import asyncio
+
+import pytest
+from models import PipelineState, SourcingPipeline
+from pipeline_store import PipelineStore
+
+
+def pipeline(pipeline_id, project_id="p1", state=PipelineState.INITIATED):
+    return SourcingPipeline(
+        id=pipeline_id, project_id=project_id, job_description="Backend engineer", state=state
+    )
+
+
+def test_upsert_replaces_and_reindexes():
+    store = PipelineStore()
+    store.add(pipeline("a"))
+    store.add(pipeline("a", project_id="p2", state=PipelineState.SCANNING))
+
+    assert len(store) == 1
+    assert store.get("a").project_id == "p2"
+    assert store.get("missing") is None
+    assert store.query(project_id="p1") == ([], 0)
+    assert store.count_by_state() == {"scanning": 1}
+
+    assert store.remove("a").id == "a"
+    assert store.remove("a") is None
+    assert "a" not in store
+    assert store.stats()["projects"] == 0
+
+
+def test_status_queries_use_the_indexes():
+    store = PipelineStore()
+    for i in range(5):
+        store.add(pipeline(f"p1-{i}"))
+    store.add(pipeline("p2-0", project_id="p2"))
+    store.set_state("p1-1", PipelineState.COMPLETED)
+    store.set_state("p1-3", "completed")
+
+    assert store.set_state("missing", PipelineState.FAILED) is None
+    assert store.count_by_state() == {"initiated": 4, "completed": 2}
+
+    page, total = store.query(project_id="p1", state=PipelineState.INITIATED, limit=2)
+    assert total == 3
+    assert [p.id for p in page] == ["p1-0", "p1-2"]
+    page, total = store.query(state="completed")
+    assert (total, {p.id for p in page}) == (2, {"p1-1", "p1-3"})
+    assert store.get("p1-1").completed_at is not None
+
+    assert store.query(state="not-a-state") == ([], 0)
+    page, total = store.query(offset=4, limit=10)
+    assert (total, [p.id for p in page]) == (6, ["p1-4", "p2-0"])
+
+
+def test_increment_updates_counters_in_place():
+    store = PipelineStore()
+    store.add(pipeline("a"))
+
+    assert store.increment("a", "candidates_found", 3) == 3
+    assert store.increment("a", "candidates_found", -1) == 2
+    assert store.increment("missing", "candidates_found") is None
+    with pytest.raises(ValueError):
+        store.increment("a", "project_id")
+
+
+def test_state_survives_reopening(tmp_path):
+    path = str(tmp_path / "snapshots" / "pipelines.json")
+    store = PipelineStore(snapshot_path=path)
+    assert store.save_snapshot() is False
+
+    store.add(pipeline("a"))
+    store.add(pipeline("b", project_id="p2"))
+    store.increment("a", "interviews_scheduled")
+    store.set_state("b", PipelineState.ENGAGING)
+    assert store.save_snapshot() is True
+    assert store.save_snapshot() is False
+
+    reopened = PipelineStore(snapshot_path=path)
+    assert reopened.load_snapshot() == 2
+    assert reopened.get("a").interviews_scheduled == 1
+    assert [p.id for p in reopened.query(state=PipelineState.ENGAGING)[0]] == ["b"]
+    assert reopened.query(project_id="p2")[1] == 1
+
+
+@pytest.mark.asyncio
+async def test_stop_writes_a_final_snapshot(tmp_path):
+    path = str(tmp_path / "pipelines.json")
+    store = PipelineStore(snapshot_path=path, snapshot_interval=60)
+    store.start()
+    store.add(pipeline("a"))
+    await asyncio.sleep(0)
+    await store.stop()
+
+    reopened = PipelineStore(snapshot_path=path)
+    reopened.start()
+    try:
+        assert "a" in reopened
+    finally:
+        await reopened.stop()
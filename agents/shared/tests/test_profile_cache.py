@@ -0,0 +1,102 @@
+"""
+Tests for the persistent ProfileCache
+"""
+
+import asyncio
+
+import pytest
+from profile_cache import ProfileCache, canonical_profile_url
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "profile_cache.sqlite3")
+
+
+def test_equivalent_urls_share_one_key():
+    assert canonical_profile_url("http://www.GitHub.com/OctoCat/?tab=repos") == (
+        "https://github.com/octocat"
+    )
+    assert canonical_profile_url("github.com/octocat") == "https://github.com/octocat"
+    assert canonical_profile_url("octocat") == "octocat"
+
+
+@pytest.mark.asyncio
+async def test_fresh_and_not_modified_entries_skip_the_payload_fetch(path):
+    cache = ProfileCache(path=path, ttl_seconds=60, stale_seconds=0)
+    calls = []
+
+    async def fetch(etag):
+        calls.append(etag)
+        return ({"login": "octocat"}, '"v1"') if etag is None else (None, etag)
+
+    assert await cache.get_or_fetch("https://github.com/octocat", fetch) == {"login": "octocat"}
+    assert await cache.get_or_fetch("github.com/OctoCat/", fetch) == {"login": "octocat"}
+    assert calls == [None]
+
+    cache.ttl_seconds = 0
+    assert await cache.get_or_fetch("https://github.com/octocat", fetch) == {"login": "octocat"}
+    assert calls == [None, '"v1"']
+    assert cache.stats()["misses"] == 2
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_served_while_one_refresh_runs(path):
+    cache = ProfileCache(path=path, ttl_seconds=0, stale_seconds=60)
+    cache.set("https://github.com/octocat", {"v": 1}, '"v1"')
+    release = asyncio.Event()
+    calls = []
+
+    async def fetch(etag):
+        calls.append(etag)
+        await release.wait()
+        return {"v": 2}, '"v2"'
+
+    assert await cache.get_or_fetch("https://github.com/octocat", fetch) == {"v": 1}
+    assert await cache.get_or_fetch("https://github.com/octocat", fetch) == {"v": 1}
+    await asyncio.sleep(0)
+    assert calls == ['"v1"']
+    assert len(cache._refresh_tasks) == 1
+
+    release.set()
+    await asyncio.gather(*cache._refresh_tasks)
+    assert not cache._refresh_tasks
+    assert cache.get("https://github.com/octocat").payload == {"v": 2}
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_pending_refreshes(path):
+    cache = ProfileCache(path=path, ttl_seconds=0, stale_seconds=60)
+    cache.set("https://github.com/octocat", {"v": 1})
+
+    async def fetch(etag):
+        await asyncio.Event().wait()
+
+    await cache.get_or_fetch("https://github.com/octocat", fetch)
+    await asyncio.sleep(0)
+    (task,) = cache._refresh_tasks
+    cache.close()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert not cache._refreshing
+
+
+def test_eviction_stays_inside_the_namespace(path):
+    busy = ProfileCache(path=path, max_entries=10, namespace="github")
+    quiet = ProfileCache(path=path, max_entries=10, namespace="enrichment")
+    quiet.set("https://linkedin.com/in/jane", {"name": "Jane"})
+
+    for i in range(25):
+        busy.set(f"https://github.com/user{i}", {"id": i})
+
+    assert len(busy) <= 10
+    assert busy.get("https://github.com/user0") is None
+    assert busy.get("https://github.com/user24") is not None
+    assert quiet.get("https://linkedin.com/in/jane").payload == {"name": "Jane"}
+
+    reopened = ProfileCache(path=path, namespace="enrichment")
+    assert len(reopened) == 1
+    for cache in (busy, quiet, reopened):
+        cache.close()
@@ -21,6 +21,7 @@ from agents.shared import (
     MessageBus,
     MessageType,
     Topics,
+    create_message_bus,
     get_config,
 )
 
@@ -39,7 +40,9 @@ async def lifespan(app: FastAPI):
     global message_bus
 
     logger.info("Starting Tool Leverage Agent...")
-    message_bus = MessageBus(config.redis_url)
+    message_bus = create_message_bus(
+        config.redis_url, backend=config.message_bus_backend, consumer_group="tool-leverage"
+    )
     await message_bus.connect()
 
     # Subscribe to sync requests
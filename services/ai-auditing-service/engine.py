@@ -0,0 +1,281 @@
+"""Audit engine: runs the checks from ``rules.CHECKS`` over a target tree.
+
+Files are hashed and checked in a process pool, a batch of files per task.
+Results are cached per file in SQLite. A later audit of the same tree with
+the same rules skips a file outright when its size and mtime are unchanged.
+When only the mtime changed, the engine reuses the cached findings if the
+content hash still matches. So re-auditing a large repository only rescans
+what changed. Findings are reported through a callback as each batch
+completes.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from rules import CHECKS, RULES, RULES_VERSION
+
+logger = logging.getLogger(__name__)
+
+AUDIT_WORKERS = int(os.getenv("AUDIT_WORKERS", "0")) or os.cpu_count() or 1
+FILES_PER_TASK = int(os.getenv("AUDIT_FILES_PER_TASK", "64"))
+MAX_FILE_BYTES = int(os.getenv("AUDIT_MAX_FILE_KB", "1024")) * 1024
+SKIP_DIRS = {
+    ".git",
+    ".hg",
+    ".svn",
+    "node_modules",
+    "__pycache__",
+    ".venv",
+    "venv",
+    ".tox",
+    ".mypy_cache",
+    ".pytest_cache",
+    ".ruff_cache",
+    "dist",
+    "build",
+}
+
+
+def list_files(root: Path) -> list[tuple[str, int, int]]:
+    """``(relative path, size, mtime_ns)`` of every auditable file under root."""
+    if root.is_file():
+        stat = root.stat()
+        return [(root.name, stat.st_size, stat.st_mtime_ns)]
+    files = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            if stat.st_size <= MAX_FILE_BYTES:
+                files.append((os.path.relpath(path, root), stat.st_size, stat.st_mtime_ns))
+    return files
+
+
+def scan_files(
+    root: str, files: list[tuple[str, str | None]], rule_ids: list[str]
+) -> list[tuple[str, str, list[dict[str, Any]] | None]]:
+    """Hash and check a batch of files (runs in a worker process).
+
+    Args:
+        root: Target directory (or the file itself for single-file targets).
+        files: ``(relative path, cached sha256 or None)`` pairs.
+        rule_ids: Checks to run.
+
+    Returns:
+        ``(relative path, sha256, findings)`` per readable file; findings is
+        None when the hash matched the cached one and the cached findings apply.
+    """
+    results = []
+    for rel, cached_sha in files:
+        path = root if os.path.isfile(root) else os.path.join(root, rel)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            continue
+        sha = hashlib.sha256(data).hexdigest()
+        if sha == cached_sha:
+            results.append((rel, sha, None))
+            continue
+        findings: list[dict[str, Any]] = []
+        if b"\0" not in data[:8192]:  # skip binary files
+            text = data.decode("utf-8", errors="replace")
+            for rule_id in rule_ids:
+                severity = RULES[rule_id].severity.value
+                for finding in CHECKS[rule_id](rel, text):
+                    findings.append({"rule_id": rule_id, "severity": severity, **finding})
+        results.append((rel, sha, findings))
+    return results
+
+
+class ScanCache:
+    """Per-file scan results keyed by (target root, relative path)."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+
+    def _conn(self) -> sqlite3.Connection:
+        if self._db is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                """
+                CREATE TABLE IF NOT EXISTS files (
+                    root TEXT NOT NULL,
+                    path TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    sha256 TEXT NOT NULL,
+                    rules TEXT NOT NULL,
+                    findings TEXT NOT NULL,
+                    PRIMARY KEY (root, path)
+                )
+                """
+            )
+        return self._db
+
+    def load(self, root: str) -> dict[str, tuple[int, int, str, str, str]]:
+        """``path -> (size, mtime_ns, sha256, rules, findings JSON)`` for a root."""
+        with self._lock:
+            rows = self._conn().execute(
+                "SELECT path, size, mtime_ns, sha256, rules, findings FROM files WHERE root = ?",
+                (root,),
+            )
+            return {row[0]: row[1:] for row in rows}
+
+    def store(
+        self, root: str, rules_key: str, entries: list[tuple[str, int, int, str, str]]
+    ) -> None:
+        """Upsert ``(path, size, mtime_ns, sha256, findings JSON)`` rows."""
+        with self._lock:
+            conn = self._conn()
+            conn.execute("BEGIN")
+            conn.executemany(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (root, path, size, mtime, sha, rules_key, findings)
+                    for path, size, mtime, sha, findings in entries
+                ],
+            )
+            conn.execute("COMMIT")
+
+    def prune(self, root: str, keep: set[str]) -> None:
+        """Forget files of ``root`` that no longer exist."""
+        with self._lock:
+            conn = self._conn()
+            stale = [
+                (root, path)
+                for (path,) in conn.execute("SELECT path FROM files WHERE root = ?", (root,))
+                if path not in keep
+            ]
+            if stale:
+                conn.executemany("DELETE FROM files WHERE root = ? AND path = ?", stale)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+class AuditEngine:
+    """Runs audits over a process pool with incremental, hash-based skipping."""
+
+    def __init__(self, cache: ScanCache, workers: int = AUDIT_WORKERS):
+        self.cache = cache
+        self.workers = workers
+        self._pool: ProcessPoolExecutor | None = None
+
+    def _executor(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self._pool
+
+    async def run(
+        self,
+        root: Path,
+        rule_ids: list[str],
+        on_findings: Callable[[list[dict[str, Any]]], None],
+        on_progress: Callable[[float], None] | None = None,
+    ) -> dict[str, Any]:
+        """Audit ``root`` and report findings as they are produced.
+
+        Args:
+            root: Directory or file to audit.
+            rule_ids: Rules from ``rules.CHECKS`` to apply.
+            on_findings: Called with each batch of findings.
+            on_progress: Called with the percentage of files processed.
+
+        Returns:
+            Summary with file counts and findings per severity.
+        """
+        started = time.monotonic()
+        rule_ids = [rule_id for rule_id in rule_ids if rule_id in CHECKS]
+        rules_key = f"{RULES_VERSION}:{','.join(sorted(rule_ids))}"
+        root_key = str(root.resolve())
+        files = await asyncio.to_thread(list_files, root)
+        cached = await asyncio.to_thread(self.cache.load, root_key)
+        counts = {"critical": 0, "high": 0, "medium": 0, "low": 0}
+        total = len(files)
+        done = 0
+
+        def emit(findings: list[dict[str, Any]]) -> None:
+            for finding in findings:
+                counts[finding["severity"]] += 1
+            if findings:
+                on_findings(findings)
+
+        # Unchanged size and mtime: reuse the cached findings without reading the file
+        pending: list[tuple[str, str | None]] = []
+        stats = {}
+        for rel, size, mtime in files:
+            entry = cached.get(rel)
+            same_rules = entry is not None and entry[3] == rules_key
+            if same_rules and entry[0] == size and entry[1] == mtime:
+                emit(json.loads(entry[4]))
+                done += 1
+            else:
+                stats[rel] = (size, mtime)
+                pending.append((rel, entry[2] if same_rules else None))
+        skipped = done
+        if on_progress and total:
+            on_progress(100.0 * done / total)
+
+        loop = asyncio.get_running_loop()
+
+        async def check(batch: list[tuple[str, str | None]]) -> tuple[int, list]:
+            results = await loop.run_in_executor(
+                self._executor(), scan_files, str(root), batch, rule_ids
+            )
+            return len(batch), results
+
+        tasks = [
+            check(pending[i : i + FILES_PER_TASK]) for i in range(0, len(pending), FILES_PER_TASK)
+        ]
+        rescanned = 0
+        for future in asyncio.as_completed(tasks):
+            batch_size, results = await future
+            updates = []
+            for rel, sha, findings in results:
+                if findings is None:
+                    findings = json.loads(cached[rel][4])
+                else:
+                    rescanned += 1
+                emit(findings)
+                updates.append((rel, *stats[rel], sha, json.dumps(findings)))
+            await asyncio.to_thread(self.cache.store, root_key, rules_key, updates)
+            done += batch_size
+            if on_progress and total:
+                on_progress(min(100.0, 100.0 * done / total))
+
+        await asyncio.to_thread(self.cache.prune, root_key, {rel for rel, _, _ in files})
+        return {
+            "counts": counts,
+            "files_scanned": total,
+            "files_skipped": skipped,
+            "files_rescanned": rescanned,
+            "duration_sec": round(time.monotonic() - started, 3),
+        }
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+        self.cache.close()
@@ -0,0 +1,105 @@
+"""Append-only JSONL journal for audit job state.
+
+Every state change is one appended line (``{"op": ..., "key": ..., "value": ...}``),
+so persisting an event costs O(1) regardless of how many jobs exist. The
+latest value per ``(op, key)`` wins on replay. Once enough superseded lines
+have accumulated, the journal is compacted: the live records are written to
+a temporary file that atomically replaces the journal.
+"""
+
+import json
+import logging
+import os
+import threading
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+def _encode(op: str, key: str, value: Any) -> str:
+    return json.dumps({"op": op, "key": key, "value": value}, ensure_ascii=False, default=str)
+
+
+class JobJournal:
+    def __init__(self, path: str, compact_every: int = 1000):
+        """
+        Args:
+            path: Journal file (created on first append).
+            compact_every: Compact after this many appends since the last
+                compaction (or as many as there are live records, if more).
+        """
+        self.path = path
+        self.compact_every = compact_every
+        self._live: dict[tuple[str, str], Any] = {}
+        self._appends = 0
+        self._lock = threading.Lock()
+        self._file = None
+        self._replay()
+
+    def _replay(self) -> None:
+        try:
+            with open(self.path, "rb+") as f:
+                end = 0
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        # A torn final line from a crash mid-write; cut it off so the
+                        # next append starts on a line of its own
+                        logger.warning(f"Truncating torn last line of {self.path}")
+                        f.truncate(end)
+                        break
+                    end += len(line)
+                    try:
+                        event = json.loads(line)
+                        self._live[(event["op"], event["key"])] = event["value"]
+                    except (ValueError, KeyError, TypeError):
+                        logger.warning(f"Skipping unreadable journal line in {self.path}")
+        except FileNotFoundError:
+            pass
+
+    def records(self, op: str) -> dict[str, Any]:
+        """Latest value of every key recorded under ``op``."""
+        return {key: value for (kind, key), value in self._live.items() if kind == op}
+
+    @property
+    def empty(self) -> bool:
+        return not self._live
+
+    def append(self, op: str, key: str, value: Any) -> None:
+        """Record the new value of ``(op, key)``."""
+        line = _encode(op, key, value)
+        with self._lock:
+            if self._file is None:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                self._file = open(self.path, "a", encoding="utf-8")  # noqa: SIM115
+            self._file.write(line + "\n")
+            self._file.flush()
+            self._live[(op, key)] = value
+            self._appends += 1
+            # Rewriting costs O(live records); waiting for at least as many
+            # appends keeps compaction amortized O(1) per event
+            if self._appends >= max(self.compact_every, len(self._live)):
+                self._compact()
+
+    def compact(self) -> None:
+        """Rewrite the journal with only the live records."""
+        with self._lock:
+            self._compact()
+
+    def _compact(self) -> None:
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for (op, key), value in self._live.items():
+                f.write(_encode(op, key, value) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        os.replace(tmp_path, self.path)
+        self._appends = 0
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
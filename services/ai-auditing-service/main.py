@@ -6,7 +6,7 @@ from typing import Any
 
 import uvicorn
 from fastapi import Body, FastAPI
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 
 _this_dir = _os.path.dirname(__file__)
 if _this_dir not in _sys.path:
@@ -37,40 +37,81 @@ CONFIG: AuditConfig = AuditConfig(
 JOBS: dict[str, dict[str, Any]] = {}
 HISTORY: dict[str, AuditHistoryItem] = {}
 
-# Simple JSON file persistence
+# Job state is journaled (append-only JSONL); findings stream to one JSONL file per job
+import asyncio as _asyncio
 import json as _json
+from pathlib import Path as _Path
+
+from engine import AuditEngine, ScanCache
+from journal import JobJournal
 
-_STATE_FILE = os.path.join(os.path.dirname(__file__), "state.json")
+_SERVICE_DIR = os.path.dirname(os.path.abspath(__file__))
+_STATE_DIR = os.environ.get("AUDIT_STATE_DIR") or os.path.join(
+    os.path.expanduser("~"), ".cache", "opentalent", "ai-auditing"
+)
+# Older versions kept state.json next to this module
+_LEGACY_STATE_FILE = os.path.join(_SERVICE_DIR, "state.json")
+_FINDINGS_DIR = os.path.join(_STATE_DIR, "findings")
+# Relative audit targets are resolved against this directory (the repository root by default)
+AUDIT_ROOT = os.path.abspath(os.environ.get("AUDIT_ROOT") or os.path.join(_SERVICE_DIR, "..", ".."))
+
+JOURNAL = JobJournal(
+    os.path.join(_STATE_DIR, "audit_journal.jsonl"),
+    compact_every=int(os.environ.get("AUDIT_JOURNAL_COMPACT_EVERY", "1000")),
+)
+ENGINE = AuditEngine(ScanCache(os.path.join(_STATE_DIR, "scan_cache.db")))
+_TASKS: set[_asyncio.Task] = set()
 
 
-def _load_state():
-    global JOBS, HISTORY
+def _import_legacy_state() -> None:
+    """One-time import of the old pretty-printed state.json into the journal."""
     try:
-        with open(_STATE_FILE, encoding="utf-8") as f:
+        with open(_LEGACY_STATE_FILE, encoding="utf-8") as f:
             data = _json.load(f)
-        jobs = data.get("jobs", {})
-        hist = data.get("history", {})
-        JOBS = jobs
-        # Reconstruct history items via model for validation
-        HISTORY = {jid: AuditHistoryItem(**item) for jid, item in hist.items()}
-    except FileNotFoundError:
-        pass
-    except Exception:
-        # Ignore corrupt state
-        pass
+    except (OSError, ValueError):
+        return
+    for jid, job in data.get("jobs", {}).items():
+        JOURNAL.append("job", jid, job)
+    for jid, item in data.get("history", {}).items():
+        JOURNAL.append("history", jid, item)
+    JOURNAL.compact()
 
 
-def _save_state():
-    try:
-        data = {
-            "jobs": JOBS,
-            "history": {jid: item.model_dump() for jid, item in HISTORY.items()},
-        }
-        with open(_STATE_FILE, "w", encoding="utf-8") as f:
-            _json.dump(data, f, ensure_ascii=False, indent=2)
-    except Exception:
-        # Best-effort persistence; ignore write errors
-        pass
+def _load_state():
+    global JOBS, HISTORY, CONFIG
+    if JOURNAL.empty:
+        _import_legacy_state()
+    JOBS = JOURNAL.records("job")
+    HISTORY = {}
+    for jid, item in JOURNAL.records("history").items():
+        try:
+            HISTORY[jid] = AuditHistoryItem(**item)
+        except Exception:
+            # Ignore corrupt records
+            pass
+    config = JOURNAL.records("config").get("current")
+    if config:
+        try:
+            CONFIG = AuditConfig(**config)
+        except Exception:
+            pass
+    # Jobs that were running when the process stopped cannot be resumed
+    for jid, job in JOBS.items():
+        if job.get("status") in (AuditJobStatus.RUNNING, AuditJobStatus.QUEUED):
+            job.update(status=AuditJobStatus.FAILED, error="Interrupted by service restart")
+            _record_job(jid)
+
+
+def _record_job(job_id: str) -> None:
+    JOURNAL.append("job", job_id, {k: v for k, v in JOBS[job_id].items() if not k.startswith("_")})
+
+
+def _record_history(job_id: str) -> None:
+    JOURNAL.append("history", job_id, HISTORY[job_id].model_dump(mode="json"))
+
+
+def _findings_path(job_id: str) -> str:
+    return os.path.join(_FINDINGS_DIR, f"{job_id}.jsonl")
 
 
 _load_state()
@@ -108,12 +149,19 @@ async def audit_run(payload: AuditRunRequest = Body(...)):
     """
     if not payload.target:
         return JSONResponse(status_code=400, content={"error": "Missing target"})
+    root = _resolve_target(payload.target)
+    if root is None:
+        return JSONResponse(status_code=400, content={"error": "Target not found"})
+    ruleset = payload.ruleset or CONFIG.default_ruleset
+    unknown = [rid for rid in ruleset if rid not in RULES]
+    if unknown:
+        return JSONResponse(status_code=400, content={"error": f"Unknown rules: {unknown}"})
     job_id = f"job_{int(time.time() * 1000)}"
     JOBS[job_id] = {
         "status": AuditJobStatus.RUNNING,
         "target": payload.target,
         "started_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-        "ruleset": payload.ruleset or CONFIG.default_ruleset,
+        "ruleset": ruleset,
         "progress": 0.0,
     }
     HISTORY[job_id] = AuditHistoryItem(
@@ -122,62 +170,77 @@ async def audit_run(payload: AuditRunRequest = Body(...)):
         status=AuditJobStatus.RUNNING,
         created_at=JOBS[job_id]["started_at"],
     )
-    _save_state()
-    # Ensure background worker is running for in-process test environments
-    await _ensure_worker()
+    _record_job(job_id)
+    _record_history(job_id)
+    task = _asyncio.create_task(_run_job(job_id, root))
+    _TASKS.add(task)
+    task.add_done_callback(_TASKS.discard)
     return {"job_id": job_id, "status": "accepted"}
 
 
-# Background job worker: auto-complete jobs after a short delay
-import asyncio as _asyncio
+def _resolve_target(target: str) -> _Path | None:
+    """Resolve a target inside AUDIT_ROOT; None if missing or outside it."""
+    root = _Path(AUDIT_ROOT)
+    path = (root / target).resolve()
+    if not path.is_relative_to(root.resolve()) or not path.exists():
+        return None
+    return path
 
 
-async def _job_worker():
-    while True:
-        try:
-            time.time()
-            for jid, job in list(JOBS.items()):
-                if job.get("status") == AuditJobStatus.RUNNING:
-                    # Initialize progress
-                    job.setdefault("progress", 0.0)
-                    # Auto-complete after ~1 second
-                    job.get("started_at")
-                    # parse started_at (YYYY-MM-DDTHH:MM:SSZ)
-                    # use a simple elapsed counter stored in job if parsing is complex
-                    elapsed = job.get("_elapsed", 0.0)
-                    elapsed += 0.5
-                    job["_elapsed"] = elapsed
-                    if elapsed >= 0.5:
-                        job["status"] = AuditJobStatus.COMPLETED
-                        job["progress"] = 100.0
-                        job["finished_at"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-                        HISTORY[jid] = AuditHistoryItem(
-                            job_id=jid,
-                            target=job["target"],
-                            status=AuditJobStatus.COMPLETED,
-                            created_at=job["started_at"],
-                            finished_at=job["finished_at"],
-                        )
-                        _save_state()
-        except Exception:
-            # Keep worker resilient
-            pass
-        await _asyncio.sleep(0.5)
+async def _run_job(job_id: str, root: _Path):
+    """Run the rules over the target, streaming findings to the job's findings file."""
+    job = JOBS[job_id]
+    max_findings = CONFIG.max_findings
+    os.makedirs(_FINDINGS_DIR, exist_ok=True)
+    written = 0
 
+    with open(_findings_path(job_id), "w", encoding="utf-8") as out:
 
-_WORKER_STARTED = False
+        def on_findings(findings: list[dict[str, Any]]) -> None:
+            nonlocal written
+            for finding in findings[: max(0, max_findings - written)]:
+                out.write(_json.dumps(finding, ensure_ascii=False) + "\n")
+                written += 1
+            out.flush()
 
+        def on_progress(progress: float) -> None:
+            job["progress"] = round(progress, 1)
 
-async def _ensure_worker():
-    global _WORKER_STARTED
-    if not _WORKER_STARTED:
-        _asyncio.create_task(_job_worker())
-        _WORKER_STARTED = True
+        try:
+            summary = await ENGINE.run(root, job["ruleset"], on_findings, on_progress)
+            status = AuditJobStatus.COMPLETED
+        except Exception as e:
+            summary = {"error": str(e)}
+            status = AuditJobStatus.FAILED
+
+    order = [s.value for s in Severity]
+    threshold = order.index(CONFIG.fail_on_severity.value)
+    if status == AuditJobStatus.COMPLETED:
+        summary["target"] = job["target"]
+        summary["findings_recorded"] = written
+        summary["passed"] = not any(summary["counts"][severity] for severity in order[threshold:])
+        job["progress"] = 100.0
+    job.update(
+        status=status,
+        finished_at=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        summary=summary,
+    )
+    HISTORY[job_id] = AuditHistoryItem(
+        job_id=job_id,
+        target=job["target"],
+        status=status,
+        created_at=job["started_at"],
+        finished_at=job["finished_at"],
+        summary=summary,
+    )
+    _record_job(job_id)
+    _record_history(job_id)
 
 
-@app.on_event("startup")
-async def _start_worker():
-    await _ensure_worker()
+@app.on_event("shutdown")
+async def _shutdown():
+    ENGINE.close()
+    JOURNAL.close()
 
 
 @app.get("/api/v1/audit/status/{job_id}")
@@ -200,35 +263,50 @@ async def audit_report(job_id: str):
     job = JOBS.get(job_id)
     if not job or job.get("status") != AuditJobStatus.COMPLETED:
         return JSONResponse(status_code=400, content={"error": "Job not completed or not found"})
-    findings = [
-        AuditFinding(
-            rule_id="enum_validation",
-            message="Loose string enum detected.",
-            severity=Severity.HIGH,
-            file="services/security-service/schemas.py",
-            line=100,
-            remediation="Use Python Enum types for roles/permissions.",
-        ),
-        AuditFinding(
-            rule_id="secret_detection",
-            message="Potential hardcoded secret found.",
-            severity=Severity.CRITICAL,
-            file="services/security-service/main.py",
-            line=50,
-            remediation="Load secrets from environment variables.",
-        ),
-    ]
-    summary = {
-        "target": job["target"],
-        "counts": {"critical": 1, "high": 1, "medium": 0, "low": 0},
-        "files_scanned": 25,
-        "duration_sec": 2,
-    }
+    findings = []
+    try:
+        with open(_findings_path(job_id), encoding="utf-8") as f:
+            for line in f:
+                findings.append(AuditFinding(**_json.loads(line)))
+    except FileNotFoundError:
+        pass
     return AuditReportResponse(
-        job_id=job_id, target=job["target"], findings=findings, summary=summary
+        job_id=job_id, target=job["target"], findings=findings, summary=job.get("summary", {})
     )
 
 
+@app.get("/api/v1/audit/findings/{job_id}")
+async def audit_findings(job_id: str):
+    """Stream a job's findings as NDJSON while it runs.
+
+    Findings already written are sent immediately; the response then follows
+    the job until it finishes.
+    """
+    if job_id not in JOBS:
+        return JSONResponse(status_code=404, content={"error": "Job not found"})
+
+    async def follow():
+        position = 0
+        while True:
+            running = JOBS[job_id].get("status") == AuditJobStatus.RUNNING
+            try:
+                with open(_findings_path(job_id), "rb") as f:
+                    f.seek(position)
+                    chunk = f.read()
+            except FileNotFoundError:
+                chunk = b""
+            # Only emit complete lines; a partial one is picked up next round
+            complete = chunk[: chunk.rfind(b"\n") + 1]
+            if complete:
+                position += len(complete)
+                yield complete
+            if not running:
+                return
+            await _asyncio.sleep(0.2)
+
+    return StreamingResponse(follow(), media_type="application/x-ndjson")
+
+
 @app.get("/api/v1/audit/rules")
 async def audit_rules():
     return {"rules": [r.model_dump() for r in RULES.values()]}
@@ -243,7 +321,7 @@ async def audit_config_get():
 async def audit_config_set(payload: AuditConfig = Body(...)):
     global CONFIG
     CONFIG = payload
-    _save_state()
+    JOURNAL.append("config", "current", CONFIG.model_dump(mode="json"))
     return {"ok": True}
 
 
@@ -1,3 +1,8 @@
+import ast
+import re
+from collections.abc import Callable
+from typing import Any
+
 from schemas import AuditRule, Severity
 
 # Central rule registry to keep RULES and validation aligned
@@ -19,3 +24,111 @@ RULES: dict[str, AuditRule] = {
 }
 
 KNOWN_RULE_IDS: set[str] = set(RULES.keys())
+
+# Bump when a check changes so cached per-file results are recomputed
+RULES_VERSION = "1"
+
+# ---------------------------------------------------------------------------
+# Rule checks: (relative path, file text) -> list of finding dicts
+# ---------------------------------------------------------------------------
+
+_SECRET_PATTERNS = [
+    ("AWS access key", re.compile(r"\b(?:AKIA|ASIA)[0-9A-Z]{16}\b")),
+    ("Private key", re.compile(r"-----BEGIN (?:RSA |EC |OPENSSH |DSA )?PRIVATE KEY-----")),
+    ("GitHub token", re.compile(r"\bgh[pousr]_[A-Za-z0-9]{36,}\b")),
+    ("Slack token", re.compile(r"\bxox[abprs]-[A-Za-z0-9-]{10,}\b")),
+    (
+        "Hardcoded credential",
+        re.compile(
+            r"""(?i)\b[\w-]*(?:password|passwd|secret|api[_-]?key"""
+            r"""|access[_-]?token|auth[_-]?token)\b"""
+            r"""\s*[:=]\s*["']([^"'\s]{8,})["']"""
+        ),
+    ),
+]
+# Values that are clearly not real credentials
+_PLACEHOLDER = re.compile(
+    r"(?i)^(?:x+|\*+|\.+|<.*>|\$\{.*\}|\{\{.*\}\}"
+    r"|change[_-]?me.*|your[_-].*|example.*|dummy.*|test.*|placeholder.*)$"
+)
+
+
+def _secret_detection(path: str, text: str) -> list[dict[str, Any]]:
+    findings = []
+    for line_no, line in enumerate(text.splitlines(), start=1):
+        for label, pattern in _SECRET_PATTERNS:
+            match = pattern.search(line)
+            if not match:
+                continue
+            if match.groups() and _PLACEHOLDER.match(match.group(1)):
+                continue
+            findings.append(
+                {
+                    "message": f"Potential hardcoded secret found ({label}).",
+                    "file": path,
+                    "line": line_no,
+                    "remediation": "Load secrets from environment variables or a secret manager.",
+                }
+            )
+            break
+    return findings
+
+
+# Field(pattern="^(admin|user|guest)$") style validators
+_ENUM_PATTERN = re.compile(r"^\^?\(?\w+(?:\|\w+)+\)?\$?$")
+
+
+def _string_constants(node: ast.AST) -> list[str]:
+    if isinstance(node, (ast.Tuple, ast.List, ast.Set)):
+        values = [
+            elt.value
+            for elt in node.elts
+            if isinstance(elt, ast.Constant) and isinstance(elt.value, str)
+        ]
+        if len(values) == len(node.elts):
+            return values
+    return []
+
+
+def _enum_validation(path: str, text: str) -> list[dict[str, Any]]:
+    if not path.endswith(".py"):
+        return []
+    try:
+        tree = ast.parse(text)
+    except (SyntaxError, ValueError):
+        return []
+    findings = []
+    for node in ast.walk(tree):
+        message = None
+        if (
+            isinstance(node, ast.Compare)
+            and isinstance(node.left, (ast.Name, ast.Attribute))
+            and len(node.ops) == 1
+            and isinstance(node.ops[0], (ast.In, ast.NotIn))
+            and len(_string_constants(node.comparators[0])) >= 3
+        ):
+            message = "Loose string enum detected (membership test against string literals)."
+        elif isinstance(node, ast.keyword) and node.arg in ("pattern", "regex"):
+            value = node.value
+            if (
+                isinstance(value, ast.Constant)
+                and isinstance(value.value, str)
+                and _ENUM_PATTERN.match(value.value)
+            ):
+                message = "Loose string enum detected (regex alternation validator)."
+        if message:
+            findings.append(
+                {
+                    "message": message,
+                    "file": path,
+                    "line": node.lineno,
+                    "remediation": "Use Python Enum types for roles/permissions.",
+                }
+            )
+    return findings
+
+
+CHECKS: dict[str, Callable[[str, str], list[dict[str, Any]]]] = {
+    "enum_validation": _enum_validation,
+    "secret_detection": _secret_detection,
+}
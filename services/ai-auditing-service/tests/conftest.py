@@ -0,0 +1,11 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def audit_dirs(tmp_path, monkeypatch):
+    """Keep the journal, scan cache and findings out of the service directory."""
+    target = tmp_path / "repo" / "services" / "security-service"
+    target.mkdir(parents=True)
+    (target / "main.py").write_text('SERVICE_NAME = "security-service"\n')
+    monkeypatch.setenv("AUDIT_STATE_DIR", str(tmp_path / "state"))
+    monkeypatch.setenv("AUDIT_ROOT", str(tmp_path / "repo"))
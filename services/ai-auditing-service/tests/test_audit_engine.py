@@ -0,0 +1,177 @@
+import asyncio
+import importlib
+import json
+import os
+import sys
+
+import httpx
+import pytest
+from httpx import ASGITransport
+
+SERVICE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if SERVICE_DIR not in sys.path:
+    sys.path.append(SERVICE_DIR)
+
+from engine import AuditEngine, ScanCache  # noqa: E402
+from journal import JobJournal  # noqa: E402
+
+LEAKY = 'API_KEY = "sk_live_4f9a8b7c6d5e"\n'
+LOOSE = 'def check(role):\n    return role in ("admin", "user", "guest")\n'
+
+
+def _write_tree(root):
+    (root / "pkg").mkdir()
+    (root / "pkg" / "settings.py").write_text(LEAKY)
+    (root / "pkg" / "roles.py").write_text(LOOSE)
+    (root / "pkg" / "clean.py").write_text('PASSWORD = "changeme"\n')
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = AuditEngine(ScanCache(str(tmp_path / "cache.db")), workers=1)
+    yield engine
+    engine.close()
+
+
+async def _audit(engine, root, rules=("enum_validation", "secret_detection")):
+    findings = []
+    summary = await engine.run(root, list(rules), findings.extend)
+    return summary, findings
+
+
+@pytest.mark.asyncio
+async def test_engine_reports_secrets_and_loose_enums(engine, tmp_path):
+    target = tmp_path / "target"
+    target.mkdir()
+    _write_tree(target)
+
+    summary, findings = await _audit(engine, target)
+    assert summary["counts"]["critical"] == 1
+    assert summary["counts"]["high"] == 1
+    assert summary["files_scanned"] == 3
+    assert {(f["rule_id"], f["file"], f["line"]) for f in findings} == {
+        ("secret_detection", os.path.join("pkg", "settings.py"), 1),
+        ("enum_validation", os.path.join("pkg", "roles.py"), 2),
+    }
+
+
+@pytest.mark.asyncio
+async def test_engine_only_rescans_changed_files(engine, tmp_path):
+    target = tmp_path / "target"
+    target.mkdir()
+    _write_tree(target)
+    await _audit(engine, target)
+
+    summary, findings = await _audit(engine, target)
+    assert (summary["files_skipped"], summary["files_rescanned"]) == (3, 0)
+    assert len(findings) == 2
+
+    # Touched but unchanged content: hash matches, findings reused
+    settings = target / "pkg" / "settings.py"
+    os.utime(settings, ns=(0, settings.stat().st_mtime_ns + 10**9))
+    (target / "pkg" / "roles.py").write_text("ROLE = 'admin'\n")
+    summary, findings = await _audit(engine, target)
+    assert (summary["files_skipped"], summary["files_rescanned"]) == (1, 1)
+    assert [f["rule_id"] for f in findings] == ["secret_detection"]
+
+    # A different ruleset invalidates the cached results
+    summary, _ = await _audit(engine, target, rules=("secret_detection",))
+    assert summary["files_rescanned"] == 3
+
+
+def test_journal_replays_latest_value_and_compacts(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    journal = JobJournal(str(path), compact_every=4)
+    journal.append("job", "a", {"status": "running"})
+    journal.append("job", "b", {"status": "running"})
+    journal.append("job", "a", {"status": "completed"})
+    journal.close()
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"op": "job", "key": "b", "val')  # torn write
+
+    journal = JobJournal(str(path), compact_every=4)
+    assert journal.records("job") == {"a": {"status": "completed"}, "b": {"status": "running"}}
+    journal.append("job", "b", {"status": "failed"})
+    journal.append("config", "current", {"max_findings": 5})
+    journal.append("job", "c", {"status": "running"})
+    journal.append("job", "c", {"status": "completed"})
+    journal.close()
+
+    lines = path.read_text().splitlines()
+    assert len(lines) == 4
+    assert JobJournal(str(path)).records("job")["b"] == {"status": "failed"}
+
+
+def test_journal_appends_after_torn_line_are_readable(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    journal = JobJournal(str(path))
+    journal.append("job", "a", {"status": "running"})
+    journal.close()
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"op": "job", "key": "a", "val')  # torn write
+
+    journal = JobJournal(str(path))
+    journal.append("job", "a", {"status": "completed"})
+    journal.append("job", "b", {"status": "running"})
+    journal.close()
+
+    assert path.read_text().count("\n") == 3
+    assert JobJournal(str(path)).records("job") == {
+        "a": {"status": "completed"},
+        "b": {"status": "running"},
+    }
+
+
+@pytest.fixture
+async def service(tmp_path, monkeypatch):
+    target = tmp_path / "repo" / "svc"
+    target.mkdir(parents=True)
+    _write_tree(target)
+    monkeypatch.setenv("AUDIT_STATE_DIR", str(tmp_path / "state"))
+    monkeypatch.setenv("AUDIT_ROOT", str(tmp_path / "repo"))
+    monkeypatch.setenv("AUDIT_WORKERS", "1")
+    spec = importlib.util.spec_from_file_location(
+        "ai_auditing_main_engine", os.path.join(SERVICE_DIR, "main.py")
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    async with httpx.AsyncClient(
+        transport=ASGITransport(app=module.app), base_url="http://testserver", timeout=10.0
+    ) as client:
+        yield module, client
+    module.ENGINE.close()
+    module.JOURNAL.close()
+
+
+async def _wait(client, job_id):
+    for _ in range(100):
+        status = (await client.get(f"/api/v1/audit/status/{job_id}")).json()["status"]
+        if status != "running":
+            return status
+        await asyncio.sleep(0.05)
+    raise AssertionError("audit did not finish")
+
+
+@pytest.mark.asyncio
+async def test_findings_stream_and_journaled_jobs(service, tmp_path):
+    module, client = service
+    assert (await client.post("/api/v1/audit/run", json={"target": "../"})).status_code == 400
+
+    run = await client.post("/api/v1/audit/run", json={"target": "svc"})
+    job_id = run.json()["job_id"]
+    assert await _wait(client, job_id) == "completed"
+
+    stream = await client.get(f"/api/v1/audit/findings/{job_id}")
+    assert stream.headers["content-type"] == "application/x-ndjson"
+    findings = [json.loads(line) for line in stream.text.splitlines()]
+    assert sorted(f["rule_id"] for f in findings) == ["enum_validation", "secret_detection"]
+
+    report = (await client.get(f"/api/v1/audit/report/{job_id}")).json()
+    assert report["summary"]["passed"] is False
+    assert len(report["findings"]) == 2
+
+    # A fresh process sees the journaled job
+    module.JOURNAL.close()
+    journal = JobJournal(str(tmp_path / "state" / "audit_journal.jsonl"))
+    assert journal.records("job")[job_id]["status"] == "completed"
+    assert journal.records("history")[job_id]["summary"]["counts"]["critical"] == 1
@@ -0,0 +1,282 @@
+"""Analytics Service - Text Analyzers
+
+Pure analyzer functions shared by the single-text endpoints and the batch
+endpoint. Each text is prepared once into ``TextFeatures`` (lower-cased
+text, word set, sentence split and a lazily built TextBlob) so running
+several analyzers on the same answer does not repeat that work. Functions
+are module-level so batches can be fanned out to a process pool.
+"""
+
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any
+
+from schemas import BiasDetection, ExpertiseAssessment, ResponseQuality, SentimentAnalysis
+from textblob import TextBlob
+
+ANALYZERS = ("sentiment", "quality", "bias", "expertise")
+
+POSITIVE_WORDS = ["good", "great", "excellent", "amazing", "love", "enjoy"]
+NEGATIVE_WORDS = ["bad", "terrible", "hate", "difficult", "challenging", "struggle"]
+
+GENDER_TERMS = ["he", "she", "his", "her", "man", "woman", "guy", "girl"]
+AGE_TERMS = ["young", "old", "experienced", "junior", "senior", "generation"]
+CULTURAL_TERMS = ["culture", "background", "ethnic", "nationality", "accent"]
+
+SKILL_KEYWORDS = {
+    "python": ["python", "django", "flask", "pandas", "numpy"],
+    "javascript": ["javascript", "react", "node", "typescript", "vue"],
+    "database": ["sql", "postgresql", "mongodb", "redis", "mysql"],
+    "cloud": ["aws", "azure", "gcp", "docker", "kubernetes"],
+    "system_design": ["architecture", "scalability", "microservices", "api"],
+}
+
+EXPERIENCE_INDICATORS = {
+    "beginner": ["learning", "basic", "introduction", "tutorial"],
+    "intermediate": ["experience", "worked on", "implemented", "developed"],
+    "advanced": ["architected", "led", "optimized", "scaled"],
+    "expert": ["designed systems", "mentored", "innovated", "pioneered"],
+}
+
+YEARS_BY_LEVEL = {"beginner": 1, "intermediate": 3, "advanced": 5, "expert": 8}
+
+
+@dataclass
+class TextFeatures:
+    """Tokenization of one text, computed once and shared by all analyzers."""
+
+    text: str
+    lower: str = field(init=False)
+
+    def __post_init__(self):
+        self.lower = self.text.lower()
+
+    @cached_property
+    def word_set(self) -> set[str]:
+        return set(self.lower.split())
+
+    @cached_property
+    def sentences(self) -> list[str]:
+        return self.text.split(".")
+
+    @cached_property
+    def blob(self) -> TextBlob:
+        return TextBlob(self.text)
+
+    def count_terms(self, terms: list[str]) -> int:
+        """Number of terms occurring anywhere in the text (substring match)."""
+        return sum(1 for term in terms if term in self.lower)
+
+
+def analyze_sentiment(features: TextFeatures) -> SentimentAnalysis:
+    """Analyze the sentiment and emotional tone of a text using TextBlob.
+
+    Args:
+        features: Prepared text.
+
+    Returns:
+        A SentimentAnalysis object with polarity, subjectivity, and emotion.
+    """
+    sentiment = features.blob.sentiment
+    polarity = sentiment.polarity
+
+    # Determine primary emotion
+    if polarity > 0.3:
+        emotion = "positive"
+    elif polarity < -0.3:
+        emotion = "negative"
+    else:
+        emotion = "neutral"
+
+    # Extract emotional keywords
+    keywords = [word for word in POSITIVE_WORDS + NEGATIVE_WORDS if word in features.lower]
+
+    return SentimentAnalysis(
+        polarity=polarity,
+        subjectivity=sentiment.subjectivity,
+        confidence=0.8,
+        emotion=emotion,
+        intensity=abs(polarity),
+        keywords=keywords[:5],
+    )
+
+
+def analyze_quality(features: TextFeatures, question: TextFeatures) -> ResponseQuality:
+    """Assess the quality and relevance of a response to a question.
+
+    Args:
+        features: Prepared response text.
+        question: Prepared question context.
+
+    Returns:
+        A ResponseQuality object with granular quality metrics.
+    """
+    # Basic quality metrics
+    length_score = min(len(features.text) / 200, 1.0) * 2.5
+
+    # Relevance check (simple keyword matching)
+    question_keywords = question.word_set
+    relevance_score = (
+        len(question_keywords.intersection(features.word_set))
+        / max(len(question_keywords), 1)
+        * 2.5
+    )
+
+    # Clarity assessment (sentence structure)
+    sentences = features.sentences
+    avg_sentence_length = sum(len(s.split()) for s in sentences) / max(len(sentences), 1)
+    clarity_score = max(0, 2.5 - abs(avg_sentence_length - 15) / 10)
+
+    # Technical accuracy (placeholder)
+    technical_score = 2.5
+
+    overall_score = (length_score + relevance_score + clarity_score + technical_score) / 4
+
+    return ResponseQuality(
+        overall_score=round(overall_score, 2),
+        completeness=length_score / 2.5,
+        relevance=relevance_score / 2.5,
+        clarity=clarity_score / 2.5,
+        technical_accuracy=technical_score / 2.5,
+        strengths=[
+            "Good length" if length_score > 2 else "",
+            "Relevant content" if relevance_score > 2 else "",
+        ],
+        improvements=[
+            "Add more detail" if length_score < 1.5 else "",
+            "Improve clarity" if clarity_score < 1.5 else "",
+        ],
+    )
+
+
+def detect_bias(features: TextFeatures) -> BiasDetection:
+    """Detect potential bias indicators in a text.
+
+    Args:
+        features: Prepared text.
+
+    Returns:
+        A BiasDetection object with flags, categories and recommendations.
+    """
+    bias_flags = []
+    categories = []
+    severity = "low"
+
+    # Gender bias indicators
+    if features.count_terms(GENDER_TERMS) > 2:
+        bias_flags.append("gender_stereotyping")
+        categories.append("gender")
+
+    # Age bias indicators
+    if features.count_terms(AGE_TERMS) > 1:
+        bias_flags.append("age_bias")
+        categories.append("age")
+
+    # Cultural bias indicators
+    if features.count_terms(CULTURAL_TERMS) > 1:
+        bias_flags.append("cultural_bias")
+        categories.append("cultural")
+
+    # Calculate severity
+    total_flags = len(bias_flags)
+    if total_flags >= 3:
+        severity = "high"
+    elif total_flags >= 2:
+        severity = "medium"
+
+    recommendations = []
+    if "gender_stereotyping" in bias_flags:
+        recommendations.append("Use gender-neutral language")
+    if "age_bias" in bias_flags:
+        recommendations.append("Focus on skills and experience, not age")
+    if "cultural_bias" in bias_flags:
+        recommendations.append("Emphasize universal competencies")
+
+    return BiasDetection(
+        bias_score=min(total_flags * 0.2, 1.0),
+        flags=bias_flags,
+        severity=severity,
+        categories=categories,
+        recommendations=recommendations,
+    )
+
+
+def analyze_expertise(features: TextFeatures) -> ExpertiseAssessment:
+    """Assess expertise level from a response.
+
+    Args:
+        features: Prepared response text.
+
+    Returns:
+        An ExpertiseAssessment object with the detected expertise level.
+    """
+    # Technical skill detection
+    technical_skills = [
+        category
+        for category, keywords in SKILL_KEYWORDS.items()
+        if any(kw in features.lower for kw in keywords)
+    ]
+
+    # Experience estimation based on content
+    expertise_scores = {
+        level: features.count_terms(indicators)
+        for level, indicators in EXPERIENCE_INDICATORS.items()
+    }
+
+    # Determine expertise level
+    max_score = max(expertise_scores.values())
+    level = "intermediate" if max_score == 0 else max(expertise_scores, key=expertise_scores.get)
+
+    # Knowledge gaps
+    knowledge_gaps = []
+    if not technical_skills:
+        knowledge_gaps.append("technical skills not demonstrated")
+
+    return ExpertiseAssessment(
+        level=level,
+        confidence=0.7,
+        technical_skills=technical_skills,
+        knowledge_gaps=knowledge_gaps,
+        experience_years=YEARS_BY_LEVEL.get(level, 3),
+    )
+
+
+def analyze_item(item: dict[str, Any], analyzers: tuple[str, ...]) -> dict[str, Any]:
+    """Run the requested analyzers on one answer with a single tokenization pass.
+
+    Args:
+        item: ``{"text": ..., "question_context": ...}``
+        analyzers: Analyzer names from ANALYZERS
+
+    Returns:
+        Analyzer name to result dict; failures are reported under ``errors``
+    """
+    features = TextFeatures(item["text"])
+    result: dict[str, Any] = {}
+    errors: dict[str, str] = {}
+
+    for name in analyzers:
+        try:
+            if name == "sentiment":
+                result[name] = analyze_sentiment(features).model_dump()
+            elif name == "quality":
+                question = item.get("question_context")
+                if question:
+                    result[name] = analyze_quality(features, TextFeatures(question)).model_dump()
+                else:
+                    errors[name] = "question_context is required for quality analysis"
+            elif name == "bias":
+                result[name] = detect_bias(features).model_dump()
+            elif name == "expertise":
+                result[name] = analyze_expertise(features).model_dump()
+        except Exception as e:
+            errors[name] = str(e)
+
+    if errors:
+        result["errors"] = errors
+    return result
+
+
+def analyze_chunk(items: list[dict[str, Any]], analyzers: tuple[str, ...]) -> list[dict]:
+    """Analyze a list of answers in order (the unit of work sent to pool processes)."""
+    return [analyze_item(item, analyzers) for item in items]
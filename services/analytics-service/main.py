@@ -1,7 +1,20 @@
-from datetime import datetime
-
-from fastapi import FastAPI, HTTPException
+import asyncio
+import contextlib
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+
+import analyzers
+from analyzers import TextFeatures
+from fastapi import FastAPI, HTTPException, Query
+from metrics_store import GRANULARITIES, MetricEvent, MetricsStore
 from schemas import (
+    AnalysisContext,
+    BatchAnalysisRequest,
+    BatchAnalysisResponse,
+    BatchAnalysisResult,
     BiasDetection,
     BiasDetectionRequest,
     ExpertiseAssessment,
@@ -23,15 +36,68 @@ from schemas import (
     TrustReport,
     TrustReportRequest,
 )
-from textblob import TextBlob
+
+logger = logging.getLogger(__name__)
+
+# Append-only analyzer results with minute/hour/day rollups
+metrics_store = MetricsStore()
+# Seconds buffered metric events may wait before being written
+METRICS_FLUSH_INTERVAL = float(os.environ.get("ANALYTICS_METRICS_FLUSH_INTERVAL", 5))
+
+
+async def _flush_metrics_periodically() -> None:
+    """Write buffered events on a timer so quiet periods don't leave them unwritten."""
+    while True:
+        await asyncio.sleep(METRICS_FLUSH_INTERVAL)
+        try:
+            await asyncio.to_thread(metrics_store.flush)
+        except Exception as e:
+            logger.error(f"Periodic metrics flush failed: {e}")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global _process_pool
+    flush_task = asyncio.create_task(_flush_metrics_periodically())
+    yield
+    flush_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await flush_task
+    metrics_store.close()
+    if _process_pool is not None:
+        _process_pool.shutdown(cancel_futures=True)
+        _process_pool = None
+
 
 # FastAPI app
 app = FastAPI(
     title="OpenTalent Analytics Service API",
     description="AI-powered analytics and intelligence service for interview analysis",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
+# Batches above this size are analyzed across a process pool in chunks
+BATCH_POOL_THRESHOLD = int(os.environ.get("ANALYTICS_BATCH_POOL_THRESHOLD", 64))
+BATCH_CHUNK_SIZE = int(os.environ.get("ANALYTICS_BATCH_CHUNK_SIZE", 32))
+BATCH_POOL_WORKERS = int(os.environ.get("ANALYTICS_BATCH_POOL_WORKERS", os.cpu_count() or 2))
+_process_pool: ProcessPoolExecutor | None = None
+
+REPORT_RANGE_DAYS = {"day": 1, "week": 7, "month": 30, "quarter": 90, "year": 365}
+
+
+def record_metrics(context: AnalysisContext | None, values: dict[str, float]) -> None:
+    """Append analyzer results to the metrics store.
+
+    Args:
+        context: Interview/tenant/role/interviewer the text belongs to
+        values: Metric name to value
+    """
+    dims = context.model_dump() if context else {}
+    metrics_store.record(
+        MetricEvent(metric=metric, value=value, **dims) for metric, value in values.items()
+    )
+
 
 @app.get("/")
 async def root():
@@ -65,35 +131,9 @@ async def analyze_sentiment(request: SentimentAnalysisRequest):
         A SentimentAnalysis object with polarity, subjectivity, and emotion.
     """
     try:
-        blob = TextBlob(request.text)
-        polarity = blob.sentiment.polarity
-        subjectivity = blob.sentiment.subjectivity
-
-        # Determine primary emotion
-        if polarity > 0.3:
-            emotion = "positive"
-        elif polarity < -0.3:
-            emotion = "negative"
-        else:
-            emotion = "neutral"
-
-        # Extract emotional keywords
-        positive_words = ["good", "great", "excellent", "amazing", "love", "enjoy"]
-        negative_words = ["bad", "terrible", "hate", "difficult", "challenging", "struggle"]
-
-        keywords = []
-        for word in positive_words + negative_words:
-            if word in request.text.lower():
-                keywords.append(word)
-
-        return SentimentAnalysis(
-            polarity=polarity,
-            subjectivity=subjectivity,
-            confidence=0.8,
-            emotion=emotion,
-            intensity=abs(polarity),
-            keywords=keywords[:5],
-        )
+        result = analyzers.analyze_sentiment(TextFeatures(request.text))
+        record_metrics(request.context, {"sentiment": result.polarity})
+        return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Sentiment analysis failed: {str(e)}")
 
@@ -112,43 +152,11 @@ async def analyze_response_quality(request: ResponseQualityRequest):
         A ResponseQuality object with granular quality metrics.
     """
     try:
-        # Basic quality metrics
-        length_score = min(len(request.response_text) / 200, 1.0) * 2.5
-
-        # Relevance check (simple keyword matching)
-        question_keywords = set(request.question_context.lower().split())
-        response_keywords = set(request.response_text.lower().split())
-        relevance_score = (
-            len(question_keywords.intersection(response_keywords))
-            / max(len(question_keywords), 1)
-            * 2.5
-        )
-
-        # Clarity assessment (sentence structure)
-        sentences = request.response_text.split(".")
-        avg_sentence_length = sum(len(s.split()) for s in sentences) / max(len(sentences), 1)
-        clarity_score = max(0, 2.5 - abs(avg_sentence_length - 15) / 10)
-
-        # Technical accuracy (placeholder)
-        technical_score = 2.5
-
-        overall_score = (length_score + relevance_score + clarity_score + technical_score) / 4
-
-        return ResponseQuality(
-            overall_score=round(overall_score, 2),
-            completeness=length_score / 2.5,
-            relevance=relevance_score / 2.5,
-            clarity=clarity_score / 2.5,
-            technical_accuracy=technical_score / 2.5,
-            strengths=[
-                "Good length" if length_score > 2 else "",
-                "Relevant content" if relevance_score > 2 else "",
-            ],
-            improvements=[
-                "Add more detail" if length_score < 1.5 else "",
-                "Improve clarity" if clarity_score < 1.5 else "",
-            ],
+        result = analyzers.analyze_quality(
+            TextFeatures(request.response_text), TextFeatures(request.question_context)
         )
+        record_metrics(request.context, {"quality": result.overall_score})
+        return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Quality analysis failed: {str(e)}")
 
@@ -158,55 +166,11 @@ async def analyze_response_quality(request: ResponseQualityRequest):
 async def detect_bias(request: BiasDetectionRequest):
     """Detect potential bias indicators in text."""
     try:
-        bias_flags = []
-        categories = []
-        severity = "low"
-
-        # Gender bias indicators
-        gender_terms = ["he", "she", "his", "her", "man", "woman", "guy", "girl"]
-        gender_count = sum(1 for term in gender_terms if term in request.text.lower())
-        if gender_count > 2:
-            bias_flags.append("gender_stereotyping")
-            categories.append("gender")
-
-        # Age bias indicators
-        age_terms = ["young", "old", "experienced", "junior", "senior", "generation"]
-        age_count = sum(1 for term in age_terms if term in request.text.lower())
-        if age_count > 1:
-            bias_flags.append("age_bias")
-            categories.append("age")
-
-        # Cultural bias indicators
-        cultural_terms = ["culture", "background", "ethnic", "nationality", "accent"]
-        cultural_count = sum(1 for term in cultural_terms if term in request.text.lower())
-        if cultural_count > 1:
-            bias_flags.append("cultural_bias")
-            categories.append("cultural")
-
-        # Calculate severity
-        total_flags = len(bias_flags)
-        if total_flags >= 3:
-            severity = "high"
-        elif total_flags >= 2:
-            severity = "medium"
-
-        bias_score = min(total_flags * 0.2, 1.0)
-
-        recommendations = []
-        if "gender_stereotyping" in bias_flags:
-            recommendations.append("Use gender-neutral language")
-        if "age_bias" in bias_flags:
-            recommendations.append("Focus on skills and experience, not age")
-        if "cultural_bias" in bias_flags:
-            recommendations.append("Emphasize universal competencies")
-
-        return BiasDetection(
-            bias_score=bias_score,
-            flags=bias_flags,
-            severity=severity,
-            categories=categories,
-            recommendations=recommendations,
+        result = analyzers.detect_bias(TextFeatures(request.text))
+        record_metrics(
+            request.context, {"bias": result.bias_score, "bias_incidents": len(result.flags)}
         )
+        return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Bias detection failed: {str(e)}")
 
@@ -223,60 +187,74 @@ async def analyze_expertise(request: ExpertiseAssessmentRequest):
         An ExpertiseAssessment object with the detected expertise level.
     """
     try:
-        # Technical skill detection
-        technical_skills = []
-        skill_keywords = {
-            "python": ["python", "django", "flask", "pandas", "numpy"],
-            "javascript": ["javascript", "react", "node", "typescript", "vue"],
-            "database": ["sql", "postgresql", "mongodb", "redis", "mysql"],
-            "cloud": ["aws", "azure", "gcp", "docker", "kubernetes"],
-            "system_design": ["architecture", "scalability", "microservices", "api"],
-        }
+        return analyzers.analyze_expertise(TextFeatures(request.response_text))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Expertise assessment failed: {str(e)}")
 
-        for category, keywords in skill_keywords.items():
-            if any(kw in request.response_text.lower() for kw in keywords):
-                technical_skills.append(category)
 
-        # Experience estimation based on content
-        experience_indicators = {
-            "beginner": ["learning", "basic", "introduction", "tutorial"],
-            "intermediate": ["experience", "worked on", "implemented", "developed"],
-            "advanced": ["architected", "led", "optimized", "scaled"],
-            "expert": ["designed systems", "mentored", "innovated", "pioneered"],
-        }
+# --- Batch Analysis ---
+def _get_process_pool() -> ProcessPoolExecutor:
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(max_workers=BATCH_POOL_WORKERS)
+    return _process_pool
 
-        expertise_scores = dict.fromkeys(experience_indicators.keys(), 0)
 
-        for level, indicators in experience_indicators.items():
-            for indicator in indicators:
-                if indicator in request.response_text.lower():
-                    expertise_scores[level] += 1
+@app.post("/api/v1/analyze/batch", response_model=BatchAnalysisResponse)
+async def analyze_batch(request: BatchAnalysisRequest):
+    """Run several analyzers over many answers in one request.
 
-        # Determine expertise level
-        max_score = max(expertise_scores.values())
-        level = (
-            "intermediate" if max_score == 0 else max(expertise_scores, key=expertise_scores.get)
-        )
+    Each answer is tokenized once and every requested analyzer runs on that
+    shared tokenization. Batches larger than BATCH_POOL_THRESHOLD are split
+    into chunks and analyzed across a process pool. Results keep the order
+    of ``items``; an analyzer failing on one answer is reported in that
+    result's ``errors`` instead of failing the batch.
 
-        # Estimate years of experience
-        years_estimate = {"beginner": 1, "intermediate": 3, "advanced": 5, "expert": 8}.get(
-            level, 3
-        )
+    Args:
+        request: A BatchAnalysisRequest with the answers and analyzers to run.
 
-        # Knowledge gaps
-        knowledge_gaps = []
-        if not technical_skills:
-            knowledge_gaps.append("technical skills not demonstrated")
-
-        return ExpertiseAssessment(
-            level=level,
-            confidence=0.7,
-            technical_skills=technical_skills,
-            knowledge_gaps=knowledge_gaps,
-            experience_years=years_estimate,
-        )
+    Returns:
+        A BatchAnalysisResponse with one result per item, in request order.
+    """
+    names = tuple(dict.fromkeys(request.analyzers))
+    items = [
+        {"text": item.text, "question_context": item.question_context} for item in request.items
+    ]
+
+    try:
+        if len(items) <= BATCH_POOL_THRESHOLD:
+            outputs = await asyncio.to_thread(analyzers.analyze_chunk, items, names)
+        else:
+            loop = asyncio.get_running_loop()
+            pool = _get_process_pool()
+            chunks = [
+                items[i : i + BATCH_CHUNK_SIZE] for i in range(0, len(items), BATCH_CHUNK_SIZE)
+            ]
+            chunk_outputs = await asyncio.gather(
+                *(
+                    loop.run_in_executor(pool, analyzers.analyze_chunk, chunk, names)
+                    for chunk in chunks
+                )
+            )
+            outputs = [output for chunk in chunk_outputs for output in chunk]
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Expertise assessment failed: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Batch analysis failed: {str(e)}")
+
+    results = []
+    for index, (item, output) in enumerate(zip(request.items, outputs, strict=True)):
+        values = {}
+        if "sentiment" in output:
+            values["sentiment"] = output["sentiment"]["polarity"]
+        if "quality" in output:
+            values["quality"] = output["quality"]["overall_score"]
+        if "bias" in output:
+            values["bias"] = output["bias"]["bias_score"]
+            values["bias_incidents"] = len(output["bias"]["flags"])
+        record_metrics(item.context, values)
+
+        results.append(BatchAnalysisResult(index=index, id=item.id, **output))
+
+    return BatchAnalysisResponse(results=results, total=len(results))
 
 
 # --- Interview Performance Analysis ---
@@ -563,22 +541,50 @@ async def generate_trust_report(request: TrustReportRequest):
         raise HTTPException(status_code=500, detail=f"Trust report generation failed: {str(e)}")
 
 
-# --- Analytics & Reporting Endpoints (minimal stubs to satisfy contract) ---
+# --- Analytics & Reporting Endpoints (served from metrics_store rollups) ---
+def _metrics_response(
+    days: int, tenant_id: str | None, role: str | None, interviewer_id: str | None
+) -> MetricsResponse:
+    """Summarize the last ``days`` of rollups into a MetricsResponse."""
+    now = datetime.now(UTC)
+    start = now - timedelta(days=days)
+    dims = {"tenant_id": tenant_id, "role": role, "interviewer_id": interviewer_id}
+    summary = metrics_store.summary(start=start, **dims)
+
+    # Trend: average quality in the second half of the window vs the first half
+    midpoint = now - timedelta(days=days / 2)
+    earlier = metrics_store.summary(start=start, end=midpoint, **dims).get("quality")
+    later = metrics_store.summary(start=midpoint, **dims).get("quality")
+    trend = "stable"
+    if earlier and later:
+        if later["avg"] - earlier["avg"] > 0.25:
+            trend = "improving"
+        elif earlier["avg"] - later["avg"] > 0.25:
+            trend = "declining"
+
+    return MetricsResponse(
+        interviews_analyzed=int(summary.get("interviews", {}).get("sum", 0)),
+        avg_sentiment=round(summary.get("sentiment", {}).get("avg", 0.0), 4),
+        avg_quality_score=round(summary.get("quality", {}).get("avg", 0.0), 4),
+        bias_incidents=int(summary.get("bias_incidents", {}).get("sum", 0)),
+        trend=trend,
+    )
+
+
 @app.get("/api/v1/analytics/interviews", response_model=MetricsResponse)
-async def get_interview_stats():
-    """Retrieve basic analytics metrics for processed interviews.
+async def get_interview_stats(
+    days: int = Query(30, ge=1, le=3650),
+    tenant_id: str | None = None,
+    role: str | None = None,
+    interviewer_id: str | None = None,
+):
+    """Retrieve analytics metrics for interviews processed in the last ``days``.
 
     Returns:
         A MetricsResponse containing total count, sentiment, quality scores,
         and trend analysis.
     """
-    return MetricsResponse(
-        interviews_analyzed=0,
-        avg_sentiment=0.0,
-        avg_quality_score=0.0,
-        bias_incidents=0,
-        trend="stable",
-    )
+    return _metrics_response(days, tenant_id, role, interviewer_id)
 
 
 @app.get("/api/v1/analytics/candidates/{candidate_id}")
@@ -589,11 +595,12 @@ async def get_candidate_analytics(candidate_id: str):
         candidate_id: Unique identifier for the candidate.
 
     Returns:
-        A dictionary containing candidate-specific insights and status.
+        A dictionary containing per-metric aggregates for the candidate.
     """
+    summary = metrics_store.entity_summary("candidate_id", candidate_id)
     return {
         "candidate_id": candidate_id,
-        "insights": [],
+        "insights": [{"metric": metric, **stats} for metric, stats in summary.items()],
         "status": "ok",
     }
 
@@ -610,38 +617,69 @@ async def get_interview_performance(interview_id: str):
     """
     return {
         "interview_id": interview_id,
-        "summary": {},
+        "summary": metrics_store.entity_summary("interview_id", interview_id),
         "status": "ok",
     }
 
 
 @app.get("/api/v1/analytics/metrics", response_model=MetricsResponse)
-async def get_overall_metrics():
-    """Get high-level aggregate analytics metrics for the entire system.
+async def get_overall_metrics(
+    days: int = Query(30, ge=1, le=3650),
+    tenant_id: str | None = None,
+    role: str | None = None,
+    interviewer_id: str | None = None,
+):
+    """Get high-level aggregate analytics metrics, optionally per tenant/role/interviewer.
 
     Returns:
-        A MetricsResponse summarizing system-wide interview performance and bias checks.
+        A MetricsResponse summarizing interview performance and bias checks.
     """
-    return MetricsResponse(
-        interviews_analyzed=0,
-        avg_sentiment=0.0,
-        avg_quality_score=0.0,
-        bias_incidents=0,
-        trend="stable",
-    )
+    return _metrics_response(days, tenant_id, role, interviewer_id)
 
 
 @app.get("/api/v1/analytics/metrics/timeseries", response_model=MetricsTimeSeriesResponse)
-async def get_time_series_metrics():
-    """Retrieve time-series data for key analytics metrics.
+async def get_time_series_metrics(
+    metric: str = Query("quality", pattern=r"^(sentiment|quality|bias|bias_incidents|interviews)$"),
+    granularity: str = Query("hour", pattern=r"^(minute|hour|day)$"),
+    aggregate: str = Query("avg", pattern=r"^(avg|sum|count|min|max)$"),
+    start: datetime | None = None,
+    end: datetime | None = None,
+    tenant_id: str | None = None,
+    role: str | None = None,
+    interviewer_id: str | None = None,
+):
+    """Retrieve a metric as rollup buckets.
+
+    Defaults to the last 120 buckets of the requested granularity.
 
     Returns:
         A MetricsTimeSeriesResponse containing timestamped data points.
     """
-    now = datetime.utcnow()
+    if start is None:
+        start = datetime.now(UTC) - timedelta(seconds=GRANULARITIES[granularity] * 120)
+    points = metrics_store.timeseries(
+        metric,
+        granularity=granularity,
+        start=start,
+        end=end,
+        aggregate=aggregate,
+        tenant_id=tenant_id,
+        role=role,
+        interviewer_id=interviewer_id,
+    )
     return MetricsTimeSeriesResponse(
-        metric="overall_quality",
-        points=[MetricPoint(timestamp=now, value=0.0)],
+        metric=metric,
+        points=[MetricPoint(timestamp=ts, value=value) for ts, value in points],
+    )
+
+
+def _report_response(report: dict) -> ReportResponse:
+    return ReportResponse(
+        report_id=report["report_id"],
+        status="completed",
+        created_at=datetime.fromtimestamp(report["created_at"], tz=UTC),
+        url=f"/api/v1/analytics/reports/{report['report_id']}",
+        summary=report["summary"],
     )
 
 
@@ -653,15 +691,28 @@ async def create_report(request: ReportCreateRequest):
         request: A ReportCreateRequest object specifying report criteria.
 
     Returns:
-        A ReportResponse containing the ID and status of the generated report.
+        A ReportResponse containing the ID, status and summary of the generated report.
     """
-    now = datetime.utcnow()
-    return ReportResponse(
-        report_id="report-generated",
-        status="completed",
-        created_at=now,
-        url=None,
+    filters = request.filters or {}
+    dims = {key: filters.get(key) for key in ("tenant_id", "role", "interviewer_id")}
+    end = datetime.now(UTC)
+    start = end - timedelta(days=REPORT_RANGE_DAYS[request.date_range])
+
+    summary = {
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "metrics": metrics_store.summary(start=start, end=end, **dims),
+        "daily_quality": [
+            {"timestamp": ts.isoformat(), "value": value}
+            for ts, value in metrics_store.timeseries(
+                "quality", "day", start=start, end=end, **dims
+            )
+        ],
+    }
+    report = metrics_store.save_report(
+        request.type, {"date_range": request.date_range, "filters": filters}, summary
     )
+    return _report_response(report)
 
 
 @app.get("/api/v1/analytics/reports/{report_id}", response_model=ReportResponse)
@@ -674,13 +725,10 @@ async def get_report(report_id: str):
     Returns:
         A ReportResponse object with report details.
     """
-    now = datetime.utcnow()
-    return ReportResponse(
-        report_id=report_id,
-        status="completed",
-        created_at=now,
-        url=None,
-    )
+    report = metrics_store.get_report(report_id)
+    if report is None:
+        raise HTTPException(status_code=404, detail="Report not found")
+    return _report_response(report)
 
 
 @app.get("/api/v1/analytics/reports/{report_id}/export", response_model=ReportExportResponse)
@@ -693,17 +741,17 @@ async def export_report(report_id: str):
     Returns:
         A ReportExportResponse containing the export format and download URL.
     """
+    if metrics_store.get_report(report_id) is None:
+        raise HTTPException(status_code=404, detail="Report not found")
     return ReportExportResponse(
         report_id=report_id,
-        format="pdf",
-        url=f"https://example.com/reports/{report_id}.pdf",
-        expires_at=datetime.utcnow(),
+        format="json",
+        url=f"/api/v1/analytics/reports/{report_id}",
+        expires_at=None,
     )
 
 
 if __name__ == "__main__":
-    import os
-
     import uvicorn
 
     host = os.environ.get("HOST", "127.0.0.1")
@@ -0,0 +1,414 @@
+"""Analytics Service - Metrics Store
+
+Append-only store for analyzer results with pre-aggregated rollups.
+
+Every sentiment/quality/bias result is appended to an ``events`` table and,
+in the same transaction, folded into minute/hour/day rollup rows keyed by
+tenant, role and interviewer. A dimension value of ``*`` holds the total
+across that dimension, so dashboard queries are index range scans over a
+handful of rollup rows and never touch raw events.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from itertools import product
+from typing import Any
+
+DEFAULT_STORE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "opentalent", "analytics.sqlite3"
+)
+
+ALL = "*"
+DIMENSIONS = ("tenant_id", "role", "interviewer_id")
+
+# Rollup granularities and their bucket width in seconds
+GRANULARITIES = {"minute": 60, "hour": 3600, "day": 86400}
+
+# How long each rollup granularity is kept (raw events and day rollups are kept)
+ROLLUP_RETENTION = {"minute": 7 * 86400, "hour": 180 * 86400}
+
+METRICS = ("sentiment", "quality", "bias", "bias_incidents", "interviews")
+AGGREGATES = ("avg", "sum", "count", "min", "max")
+
+# Rollup value for each aggregate, from a row's (total, count, min, max)
+_ROLLUP_VALUES = {
+    "avg": lambda total, count, low, high: total / count,
+    "sum": lambda total, count, low, high: total,
+    "count": lambda total, count, low, high: count,
+    "min": lambda total, count, low, high: low,
+    "max": lambda total, count, low, high: high,
+}
+
+# Per-entity summaries; one static statement per filter column
+_ENTITY_SUMMARY_SQL = {
+    "interview_id": """
+        SELECT metric, COUNT(*), AVG(value), MIN(value), MAX(value) FROM events
+        WHERE interview_id = ? GROUP BY metric
+    """,
+    "candidate_id": """
+        SELECT metric, COUNT(*), AVG(value), MIN(value), MAX(value) FROM events
+        WHERE candidate_id = ? GROUP BY metric
+    """,
+}
+
+
+@dataclass
+class MetricEvent:
+    """One analyzer result to be recorded."""
+
+    metric: str
+    value: float
+    timestamp: float = field(default_factory=time.time)
+    tenant_id: str | None = None
+    role: str | None = None
+    interviewer_id: str | None = None
+    interview_id: str | None = None
+    candidate_id: str | None = None
+
+
+def _epoch(value: datetime | float | None) -> float | None:
+    if value is None or isinstance(value, int | float):
+        return value
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.timestamp()
+
+
+class MetricsStore:
+    """SQLite-backed event log with minute/hour/day rollups."""
+
+    def __init__(self, path: str | None = None, batch_size: int = 100):
+        """Open (or create) the metrics store.
+
+        Args:
+            path: Database file; defaults to ANALYTICS_STORE_PATH or ~/.cache/opentalent
+            batch_size: Buffered events that trigger a write
+        """
+        self.path = path or os.getenv("ANALYTICS_STORE_PATH", DEFAULT_STORE_PATH)
+        self.batch_size = batch_size
+        self._buffer: list[MetricEvent] = []
+        self._lock = threading.Lock()
+        self._last_compaction = 0.0
+        self._conn = self._open()
+
+    def _open(self) -> sqlite3.Connection:
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS events (
+                ts REAL NOT NULL,
+                metric TEXT NOT NULL,
+                value REAL NOT NULL,
+                tenant_id TEXT NOT NULL,
+                role TEXT NOT NULL,
+                interviewer_id TEXT NOT NULL,
+                interview_id TEXT,
+                candidate_id TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_events_interview ON events(interview_id);
+            CREATE INDEX IF NOT EXISTS idx_events_candidate ON events(candidate_id);
+
+            CREATE TABLE IF NOT EXISTS interviews (
+                interview_id TEXT PRIMARY KEY,
+                first_seen REAL NOT NULL
+            );
+
+            CREATE TABLE IF NOT EXISTS rollups (
+                granularity TEXT NOT NULL,
+                metric TEXT NOT NULL,
+                tenant_id TEXT NOT NULL,
+                role TEXT NOT NULL,
+                interviewer_id TEXT NOT NULL,
+                bucket INTEGER NOT NULL,
+                count INTEGER NOT NULL,
+                total REAL NOT NULL,
+                min REAL NOT NULL,
+                max REAL NOT NULL,
+                PRIMARY KEY (granularity, metric, tenant_id, role, interviewer_id, bucket)
+            ) WITHOUT ROWID;
+
+            CREATE TABLE IF NOT EXISTS reports (
+                report_id TEXT PRIMARY KEY,
+                type TEXT NOT NULL,
+                params TEXT NOT NULL,
+                summary TEXT NOT NULL,
+                created_at REAL NOT NULL
+            );
+            """
+        )
+        return conn
+
+    def close(self) -> None:
+        """Flush buffered events and close the database."""
+        self.flush()
+        with self._lock:
+            self._conn.close()
+
+    # ============================
+    # Ingestion
+    # ============================
+
+    def record(self, events: Iterable[MetricEvent]) -> None:
+        """Buffer events, writing them once ``batch_size`` have accumulated.
+
+        Args:
+            events: Analyzer results to append
+        """
+        with self._lock:
+            self._buffer.extend(events)
+            if len(self._buffer) < self.batch_size:
+                return
+        self.flush()
+
+    def flush(self) -> int:
+        """Append buffered events and fold them into the rollups in one transaction.
+
+        Returns:
+            Number of events written
+        """
+        with self._lock:
+            events, self._buffer = self._buffer, []
+            if not events:
+                return 0
+
+            event_rows = []
+            rollup_rows = []
+            new_interviews = []
+            for event in events:
+                dims = (event.tenant_id or "", event.role or "", event.interviewer_id or "")
+                event_rows.append(
+                    (event.timestamp, event.metric, event.value, *dims)
+                    + (event.interview_id, event.candidate_id)
+                )
+                if event.interview_id:
+                    new_interviews.append((event.interview_id, event.timestamp, dims))
+                rollup_rows.extend(
+                    self._rollup_rows(event.metric, event.value, event.timestamp, dims)
+                )
+
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "INSERT INTO events VALUES (?, ?, ?, ?, ?, ?, ?, ?)", event_rows
+                )
+                for interview_id, ts, dims in new_interviews:
+                    cursor = self._conn.execute(
+                        "INSERT OR IGNORE INTO interviews VALUES (?, ?)", (interview_id, ts)
+                    )
+                    if cursor.rowcount:
+                        rollup_rows.extend(self._rollup_rows("interviews", 1.0, ts, dims))
+                self._conn.executemany(
+                    """
+                    INSERT INTO rollups VALUES (?, ?, ?, ?, ?, ?, 1, ?, ?, ?)
+                    ON CONFLICT (granularity, metric, tenant_id, role, interviewer_id, bucket)
+                    DO UPDATE SET
+                        count = count + 1,
+                        total = total + excluded.total,
+                        min = MIN(min, excluded.min),
+                        max = MAX(max, excluded.max)
+                    """,
+                    rollup_rows,
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                self._buffer = events + self._buffer
+                raise
+
+            if time.time() - self._last_compaction > 3600:
+                self._compact()
+        return len(events)
+
+    @staticmethod
+    def _rollup_rows(
+        metric: str, value: float, ts: float, dims: tuple[str, str, str]
+    ) -> list[tuple]:
+        """Rollup upserts for every granularity and every dims/``*`` combination."""
+        rows = []
+        for granularity, width in GRANULARITIES.items():
+            bucket = int(ts // width * width)
+            for combo in product(*((dim, ALL) for dim in dims)):
+                rows.append((granularity, metric, *combo, bucket, value, value, value))
+        return rows
+
+    def _compact(self) -> None:
+        """Drop fine-grained rollups past their retention (caller holds lock)."""
+        now = time.time()
+        for granularity, retention in ROLLUP_RETENTION.items():
+            self._conn.execute(
+                "DELETE FROM rollups WHERE granularity = ? AND bucket < ?",
+                (granularity, now - retention),
+            )
+        self._last_compaction = now
+
+    # ============================
+    # Queries
+    # ============================
+
+    def _dims(
+        self, tenant_id: str | None, role: str | None, interviewer_id: str | None
+    ) -> tuple[str, str, str]:
+        return (tenant_id or ALL, role or ALL, interviewer_id or ALL)
+
+    def timeseries(
+        self,
+        metric: str,
+        granularity: str = "hour",
+        start: datetime | float | None = None,
+        end: datetime | float | None = None,
+        aggregate: str = "avg",
+        tenant_id: str | None = None,
+        role: str | None = None,
+        interviewer_id: str | None = None,
+    ) -> list[tuple[datetime, float]]:
+        """Read one metric as a series of rollup buckets.
+
+        Args:
+            metric: One of METRICS
+            granularity: minute, hour or day
+            start: Earliest bucket (inclusive)
+            end: Latest bucket (exclusive)
+            aggregate: avg, sum, count, min or max
+            tenant_id: Optional tenant filter
+            role: Optional role filter
+            interviewer_id: Optional interviewer filter
+
+        Returns:
+            (bucket start, value) pairs in time order
+        """
+        if granularity not in GRANULARITIES:
+            raise ValueError(f"Unknown granularity: {granularity}")
+        if aggregate not in AGGREGATES:
+            raise ValueError(f"Unknown aggregate: {aggregate}")
+        self.flush()
+
+        start_ts = _epoch(start) or 0
+        end_ts = _epoch(end) or float("inf")
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT bucket, total, count, min, max FROM rollups
+                WHERE granularity = ? AND metric = ? AND tenant_id = ? AND role = ?
+                    AND interviewer_id = ? AND bucket >= ? AND bucket < ?
+                ORDER BY bucket
+                """,
+                (
+                    granularity,
+                    metric,
+                    *self._dims(tenant_id, role, interviewer_id),
+                    start_ts,
+                    end_ts,
+                ),
+            ).fetchall()
+        value = _ROLLUP_VALUES[aggregate]
+        return [(datetime.fromtimestamp(row[0], tz=UTC), value(*row[1:])) for row in rows]
+
+    def summary(
+        self,
+        start: datetime | float | None = None,
+        end: datetime | float | None = None,
+        tenant_id: str | None = None,
+        role: str | None = None,
+        interviewer_id: str | None = None,
+    ) -> dict[str, dict[str, float]]:
+        """Aggregate every metric over a time range from day rollups.
+
+        Returns:
+            ``{metric: {"count", "sum", "avg", "min", "max"}}`` for metrics with data
+        """
+        self.flush()
+        start_ts = _epoch(start) or 0
+        end_ts = _epoch(end) or float("inf")
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT metric, SUM(count), SUM(total), MIN(min), MAX(max) FROM rollups
+                WHERE granularity = 'day' AND tenant_id = ? AND role = ? AND interviewer_id = ?
+                    AND bucket >= ? AND bucket < ?
+                GROUP BY metric
+                """,
+                (*self._dims(tenant_id, role, interviewer_id), start_ts, end_ts),
+            ).fetchall()
+        return {
+            metric: {"count": count, "sum": total, "avg": total / count, "min": low, "max": high}
+            for metric, count, total, low, high in rows
+        }
+
+    def entity_summary(self, column: str, value: str) -> dict[str, dict[str, float]]:
+        """Aggregate raw events for one interview or candidate.
+
+        Args:
+            column: ``interview_id`` or ``candidate_id``
+            value: Identifier to summarize
+
+        Returns:
+            ``{metric: {"count", "avg", "min", "max"}}``
+        """
+        if column not in _ENTITY_SUMMARY_SQL:
+            raise ValueError(f"Cannot summarize by {column}")
+        self.flush()
+        with self._lock:
+            rows = self._conn.execute(_ENTITY_SUMMARY_SQL[column], (value,)).fetchall()
+        return {
+            metric: {"count": count, "avg": avg, "min": low, "max": high}
+            for metric, count, avg, low, high in rows
+        }
+
+    # ============================
+    # Reports
+    # ============================
+
+    def save_report(self, report_type: str, params: dict[str, Any], summary: dict) -> dict:
+        """Persist a generated report.
+
+        Returns:
+            The stored report record
+        """
+        report = {
+            "report_id": f"report-{uuid.uuid4().hex[:12]}",
+            "type": report_type,
+            "params": params,
+            "summary": summary,
+            "created_at": time.time(),
+        }
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO reports VALUES (?, ?, ?, ?, ?)",
+                (
+                    report["report_id"],
+                    report_type,
+                    json.dumps(params, default=str),
+                    json.dumps(summary, default=str),
+                    report["created_at"],
+                ),
+            )
+        return report
+
+    def get_report(self, report_id: str) -> dict | None:
+        """Load a stored report, or None if it does not exist."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT report_id, type, params, summary, created_at FROM reports "
+                "WHERE report_id = ?",
+                (report_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "report_id": row[0],
+            "type": row[1],
+            "params": json.loads(row[2]),
+            "summary": json.loads(row[3]),
+            "created_at": row[4],
+        }
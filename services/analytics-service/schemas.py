@@ -5,7 +5,7 @@ Coverage: ~14 request/response models for sentiment, quality, bias, expertise, p
 
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -17,8 +17,19 @@ class SeverityLevel(str, Enum):
     critical = "critical"
 
 
+class AnalysisContext(BaseModel):
+    """Identifies where an analyzed text came from, for metrics rollups."""
+
+    interview_id: str | None = None
+    candidate_id: str | None = None
+    tenant_id: str | None = None
+    role: str | None = None
+    interviewer_id: str | None = None
+
+
 class SentimentAnalysisRequest(BaseModel):
     text: str = Field(..., min_length=1)
+    context: AnalysisContext | None = None
 
 
 class SentimentAnalysis(BaseModel):
@@ -33,6 +44,7 @@ class SentimentAnalysis(BaseModel):
 class ResponseQualityRequest(BaseModel):
     response_text: str = Field(..., min_length=1)
     question_context: str = Field(..., min_length=1)
+    context: AnalysisContext | None = None
 
 
 class ResponseQuality(BaseModel):
@@ -48,6 +60,7 @@ class ResponseQuality(BaseModel):
 class BiasDetectionRequest(BaseModel):
     text: str = Field(..., min_length=1)
     participants: list[dict[str, Any]] | None = None
+    context: AnalysisContext | None = None
 
 
 class BiasDetection(BaseModel):
@@ -71,6 +84,38 @@ class ExpertiseAssessment(BaseModel):
     experience_years: int | None = None
 
 
+class BatchAnalysisItem(BaseModel):
+    id: str | None = None
+    text: str = Field(..., min_length=1)
+    question_context: str | None = None
+    context: AnalysisContext | None = None
+
+
+class BatchAnalysisRequest(BaseModel):
+    items: list[BatchAnalysisItem] = Field(..., min_length=1, max_length=5000)
+    analyzers: list[Literal["sentiment", "quality", "bias", "expertise"]] = [
+        "sentiment",
+        "quality",
+        "bias",
+        "expertise",
+    ]
+
+
+class BatchAnalysisResult(BaseModel):
+    index: int
+    id: str | None = None
+    sentiment: SentimentAnalysis | None = None
+    quality: ResponseQuality | None = None
+    bias: BiasDetection | None = None
+    expertise: ExpertiseAssessment | None = None
+    errors: dict[str, str] = {}
+
+
+class BatchAnalysisResponse(BaseModel):
+    results: list[BatchAnalysisResult]
+    total: int
+
+
 class InterviewPerformanceRequest(BaseModel):
     room_id: str
     response_analyses: list[dict[str, Any]] = []
@@ -131,6 +176,7 @@ class ReportResponse(BaseModel):
     status: str
     created_at: datetime
     url: str | None = None
+    summary: dict[str, Any] | None = None
 
 
 class ReportExportResponse(BaseModel):
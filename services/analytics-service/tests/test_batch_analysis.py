@@ -0,0 +1,84 @@
+import main
+import pytest
+from metrics_store import MetricsStore
+
+ANSWERS = [
+    {
+        "id": "a1",
+        "text": "I architected and led a Kubernetes migration on AWS. It went great.",
+        "question_context": "Describe your cloud experience.",
+    },
+    {
+        "id": "a2",
+        "text": "I struggle with difficult SQL queries but I am learning.",
+        "question_context": "How comfortable are you with databases?",
+    },
+    {"id": "a3", "text": "We want a young junior person from a similar background and culture."},
+]
+
+
+class TestBatchAnalysis:
+    def test_results_match_single_endpoints_in_order(self, client):
+        response = client.post("/api/v1/analyze/batch", json={"items": ANSWERS})
+        assert response.status_code == 200
+        results = response.json()["results"]
+
+        assert [r["id"] for r in results] == ["a1", "a2", "a3"]
+        assert [r["index"] for r in results] == [0, 1, 2]
+
+        single = client.post("/api/v1/analyze/sentiment", json={"text": ANSWERS[1]["text"]})
+        assert results[1]["sentiment"] == single.json()
+
+        single = client.post(
+            "/api/v1/analyze/quality",
+            json={
+                "response_text": ANSWERS[0]["text"],
+                "question_context": ANSWERS[0]["question_context"],
+            },
+        )
+        assert results[0]["quality"] == single.json()
+        assert results[0]["expertise"]["level"] in ["advanced", "expert"]
+        assert "age_bias" in results[2]["bias"]["flags"]
+
+    def test_quality_without_question_reported_per_item(self, client):
+        response = client.post(
+            "/api/v1/analyze/batch", json={"items": ANSWERS, "analyzers": ["quality"]}
+        )
+        results = response.json()["results"]
+
+        assert results[0]["quality"] is not None
+        assert results[0]["sentiment"] is None
+        assert results[2]["quality"] is None
+        assert "quality" in results[2]["errors"]
+
+    def test_unknown_analyzer_rejected(self, client):
+        response = client.post(
+            "/api/v1/analyze/batch", json={"items": ANSWERS, "analyzers": ["tone"]}
+        )
+        assert response.status_code == 422
+
+    def test_large_batch_uses_process_pool(self, client, monkeypatch):
+        monkeypatch.setattr(main, "BATCH_POOL_THRESHOLD", 2)
+        monkeypatch.setattr(main, "BATCH_CHUNK_SIZE", 2)
+        items = [{"id": str(i), "text": f"Answer number {i} was great."} for i in range(7)]
+
+        response = client.post(
+            "/api/v1/analyze/batch", json={"items": items, "analyzers": ["sentiment"]}
+        )
+
+        assert response.status_code == 200
+        assert [r["id"] for r in response.json()["results"]] == [str(i) for i in range(7)]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
+
+
+@pytest.mark.asyncio
+async def test_process_pool_is_shut_down_with_the_app(monkeypatch):
+    monkeypatch.setattr(main, "metrics_store", MetricsStore(":memory:"))
+    async with main.lifespan(main.app):
+        pool = main._get_process_pool()
+    assert main._process_pool is None
+    with pytest.raises(RuntimeError):
+        pool.submit(len, [])
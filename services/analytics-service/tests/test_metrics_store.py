@@ -0,0 +1,129 @@
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from metrics_store import MetricEvent, MetricsStore
+
+
+@pytest.fixture
+def store():
+    return MetricsStore(":memory:", batch_size=10)
+
+
+class TestMetricsStore:
+    def test_rollups_split_by_dimension(self, store):
+        now = time.time()
+        store.record(
+            [
+                MetricEvent("quality", 8.0, now, tenant_id="acme", role="backend"),
+                MetricEvent("quality", 6.0, now, tenant_id="acme", role="frontend"),
+                MetricEvent("quality", 2.0, now, tenant_id="globex", role="backend"),
+            ]
+        )
+
+        assert store.summary()["quality"]["count"] == 3
+        assert store.summary(tenant_id="acme")["quality"]["avg"] == 7.0
+        assert store.summary(role="backend")["quality"]["avg"] == 5.0
+        assert store.summary(tenant_id="acme", role="backend")["quality"]["max"] == 8.0
+
+    def test_timeseries_buckets_by_granularity(self, store):
+        base = datetime.now(UTC).replace(minute=0, second=0, microsecond=0)
+        base -= timedelta(hours=3)
+        store.record(
+            [
+                MetricEvent("sentiment", 0.5, base.timestamp()),
+                MetricEvent("sentiment", -0.5, (base + timedelta(minutes=5)).timestamp()),
+                MetricEvent("sentiment", 1.0, (base + timedelta(hours=2)).timestamp()),
+            ]
+        )
+
+        hourly = store.timeseries("sentiment", "hour", start=base, aggregate="sum")
+        daily = store.timeseries(
+            "sentiment", "day", start=base - timedelta(days=1), aggregate="count"
+        )
+
+        assert [value for _, value in hourly] == [0.0, 1.0]
+        assert sum(value for _, value in daily) == 3
+
+    def test_old_minute_rollups_compacted(self, store):
+        old = time.time() - 30 * 86400
+        store.record([MetricEvent("quality", 4.0, old)])
+
+        assert store.timeseries("quality", "minute", start=old - 60) == []
+        assert store.summary(start=old - 86400)["quality"]["avg"] == 4.0
+
+    def test_interviews_counted_once(self, store):
+        now = time.time()
+        store.record(MetricEvent("quality", 5.0, now, interview_id="int-1") for _ in range(4))
+        store.record([MetricEvent("bias", 0.2, now, interview_id="int-2")])
+
+        assert store.summary()["interviews"]["sum"] == 2
+        assert store.entity_summary("interview_id", "int-1")["quality"]["count"] == 4
+
+    def test_reports_round_trip(self, store):
+        report = store.save_report("daily", {"date_range": "day"}, {"metrics": {}})
+
+        assert store.get_report(report["report_id"])["summary"] == {"metrics": {}}
+        assert store.get_report("missing") is None
+
+
+class TestMetricsEndpoints:
+    def test_analyzer_results_feed_metrics(self, client):
+        context = {"tenant_id": "tenant-metrics", "interview_id": "int-metrics"}
+        client.post(
+            "/api/v1/analyze/sentiment",
+            json={"text": "I love this team", "context": context},
+        )
+        client.post(
+            "/api/v1/analyze/bias",
+            json={"text": "young junior candidate", "context": context},
+        )
+
+        response = client.get("/api/v1/analytics/metrics", params={"tenant_id": "tenant-metrics"})
+        data = response.json()
+
+        assert response.status_code == 200
+        assert data["interviews_analyzed"] == 1
+        assert data["avg_sentiment"] > 0
+        assert data["bias_incidents"] == 1
+
+    def test_timeseries_rejects_unknown_metric(self, client):
+        response = client.get("/api/v1/analytics/metrics/timeseries", params={"metric": "unknown"})
+        assert response.status_code == 422
+
+    def test_report_created_and_fetched(self, client):
+        created = client.post(
+            "/api/v1/analytics/reports", json={"type": "weekly", "date_range": "week"}
+        ).json()
+
+        response = client.get(f"/api/v1/analytics/reports/{created['report_id']}")
+
+        assert response.status_code == 200
+        assert "metrics" in response.json()["summary"]
+        assert client.get("/api/v1/analytics/reports/missing").status_code == 404
+
+
+class TestServiceLifespan:
+    @pytest.mark.asyncio
+    async def test_buffered_events_are_flushed_on_a_timer_and_on_shutdown(
+        self, tmp_path, monkeypatch
+    ):
+        import main
+
+        path = str(tmp_path / "metrics.sqlite3")
+        store = MetricsStore(path, batch_size=1000)
+        monkeypatch.setattr(main, "metrics_store", store)
+        monkeypatch.setattr(main, "METRICS_FLUSH_INTERVAL", 0.01)
+
+        async with main.lifespan(main.app):
+            store.record([MetricEvent("quality", 7.0)])
+            for _ in range(100):
+                if not store._buffer:
+                    break
+                await asyncio.sleep(0.01)
+            assert not store._buffer
+            store.record([MetricEvent("quality", 9.0)])
+
+        # Shutdown flushed the last event and closed the store
+        assert MetricsStore(path).summary()["quality"]["count"] == 2
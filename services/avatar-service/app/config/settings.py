@@ -1,6 +1,9 @@
 """Configuration settings for the Avatar Service."""
 
+import json
+import os
 import tempfile
+from pathlib import Path
 
 from dotenv import load_dotenv
 
@@ -18,6 +21,32 @@ ALLOWED_ORIGINS = [
 AUDIO_OUTPUT_FORMAT = "mp3_44100_128"
 TEMP_AUDIO_PATH = tempfile.gettempdir()
 
+# Voice service used for TTS + phoneme extraction
+VOICE_SERVICE_URL = os.getenv("VOICE_SERVICE_URL", "http://localhost:8002")
+
+# Streaming lip-sync: audio is sent to the client in chunks of this length
+LIPSYNC_CHUNK_MS = int(os.getenv("AVATAR_LIPSYNC_CHUNK_MS", "100"))
+
+# Offline video render jobs
+RENDER_JOB_DIR = os.getenv("AVATAR_RENDER_JOB_DIR", os.path.join(tempfile.gettempdir(), "OpenTalent_render_jobs"))
+RENDER_JOB_TTL_SEC = int(os.getenv("AVATAR_RENDER_JOB_TTL_SEC", "3600"))
+
+
+def _renderer_version() -> str:
+    try:
+        package = json.loads((Path(__file__).resolve().parents[2] / "package.json").read_text())
+        return str(package.get("version", "0"))
+    except (OSError, ValueError):
+        return "0"
+
+
+# Render cache: speech, phonemes and videos keyed on (text, voice, model, renderer version)
+RENDER_CACHE_DIR = os.getenv("AVATAR_RENDER_CACHE_DIR", os.path.join(tempfile.gettempdir(), "OpenTalent_render_cache"))
+RENDER_CACHE_MAX_BYTES = int(os.getenv("AVATAR_RENDER_CACHE_MAX_MB", "2048")) * 1024 * 1024
+# Bump (or set AVATAR_RENDERER_VERSION) when renderer output changes to invalidate cached videos
+RENDERER_VERSION = os.getenv("AVATAR_RENDERER_VERSION") or _renderer_version()
+PRECOMPUTE_CONCURRENCY = int(os.getenv("AVATAR_PRECOMPUTE_CONCURRENCY", "2"))
+
 # Service Information
 SERVICE_TITLE = "OpenTalent - Avatar Service"
 SERVICE_DESCRIPTION = "Manages AI avatar interactions and rendering"
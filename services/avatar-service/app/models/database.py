@@ -6,7 +6,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import JSON, Column, DateTime, Float, ForeignKey, Integer, String
+from sqlalchemy import JSON, Column, DateTime, Float, ForeignKey, Integer, LargeBinary, String
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
@@ -111,6 +111,8 @@ class Audio(Base):
     sample_rate = Column(Integer, default=22050)
     file_path = Column(String(1024), nullable=True)
     file_size = Column(Integer, nullable=True)
+    # Packed phoneme timing (see lipsync_service.PhonemeTimeline)
+    phoneme_timeline = Column(LargeBinary, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
     # Relationships
@@ -122,7 +124,11 @@ class Audio(Base):
 
 
 class Phoneme(Base):
-    """Phoneme entity — phoneme timing data for lipsync."""
+    """Phoneme entity — legacy per-row phoneme timing.
+
+    Timings are now stored packed in ``Audio.phoneme_timeline``; rows left
+    in this table are converted by ``DatabaseService.migrate_phoneme_rows``.
+    """
 
     __tablename__ = "phonemes"
 
@@ -3,30 +3,69 @@
 Endpoints for avatar video generation and management.
 """
 
+import asyncio
+import base64
 import io
 import logging
+import time
+import uuid
 from pathlib import Path
 
 import httpx
-from fastapi import APIRouter, File, Form, HTTPException, Request, UploadFile
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    File,
+    Form,
+    HTTPException,
+    Request,
+    UploadFile,
+    WebSocket,
+    WebSocketDisconnect,
+)
 from fastapi.responses import FileResponse, HTMLResponse, StreamingResponse
-from pydantic import BaseModel
-
+from pydantic import BaseModel, Field
+
+from app.config.settings import (
+    LIPSYNC_CHUNK_MS,
+    PRECOMPUTE_CONCURRENCY,
+    RENDER_CACHE_DIR,
+    RENDER_CACHE_MAX_BYTES,
+    RENDER_JOB_DIR,
+    RENDER_JOB_TTL_SEC,
+    RENDERER_VERSION,
+    VOICE_SERVICE_URL,
+)
+from app.services import lipsync_service
 from app.services.avatar_rendering_service import AvatarRenderingService
+from app.services.render_cache import PHONEMES_FILE, CacheEntry, RenderCache, cache_key, speech_key
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 # Initialize service
 avatar_service = AvatarRenderingService()
+render_cache = RenderCache(RENDER_CACHE_DIR, RENDER_CACHE_MAX_BYTES)
+
+DEFAULT_VOICE = "en_US-lessac-medium"
+DEFAULT_AVATAR_MODEL = "face"
 
 
 class AvatarRequest(BaseModel):
     """Request model for avatar generation."""
 
     text: str
-    voice: str | None = "en_US-lessac-medium"
+    voice: str | None = DEFAULT_VOICE
+    avatar_id: str | None = "default"
+
+
+class PrecomputeRequest(BaseModel):
+    """Lines to synthesize (and optionally render) ahead of interviews."""
+
+    texts: list[str] = Field(..., min_length=1, max_length=5000)
+    voice: str | None = DEFAULT_VOICE
     avatar_id: str | None = "default"
+    render_video: bool = False
 
 
 class PhonemeData(BaseModel):
@@ -40,13 +79,108 @@ class PhonemeData(BaseModel):
 # Global storage for current session phonemes and audio
 current_session = {"audio_url": None, "phonemes": None}
 
+# Offline video render jobs by id
+render_jobs: dict[str, dict] = {}
+
+
+async def _synthesize(text: str, voice: str | None) -> tuple[bytes, float, list]:
+    """Get speech audio and aligned phonemes from the voice service.
+
+    Returns:
+        (audio_bytes, duration_seconds, phonemes)
+    """
+    async with httpx.AsyncClient(timeout=30.0) as client:
+        voice_response = await client.post(
+            f"{VOICE_SERVICE_URL}/voice/tts",
+            json={"text": text, "voice": voice, "extract_phonemes": True},
+        )
+        voice_response.raise_for_status()
+        voice_data = voice_response.json()
+
+    audio_data = voice_data.get("audio_data")
+    if not audio_data:
+        raise HTTPException(status_code=500, detail="No audio data from voice service")
+    if isinstance(audio_data, str):
+        audio_data = base64.b64decode(audio_data)
+    return audio_data, voice_data.get("duration", 5.0), voice_data.get("phonemes", [])
+
+
+def _line_settings(voice: str | None, avatar_id: str | None) -> tuple[str, str]:
+    """Voice and avatar model of a line with defaults filled in.
+
+    Every route resolves defaults here, so lines warmed by precompute are
+    found again by ``/generate`` and ``/lipsync/stream``.
+    """
+    model = avatar_id if avatar_id and avatar_id != "default" else DEFAULT_AVATAR_MODEL
+    return voice or DEFAULT_VOICE, model
+
+
+def _video_key(text: str, voice: str | None, avatar_id: str | None) -> str:
+    return cache_key(text, *_line_settings(voice, avatar_id), RENDERER_VERSION)
+
+
+def _speech_key(text: str, voice: str | None) -> str:
+    return speech_key(text, _line_settings(voice, None)[0])
+
+
+async def _speech(text: str, voice: str | None) -> tuple[bytes, float, list]:
+    """Speech audio and phonemes for a line, synthesized only on a cache miss."""
+    voice = _line_settings(voice, None)[0]
+    key = speech_key(text, voice)
+    entry = render_cache.get(key)
+    if entry is not None and entry.has_speech:
+        stored = await asyncio.to_thread(entry.phonemes)
+        audio_data = await asyncio.to_thread(entry.audio.read_bytes)
+        return audio_data, stored["duration"], stored["phonemes"]
+    audio_data, duration, phonemes = await _synthesize(text, voice)
+    await asyncio.to_thread(render_cache.put_speech, key, audio_data, phonemes, duration)
+    return audio_data, duration, phonemes
+
+
+def _video_extension(video_bytes: bytes) -> str:
+    # The Node renderer produces WebM; the mock fallback produces MP4
+    return "mp4" if video_bytes[4:8] == b"ftyp" else "webm"
+
+
+async def _video(request: AvatarRequest) -> CacheEntry | bytes:
+    """Rendered lip-sync video for a line, rendered only on a cache miss.
+
+    Returns:
+        The cache entry holding the video, or the video bytes of a mock
+        render when the renderer failed (mock videos are not cached).
+    """
+    voice, model = _line_settings(request.voice, request.avatar_id)
+    key = _video_key(request.text, voice, model)
+    entry = render_cache.get(key)
+    if entry is not None and entry.video is not None:
+        return entry
+    audio_data, duration, phonemes = await _speech(request.text, voice)
+    try:
+        video_bytes = await avatar_service.generate_avatar_video(
+            audio_data=audio_data,
+            phonemes=phonemes,
+            duration=duration,
+            model=model,
+            fallback_to_mock=False,
+        )
+    except Exception as e:
+        logger.warning(f"Rendering failed, returning an uncached mock video: {e}")
+        return await avatar_service.generate_mock_video(audio_data, duration)
+    return await asyncio.to_thread(
+        render_cache.put_video, key, video_bytes, _video_extension(video_bytes)
+    )
+
 
 @router.get("/")
 async def get_avatar_page():
     """Serve the avatar HTML page from shared ai-orchestra-simulation library."""
     try:
         # Use shared avatar.html from ai-orchestra-simulation
-        html_path = Path(__file__).parent.parent.parent.parent.parent / "ai-orchestra-simulation" / "avatar.html"
+        html_path = (
+            Path(__file__).parent.parent.parent.parent.parent
+            / "ai-orchestra-simulation"
+            / "avatar.html"
+        )
         with open(html_path) as f:
             html_content = f.read()
         return HTMLResponse(content=html_content, status_code=200)
@@ -60,7 +194,12 @@ async def serve_src_files(path: str):
     """Serve JavaScript source files from shared ai-orchestra-simulation library."""
     try:
         # Use shared library from ai-orchestra-simulation
-        orchestra_path = Path(__file__).parent.parent.parent.parent.parent / "ai-orchestra-simulation" / "src" / path
+        orchestra_path = (
+            Path(__file__).parent.parent.parent.parent.parent
+            / "ai-orchestra-simulation"
+            / "src"
+            / path
+        )
         if orchestra_path.exists() and orchestra_path.is_file():
             return FileResponse(orchestra_path)
         else:
@@ -76,7 +215,10 @@ async def serve_asset_files(path: str):
     try:
         # Use shared assets from ai-orchestra-simulation
         orchestra_assets = (
-            Path(__file__).parent.parent.parent.parent.parent / "ai-orchestra-simulation" / "assets" / path
+            Path(__file__).parent.parent.parent.parent.parent
+            / "ai-orchestra-simulation"
+            / "assets"
+            / path
         )
         if orchestra_assets.exists() and orchestra_assets.is_file():
             return FileResponse(orchestra_assets)
@@ -95,47 +237,23 @@ async def generate_avatar_video(request: AvatarRequest):
     1. Calls voice service to generate audio and phonemes
     2. Generates avatar video with lip-sync
     3. Returns the video file
+
+    Lines rendered before are served straight from the render cache.
     """
     try:
         logger.info(f"Generating avatar video for text: {request.text[:50]}...")
 
-        # Call voice service for TTS
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            voice_response = await client.post(
-                "http://localhost:8002/voice/tts",
-                json={"text": request.text, "voice": request.voice, "extract_phonemes": True},
+        result = await _video(request)
+        if isinstance(result, CacheEntry):
+            return FileResponse(
+                result.video,
+                media_type=result.video_media_type,
+                filename=f"avatar_video{result.video.suffix}",
             )
-            voice_response.raise_for_status()
-
-            # Parse JSON response
-            voice_data = voice_response.json()
-            audio_data = voice_data.get("audio_data")
-            duration = voice_data.get("duration", 5.0)
-            phonemes = voice_data.get("phonemes", [])
-            voice_data.get("words", [])
-
-        if not audio_data:
-            raise HTTPException(status_code=500, detail="No audio data from voice service")
-
-        logger.info(f"Received audio: {len(audio_data)} bytes, duration: {duration:.2f}s, phonemes: {len(phonemes)}")
-
-        # Convert audio_data from base64
-        if isinstance(audio_data, str):
-            import base64
-
-            audio_data = base64.b64decode(audio_data)
-
-        # Generate avatar video with phonemes
-        video_bytes = await avatar_service.generate_avatar_video(
-            audio_data=audio_data,
-            phonemes=phonemes,
-            duration=duration,
-            model=request.avatar_id or "face",
-        )
 
         # Return video as streaming response
         return StreamingResponse(
-            io.BytesIO(video_bytes),
+            io.BytesIO(result),
             media_type="video/webm",
             headers={"Content-Disposition": "attachment; filename=avatar_video.webm"},
         )
@@ -143,6 +261,8 @@ async def generate_avatar_video(request: AvatarRequest):
     except httpx.RequestError as e:
         logger.error(f"Voice service error: {e}")
         raise HTTPException(status_code=503, detail="Voice service unavailable")
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Avatar generation failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -209,7 +329,9 @@ async def generate_avatar_from_audio(
             phoneme_data = json.loads(phonemes)
 
         # Generate video
-        video_bytes = await avatar_service.generate_avatar_video(audio_data=audio_data, phonemes=phoneme_data)
+        video_bytes = await avatar_service.generate_avatar_video(
+            audio_data=audio_data, phonemes=phoneme_data
+        )
 
         return StreamingResponse(
             io.BytesIO(video_bytes),
@@ -222,6 +344,263 @@ async def generate_avatar_from_audio(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.websocket("/lipsync/stream")
+async def stream_lipsync(websocket: WebSocket):
+    """Stream speech audio with a viseme timeline for client-side lip-sync.
+
+    The client sends one JSON message per utterance::
+
+        {"text": "...", "voice": "en_US-lessac-medium", "format": "ndjson" | "binary"}
+
+    and receives, in order:
+
+    1. ``{"event": "start", ...}`` with the audio format and viseme id table
+    2. the timeline: one text message of NDJSON frames ``{"v", "s", "e"}``,
+       or one binary message (see ``lipsync_service.encode_binary``)
+    3. binary audio chunks of ``AVATAR_LIPSYNC_CHUNK_MS`` each
+    4. ``{"event": "end", ...}``
+
+    No video is rendered; the desktop client drives the avatar's morph
+    targets from the timeline while the audio plays. The connection stays
+    open for further utterances.
+    """
+    await websocket.accept()
+    try:
+        while True:
+            message = await websocket.receive_json()
+            text = (message.get("text") or "").strip()
+            output_format = message.get("format", "ndjson")
+            if not text or output_format not in ("ndjson", "binary"):
+                await websocket.send_json(
+                    {
+                        "event": "error",
+                        "detail": "Expected non-empty text and format 'ndjson' or 'binary'",
+                    }
+                )
+                continue
+
+            utterance_id = message.get("utterance_id") or uuid.uuid4().hex
+            try:
+                audio_data, duration, phonemes = await _speech(text, message.get("voice"))
+            except (httpx.HTTPError, HTTPException) as e:
+                logger.error(f"Voice service error: {e}")
+                await websocket.send_json(
+                    {
+                        "event": "error",
+                        "utterance_id": utterance_id,
+                        "detail": "Voice service unavailable",
+                    }
+                )
+                continue
+
+            frames = lipsync_service.build_timeline(phonemes)
+            audio = lipsync_service.audio_format(audio_data)
+            duration_ms = audio.get("duration_ms") or int(duration * 1000)
+            await websocket.send_json(
+                {
+                    "event": "start",
+                    "utterance_id": utterance_id,
+                    "format": output_format,
+                    "frames": len(frames),
+                    "duration_ms": duration_ms,
+                    "audio": audio,
+                    "visemes": list(lipsync_service.VISEMES),
+                }
+            )
+            if output_format == "binary":
+                await websocket.send_bytes(lipsync_service.encode_binary(frames, duration_ms))
+            else:
+                await websocket.send_text(lipsync_service.encode_ndjson(frames))
+
+            chunks = 0
+            for chunk in lipsync_service.audio_chunks(audio_data, LIPSYNC_CHUNK_MS):
+                await websocket.send_bytes(chunk)
+                chunks += 1
+            await websocket.send_json(
+                {"event": "end", "utterance_id": utterance_id, "chunks": chunks}
+            )
+    except WebSocketDisconnect:
+        return
+
+
+def _purge_render_jobs() -> None:
+    """Drop finished jobs (and their videos) older than AVATAR_RENDER_JOB_TTL_SEC."""
+    cutoff = time.time() - RENDER_JOB_TTL_SEC
+    for job_id, job in list(render_jobs.items()):
+        if job["status"] in ("completed", "failed") and job["updated_at"] < cutoff:
+            if job.get("path"):
+                Path(job["path"]).unlink(missing_ok=True)
+            render_jobs.pop(job_id, None)
+
+
+async def _run_render_job(job_id: str, request: AvatarRequest) -> None:
+    job = render_jobs[job_id]
+    job.update(status="running", updated_at=time.time())
+    try:
+        result = await _video(request)
+        if isinstance(result, CacheEntry):
+            job.update(
+                status="completed",
+                cache_key=result.key,
+                media_type=result.video_media_type,
+                size=result.video.stat().st_size,
+            )
+        else:
+            extension = _video_extension(result)
+            output_dir = Path(RENDER_JOB_DIR)
+            output_dir.mkdir(parents=True, exist_ok=True)
+            path = output_dir / f"{job_id}.{extension}"
+            path.write_bytes(result)
+            job.update(
+                status="completed",
+                path=str(path),
+                media_type=f"video/{extension}",
+                size=len(result),
+            )
+    except Exception as e:
+        logger.error(f"Render job {job_id} failed: {e}")
+        job.update(status="failed", error=str(e))
+    job["updated_at"] = time.time()
+
+
+def _job_view(job: dict) -> dict:
+    return {key: value for key, value in job.items() if key != "path"}
+
+
+@router.post("/render/jobs", status_code=202)
+async def create_render_job(request: AvatarRequest, background_tasks: BackgroundTasks):
+    """Queue an offline lip-sync video render.
+
+    Interactive sessions use ``/lipsync/stream``; full video rendering is
+    only needed for recordings and previews, so it runs in the background
+    and is fetched from ``/render/jobs/{job_id}/video`` when complete.
+    """
+    _purge_render_jobs()
+    job_id = uuid.uuid4().hex
+    now = time.time()
+    render_jobs[job_id] = {
+        "job_id": job_id,
+        "status": "queued",
+        "created_at": now,
+        "updated_at": now,
+    }
+    background_tasks.add_task(_run_render_job, job_id, request)
+    return _job_view(render_jobs[job_id])
+
+
+@router.get("/render/jobs/{job_id}")
+async def get_render_job(job_id: str):
+    """Get the status of an offline render job."""
+    job = render_jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Render job not found")
+    return _job_view(job)
+
+
+@router.get("/render/jobs/{job_id}/video")
+async def get_render_job_video(job_id: str):
+    """Download the video of a completed render job."""
+    job = render_jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Render job not found")
+    if job.get("kind") == "precompute":
+        raise HTTPException(status_code=404, detail="Precompute jobs have no video")
+    if job["status"] != "completed":
+        raise HTTPException(status_code=409, detail=f"Render job is {job['status']}")
+    if job.get("cache_key"):
+        entry = render_cache.get(job["cache_key"])
+        if entry is None or entry.video is None:
+            raise HTTPException(status_code=410, detail="Rendered video was evicted from the cache")
+        return FileResponse(
+            entry.video, media_type=entry.video_media_type, filename=f"{job_id}{entry.video.suffix}"
+        )
+    return FileResponse(job["path"], media_type=job["media_type"], filename=Path(job["path"]).name)
+
+
+async def _run_precompute(job_id: str, request: PrecomputeRequest) -> None:
+    job = render_jobs[job_id]
+    job.update(status="running", updated_at=time.time())
+    semaphore = asyncio.Semaphore(PRECOMPUTE_CONCURRENCY)
+
+    async def warm(text: str) -> None:
+        async with semaphore:
+            try:
+                if request.render_video:
+                    line = AvatarRequest(
+                        text=text, voice=request.voice, avatar_id=request.avatar_id
+                    )
+                    if not isinstance(await _video(line), CacheEntry):
+                        raise RuntimeError("Renderer unavailable")
+                else:
+                    await _speech(text, request.voice)
+                job["done"] += 1
+            except Exception as e:
+                logger.warning(f"Precompute failed for line {text[:50]!r}: {e}")
+                job["failed"] += 1
+            job["updated_at"] = time.time()
+
+    await asyncio.gather(*(warm(text) for text in job["keys"]))
+    job.update(status="completed", updated_at=time.time())
+
+
+@router.post("/render/precompute", status_code=202)
+async def precompute_renders(request: PrecomputeRequest, background_tasks: BackgroundTasks):
+    """Warm the render cache for a question bank.
+
+    Synthesizes speech and phonemes for every line (and renders the video
+    when ``render_video`` is set) in the background. Progress is reported by
+    ``/render/jobs/{job_id}``; ``keys`` maps each line to its cache key for
+    ``/render/cache/{key}/{artifact}`` (the video's key when ``render_video``
+    is set, otherwise the speech's).
+    """
+    _purge_render_jobs()
+    job_id = uuid.uuid4().hex
+    now = time.time()
+    texts = list(dict.fromkeys(text.strip() for text in request.texts if text.strip()))
+
+    def line_key(text: str) -> str:
+        if request.render_video:
+            return _video_key(text, request.voice, request.avatar_id)
+        return _speech_key(text, request.voice)
+
+    render_jobs[job_id] = {
+        "job_id": job_id,
+        "kind": "precompute",
+        "status": "queued",
+        "total": len(texts),
+        "done": 0,
+        "failed": 0,
+        "keys": {text: line_key(text) for text in texts},
+        "created_at": now,
+        "updated_at": now,
+    }
+    background_tasks.add_task(_run_precompute, job_id, request)
+    return _job_view(render_jobs[job_id])
+
+
+@router.get("/render/cache/stats")
+async def render_cache_stats():
+    """Render cache size and hit counters."""
+    return {**render_cache.stats(), "renderer_version": RENDERER_VERSION}
+
+
+@router.get("/render/cache/{key}/{artifact}")
+async def get_cached_artifact(key: str, artifact: str):
+    """Serve a cached ``audio``, ``phonemes`` or ``video`` file directly from disk."""
+    if artifact not in ("audio", "phonemes", "video"):
+        raise HTTPException(status_code=404, detail=f"Unknown artifact: {artifact}")
+    entry = render_cache.get(key)
+    if entry is None:
+        raise HTTPException(status_code=404, detail="Not in render cache")
+    if artifact == "video":
+        if entry.video is None:
+            raise HTTPException(status_code=404, detail="Video not rendered")
+        return FileResponse(entry.video, media_type=entry.video_media_type)
+    if artifact == "audio":
+        return FileResponse(entry.audio, media_type="audio/wav")
+    return FileResponse(entry.path / PHONEMES_FILE, media_type="application/json")
+
+
 @router.get("/info")
 async def get_avatar_info():
     """Get avatar service information."""
@@ -46,6 +46,7 @@ class AvatarRenderingService:
         phonemes: list | None = None,
         duration: float | None = None,
         model: str = "face",
+        fallback_to_mock: bool = True,
     ) -> bytes:
         """Generate avatar video with audio using Node.js renderer.
 
@@ -54,6 +55,8 @@ class AvatarRenderingService:
             phonemes: Phoneme timing data for lip-sync (optional)
             duration: Audio duration in seconds
             model: Avatar model preset ('face', 'metahuman', 'conductor')
+            fallback_to_mock: Return a mock video when rendering fails; if
+                False the error is raised instead (used when the result is cached)
 
         Returns:
             Video file as bytes
@@ -61,8 +64,10 @@ class AvatarRenderingService:
         try:
             # If no phonemes provided, return mock video
             if not phonemes:
+                if not fallback_to_mock:
+                    raise ValueError("Phonemes are required for lip-sync rendering")
                 logger.warning("No phonemes provided, using mock video generation")
-                return await self._generate_mock_video(audio_data, duration)
+                return await self.generate_mock_video(audio_data, duration)
 
             # Upload audio to temporary accessible URL
             audio_url = await self._upload_audio_temp(audio_data)
@@ -87,7 +92,9 @@ class AvatarRenderingService:
                 if response.status != 200:
                     error_text = await response.text()
                     logger.error(f"Avatar renderer failed: {response.status} - {error_text}")
-                    return await self._generate_mock_video(audio_data, duration)
+                    if not fallback_to_mock:
+                        raise RuntimeError(f"Avatar renderer failed with status {response.status}")
+                    return await self.generate_mock_video(audio_data, duration)
 
                 # Get video data
                 video_data = await response.read()
@@ -104,8 +111,10 @@ class AvatarRenderingService:
 
         except Exception as e:
             logger.error(f"Failed to generate avatar video: {e}")
+            if not fallback_to_mock:
+                raise
             # Fallback to mock video
-            return await self._generate_mock_video(audio_data, duration)
+            return await self.generate_mock_video(audio_data, duration)
 
     async def _upload_audio_temp(self, audio_data: bytes) -> str:
         """Upload audio to temporary accessible location."""
@@ -131,7 +140,7 @@ class AvatarRenderingService:
         except Exception as e:
             logger.warning(f"Failed to cleanup temp file {file_path}: {e}")
 
-    async def _generate_mock_video(self, audio_data: bytes, duration: float | None = None) -> bytes:
+    async def generate_mock_video(self, audio_data: bytes, duration: float | None = None) -> bytes:
         """Generate a simple mock video when renderer is unavailable."""
         try:
             import numpy as np
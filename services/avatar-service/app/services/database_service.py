@@ -4,11 +4,13 @@ Provides CRUD operations and data persistence.
 
 from __future__ import annotations
 
+from collections import defaultdict
 from contextlib import contextmanager
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import create_engine, func
+import numpy as np
+from sqlalchemy import LargeBinary, create_engine, func, inspect, text
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import sessionmaker
 
@@ -23,6 +25,7 @@ from app.models.database import (
     Render,
 )
 from app.models.database import Session as DBSession
+from app.services.lipsync_service import PhonemeTimeline, viseme_id
 
 
 class DatabaseService:
@@ -47,6 +50,16 @@ class DatabaseService:
 
         # Create tables
         Base.metadata.create_all(bind=self.engine)
+        self._ensure_timeline_column()
+        self.migrate_phoneme_rows()
+
+    def _ensure_timeline_column(self) -> None:
+        """Add audios.phoneme_timeline to databases created before it existed."""
+        columns = {column["name"] for column in inspect(self.engine).get_columns("audios")}
+        if "phoneme_timeline" not in columns:
+            column_type = LargeBinary().compile(dialect=self.engine.dialect)
+            with self.engine.begin() as conn:
+                conn.execute(text(f"ALTER TABLE audios ADD COLUMN phoneme_timeline {column_type}"))
 
     @contextmanager
     def get_db(self):
@@ -262,29 +275,78 @@ class DatabaseService:
 
     # ============= PHONEME OPERATIONS =============
 
-    def create_phoneme(self, audio_id: str, phoneme: str, start_ms: int, end_ms: int, **kwargs) -> Phoneme:
-        """Create phoneme record."""
+    def create_phoneme(
+        self, audio_id: str, phoneme: str, start_ms: int, end_ms: int, *, viseme: str | None = None
+    ) -> PhonemeTimeline:
+        """Add one phoneme to an audio's timeline.
+
+        The packed timeline only keeps the viseme and timings, so other
+        per-phoneme fields (e.g. ``confidence``) are not accepted.
+        """
+        new_id = viseme_id(phoneme, viseme)
         with self.get_db() as db:
-            ph = Phoneme(audio_id=audio_id, phoneme=phoneme, start_ms=start_ms, end_ms=end_ms, **kwargs)
-            db.add(ph)
-            db.commit()
-            return ph
+            blob = db.query(Audio.phoneme_timeline).filter_by(audio_id=audio_id).scalar()
+            current = PhonemeTimeline(blob) if blob else PhonemeTimeline.from_arrays([], [], [])
+            timeline = PhonemeTimeline.from_arrays(
+                np.append(current.viseme_ids, new_id),
+                np.append(current.start_ms, start_ms),
+                np.append(current.end_ms, end_ms),
+            )
+            self._store_timeline(db, audio_id, timeline)
+            return timeline
 
-    def get_phonemes(self, audio_id: str) -> list[Phoneme]:
-        """Get all phonemes for audio."""
+    def get_phonemes(self, audio_id: str) -> PhonemeTimeline | None:
+        """Get the phoneme timeline for audio (arrays are views onto the stored blob)."""
         with self.get_db() as db:
-            return db.query(Phoneme).filter_by(audio_id=audio_id).order_by(Phoneme.start_ms).all()
+            blob = db.query(Audio.phoneme_timeline).filter_by(audio_id=audio_id).scalar()
+            return PhonemeTimeline(blob) if blob else None
 
-    def create_phonemes_batch(self, audio_id: str, phonemes: list[dict]) -> list[Phoneme]:
-        """Create multiple phonemes in one transaction."""
+    def create_phonemes_batch(self, audio_id: str, phonemes: list[dict]) -> PhonemeTimeline:
+        """Store an audio's phonemes as one packed timeline, replacing any previous one."""
+        timeline = PhonemeTimeline.from_phonemes(phonemes)
         with self.get_db() as db:
-            created = []
-            for ph_data in phonemes:
-                ph = Phoneme(audio_id=audio_id, **ph_data)
-                db.add(ph)
-                created.append(ph)
-            db.commit()
-            return created
+            self._store_timeline(db, audio_id, timeline)
+        return timeline
+
+    @staticmethod
+    def _store_timeline(db, audio_id: str, timeline: PhonemeTimeline) -> None:
+        updated = (
+            db.query(Audio)
+            .filter_by(audio_id=audio_id)
+            .update({Audio.phoneme_timeline: timeline.blob}, synchronize_session=False)
+        )
+        if not updated:
+            raise ValueError(f"Audio {audio_id} not found")
+
+    def migrate_phoneme_rows(self, batch_size: int = 100) -> int:
+        """Pack legacy per-row phonemes into audios.phoneme_timeline.
+
+        Rows are deleted once converted; audios that already have a packed
+        timeline keep it. Safe to run repeatedly.
+
+        Returns:
+            Number of audios whose timeline was written.
+        """
+        migrated = 0
+        while True:
+            with self.get_db() as db:
+                audio_ids = [row[0] for row in db.query(Phoneme.audio_id).distinct().limit(batch_size)]
+                if not audio_ids:
+                    return migrated
+                grouped: dict[str, list[dict]] = defaultdict(list)
+                rows = db.query(Phoneme.audio_id, Phoneme.phoneme, Phoneme.viseme, Phoneme.start_ms, Phoneme.end_ms)
+                for audio_id, phoneme, viseme, start_ms, end_ms in rows.filter(Phoneme.audio_id.in_(audio_ids)):
+                    grouped[audio_id].append(
+                        {"phoneme": phoneme, "viseme": viseme, "start_ms": start_ms, "end_ms": end_ms}
+                    )
+                existing = dict(
+                    db.query(Audio.audio_id, Audio.phoneme_timeline).filter(Audio.audio_id.in_(audio_ids)).all()
+                )
+                for audio_id, phonemes in grouped.items():
+                    if audio_id in existing and existing[audio_id] is None:
+                        self._store_timeline(db, audio_id, PhonemeTimeline.from_phonemes(phonemes))
+                        migrated += 1
+                db.query(Phoneme).filter(Phoneme.audio_id.in_(audio_ids)).delete(synchronize_session=False)
 
     # ============= ASSET OPERATIONS =============
 
@@ -0,0 +1,247 @@
+"""Streaming lip-sync for OpenTalent Platform.
+
+Instead of rendering a video per utterance, the service sends the client a
+compact viseme timeline together with the audio, and the desktop client
+animates the avatar's morph targets locally. A timeline is a list of frames
+``(viseme, start_ms, end_ms)``; it is encoded either as NDJSON or as a packed
+binary blob (10 bytes per frame).
+
+For storage, :class:`PhonemeTimeline` keeps one audio's phonemes as a single
+struct-of-arrays blob that is read back as NumPy views without copying.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import re
+import struct
+import wave
+from collections.abc import Iterator
+from typing import Any
+
+import numpy as np
+
+from app.services.tts_service import VISEME_MAP
+
+# Stable viseme ids used by the binary encoding; only ever append to this
+VISEMES: tuple[str, ...] = (
+    "viseme_rest",
+    "viseme_A",
+    "viseme_E",
+    "viseme_I",
+    "viseme_O",
+    "viseme_U",
+    "viseme_P",
+    "viseme_B",
+    "viseme_M",
+    "viseme_F",
+    "viseme_V",
+    "viseme_T",
+    "viseme_D",
+    "viseme_N",
+    "viseme_S",
+    "viseme_Z",
+    "viseme_L",
+    "viseme_K",
+    "viseme_G",
+    "viseme_R",
+)
+VISEME_IDS = {name: index for index, name in enumerate(VISEMES)}
+
+TIMELINE_MAGIC = b"VTL1"
+# magic, frame count, total duration (ms)
+TIMELINE_HEADER = struct.Struct("<4sII")
+# viseme id, start ms, end ms
+TIMELINE_FRAME = struct.Struct("<HII")
+
+_STRESS = re.compile(r"\d+$")
+
+
+def _phoneme_times_ms(phoneme: dict[str, Any]) -> tuple[float, float]:
+    """Start/end of a phoneme in ms, whichever timing keys the producer used."""
+    if "start_ms" in phoneme:
+        return float(phoneme["start_ms"]), float(phoneme.get("end_ms", phoneme["start_ms"]))
+    for start_key, end_key in (("start", "end"), ("start_time", "end_time"), ("start_s", "end_s")):
+        if start_key in phoneme:
+            start = float(phoneme[start_key])
+            return start * 1000, float(phoneme.get(end_key, start)) * 1000
+    return 0.0, 0.0
+
+
+def viseme_for(phoneme: str) -> str:
+    """Viseme for an ARPAbet phoneme (stress digits ignored, unknown -> rest)."""
+    return VISEME_MAP.get(_STRESS.sub("", phoneme.strip().upper()), "viseme_rest")
+
+
+def viseme_id(phoneme: str, viseme: str | None = None) -> int:
+    """Id in :data:`VISEMES` of ``viseme`` if known, else of the phoneme's viseme."""
+    if viseme in VISEME_IDS:
+        return VISEME_IDS[viseme]
+    return VISEME_IDS[viseme_for(phoneme)]
+
+
+def build_timeline(phonemes: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Convert aligned phonemes into a compact viseme timeline.
+
+    Consecutive phonemes with the same mouth shape are merged and empty
+    frames dropped, so the client only receives actual shape changes.
+
+    Args:
+        phonemes: Aligned phonemes as produced by the voice service
+            (``start``/``end`` in seconds) or ``PiperTTSService``
+            (``start_ms``/``end_ms``).
+
+    Returns:
+        List of ``{"viseme", "start_ms", "end_ms"}`` frames in time order.
+    """
+    frames: list[dict[str, Any]] = []
+    timed = sorted((_phoneme_times_ms(p), p.get("phoneme", "")) for p in phonemes)
+    for (start, end), phoneme in timed:
+        start_ms, end_ms = int(round(start)), int(round(end))
+        if end_ms <= start_ms:
+            continue
+        viseme = viseme_for(phoneme)
+        last = frames[-1] if frames else None
+        if last and last["viseme"] == viseme and start_ms <= last["end_ms"]:
+            last["end_ms"] = max(last["end_ms"], end_ms)
+        else:
+            frames.append({"viseme": viseme, "start_ms": start_ms, "end_ms": end_ms})
+    return frames
+
+
+def encode_ndjson(frames: list[dict[str, Any]]) -> str:
+    """One ``{"v", "s", "e"}`` JSON object per line."""
+    return "".join(
+        json.dumps({"v": f["viseme"], "s": f["start_ms"], "e": f["end_ms"]}, separators=(",", ":"))
+        + "\n"
+        for f in frames
+    )
+
+
+def encode_binary(frames: list[dict[str, Any]], duration_ms: int = 0) -> bytes:
+    """Pack a timeline as header + fixed-size little-endian frames."""
+    buffer = bytearray(TIMELINE_HEADER.pack(TIMELINE_MAGIC, len(frames), duration_ms))
+    for f in frames:
+        buffer += TIMELINE_FRAME.pack(VISEME_IDS.get(f["viseme"], 0), f["start_ms"], f["end_ms"])
+    return bytes(buffer)
+
+
+def decode_binary(blob: bytes) -> tuple[list[dict[str, Any]], int]:
+    """Inverse of :func:`encode_binary`; returns ``(frames, duration_ms)``."""
+    magic, count, duration_ms = TIMELINE_HEADER.unpack_from(blob)
+    if magic != TIMELINE_MAGIC:
+        raise ValueError("Not a viseme timeline")
+    frames = [
+        {
+            "viseme": VISEMES[viseme_id] if viseme_id < len(VISEMES) else "viseme_rest",
+            "start_ms": start,
+            "end_ms": end,
+        }
+        for viseme_id, start, end in TIMELINE_FRAME.iter_unpack(
+            blob[TIMELINE_HEADER.size : TIMELINE_HEADER.size + count * TIMELINE_FRAME.size]
+        )
+    ]
+    return frames, duration_ms
+
+
+class PhonemeTimeline:
+    """Phoneme timing of one audio as three parallel NumPy arrays.
+
+    Blob layout (little-endian): ``uint32 count``, then ``count`` ``uint32``
+    start times, ``count`` ``uint32`` end times and ``count`` ``uint16``
+    viseme ids (indexes into :data:`VISEMES`). Every array is naturally
+    aligned, so reading a stored blob only creates views onto its bytes.
+    """
+
+    __slots__ = ("blob", "end_ms", "start_ms", "viseme_ids")
+
+    def __init__(self, blob: bytes):
+        count = int(np.frombuffer(blob, dtype="<u4", count=1)[0]) if blob else 0
+        if len(blob) != self.size_for(count):
+            raise ValueError("Corrupt phoneme timeline blob")
+        self.blob = blob
+        self.start_ms = np.frombuffer(blob, dtype="<u4", count=count, offset=4)
+        self.end_ms = np.frombuffer(blob, dtype="<u4", count=count, offset=4 + 4 * count)
+        self.viseme_ids = np.frombuffer(blob, dtype="<u2", count=count, offset=4 + 8 * count)
+
+    @staticmethod
+    def size_for(count: int) -> int:
+        """Blob size in bytes of a timeline with ``count`` phonemes."""
+        return 4 + 10 * count
+
+    @classmethod
+    def from_arrays(cls, viseme_ids: Any, start_ms: Any, end_ms: Any) -> PhonemeTimeline:
+        """Pack parallel arrays (sorted by start time) into a timeline."""
+        start = np.asarray(start_ms, dtype="<u4")
+        end = np.asarray(end_ms, dtype="<u4")
+        ids = np.asarray(viseme_ids, dtype="<u2")
+        order = np.argsort(start, kind="stable")
+        count = len(start)
+        buffer = bytearray(cls.size_for(count))
+        np.frombuffer(buffer, dtype="<u4", count=1)[0] = count
+        np.frombuffer(buffer, dtype="<u4", count=count, offset=4)[:] = start[order]
+        np.frombuffer(buffer, dtype="<u4", count=count, offset=4 + 4 * count)[:] = end[order]
+        np.frombuffer(buffer, dtype="<u2", count=count, offset=4 + 8 * count)[:] = ids[order]
+        return cls(bytes(buffer))
+
+    @classmethod
+    def from_phonemes(cls, phonemes: list[dict[str, Any]]) -> PhonemeTimeline:
+        """Pack phoneme dicts (``phoneme``/``viseme`` plus any timing keys)."""
+        times = [_phoneme_times_ms(p) for p in phonemes]
+        viseme_ids = [viseme_id(p.get("phoneme", ""), p.get("viseme")) for p in phonemes]
+        return cls.from_arrays(
+            viseme_ids,
+            [int(round(start)) for start, _ in times],
+            [int(round(end)) for _, end in times],
+        )
+
+    def __len__(self) -> int:
+        return len(self.start_ms)
+
+    def to_frames(self) -> list[dict[str, Any]]:
+        """Timeline frames in the shape returned by :func:`build_timeline`."""
+        return [
+            {
+                "viseme": VISEMES[v] if v < len(VISEMES) else "viseme_rest",
+                "start_ms": int(s),
+                "end_ms": int(e),
+            }
+            for v, s, e in zip(
+                self.viseme_ids.tolist(), self.start_ms.tolist(), self.end_ms.tolist(), strict=True
+            )
+        ]
+
+
+def audio_format(audio_data: bytes) -> dict[str, Any]:
+    """Describe the audio for the client; PCM parameters when it is a WAV file."""
+    try:
+        with wave.open(io.BytesIO(audio_data)) as wav:
+            return {
+                "encoding": f"pcm_s{wav.getsampwidth() * 8}le",
+                "sample_rate": wav.getframerate(),
+                "channels": wav.getnchannels(),
+                "duration_ms": int(wav.getnframes() * 1000 / wav.getframerate()),
+            }
+    except (wave.Error, EOFError):
+        return {"encoding": "encoded"}
+
+
+def audio_chunks(audio_data: bytes, chunk_ms: int) -> Iterator[bytes]:
+    """Split audio into ~``chunk_ms`` pieces for streaming playback.
+
+    WAV input is sent as raw PCM (header stripped, format described by
+    :func:`audio_format`); anything else is passed through in fixed-size
+    byte chunks.
+    """
+    try:
+        with wave.open(io.BytesIO(audio_data)) as wav:
+            frames_per_chunk = max(1, wav.getframerate() * chunk_ms // 1000)
+            while chunk := wav.readframes(frames_per_chunk):
+                yield chunk
+            return
+    except (wave.Error, EOFError):
+        pass
+    size = 16 * 1024
+    for start in range(0, len(audio_data), size):
+        yield audio_data[start : start + size]
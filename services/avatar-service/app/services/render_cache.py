@@ -0,0 +1,190 @@
+"""On-disk render cache for OpenTalent Platform.
+
+Interviewer lines repeat across sessions, so synthesized speech, its phoneme
+timeline and the rendered lip-sync video are cached by content. Speech is
+keyed by (text, voice) and shared by every avatar model; a video is keyed by
+(text, voice, avatar model, renderer version). Each entry is a directory
+holding ``audio.wav`` and ``phonemes.json`` (speech) or ``video.<ext>``.
+Entries are evicted least-recently-used first when the cache exceeds its
+byte budget; recency is kept in the directory mtime so it survives restarts.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+AUDIO_FILE = "audio.wav"
+PHONEMES_FILE = "phonemes.json"
+VIDEO_MEDIA_TYPES = {"webm": "video/webm", "mp4": "video/mp4"}
+
+
+def speech_key(text: str, voice: str | None) -> str:
+    """Content address of a line's synthesized speech and phonemes."""
+    payload = json.dumps(["speech", text.strip(), voice or ""], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def cache_key(text: str, voice: str | None, model: str | None, renderer_version: str) -> str:
+    """Content address of a rendered line's video."""
+    payload = json.dumps(
+        [text.strip(), voice or "", model or "", renderer_version], ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CacheEntry:
+    """Files of one cached line; ``video`` is None until it has been rendered."""
+
+    def __init__(self, key: str, path: Path):
+        self.key = key
+        self.path = path
+        self.audio = path / AUDIO_FILE
+        self.video = next(
+            (
+                path / f"video.{ext}"
+                for ext in VIDEO_MEDIA_TYPES
+                if (path / f"video.{ext}").exists()
+            ),
+            None,
+        )
+
+    @property
+    def has_speech(self) -> bool:
+        """Whether the entry holds synthesized audio and its phonemes."""
+        return self.audio.exists() and (self.path / PHONEMES_FILE).exists()
+
+    @property
+    def video_media_type(self) -> str | None:
+        """Media type of the cached video, or None if not rendered."""
+        return VIDEO_MEDIA_TYPES[self.video.suffix[1:]] if self.video else None
+
+    def phonemes(self) -> dict[str, Any]:
+        """``{"phonemes": [...], "duration": seconds}`` as stored with the audio."""
+        return json.loads((self.path / PHONEMES_FILE).read_text())
+
+
+class RenderCache:
+    """Content-addressed speech/video cache with byte-budget LRU eviction."""
+
+    def __init__(self, root: str | os.PathLike, max_bytes: int):
+        """Initialize the cache.
+
+        Args:
+            root: Cache directory (created if missing).
+            max_bytes: Total size budget; 0 disables eviction.
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._sizes: OrderedDict[str, int] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._load()
+
+    def _load(self) -> None:
+        entries = []
+        for path in self.root.glob("*/*"):
+            if path.is_dir():
+                size = sum(f.stat().st_size for f in path.iterdir() if f.is_file())
+                entries.append((path.stat().st_mtime, path.name, size))
+        for _, key, size in sorted(entries):
+            self._sizes[key] = size
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / key
+
+    @property
+    def total_bytes(self) -> int:
+        """Size of every cached entry on disk."""
+        return sum(self._sizes.values())
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Look up an entry and mark it most recently used."""
+        with self._lock:
+            if key not in self._sizes:
+                self._misses += 1
+                return None
+            self._sizes.move_to_end(key)
+            self._hits += 1
+        path = self._path(key)
+        try:
+            os.utime(path)
+        except OSError:
+            with self._lock:
+                self._sizes.pop(key, None)
+            return None
+        return CacheEntry(key, path)
+
+    def _write(self, key: str, name: str, data: bytes) -> Path:
+        path = self._path(key)
+        path.mkdir(parents=True, exist_ok=True)
+        target = path / name
+        # Write then rename so a concurrent reader never sees a partial file
+        tmp = path / f".{name}.tmp"
+        tmp.write_bytes(data)
+        tmp.replace(target)
+        with self._lock:
+            self._sizes[key] = sum(f.stat().st_size for f in path.iterdir() if f.is_file())
+            self._sizes.move_to_end(key)
+        self._evict(keep=key)
+        return target
+
+    def put_speech(
+        self, key: str, audio: bytes, phonemes: list[dict[str, Any]], duration: float
+    ) -> CacheEntry:
+        """Store synthesized audio and its aligned phonemes."""
+        self._write(
+            key,
+            PHONEMES_FILE,
+            json.dumps({"phonemes": phonemes, "duration": duration}).encode("utf-8"),
+        )
+        self._write(key, AUDIO_FILE, audio)
+        return CacheEntry(key, self._path(key))
+
+    def put_video(self, key: str, video: bytes, extension: str) -> CacheEntry:
+        """Store a rendered video (``extension`` is ``webm`` or ``mp4``)."""
+        self._write(key, f"video.{extension}", video)
+        return CacheEntry(key, self._path(key))
+
+    def _evict(self, keep: str) -> None:
+        if not self.max_bytes:
+            return
+        victims = []
+        with self._lock:
+            total = self.total_bytes
+            for key in list(self._sizes):
+                if total <= self.max_bytes:
+                    break
+                if key == keep:
+                    continue
+                total -= self._sizes.pop(key)
+                victims.append(key)
+            self._evictions += len(victims)
+        for key in victims:
+            shutil.rmtree(self._path(key), ignore_errors=True)
+        if victims:
+            logger.info(f"Render cache evicted {len(victims)} entries")
+
+    def stats(self) -> dict[str, Any]:
+        """Entry count, size and hit/miss/eviction counters."""
+        with self._lock:
+            return {
+                "entries": len(self._sizes),
+                "bytes": self.total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
@@ -9,6 +9,60 @@ import subprocess
 import tempfile
 from pathlib import Path
 
+# ARPAbet phoneme -> viseme (mouth shape) used for lip-sync
+VISEME_MAP: dict[str, str] = {
+    # Vowels
+    "AE": "viseme_A",  # /æ/ as in "cat"
+    "EH": "viseme_E",  # /ɛ/ as in "bed"
+    "IH": "viseme_I",  # /ɪ/ as in "bit"
+    "AO": "viseme_O",  # /ɔ/ as in "dog"
+    "UH": "viseme_U",  # /ʊ/ as in "book"
+    "AA": "viseme_A",  # /ɑ/ as in "palm"
+    "ER": "viseme_E",  # /ɜ/ as in "bird"
+    "IY": "viseme_I",  # /i/ as in "beet"
+    "OW": "viseme_O",  # /oʊ/ as in "go"
+    "UW": "viseme_U",  # /u/ as in "boot"
+    "AH": "viseme_A",  # /ʌ/ as in "but"
+    "AW": "viseme_A",  # /aʊ/ as in "cow"
+    "AY": "viseme_A",  # /aɪ/ as in "buy"
+    "EY": "viseme_E",  # /eɪ/ as in "say"
+    "OY": "viseme_O",  # /ɔɪ/ as in "boy"
+    # Bilabial (both lips)
+    "P": "viseme_P",  # /p/
+    "B": "viseme_B",  # /b/
+    "M": "viseme_M",  # /m/
+    # Labiodental (lower lip + upper teeth)
+    "F": "viseme_F",  # /f/
+    "V": "viseme_V",  # /v/
+    # Dental
+    "TH": "viseme_T",  # /θ/
+    "DH": "viseme_D",  # /ð/
+    # Alveolar
+    "T": "viseme_T",  # /t/
+    "D": "viseme_D",  # /d/
+    "N": "viseme_N",  # /n/
+    "S": "viseme_S",  # /s/
+    "Z": "viseme_Z",  # /z/
+    "L": "viseme_L",  # /l/
+    # Postalveolar
+    "SH": "viseme_S",  # /ʃ/
+    "ZH": "viseme_Z",  # /ʒ/
+    "CH": "viseme_T",  # /tʃ/
+    "JH": "viseme_D",  # /dʒ/
+    # Velar
+    "K": "viseme_K",  # /k/
+    "G": "viseme_G",  # /ɡ/
+    "NG": "viseme_N",  # /ŋ/
+    # Glottals
+    "HH": "viseme_A",  # /h/
+    # Other
+    "R": "viseme_R",  # /ɹ/
+    "W": "viseme_U",  # /w/
+    "Y": "viseme_I",  # /j/
+    # Silence
+    "SILENCE": "viseme_rest",
+}
+
 
 class PiperTTSService:
     """Local Piper text-to-speech service.
@@ -38,7 +92,9 @@ class PiperTTSService:
     def _verify_piper_available(self) -> None:
         """Verify piper CLI is installed and accessible."""
         try:
-            result = subprocess.run(["piper", "--version"], check=False, capture_output=True, timeout=5)
+            result = subprocess.run(
+                ["piper", "--version"], check=False, capture_output=True, timeout=5
+            )
             if result.returncode != 0:
                 raise RuntimeError("Piper CLI not found")
         except (FileNotFoundError, subprocess.TimeoutExpired) as e:
@@ -78,7 +134,9 @@ class PiperTTSService:
             if self.use_gpu:
                 cmd.append("--cuda")
 
-            result = subprocess.run(cmd, check=False, input=text.encode("utf-8"), capture_output=True, timeout=30)
+            result = subprocess.run(
+                cmd, check=False, input=text.encode("utf-8"), capture_output=True, timeout=30
+            )
 
             if result.returncode != 0:
                 raise RuntimeError(f"Piper failed: {result.stderr.decode()}")
@@ -219,47 +277,4 @@ class PhonemeService:
         Visemes are visual representations of phonemes.
         Multiple phonemes can map to same viseme.
         """
-        return {
-            # Vowels
-            "AE": "viseme_A",  # /æ/ as in "cat"
-            "EH": "viseme_E",  # /ɛ/ as in "bed"
-            "IH": "viseme_I",  # /ɪ/ as in "bit"
-            "AO": "viseme_O",  # /ɔ/ as in "dog"
-            "UH": "viseme_U",  # /ʊ/ as in "book"
-            "AA": "viseme_A",  # /ɑ/ as in "palm"
-            "ER": "viseme_E",  # /ɜ/ as in "bird"
-            "IY": "viseme_I",  # /i/ as in "beet"
-            "OW": "viseme_O",  # /oʊ/ as in "go"
-            "UW": "viseme_U",  # /u/ as in "boot"
-            # Bilabial (both lips)
-            "P": "viseme_P",  # /p/
-            "B": "viseme_B",  # /b/
-            "M": "viseme_M",  # /m/
-            # Labiodental (lower lip + upper teeth)
-            "F": "viseme_F",  # /f/
-            "V": "viseme_V",  # /v/
-            # Alveolar
-            "T": "viseme_T",  # /t/
-            "D": "viseme_D",  # /d/
-            "N": "viseme_N",  # /n/
-            "S": "viseme_S",  # /s/
-            "Z": "viseme_Z",  # /z/
-            "L": "viseme_L",  # /l/
-            # Postalveolar
-            "SH": "viseme_S",  # /ʃ/
-            "ZH": "viseme_Z",  # /ʒ/
-            "CH": "viseme_T",  # /tʃ/
-            "JH": "viseme_D",  # /dʒ/
-            # Velar
-            "K": "viseme_K",  # /k/
-            "G": "viseme_G",  # /ɡ/
-            "NG": "viseme_N",  # /ŋ/
-            # Glottals
-            "HH": "viseme_A",  # /h/
-            # Other
-            "R": "viseme_R",  # /ɹ/
-            "W": "viseme_U",  # /w/
-            "Y": "viseme_I",  # /j/
-            # Silence
-            "SILENCE": "viseme_rest",
-        }
+        return dict(VISEME_MAP)
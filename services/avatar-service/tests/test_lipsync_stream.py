@@ -0,0 +1,133 @@
+"""Streaming lip-sync tests.
+Validates the viseme timeline encodings, the WebSocket stream and offline render jobs.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import wave
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+def _wav(duration_ms: int = 500, sample_rate: int = 16000) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(b"\x00\x00" * (sample_rate * duration_ms // 1000))
+    return buffer.getvalue()
+
+
+PHONEMES = [
+    {"phoneme": "HH", "start": 0.0, "end": 0.08},
+    {"phoneme": "AH0", "start": 0.08, "end": 0.2},
+    {"phoneme": "L", "start": 0.2, "end": 0.3},
+    {"phoneme": "OW1", "start": 0.3, "end": 0.45},
+    {"phoneme": "sil", "start": 0.45, "end": 0.45},
+]
+
+
+@pytest.fixture(scope="function")
+def client(app, monkeypatch, tmp_path):
+    from app.routes import avatar_routes
+    from app.services.render_cache import RenderCache
+
+    monkeypatch.setattr(avatar_routes, "render_cache", RenderCache(tmp_path / "cache", 0))
+
+    async def fake_synthesize(text, voice):
+        return _wav(), 0.5, PHONEMES
+
+    monkeypatch.setattr(avatar_routes, "_synthesize", fake_synthesize)
+    return TestClient(app)
+
+
+class TestVisemeTimeline:
+    def test_timeline_merges_shapes_and_round_trips_binary(self):
+        from app.services import lipsync_service
+
+        frames = lipsync_service.build_timeline(PHONEMES)
+        # HH and AH share viseme_A; the zero-length silence is dropped
+        assert frames == [
+            {"viseme": "viseme_A", "start_ms": 0, "end_ms": 200},
+            {"viseme": "viseme_L", "start_ms": 200, "end_ms": 300},
+            {"viseme": "viseme_O", "start_ms": 300, "end_ms": 450},
+        ]
+
+        blob = lipsync_service.encode_binary(frames, 500)
+        assert (
+            len(blob)
+            == lipsync_service.TIMELINE_HEADER.size + 3 * lipsync_service.TIMELINE_FRAME.size
+        )
+        assert lipsync_service.decode_binary(blob) == (frames, 500)
+
+    def test_millisecond_timings_are_accepted(self):
+        from app.services import lipsync_service
+
+        frames = lipsync_service.build_timeline([{"phoneme": "M", "start_ms": 10, "end_ms": 90}])
+        assert frames == [{"viseme": "viseme_M", "start_ms": 10, "end_ms": 90}]
+
+
+class TestLipsyncStream:
+    def test_ndjson_stream_sends_timeline_then_audio(self, client):
+        with client.websocket_connect("/lipsync/stream") as ws:
+            ws.send_json({"text": "Hello", "format": "ndjson"})
+            start = ws.receive_json()
+            assert start["event"] == "start"
+            assert start["audio"]["encoding"] == "pcm_s16le"
+            assert start["duration_ms"] == 500
+
+            lines = ws.receive_text().splitlines()
+            assert [json.loads(line)["v"] for line in lines] == ["viseme_A", "viseme_L", "viseme_O"]
+
+            audio = b""
+            while True:
+                message = ws.receive()
+                if message.get("bytes") is not None:
+                    audio += message["bytes"]
+                    continue
+                end = json.loads(message["text"])
+                break
+            assert end["event"] == "end"
+            assert end["chunks"] == 5  # 500 ms in 100 ms chunks
+            assert len(audio) == 16000  # 8000 16-bit samples, WAV header stripped
+
+    def test_binary_stream_and_invalid_request(self, client):
+        from app.services import lipsync_service
+
+        with client.websocket_connect("/lipsync/stream") as ws:
+            ws.send_json({"text": "", "format": "ndjson"})
+            assert ws.receive_json()["event"] == "error"
+
+            ws.send_json({"text": "Hello", "format": "binary"})
+            start = ws.receive_json()
+            frames, duration_ms = lipsync_service.decode_binary(ws.receive_bytes())
+            assert len(frames) == start["frames"] == 3
+            assert duration_ms == 500
+
+
+class TestRenderJobs:
+    def test_render_job_runs_offline(self, client, monkeypatch, tmp_path):
+        from app.routes import avatar_routes
+
+        async def fake_render(**kwargs):
+            return b"\x1a\x45\xdf\xa3webm"
+
+        monkeypatch.setattr(avatar_routes, "RENDER_JOB_DIR", str(tmp_path))
+        monkeypatch.setattr(avatar_routes.avatar_service, "generate_avatar_video", fake_render)
+
+        res = client.post("/render/jobs", json={"text": "Hello"})
+        assert res.status_code == 202
+        job_id = res.json()["job_id"]
+
+        job = client.get(f"/render/jobs/{job_id}").json()
+        assert job["status"] == "completed"
+        video = client.get(f"/render/jobs/{job_id}/video")
+        assert video.headers["content-type"] == "video/webm"
+        assert video.content == b"\x1a\x45\xdf\xa3webm"
+
+    def test_unknown_render_job(self, client):
+        assert client.get("/render/jobs/missing").status_code == 404
@@ -0,0 +1,84 @@
+"""Packed phoneme timeline tests.
+Validates the struct-of-arrays blob, DatabaseService storage and the legacy row migration.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+PHONEMES = [
+    {"phoneme": "L", "start_ms": 120, "end_ms": 200},
+    {"phoneme": "HH", "start_ms": 0, "end_ms": 60},
+    {"phoneme": "EH", "start_ms": 60, "end_ms": 120},
+    {"phoneme": "OW", "start_ms": 200, "end_ms": 350, "viseme": "viseme_O"},
+]
+
+
+@pytest.fixture
+def db(tmp_path):
+    from app.services.database_service import DatabaseService
+
+    service = DatabaseService(f"sqlite:///{tmp_path / 'avatar.db'}")
+    service.create_avatar("interviewer")
+    service.create_audio("a1", "interviewer", "Hello", "/tmp/a1.wav", duration_ms=350)
+    return service
+
+
+class TestPhonemeTimeline:
+    def test_blob_is_sorted_struct_of_arrays_and_read_without_copy(self):
+        from app.services.lipsync_service import VISEME_IDS, PhonemeTimeline
+
+        timeline = PhonemeTimeline.from_phonemes(PHONEMES)
+        assert len(timeline.blob) == 4 + 10 * len(PHONEMES)
+
+        stored = PhonemeTimeline(timeline.blob)
+        assert stored.start_ms.tolist() == [0, 60, 120, 200]
+        assert stored.end_ms.tolist() == [60, 120, 200, 350]
+        assert stored.viseme_ids.tolist() == [
+            VISEME_IDS[v] for v in ("viseme_A", "viseme_E", "viseme_L", "viseme_O")
+        ]
+        assert not stored.start_ms.flags.owndata
+
+    def test_corrupt_blob_is_rejected(self):
+        from app.services.lipsync_service import PhonemeTimeline
+
+        with pytest.raises(ValueError):
+            PhonemeTimeline(PhonemeTimeline.from_phonemes(PHONEMES).blob[:-2])
+
+
+class TestDatabaseTimeline:
+    def test_batch_is_stored_in_one_row(self, db, tmp_path):
+        db.create_phonemes_batch("a1", PHONEMES)
+        db.create_phoneme("a1", "M", 350, 400)
+
+        timeline = db.get_phonemes("a1")
+        assert len(timeline) == 5
+        assert timeline.to_frames()[-1] == {"viseme": "viseme_M", "start_ms": 350, "end_ms": 400}
+        assert db.get_phonemes("missing") is None
+        with pytest.raises(TypeError):
+            db.create_phoneme("a1", "M", 400, 450, confidence=0.5)
+        with pytest.raises(ValueError):
+            db.create_phonemes_batch("missing", PHONEMES)
+
+        conn = sqlite3.connect(tmp_path / "avatar.db")
+        assert conn.execute("SELECT COUNT(*) FROM phonemes").fetchone() == (0,)
+
+    def test_legacy_rows_are_migrated(self, db, tmp_path):
+        from app.services.database_service import DatabaseService
+
+        db.engine.dispose()
+        conn = sqlite3.connect(tmp_path / "avatar.db")
+        conn.execute("ALTER TABLE audios DROP COLUMN phoneme_timeline")
+        conn.executemany(
+            "INSERT INTO phonemes (audio_id, phoneme, start_ms, end_ms, viseme, confidence)"
+            " VALUES (?, ?, ?, ?, ?, 1.0)",
+            [("a1", p["phoneme"], p["start_ms"], p["end_ms"], p.get("viseme")) for p in PHONEMES],
+        )
+        conn.commit()
+
+        migrated = DatabaseService(f"sqlite:///{tmp_path / 'avatar.db'}")
+        assert migrated.get_phonemes("a1").start_ms.tolist() == [0, 60, 120, 200]
+        assert conn.execute("SELECT COUNT(*) FROM phonemes").fetchone() == (0,)
+        assert migrated.migrate_phoneme_rows() == 0
@@ -0,0 +1,136 @@
+"""Render cache tests.
+Validates content addressing, byte-budget LRU eviction, cached serving and precompute.
+"""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+PHONEMES = [
+    {"phoneme": "HH", "start": 0.0, "end": 0.1},
+    {"phoneme": "AY", "start": 0.1, "end": 0.3},
+]
+
+
+class TestRenderCache:
+    def test_key_covers_text_voice_model_and_renderer(self):
+        from app.services.render_cache import cache_key
+
+        base = cache_key("Tell me about yourself", "amy", "face", "1.0.0")
+        assert base == cache_key(" Tell me about yourself ", "amy", "face", "1.0.0")
+        assert base != cache_key("Tell me about yourself", "lessac", "face", "1.0.0")
+        assert base != cache_key("Tell me about yourself", "amy", "metahuman", "1.0.0")
+        assert base != cache_key("Tell me about yourself", "amy", "face", "1.1.0")
+
+    def test_speech_key_ignores_model_and_renderer(self):
+        from app.services.render_cache import cache_key, speech_key
+
+        base = speech_key("Tell me about yourself", "amy")
+        assert base == speech_key(" Tell me about yourself ", "amy")
+        assert base != speech_key("Tell me about yourself", "lessac")
+        assert base != cache_key("Tell me about yourself", "amy", "face", "1.0.0")
+
+    def test_least_recently_used_entries_are_evicted_over_budget(self, tmp_path):
+        from app.services.render_cache import RenderCache
+
+        cache = RenderCache(tmp_path, max_bytes=2500)
+        for key in ("a" * 64, "b" * 64):
+            cache.put_speech(key, b"\x00" * 1000, PHONEMES, 0.3)
+        cache.get("a" * 64)  # "b" is now least recently used
+        cache.put_video("c" * 64, b"\x1a\x45\xdf\xa3" * 250, "webm")
+
+        assert cache.get("b" * 64) is None
+        assert cache.get("a" * 64).has_speech
+        assert cache.get("c" * 64).video_media_type == "video/webm"
+        assert cache.stats()["evictions"] == 1
+        assert not (tmp_path / "bb" / ("b" * 64)).exists()
+
+    def test_recency_survives_reopen(self, tmp_path):
+        from app.services.render_cache import RenderCache
+
+        cache = RenderCache(tmp_path, max_bytes=0)
+        cache.put_speech("a" * 64, b"\x00" * 10, PHONEMES, 0.3)
+        cache.put_speech("b" * 64, b"\x00" * 10, PHONEMES, 0.3)
+        os.utime(tmp_path / "aa" / ("a" * 64), (2_000_000_000, 2_000_000_000))
+
+        reopened = RenderCache(tmp_path, max_bytes=0)
+        assert list(reopened._sizes) == ["b" * 64, "a" * 64]
+        assert reopened.get("a" * 64).phonemes() == {"phonemes": PHONEMES, "duration": 0.3}
+
+
+@pytest.fixture(scope="function")
+def calls(app, monkeypatch, tmp_path):
+    from app.routes import avatar_routes
+    from app.services.render_cache import RenderCache
+
+    recorded = {"synthesize": 0, "render": 0}
+
+    async def fake_synthesize(text, voice):
+        recorded["synthesize"] += 1
+        return b"RIFF-audio", 0.3, PHONEMES
+
+    async def fake_render(**kwargs):
+        recorded["render"] += 1
+        return b"\x1a\x45\xdf\xa3webm"
+
+    monkeypatch.setattr(avatar_routes, "render_cache", RenderCache(tmp_path, 0))
+    monkeypatch.setattr(avatar_routes, "_synthesize", fake_synthesize)
+    monkeypatch.setattr(avatar_routes.avatar_service, "generate_avatar_video", fake_render)
+    return recorded
+
+
+class TestCachedEndpoints:
+    def test_repeated_lines_are_served_from_cache(self, app, calls):
+        client = TestClient(app)
+        for _ in range(2):
+            res = client.post("/generate", json={"text": "Why this role?"})
+            assert res.status_code == 200
+            assert res.content == b"\x1a\x45\xdf\xa3webm"
+            assert res.headers["content-type"] == "video/webm"
+        assert calls == {"synthesize": 1, "render": 1}
+
+    def test_precompute_warms_question_bank(self, app, calls):
+        client = TestClient(app)
+        questions = ["Tell me about yourself", "Why this role?", "Tell me about yourself"]
+        res = client.post("/render/precompute", json={"texts": questions})
+        assert res.status_code == 202
+        job = client.get(f"/render/jobs/{res.json()['job_id']}").json()
+        assert job["status"] == "completed"
+        assert (job["total"], job["done"], job["failed"]) == (2, 2, 0)
+        assert calls == {"synthesize": 2, "render": 0}
+
+        key = job["keys"]["Why this role?"]
+        audio = client.get(f"/render/cache/{key}/audio")
+        assert audio.content == b"RIFF-audio"
+        assert client.get(f"/render/cache/{key}/phonemes").json()["phonemes"] == PHONEMES
+        assert client.get(f"/render/cache/{key}/video").status_code == 404
+        assert client.get("/render/cache/stats").json()["entries"] == 2
+
+    def test_speech_is_shared_across_avatar_models(self, app, calls):
+        client = TestClient(app)
+        for avatar_id in ("default", "face", "metahuman"):
+            res = client.post("/generate", json={"text": "Why this role?", "avatar_id": avatar_id})
+            assert res.status_code == 200
+        # "default" and "face" are the same model; metahuman reuses the speech
+        assert calls == {"synthesize": 1, "render": 2}
+
+    def test_precomputed_lines_hit_the_cache_when_streamed(self, app, calls):
+        from app.routes import avatar_routes
+
+        client = TestClient(app)
+        res = client.post("/render/precompute", json={"texts": ["Why this role?"]})
+        assert client.get(f"/render/jobs/{res.json()['job_id']}").json()["done"] == 1
+        hits = avatar_routes.render_cache.stats()["hits"]
+
+        with client.websocket_connect("/lipsync/stream") as ws:
+            ws.send_json({"text": "Why this role?", "format": "ndjson"})
+            assert ws.receive_json()["event"] == "start"
+            ws.receive_text()  # timeline
+            assert ws.receive_bytes() == b"RIFF-audio"
+            assert ws.receive_json()["event"] == "end"
+
+        assert calls == {"synthesize": 1, "render": 0}
+        assert avatar_routes.render_cache.stats()["hits"] == hits + 1
@@ -10,6 +10,7 @@ MERGED VERSION combining:
 import json
 import logging
 import os
+import sys
 import uuid
 from datetime import datetime
 from enum import Enum
@@ -37,6 +38,16 @@ try:
 except ImportError:
     VECTOR_SEARCH_AVAILABLE = False
 
+# Local JWT verification shared with other services (optional)
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "shared"))
+try:
+    from token_verifier import TokenVerifier
+
+    TOKEN_VERIFIER_AVAILABLE = True
+except ImportError:
+    TokenVerifier = None
+    TOKEN_VERIFIER_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -54,6 +65,12 @@ class Settings(BaseSettings):
 
     database_url: str = os.getenv("DATABASE_URL", "postgresql://user:@localhost/db")
     vector_db_path: str = os.getenv("VECTOR_DB_PATH", "./candidate_vectors.db")
+    security_secret_key: str = os.getenv(
+        "SECURITY_SECRET_KEY", "DEV_ONLY_INSECURE_SECRET_CHANGE_ME"
+    )
+    security_service_url: str = os.getenv("SECURITY_SERVICE_URL", "http://localhost:8010")
+    # Reject requests without a valid Security Service token instead of using the stub user
+    auth_required: bool = os.getenv("CANDIDATE_AUTH_REQUIRED", "false").lower() == "true"
 
 
 settings = Settings()
@@ -421,6 +438,14 @@ TEST_TOKEN = "test-token-12345"
 DEFAULT_USER_ID = "test-user-001"
 
 
+# Security Service tokens are verified in-process, with claims cached until exp
+token_verifier = (
+    TokenVerifier(settings.security_secret_key, security_service_url=settings.security_service_url)
+    if TOKEN_VERIFIER_AVAILABLE
+    else None
+)
+
+
 def get_current_user(authorization: str | None = Header(None)) -> str | None:
     """Simple auth stub that accepts Bearer tokens.
 
@@ -430,7 +455,24 @@ def get_current_user(authorization: str | None = Header(None)) -> str | None:
     - Any other Bearer token → rejected (returns None)
 
     This allows endpoints to work without requiring real auth infrastructure.
+    Bearer tokens issued by the Security Service are verified locally and
+    resolve to the token's email; an expired, revoked or wrongly signed JWT is
+    rejected with 401. With CANDIDATE_AUTH_REQUIRED=true nothing else is accepted.
     """
+    if token_verifier is not None and authorization:
+        scheme, _, token = authorization.partition(" ")
+        # Only JWT-shaped tokens are checked; anything else is left to the stub below
+        if scheme.lower() == "bearer" and token.count(".") == 2:
+            try:
+                claims = token_verifier.verify(token)
+            except Exception as e:
+                logger.warning(f"Rejected bearer token: {e}")
+                raise HTTPException(status_code=401, detail="Invalid or expired token") from e
+            return claims.get("email") or claims.get("sub")
+
+    if settings.auth_required:
+        return None
+
     if not authorization:
         # No auth header: use default test user ID
         return DEFAULT_USER_ID
@@ -600,6 +642,20 @@ def on_startup():
     initialize_vector_search()
 
 
+@app.on_event("startup")
+async def start_token_verifier():
+    """Start polling the Security Service revocation feed."""
+    if token_verifier is not None:
+        token_verifier.start()
+
+
+@app.on_event("shutdown")
+async def stop_token_verifier():
+    """Stop revocation feed polling."""
+    if token_verifier is not None:
+        await token_verifier.stop()
+
+
 # ============================================================================
 # ROOT & HEALTH ENDPOINTS
 # ============================================================================
@@ -5,9 +5,12 @@
 4. All endpoints are guarded but accessible with auth stub.
 """
 
+from datetime import UTC, datetime, timedelta
+
+import jwt
 import pytest
 from fastapi.testclient import TestClient
-from main import DEFAULT_USER_ID, TEST_TOKEN, app
+from main import DEFAULT_USER_ID, TEST_TOKEN, TOKEN_VERIFIER_AVAILABLE, app, settings
 
 
 @pytest.fixture
@@ -116,6 +119,26 @@ class TestAuthStub:
             )
 
 
+@pytest.mark.skipif(not TOKEN_VERIFIER_AVAILABLE, reason="shared token verifier not importable")
+class TestSecurityServiceTokens:
+    """Test that Security Service JWTs are verified instead of stubbed."""
+
+    def _token(self, secret: str = settings.security_secret_key) -> str:
+        exp = datetime.now(UTC) + timedelta(minutes=5)
+        return jwt.encode({"email": "jwt@example.com", "exp": exp}, secret, algorithm="HS256")
+
+    def test_valid_token_is_accepted(self, client):
+        """Verify a correctly signed token is accepted."""
+        headers = {"Authorization": f"Bearer {self._token()}"}
+        assert client.get("/api/v1/candidates", headers=headers).status_code == 200
+
+    def test_wrongly_signed_token_is_rejected(self, client):
+        """Verify a JWT that fails verification gets 401 instead of the stub user."""
+        headers = {"Authorization": f"Bearer {self._token('not-the-secret')}"}
+        response = client.get("/api/v1/candidates", headers=headers)
+        assert response.status_code == 401
+
+
 class TestAuthStubIntegration:
     """Test auth stub with actual endpoint operations."""
 
@@ -2,8 +2,12 @@
 Integrates with project-service and candidate-service.
 """
 
+import asyncio
 import logging
 import os
+import re
+import time
+from collections import OrderedDict
 from typing import Any
 
 import httpx
@@ -16,6 +20,12 @@ logger = logging.getLogger(__name__)
 PROJECT_SERVICE_URL = os.getenv("PROJECT_SERVICE_URL", "http://localhost:8005")
 CANDIDATE_SERVICE_URL = os.getenv("CANDIDATE_SERVICE_URL", "http://localhost:8006")
 USE_MOCK_JOB_DESC = os.getenv("USE_MOCK_JOB_DESC", "true").lower() == "true"
+# Jobs kept for reuse across conversation starts; freshness follows project-service's
+# Cache-Control max-age, falling back to JOB_CACHE_TTL seconds
+JOB_CACHE_SIZE = int(os.getenv("JOB_CACHE_SIZE", "512"))
+JOB_CACHE_TTL = float(os.getenv("JOB_CACHE_TTL", "60"))
+
+_MAX_AGE = re.compile(r"max-age=(\d+)")
 
 
 class JobDescriptionService:
@@ -26,6 +36,10 @@ class JobDescriptionService:
         self.candidate_service_url = CANDIDATE_SERVICE_URL
         self.use_mock = USE_MOCK_JOB_DESC
         self.client = httpx.AsyncClient(timeout=10.0)
+        # job id -> (fresh until, ETag, formatted job)
+        self._job_cache: OrderedDict[str, tuple[float, str | None, dict[str, Any]]] = OrderedDict()
+        self._job_fetches: dict[str, asyncio.Task] = {}
+        self.cache_stats = {"hits": 0, "revalidated": 0, "fetched": 0}
 
     async def get_job_description(
         self, project_id: str | None = None, job_id: str | None = None
@@ -33,7 +47,9 @@ class JobDescriptionService:
         """Fetch a job description from the project service or a mock source.
 
         Integrates with the external project-service to retrieve structured job
-        information including skills and responsibilities.
+        information including skills and responsibilities. Jobs are cached for
+        the max-age project-service advertises; expired copies are revalidated
+        with their ETag, so repeated conversation starts rarely transfer a body.
 
         Args:
             project_id: Optional project identifier to fetch.
@@ -42,24 +58,70 @@ class JobDescriptionService:
         Returns:
             A dictionary containing the job details (title, description, skills, etc.).
         """
-        if self.use_mock:
-            return self._get_mock_job_description(project_id or job_id)
-
+        key = project_id or job_id
+        if self.use_mock or not key:
+            return self._get_mock_job_description(key)
+
+        cached = self._job_cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            self._job_cache.move_to_end(key)
+            self.cache_stats["hits"] += 1
+            return cached[2]
+
+        # Concurrent conversation starts for the same job share one request
+        task = self._job_fetches.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch_job(key, cached))
+            self._job_fetches[key] = task
+            task.add_done_callback(lambda _: self._job_fetches.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _fetch_job(
+        self, key: str | None, cached: tuple[float, str | None, dict[str, Any]] | None
+    ) -> dict[str, Any]:
+        """Fetch a job, revalidating an expired cached copy with ``If-None-Match``."""
+        headers = {"If-None-Match": cached[1]} if cached and cached[1] else {}
+        status = None
         try:
-            # Try to fetch from project service
-            endpoint = f"{self.project_service_url}/api/v1/projects/{project_id or job_id}"
-            response = await self.client.get(endpoint)
-
-            if response.status_code == 200:
-                job_data = response.json()
-                return self._format_job_description(job_data)
-            else:
-                logger.warning(f"Project service returned {response.status_code}, using mock")
-                return self._get_mock_job_description(project_id or job_id)
-
+            endpoint = f"{self.project_service_url}/jobs/{key}"
+            response = await self.client.get(endpoint, headers=headers)
+            status = response.status_code
+
+            if status == 304 and cached:
+                self.cache_stats["revalidated"] += 1
+                return self._remember_job(key, response, cached[2])
+            if status == 200:
+                self.cache_stats["fetched"] += 1
+                job = self._format_job_description(response.json())
+                return self._remember_job(key, response, job)
+            logger.warning(f"Project service returned {status}, using mock")
         except Exception as e:
             logger.error(f"Error fetching job description: {e}")
-            return self._get_mock_job_description(project_id or job_id)
+
+        if status == 404:
+            self.invalidate_job(key)
+        elif cached:
+            # An expired copy beats a mock while project-service is unavailable
+            return cached[2]
+        return self._get_mock_job_description(key)
+
+    def _remember_job(
+        self, key: str | None, response: httpx.Response, job: dict[str, Any]
+    ) -> dict[str, Any]:
+        match = _MAX_AGE.search(response.headers.get("Cache-Control", ""))
+        ttl = float(match.group(1)) if match else JOB_CACHE_TTL
+        self._job_cache[key] = (time.monotonic() + ttl, response.headers.get("ETag"), job)
+        self._job_cache.move_to_end(key)
+        while len(self._job_cache) > JOB_CACHE_SIZE:
+            self._job_cache.popitem(last=False)
+        return job
+
+    def invalidate_job(self, job_id: str | None = None) -> None:
+        """Drop one cached job (or all of them) so the next lookup refetches it."""
+        if job_id is None:
+            self._job_cache.clear()
+        else:
+            self._job_cache.pop(job_id, None)
 
     async def get_candidate_profile(self, candidate_id: str) -> dict[str, Any] | None:
         """Fetch a candidate profile from the candidate service or a mock source.
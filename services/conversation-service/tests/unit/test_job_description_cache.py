@@ -0,0 +1,95 @@
+"""Job description cache tests.
+
+Covers reuse of project-service jobs across conversation starts: max-age
+freshness, ETag revalidation, request coalescing and stale fallback.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from app.services.job_description_service import JobDescriptionService
+
+JOB = {
+    "id": "project-001",
+    "title": "Senior AI Architect",
+    "description": "Lead the design of agentic AI systems.",
+    "key_responsibilities": ["Architect multi-agent orchestration layers"],
+    "required_skills": ["Python", "LLMs"],
+}
+
+
+class FakeProjectService:
+    """Minimal project-service job endpoint speaking ETag/max-age."""
+
+    def __init__(self, max_age: int = 60):
+        self.max_age = max_age
+        self.requests: list[httpx.Request] = []
+        self.down = False
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        await asyncio.sleep(0)
+        if self.down:
+            return httpx.Response(503)
+        if not request.url.path.endswith("/jobs/project-001"):
+            return httpx.Response(404)
+        headers = {"ETag": '"v1"', "Cache-Control": f"max-age={self.max_age}"}
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers=headers)
+        return httpx.Response(200, json=JOB, headers=headers)
+
+
+@pytest.fixture
+def project_service():
+    return FakeProjectService()
+
+
+@pytest.fixture
+def service(project_service):
+    service = JobDescriptionService()
+    service.use_mock = False
+    service.client = httpx.AsyncClient(transport=httpx.MockTransport(project_service))
+    return service
+
+
+@pytest.mark.asyncio
+async def test_fresh_job_is_served_without_a_request(service, project_service):
+    first = await service.get_job_description(job_id="project-001")
+    second = await service.get_job_description(job_id="project-001")
+    assert first["title"] == second["title"] == "Senior AI Architect"
+    assert len(project_service.requests) == 1
+    assert service.cache_stats["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_job_is_revalidated_with_etag(service, project_service):
+    project_service.max_age = 0
+    await service.get_job_description(job_id="project-001")
+    job = await service.get_job_description(job_id="project-001")
+    assert job["required_skills"] == ["Python", "LLMs"]
+    assert project_service.requests[-1].headers["If-None-Match"] == '"v1"'
+    assert service.cache_stats["revalidated"] == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_starts_share_one_request(service, project_service):
+    jobs = await asyncio.gather(
+        *(service.get_job_description(job_id="project-001") for _ in range(5))
+    )
+    assert all(job["job_id"] == "project-001" for job in jobs)
+    assert len(project_service.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_copy_survives_outage_and_invalidation_refetches(service, project_service):
+    project_service.max_age = 0
+    await service.get_job_description(job_id="project-001")
+    project_service.down = True
+    assert (await service.get_job_description(job_id="project-001"))["job_id"] == "project-001"
+
+    project_service.down = False
+    service.invalidate_job("project-001")
+    await service.get_job_description(job_id="project-001")
+    assert "If-None-Match" not in project_service.requests[-1].headers
+    assert (await service.get_job_description(job_id="missing"))["job_id"] == "python-backend"
@@ -0,0 +1,195 @@
+"""Explainability Service - Feature Extraction and Scoring Model
+
+Turns the analytics signals of a finished interview (the per-response
+sentiment/quality/bias/expertise results produced by analytics-service) into
+a fixed-length feature vector, scores it with a linear model and explains the
+score.
+
+Because the model is linear, the Shapley value of each feature for the raw
+(unclipped) score, relative to the model's baseline, is exactly
+``weight * (value - baseline)``, so per-interview contributions are computed
+once at ingestion and stored. The reported score is the raw score clipped to
+0-10: contributions always add up to ``raw - baseline`` and match the reported
+score only when it was not clipped. Global importances are computed in batch
+over the whole feature matrix with NumPy: mean absolute contribution, and
+model-agnostic permutation importance of the reported score.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+# Bump when extraction changes; stored vectors of other versions are ignored
+FEATURE_VERSION = "1"
+
+FEATURES = (
+    "answer_completeness",
+    "answer_relevance",
+    "communication_clarity",
+    "technical_accuracy",
+    "sentiment",
+    "expertise",
+    "bias_flags",
+    "consistency",
+)
+
+EXPERTISE_LEVELS = {"beginner": 0.25, "intermediate": 0.5, "advanced": 0.75, "expert": 1.0}
+
+# Quality sub-scores (0-1) reported by analytics-service, in FEATURES order
+_QUALITY_FIELDS = ("completeness", "relevance", "clarity", "technical_accuracy")
+
+# Advice for features that pulled the score down
+RECOMMENDATIONS = {
+    "answer_completeness": "Probe for fuller answers; responses were often brief",
+    "answer_relevance": "Ask follow-ups that tie answers back to the question",
+    "communication_clarity": "Explore communication skills in a structured follow-up",
+    "technical_accuracy": "Focus on clarifying technical trade-offs",
+    "sentiment": "Review whether question difficulty affected candidate confidence",
+    "expertise": "Verify depth of hands-on experience with a practical exercise",
+    "bias_flags": "Have a second reviewer check flagged responses for bias",
+    "consistency": "Revisit topics where answer quality varied",
+}
+
+
+def _mean(values: list[float], default: float = 0.0) -> float:
+    return float(np.mean(values)) if values else default
+
+
+def extract_features(analyses: list[dict[str, Any]]) -> np.ndarray:
+    """Build the feature vector of one interview.
+
+    Args:
+        analyses: Per-response analytics results. Each may hold ``quality``,
+            ``sentiment``, ``bias`` (or ``bias_detection``) and ``expertise``
+            (or ``expertise_assessment``) dicts; missing signals are skipped.
+
+    Returns:
+        float32 vector in FEATURES order.
+    """
+    quality = [[] for _ in _QUALITY_FIELDS]
+    per_response_quality = []
+    polarity, expertise, flags = [], [], []
+    for analysis in analyses:
+        q = analysis.get("quality") or {}
+        values = [q[field] for field in _QUALITY_FIELDS if field in q]
+        for i, field in enumerate(_QUALITY_FIELDS):
+            if field in q:
+                quality[i].append(float(q[field]))
+        if values:
+            per_response_quality.append(sum(values) / len(values))
+        sentiment = analysis.get("sentiment") or {}
+        if "polarity" in sentiment:
+            polarity.append(float(sentiment["polarity"]))
+        level = (analysis.get("expertise") or analysis.get("expertise_assessment") or {}).get(
+            "level"
+        )
+        if level in EXPERTISE_LEVELS:
+            expertise.append(EXPERTISE_LEVELS[level])
+        bias = analysis.get("bias") or analysis.get("bias_detection")
+        if bias is not None:
+            flags.append(len(bias.get("flags", [])))
+
+    # Spread of per-answer quality; 0.5 standard deviation or more counts as fully inconsistent
+    consistency = 1.0 - min(1.0, 2 * float(np.std(per_response_quality or [0.0])))
+    return np.array(
+        [_mean(values, 0.5) for values in quality]
+        + [
+            _mean(polarity),
+            _mean(expertise, 0.5),
+            _mean(flags),
+            consistency,
+        ],
+        dtype=np.float32,
+    )
+
+
+@dataclass(frozen=True)
+class LinearScoringModel:
+    """Interview score as ``intercept + weights . features``, reported on a 0-10 scale."""
+
+    name: str
+    version: str
+    weights: np.ndarray
+    intercept: float
+    # Reference interview that contributions are measured against
+    baseline: np.ndarray
+    feature_version: str = FEATURE_VERSION
+
+    def raw_score(self, X: np.ndarray) -> np.ndarray:
+        """Unclipped scores for feature vectors of shape ``(..., len(FEATURES))``."""
+        return X @ self.weights + self.intercept
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """Reported scores: the raw score clipped to 0-10."""
+        return np.clip(self.raw_score(X), 0.0, 10.0)
+
+    @property
+    def baseline_score(self) -> float:
+        return float(self.raw_score(self.baseline))
+
+    def contributions(self, X: np.ndarray) -> np.ndarray:
+        """Per-feature Shapley values of the raw score relative to the baseline.
+
+        Exact for a linear model: they sum to ``raw_score(X) - baseline_score``.
+        """
+        return (X - self.baseline) * self.weights
+
+
+MODEL = LinearScoringModel(
+    name="talent_ai_scoring",
+    version="talent_ai_scoring_v2.0",
+    weights=np.array([1.5, 2.0, 1.5, 2.5, 0.5, 1.5, -1.0, 0.5], dtype=np.float32),
+    intercept=0.0,
+    baseline=np.array([0.5, 0.5, 0.5, 0.5, 0.0, 0.5, 0.0, 0.8], dtype=np.float32),
+)
+
+
+def explain(model: LinearScoringModel, vector: np.ndarray) -> tuple[float, np.ndarray]:
+    """Reported (clipped) score of one interview and its raw-score contributions."""
+    return float(model.predict(vector)), model.contributions(vector).astype(np.float32)
+
+
+def batch_importance(
+    model: LinearScoringModel, X: np.ndarray, chunk_size: int = 4096, seed: int = 0
+) -> dict[str, dict[str, float]]:
+    """Global feature importances over a matrix of interview features.
+
+    Args:
+        model: Model to explain.
+        X: Feature matrix of shape ``(interviews, len(FEATURES))``.
+        chunk_size: Rows evaluated per vectorized step; bounds peak memory.
+        seed: Seed for the column permutations, so results are reproducible.
+
+    Returns:
+        ``shap``: mean absolute contribution per feature, normalized to sum to 1.
+        ``permutation``: mean absolute score change when the feature's column
+        is shuffled across interviews.
+    """
+    n, f = X.shape
+    X = X.astype(np.float64)
+    shap = np.abs(model.contributions(X)).mean(axis=0)
+
+    # Column j of permuted[j] is shuffled; all F variants are scored in one matmul per chunk
+    rng = np.random.default_rng(seed)
+    order = np.argsort(rng.random((f, n)), axis=1)
+    shuffled = X[order, np.arange(f)[:, None]]  # (f, n): shuffled[j] = X[order[j], j]
+    base = model.predict(X)
+    delta = np.zeros(f)
+    for start in range(0, n, chunk_size):
+        stop = min(start + chunk_size, n)
+        permuted = np.repeat(X[None, start:stop], f, axis=0)
+        permuted[np.arange(f), :, np.arange(f)] = shuffled[:, start:stop]
+        delta += np.abs(model.predict(permuted) - base[start:stop]).sum(axis=1)
+    permutation = delta / max(n, 1)
+
+    total = float(shap.sum())
+    return {
+        "shap": {
+            name: round(float(value) / total, 4) if total else 0.0
+            for name, value in zip(FEATURES, shap, strict=True)
+        },
+        "permutation": {
+            name: round(float(value), 4) for name, value in zip(FEATURES, permutation, strict=True)
+        },
+    }
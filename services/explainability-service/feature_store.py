@@ -0,0 +1,228 @@
+"""Explainability Service - Feature Store
+
+SQLite store of per-interview feature vectors and their precomputed
+explanations.
+
+Vectors are written once, when an interview's analytics signals are ingested,
+as packed float32 blobs keyed by interview_id. Explanations (score and
+per-feature contributions) are stored per model version, and global feature
+importances are cached per model version together with the store revision
+they were computed at, so explanation requests are lookups.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any
+
+import numpy as np
+
+DEFAULT_STORE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "opentalent", "explainability.sqlite3"
+)
+
+
+class FeatureStore:
+    """Interview feature vectors, explanations and cached importances."""
+
+    def __init__(self, path: str | None = None):
+        """Open (or create) the feature store.
+
+        Args:
+            path: Database file; defaults to EXPLAINABILITY_STORE_PATH or ~/.cache/opentalent
+        """
+        self.path = path or os.getenv("EXPLAINABILITY_STORE_PATH", DEFAULT_STORE_PATH)
+        self._lock = threading.Lock()
+        self._conn = self._open()
+
+    def _open(self) -> sqlite3.Connection:
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS features (
+                interview_id TEXT PRIMARY KEY,
+                feature_version TEXT NOT NULL,
+                vector BLOB NOT NULL,
+                n_responses INTEGER NOT NULL,
+                candidate_id TEXT,
+                role TEXT,
+                created_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_features_version ON features(feature_version);
+
+            CREATE TABLE IF NOT EXISTS explanations (
+                interview_id TEXT NOT NULL,
+                model_version TEXT NOT NULL,
+                score REAL NOT NULL,
+                contributions BLOB NOT NULL,
+                PRIMARY KEY (interview_id, model_version)
+            ) WITHOUT ROWID;
+
+            CREATE TABLE IF NOT EXISTS importances (
+                model_version TEXT PRIMARY KEY,
+                revision INTEGER NOT NULL,
+                n_interviews INTEGER NOT NULL,
+                computed_at REAL NOT NULL,
+                payload TEXT NOT NULL
+            );
+
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value INTEGER NOT NULL
+            );
+            INSERT OR IGNORE INTO meta VALUES ('revision', 0);
+            """
+        )
+        return conn
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ============================
+    # Per-interview features
+    # ============================
+
+    def put_features(
+        self,
+        interview_id: str,
+        feature_version: str,
+        vector: np.ndarray,
+        n_responses: int,
+        explanation: tuple[str, float, np.ndarray],
+        candidate_id: str | None = None,
+        role: str | None = None,
+    ) -> None:
+        """Store an interview's features and its explanation for the current model.
+
+        Re-ingesting an interview replaces its vector and drops explanations
+        made by other model versions from the old vector.
+        """
+        model_version, score, contributions = explanation
+        with self._lock:
+            conn = self._conn
+            conn.execute("BEGIN")
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO features VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        interview_id,
+                        feature_version,
+                        np.asarray(vector, dtype=np.float32).tobytes(),
+                        n_responses,
+                        candidate_id,
+                        role,
+                        time.time(),
+                    ),
+                )
+                conn.execute("DELETE FROM explanations WHERE interview_id = ?", (interview_id,))
+                conn.execute(
+                    "INSERT INTO explanations VALUES (?, ?, ?, ?)",
+                    (
+                        interview_id,
+                        model_version,
+                        score,
+                        np.asarray(contributions, dtype=np.float32).tobytes(),
+                    ),
+                )
+                # Any change to the feature matrix invalidates cached importances
+                conn.execute("UPDATE meta SET value = value + 1 WHERE key = 'revision'")
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def get_features(self, interview_id: str, feature_version: str) -> dict[str, Any] | None:
+        """Stored vector and metadata of an interview, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT vector, n_responses, candidate_id, role, created_at FROM features "
+                "WHERE interview_id = ? AND feature_version = ?",
+                (interview_id, feature_version),
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "vector": np.frombuffer(row[0], dtype=np.float32),
+            "n_responses": row[1],
+            "candidate_id": row[2],
+            "role": row[3],
+            "created_at": row[4],
+        }
+
+    def feature_matrix(self, feature_version: str, n_features: int) -> np.ndarray:
+        """All stored vectors of a feature version as one ``(interviews, features)`` matrix."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT vector FROM features WHERE feature_version = ?", (feature_version,)
+            ).fetchall()
+        blob = b"".join(row[0] for row in rows)
+        return np.frombuffer(blob, dtype=np.float32).reshape(len(rows), n_features)
+
+    # ============================
+    # Explanations and importances
+    # ============================
+
+    def get_explanation(
+        self, interview_id: str, model_version: str
+    ) -> tuple[float, np.ndarray] | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT score, contributions FROM explanations "
+                "WHERE interview_id = ? AND model_version = ?",
+                (interview_id, model_version),
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0], np.frombuffer(row[1], dtype=np.float32)
+
+    def put_explanation(
+        self, interview_id: str, model_version: str, score: float, contributions: np.ndarray
+    ) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO explanations VALUES (?, ?, ?, ?)",
+                (
+                    interview_id,
+                    model_version,
+                    score,
+                    np.asarray(contributions, dtype=np.float32).tobytes(),
+                ),
+            )
+
+    def revision(self) -> int:
+        """Counter bumped on every feature write."""
+        with self._lock:
+            return self._conn.execute("SELECT value FROM meta WHERE key = 'revision'").fetchone()[0]
+
+    def get_importance(self, model_version: str) -> dict[str, Any] | None:
+        """Cached importances of a model version, with the revision they were computed at."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT revision, n_interviews, computed_at, payload FROM importances "
+                "WHERE model_version = ?",
+                (model_version,),
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "revision": row[0],
+            "n_interviews": row[1],
+            "computed_at": row[2],
+            **json.loads(row[3]),
+        }
+
+    def put_importance(
+        self, model_version: str, revision: int, n_interviews: int, payload: dict[str, Any]
+    ) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO importances VALUES (?, ?, ?, ?, ?)",
+                (model_version, revision, n_interviews, time.time(), json.dumps(payload)),
+            )
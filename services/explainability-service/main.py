@@ -1,8 +1,12 @@
-from datetime import datetime
+import asyncio
+from datetime import UTC, datetime
 from typing import Any
 
-from fastapi import Body, FastAPI
-from pydantic import BaseModel
+import numpy as np
+from explainer import FEATURES, MODEL, RECOMMENDATIONS, batch_importance, explain, extract_features
+from fastapi import Body, FastAPI, HTTPException
+from feature_store import FeatureStore
+from pydantic import BaseModel, Field
 
 app = FastAPI(
     title="OpenTalent Explainability Service API",
@@ -21,6 +25,54 @@ class ExplanationResponse(BaseModel):
     recommendations: list[str]
 
 
+class InterviewSignals(BaseModel):
+    """Analytics results of a finished interview, one entry per response."""
+
+    analyses: list[dict[str, Any]] = Field(..., min_length=1)
+    candidate_id: str | None = None
+    role: str | None = None
+
+
+class InterviewFeatures(BaseModel):
+    interview_id: str
+    feature_version: str
+    features: dict[str, float]
+    n_responses: int
+    computed_at: str
+
+
+# Feature vectors and explanations are computed once per interview and looked up afterwards
+feature_store = FeatureStore()
+
+
+def _features_response(interview_id: str, stored: dict[str, Any]) -> InterviewFeatures:
+    return InterviewFeatures(
+        interview_id=interview_id,
+        feature_version=MODEL.feature_version,
+        features={
+            name: round(float(v), 4) for name, v in zip(FEATURES, stored["vector"], strict=True)
+        },
+        n_responses=stored["n_responses"],
+        computed_at=datetime.fromtimestamp(stored["created_at"], UTC).isoformat(),
+    )
+
+
+def _lookup_explanation(interview_id: str) -> tuple[float, np.ndarray, int] | None:
+    """Score, contributions and response count of an interview under the current model.
+
+    Explanations are stored at ingestion; after a model upgrade the stored
+    vector is explained once more and the result cached for the new version.
+    """
+    stored = feature_store.get_features(interview_id, MODEL.feature_version)
+    if stored is None:
+        return None
+    cached = feature_store.get_explanation(interview_id, MODEL.version)
+    if cached is None:
+        cached = explain(MODEL, stored["vector"])
+        feature_store.put_explanation(interview_id, MODEL.version, *cached)
+    return cached[0], cached[1], stored["n_responses"]
+
+
 @app.get("/")
 async def root():
     return {"message": "OpenTalent Explainability Service is running!"}
@@ -37,17 +89,42 @@ async def explain_score(request: dict = Body(...)):
     score = request.get("score", 0.0)
 
     explanation_id = f"exp_score_{interview_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    found = _lookup_explanation(interview_id)
+    if found is None:
+        return ExplanationResponse(
+            explanation_id=explanation_id,
+            timestamp=datetime.now().isoformat(),
+            summary=f"No features recorded for interview {interview_id}",
+            details={"score": score, "model": MODEL.version, "features_available": False},
+            confidence=0.0,
+            recommendations=["Submit the interview's analytics signals to explain its score"],
+        )
+
+    model_score, contributions, n_responses = found
+    raw_score = MODEL.baseline_score + float(contributions.sum())
+    ranked = sorted(
+        zip(FEATURES, contributions.tolist(), strict=True), key=lambda item: -abs(item[1])
+    )
+    weakest = [name for name, value in sorted(ranked, key=lambda item: item[1]) if value < 0]
     return ExplanationResponse(
         explanation_id=explanation_id,
         timestamp=datetime.now().isoformat(),
         summary=f"Score explanation for interview {interview_id}",
         details={
-            "score": score,
-            "factors": ["Technical Accuracy", "Communication", "Problem Solving"],
-            "model": "talent_ai_scoring_v1.3",
+            "score": round(model_score, 2),
+            # Contributions explain raw_score; score is raw_score clipped to 0-10
+            "raw_score": round(raw_score, 2),
+            "clipped": abs(raw_score - model_score) > 1e-4,
+            "baseline_score": round(MODEL.baseline_score, 2),
+            "contributions": {name: round(value, 4) for name, value in ranked},
+            "factors": [name for name, _ in ranked[:3]],
+            "model": MODEL.version,
+            "features_available": True,
         },
-        confidence=0.92,
-        recommendations=["Focus on clarifying technical trade-offs"],
+        # More answered questions give a more reliable feature vector
+        confidence=round(n_responses / (n_responses + 2), 2),
+        recommendations=[RECOMMENDATIONS[name] for name in weakest[:2]]
+        or ["No weak areas relative to the baseline interview"],
     )
 
 
@@ -87,32 +164,74 @@ async def explain_path(request: dict = Body(...)):
 
 @app.get("/api/v1/features/importance")
 async def get_feature_importance():
+    """Global feature importances, recomputed in batch only when the store has changed."""
+    revision = feature_store.revision()
+    cached = feature_store.get_importance(MODEL.version)
+    if cached is None or cached["revision"] != revision:
+        X = feature_store.feature_matrix(MODEL.feature_version, len(FEATURES))
+        if len(X) == 0:
+            weights = np.abs(MODEL.weights)
+            return {
+                "model_version": MODEL.version,
+                "n_interviews": 0,
+                "method": "model_weights",
+                "importance": {
+                    name: round(float(w / weights.sum()), 4)
+                    for name, w in zip(FEATURES, weights, strict=True)
+                },
+            }
+        payload = await asyncio.to_thread(batch_importance, MODEL, X)
+        feature_store.put_importance(MODEL.version, revision, len(X), payload)
+        cached = feature_store.get_importance(MODEL.version)
     return {
-        "importance": {
-            "technical_skills": 0.45,
-            "communication_clarity": 0.25,
-            "industry_experience": 0.20,
-            "problem_solving_approach": 0.10,
-        }
+        "model_version": MODEL.version,
+        "n_interviews": cached["n_interviews"],
+        "computed_at": datetime.fromtimestamp(cached["computed_at"], UTC).isoformat(),
+        "method": "shap",
+        "importance": cached["shap"],
+        "permutation": cached["permutation"],
     }
 
 
-@app.get("/api/v1/interviews/{interview_id}/features")
+@app.post(
+    "/api/v1/interviews/{interview_id}/features",
+    response_model=InterviewFeatures,
+    status_code=201,
+)
+async def record_interview_features(interview_id: str, signals: InterviewSignals):
+    """Compute and store an interview's feature vector when the interview ends."""
+    vector = extract_features(signals.analyses)
+    feature_store.put_features(
+        interview_id,
+        MODEL.feature_version,
+        vector,
+        len(signals.analyses),
+        (MODEL.version, *explain(MODEL, vector)),
+        candidate_id=signals.candidate_id,
+        role=signals.role,
+    )
+    return _features_response(
+        interview_id, feature_store.get_features(interview_id, MODEL.feature_version)
+    )
+
+
+@app.get("/api/v1/interviews/{interview_id}/features", response_model=InterviewFeatures)
 async def get_interview_features(interview_id: str):
-    return {
-        "interview_id": interview_id,
-        "features": {"clarity": 0.85, "technical_depth": 0.72, "responsiveness": 0.90},
-    }
+    stored = feature_store.get_features(interview_id, MODEL.feature_version)
+    if stored is None:
+        raise HTTPException(status_code=404, detail="No features recorded for this interview")
+    return _features_response(interview_id, stored)
 
 
 @app.get("/api/v1/model/metadata")
 async def get_model_metadata():
     return {
         "model_name": "OpenTalent Interview AI Engine",
-        "version": "2.1.4",
-        "last_updated": "2025-11-25",
-        "type": "Neural Scoring Engine",
-        "parameters_count": "350M",
+        "version": MODEL.version,
+        "type": "Linear Scoring Model",
+        "features": list(FEATURES),
+        "feature_version": MODEL.feature_version,
+        "parameters_count": str(len(FEATURES) + 1),
     }
 
 
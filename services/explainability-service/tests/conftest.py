@@ -9,6 +9,9 @@ service_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if service_root not in sys.path:
     sys.path.insert(0, service_root)
 
+# Keep test features out of the developer's cache directory
+os.environ.setdefault("EXPLAINABILITY_STORE_PATH", ":memory:")
+
 
 @pytest.fixture
 def client():
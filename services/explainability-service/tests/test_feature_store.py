@@ -0,0 +1,119 @@
+import numpy as np
+import pytest
+from explainer import FEATURES, MODEL, batch_importance, explain, extract_features
+from feature_store import FeatureStore
+
+
+def _analysis(quality, polarity=0.2, level="advanced", flags=()):
+    return {
+        "quality": {
+            "completeness": quality,
+            "relevance": quality,
+            "clarity": quality,
+            "technical_accuracy": quality,
+        },
+        "sentiment": {"polarity": polarity},
+        "expertise_assessment": {"level": level},
+        "bias_detection": {"flags": list(flags)},
+    }
+
+
+STRONG = [_analysis(0.9), _analysis(0.8)]
+WEAK = [_analysis(0.2, polarity=-0.4, level="beginner", flags=["age"]), _analysis(0.3)]
+
+
+@pytest.fixture
+def store():
+    return FeatureStore(":memory:")
+
+
+class TestExplainer:
+    def test_features_follow_analytics_signals(self):
+        vector = extract_features(STRONG)
+        features = dict(zip(FEATURES, vector.tolist(), strict=True))
+        assert features["technical_accuracy"] == pytest.approx(0.85)
+        assert features["expertise"] == 0.75
+        assert features["bias_flags"] == 0.0
+        assert features["consistency"] == pytest.approx(0.9)
+
+    def test_clipped_scores_keep_exact_raw_contributions(self):
+        vector = extract_features(WEAK)
+        vector[FEATURES.index("bias_flags")] = 20.0
+        score, contributions = explain(MODEL, vector)
+        assert score == 0.0
+        assert MODEL.baseline_score + contributions.sum() == pytest.approx(
+            float(MODEL.raw_score(vector)), abs=1e-4
+        )
+
+    def test_contributions_sum_to_score_minus_baseline(self):
+        score, contributions = explain(MODEL, extract_features(WEAK))
+        assert score == pytest.approx(MODEL.baseline_score + contributions.sum(), abs=1e-4)
+        assert score < MODEL.baseline_score
+
+    def test_batch_importance_ranks_heavier_features_higher(self):
+        rng = np.random.default_rng(1)
+        X = rng.random((500, len(FEATURES))).astype(np.float32)
+        result = batch_importance(MODEL, X, chunk_size=64)
+        assert sum(result["shap"].values()) == pytest.approx(1.0, abs=1e-3)
+        assert result["shap"]["technical_accuracy"] > result["shap"]["sentiment"]
+        assert result["permutation"]["technical_accuracy"] > result["permutation"]["sentiment"]
+        # Chunking does not change the result
+        assert batch_importance(MODEL, X, chunk_size=500) == result
+
+
+class TestFeatureStore:
+    def test_vectors_and_explanations_round_trip(self, store):
+        vector = extract_features(STRONG)
+        store.put_features("int1", "1", vector, 2, (MODEL.version, *explain(MODEL, vector)))
+        stored = store.get_features("int1", "1")
+        assert np.array_equal(stored["vector"], vector)
+        assert store.get_features("int1", "0") is None
+        score, contributions = store.get_explanation("int1", MODEL.version)
+        assert score == pytest.approx(explain(MODEL, vector)[0])
+        assert store.feature_matrix("1", len(FEATURES)).shape == (1, len(FEATURES))
+
+    def test_writes_bump_revision(self, store):
+        before = store.revision()
+        vector = extract_features(WEAK)
+        store.put_features("int1", "1", vector, 2, (MODEL.version, *explain(MODEL, vector)))
+        assert store.revision() == before + 1
+
+
+class TestEndpoints:
+    def test_explanations_are_lookups_after_ingestion(self, client, monkeypatch):
+        import main
+
+        monkeypatch.setattr(main, "feature_store", FeatureStore(":memory:"))
+        assert client.get("/api/v1/interviews/int_s/features").status_code == 404
+
+        res = client.post("/api/v1/interviews/int_s/features", json={"analyses": STRONG})
+        assert res.status_code == 201
+        assert res.json()["n_responses"] == 2
+        client.post("/api/v1/interviews/int_w/features", json={"analyses": WEAK})
+
+        calls = []
+        monkeypatch.setattr(main, "explain", lambda *args: calls.append(args))
+        body = client.post("/api/v1/explain/score", json={"interview_id": "int_w"}).json()
+        assert calls == []
+        assert body["details"]["score"] < body["details"]["baseline_score"]
+        assert body["details"]["contributions"]["technical_accuracy"] < 0
+        assert body["confidence"] == 0.5
+
+    def test_importance_is_cached_until_features_change(self, client, monkeypatch):
+        import main
+
+        monkeypatch.setattr(main, "feature_store", FeatureStore(":memory:"))
+        assert client.get("/api/v1/features/importance").json()["method"] == "model_weights"
+        client.post("/api/v1/interviews/a/features", json={"analyses": STRONG})
+        client.post("/api/v1/interviews/b/features", json={"analyses": WEAK})
+
+        calls = []
+        real = main.batch_importance
+        monkeypatch.setattr(main, "batch_importance", lambda *args: calls.append(1) or real(*args))
+        first = client.get("/api/v1/features/importance").json()
+        assert client.get("/api/v1/features/importance").json() == first
+        assert first["n_interviews"] == 2 and len(calls) == 1
+
+        client.post("/api/v1/interviews/c/features", json={"analyses": STRONG})
+        assert client.get("/api/v1/features/importance").json()["n_interviews"] == 3
+        assert len(calls) == 2
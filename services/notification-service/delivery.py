@@ -0,0 +1,231 @@
+"""
+Notification Service - Delivery Engine
+
+Workers drain the outbox per channel. Each channel has its own worker count
+and rate limit, so a large email campaign cannot starve SMS or exceed a
+provider's quota. A worker claims a batch of due messages and hands the
+whole batch to ``provider.send_batch`` (one Novu bulk trigger per 100
+events; other providers send the batch concurrently). Failed messages are
+retried with exponential, jittered backoff until NOTIFY_MAX_ATTEMPTS is
+reached, then marked failed.
+"""
+
+import asyncio
+import logging
+import os
+import random
+import time
+from typing import Any
+
+try:
+    from .outbox import Outbox
+except ImportError:
+    from outbox import Outbox
+
+logger = logging.getLogger(__name__)
+
+CHANNELS = ("email", "sms", "push")
+
+BATCH_SIZE = int(os.getenv("NOTIFY_BATCH_SIZE", "100"))
+MAX_ATTEMPTS = int(os.getenv("NOTIFY_MAX_ATTEMPTS", "5"))
+RETRY_BASE_SEC = float(os.getenv("NOTIFY_RETRY_BASE_SEC", "2"))
+RETRY_MAX_SEC = float(os.getenv("NOTIFY_RETRY_MAX_SEC", "300"))
+POLL_INTERVAL_SEC = float(os.getenv("NOTIFY_POLL_INTERVAL_SEC", "1"))
+RETENTION_SEC = float(os.getenv("NOTIFY_OUTBOX_RETENTION_HOURS", "168")) * 3600
+
+
+def _channel_setting(channel: str, name: str, default: str) -> float:
+    return float(os.getenv(f"NOTIFY_{channel.upper()}_{name}", default))
+
+
+def delivered(result: Any) -> bool:
+    """Whether a provider result (or raised exception) counts as delivered."""
+    if isinstance(result, BaseException):
+        return False
+    if isinstance(result, dict):
+        if "ok" in result:
+            return bool(result["ok"])
+        status = result.get("status")
+        if isinstance(status, int):
+            return 200 <= status < 300
+    return True
+
+
+def _error_text(result: Any) -> str:
+    if isinstance(result, BaseException):
+        return f"{type(result).__name__}: {result}"
+    if isinstance(result, dict):
+        return str(result.get("error") or result.get("data") or result)
+    return str(result)
+
+
+class RateLimiter:
+    """Spaces out sends to at most ``rate`` messages per second (0 = unlimited)."""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self._next = 0.0
+
+    async def acquire(self, count: int = 1) -> None:
+        if self.rate <= 0:
+            return
+        now = time.monotonic()
+        start = max(now, self._next)
+        self._next = start + count / self.rate
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+class DeliveryEngine:
+    """Per-channel worker pools that deliver queued notifications."""
+
+    def __init__(
+        self,
+        outbox: Outbox,
+        provider: Any,
+        batch_size: int = BATCH_SIZE,
+        max_attempts: int = MAX_ATTEMPTS,
+    ):
+        """
+        Args:
+            outbox: Durable message queue.
+            provider: NotificationProvider used for delivery.
+            batch_size: Messages claimed and sent per provider call.
+            max_attempts: Attempts before a message is marked failed.
+        """
+        self.outbox = outbox
+        self.provider = provider
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        # NOTIFY_<CHANNEL>_WORKERS concurrent batches, NOTIFY_<CHANNEL>_RATE messages/second
+        self.workers = {
+            channel: max(1, int(_channel_setting(channel, "WORKERS", "4"))) for channel in CHANNELS
+        }
+        self.limiters = {
+            channel: RateLimiter(_channel_setting(channel, "RATE", "0")) for channel in CHANNELS
+        }
+        self._wakeup = {channel: asyncio.Event() for channel in CHANNELS}
+        self._tasks: list[asyncio.Task] = []
+        self._stats = {
+            channel: {"batches": 0, "sent": 0, "retried": 0, "failed": 0} for channel in CHANNELS
+        }
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Requeue interrupted messages and start the workers."""
+        if self._tasks:
+            return
+        recovered = self.outbox.recover()
+        if recovered:
+            logger.info(f"Requeued {recovered} notifications interrupted by a restart")
+        for channel in CHANNELS:
+            for _ in range(self.workers[channel]):
+                self._tasks.append(asyncio.create_task(self._worker(channel)))
+        self._tasks.append(asyncio.create_task(self._purge_loop()))
+
+    async def stop(self) -> None:
+        """Stop the workers; messages in flight are requeued on the next start."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    def notify(self, channel: str) -> None:
+        """Wake the channel's idle workers after new messages were queued."""
+        self._wakeup[channel].set()
+
+    # ------------------------------------------------------------------
+    # Delivery
+    # ------------------------------------------------------------------
+
+    def _retry_at(self, attempts: int) -> float | None:
+        if attempts >= self.max_attempts:
+            return None
+        delay = min(RETRY_MAX_SEC, RETRY_BASE_SEC * 2 ** (attempts - 1))
+        return time.time() + delay * random.uniform(0.5, 1.5)
+
+    async def run_once(self, channel: str) -> int:
+        """Claim and send one batch of due messages.
+
+        Returns:
+            Number of messages attempted (0 when nothing is due).
+        """
+        batch = await asyncio.to_thread(self.outbox.claim, channel, self.batch_size)
+        if not batch:
+            return 0
+        await self.limiters[channel].acquire(len(batch))
+        try:
+            results = await self.provider.send_batch(
+                channel, [message["payload"] for message in batch]
+            )
+        except Exception as e:
+            results = [e] * len(batch)
+
+        sent: list[str] = []
+        failures: list[tuple[str, str, float | None]] = []
+        for message, result in zip(batch, results, strict=True):
+            if delivered(result):
+                sent.append(message["id"])
+            else:
+                retry_at = self._retry_at(message["attempts"] + 1)
+                failures.append((message["id"], _error_text(result), retry_at))
+
+        def record() -> None:
+            self.outbox.mark_sent(sent)
+            for message_id, error, retry_at in failures:
+                self.outbox.mark_failed(message_id, error, retry_at)
+
+        await asyncio.to_thread(record)
+        stats = self._stats[channel]
+        stats["batches"] += 1
+        stats["sent"] += len(sent)
+        for _, error, retry_at in failures:
+            stats["retried" if retry_at is not None else "failed"] += 1
+            if retry_at is None:
+                logger.warning(f"Giving up on {channel} notification: {error}")
+        return len(batch)
+
+    async def flush(self, channel: str) -> int:
+        """Send batches until nothing is due; returns the number of messages attempted."""
+        total = 0
+        while count := await self.run_once(channel):
+            total += count
+        return total
+
+    async def _worker(self, channel: str) -> None:
+        while True:
+            try:
+                if await self.run_once(channel):
+                    continue
+            except Exception as e:
+                logger.error(f"{channel} delivery worker error: {e}")
+            # Idle (or the outbox failed): sleep until woken or the next poll
+            try:
+                await asyncio.wait_for(self._wakeup[channel].wait(), POLL_INTERVAL_SEC)
+            except TimeoutError:
+                pass
+            self._wakeup[channel].clear()
+
+    async def _purge_loop(self) -> None:
+        while True:
+            try:
+                await asyncio.to_thread(self.outbox.purge, time.time() - RETENTION_SEC)
+            except Exception as e:
+                logger.error(f"Outbox purge failed: {e}")
+            await asyncio.sleep(3600)
+
+    def stats(self) -> dict[str, Any]:
+        """Delivery counters and outbox depth per channel."""
+        depth = self.outbox.stats()
+        return {
+            channel: {
+                "workers": self.workers[channel],
+                "rate_limit": self.limiters[channel].rate,
+                **self._stats[channel],
+                "outbox": depth.get(channel, {}),
+            }
+            for channel in CHANNELS
+        }
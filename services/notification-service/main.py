@@ -1,8 +1,14 @@
+import asyncio
 import os
+import re
 import sys as _sys
+import uuid
+from contextlib import asynccontextmanager
+from datetime import UTC
 
 from fastapi import Body, Depends, FastAPI
 from fastapi.responses import JSONResponse
+from pydantic import EmailStr, TypeAdapter, ValidationError
 
 # Ensure local imports work in various loaders
 _this_dir = os.path.dirname(__file__)
@@ -11,21 +17,52 @@ if _this_dir not in _sys.path:
 
 # Import from local modules (handles both package and spec loading)
 try:
-    from .providers import get_provider
+    from .delivery import CHANNELS, DeliveryEngine
+    from .outbox import Outbox
+    from .providers import ProviderRegistry
+    from .template_cache import TemplateCache
 except ImportError:
-    from providers import get_provider
+    from delivery import CHANNELS, DeliveryEngine
+    from outbox import Outbox
+    from providers import ProviderRegistry
+    from template_cache import TemplateCache
 
 from schemas import (
+    BulkNotificationRequest,
+    BulkNotificationResponse,
     EmailNotificationRequest,
     PushNotificationRequest,
     SMSNotificationRequest,
+    TemplateRenderRequest,
 )
 
-app = FastAPI(title="Notification Service", version="1.0.0")
+# One long-lived provider per process: built on first use, rebuilt when its
+# configuration changes, HTTP connections pooled across requests
+provider = ProviderRegistry()
+templates = TemplateCache(provider.get_templates)
+provider.on_reload(templates.invalidate)
+outbox = Outbox()
+engine = DeliveryEngine(outbox, provider)
+
+E164_PATTERN = re.compile(r"^\+?[1-9]\d{1,14}$")
+_email_adapter = TypeAdapter(EmailStr)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    provider.start()
+    engine.start()
+    yield
+    await engine.stop()
+    await provider.close()
+    outbox.close()
+
+
+app = FastAPI(title="Notification Service", version="1.0.0", lifespan=lifespan)
 
 
 def provider_dep():
-    return get_provider()
+    return provider
 
 
 @app.get("/")
@@ -81,9 +118,133 @@ async def notify_push(payload: PushNotificationRequest = Body(...), p=Depends(pr
     return result
 
 
+def _valid_recipient(channel: str, recipient: str) -> bool:
+    if channel == "sms":
+        return bool(E164_PATTERN.match(recipient))
+    if channel == "email":
+        try:
+            _email_adapter.validate_python(recipient)
+        except ValidationError:
+            return False
+        return True
+    return bool(recipient.strip())
+
+
+def _bulk_message(payload: BulkNotificationRequest, recipient: str, template=None) -> dict:
+    channel = payload.notification_type.value
+    subject, message, html = payload.subject, payload.message, payload.html
+    if template is not None:
+        rendered = template.render(
+            {**(payload.data or {}), "recipient": recipient, "message": payload.message}
+        )
+        subject = rendered.get("subject") or rendered.get("title") or subject
+        message = rendered.get("text") or rendered.get("body") or message
+        html = rendered.get("html") or rendered.get("content") or html
+    if channel == "email":
+        return {"to": recipient, "subject": subject, "html": html or message, "text": message}
+    if channel == "sms":
+        return {"to": recipient, "text": message}
+    return {"to": recipient, "title": subject, "body": message, "data": payload.data}
+
+
+@app.post("/api/v1/notify/bulk", status_code=202, response_model=BulkNotificationResponse)
+async def notify_bulk(payload: BulkNotificationRequest = Body(...)):
+    """Queue one message per recipient; delivery happens in the background.
+
+    Invalid recipients are returned in ``rejected`` and not queued. Progress
+    can be polled at ``/api/v1/notify/bulk/{batch_id}``.
+    """
+    channel = payload.notification_type.value
+    if channel not in CHANNELS:
+        return JSONResponse(
+            status_code=400, content={"error": f"Bulk delivery does not support '{channel}'"}
+        )
+    template = None
+    if payload.template_id:
+        template = await templates.get(payload.template_id, payload.locale)
+        if template is None:
+            return JSONResponse(status_code=404, content={"error": "Unknown template"})
+    has_subject = template is not None and bool({"subject", "title"} & template.fields.keys())
+    if channel in ("email", "push") and not (payload.subject or has_subject):
+        return JSONResponse(status_code=400, content={"error": "Missing 'subject'"})
+
+    recipients = list(dict.fromkeys(recipient.strip() for recipient in payload.recipients))
+    accepted: list[str] = []
+    rejected: list[str] = []
+    for recipient in recipients:
+        (accepted if _valid_recipient(channel, recipient) else rejected).append(recipient)
+
+    not_before = None
+    if payload.scheduled_at is not None:
+        scheduled = payload.scheduled_at
+        if scheduled.tzinfo is None:
+            scheduled = scheduled.replace(tzinfo=UTC)
+        not_before = scheduled.timestamp()
+
+    batch_id = str(uuid.uuid4())
+    ids = await asyncio.to_thread(
+        outbox.enqueue,
+        channel,
+        [_bulk_message(payload, recipient, template) for recipient in accepted],
+        payload.priority.value,
+        not_before,
+        batch_id,
+    )
+    engine.notify(channel)
+    return BulkNotificationResponse(
+        batch_id=batch_id,
+        total=len(recipients),
+        sent=0,
+        failed=len(rejected),
+        pending=len(ids),
+        notification_ids=ids,
+        rejected=rejected,
+    )
+
+
+@app.get("/api/v1/notify/bulk/{batch_id}", response_model=BulkNotificationResponse)
+async def bulk_status(batch_id: str):
+    status = await asyncio.to_thread(outbox.batch_status, batch_id)
+    if status is None:
+        return JSONResponse(status_code=404, content={"error": "Unknown batch"})
+    return BulkNotificationResponse(
+        batch_id=batch_id,
+        total=len(status["ids"]),
+        sent=status["sent"],
+        failed=status["failed"],
+        pending=status["pending"] + status["sending"],
+        notification_ids=status["ids"],
+    )
+
+
+@app.get("/api/v1/notify/queue")
+async def queue_stats():
+    """Outbox depth and delivery counters per channel."""
+    return await asyncio.to_thread(engine.stats)
+
+
+@app.post("/api/v1/provider/reload")
+async def reload_provider():
+    """Re-read the provider configuration now instead of at the next periodic check."""
+    provider.reload()
+    return {"generation": provider.generation}
+
+
 @app.get("/api/v1/notify/templates")
-async def list_templates(p=Depends(provider_dep)):
-    return {"data": await p.get_templates()}
+async def list_templates():
+    return {"data": await templates.list()}
+
+
+@app.post("/api/v1/notify/templates/{template_id}/render")
+async def render_template(template_id: str, payload: TemplateRenderRequest = Body(...)):
+    template = await templates.get(template_id, payload.locale)
+    if template is None:
+        return JSONResponse(status_code=404, content={"error": "Unknown template"})
+    return {
+        "template_id": template_id,
+        "locale": payload.locale,
+        "rendered": template.render(payload.variables),
+    }
 
 
 if __name__ == "__main__":
@@ -0,0 +1,252 @@
+"""
+Notification Service - Durable Outbox
+
+Queued notifications are written to SQLite before the API answers, so a
+crash or restart never loses an accepted message. The delivery engine
+claims due messages per channel (highest priority, then oldest first),
+marks them ``sending`` while a provider call is in flight and records the
+outcome. Messages left ``sending`` by a crash are put back in the queue on
+the next start. The database is opened on first use.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any
+
+PRIORITIES = {"low": 0, "normal": 1, "high": 2, "urgent": 3}
+
+# Directory for the outbox database, independent of the working directory
+DATA_DIR = os.environ.get("NOTIFY_DATA_DIR") or os.path.join(
+    os.path.expanduser("~"), ".cache", "opentalent", "notification-service"
+)
+
+
+class Outbox:
+    """SQLite-backed queue of notifications awaiting delivery."""
+
+    def __init__(self, path: str | None = None):
+        """
+        Args:
+            path: SQLite file; defaults to NOTIFY_OUTBOX_PATH or
+                notification_outbox.db in NOTIFY_DATA_DIR.
+        """
+        self.path = (
+            path
+            or os.environ.get("NOTIFY_OUTBOX_PATH")
+            or os.path.join(DATA_DIR, "notification_outbox.db")
+        )
+        self._lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+
+    def _conn(self) -> sqlite3.Connection:
+        if self._db is None:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS outbox ("
+                "id TEXT PRIMARY KEY, batch_id TEXT, channel TEXT NOT NULL, "
+                "payload TEXT NOT NULL, priority INTEGER NOT NULL DEFAULT 1, "
+                "status TEXT NOT NULL DEFAULT 'pending', attempts INTEGER NOT NULL DEFAULT 0, "
+                "next_attempt_at REAL NOT NULL, created_at REAL NOT NULL, "
+                "updated_at REAL NOT NULL, last_error TEXT)"
+            )
+            db.execute(
+                "CREATE INDEX IF NOT EXISTS outbox_due "
+                "ON outbox (channel, status, priority DESC, next_attempt_at)"
+            )
+            db.execute("CREATE INDEX IF NOT EXISTS outbox_batch ON outbox (batch_id, status)")
+            self._db = db
+        return self._db
+
+    def _write_many(self, sql: str, rows: list[tuple]) -> None:
+        # One transaction for the whole batch; caller holds the lock
+        db = self._conn()
+        db.execute("BEGIN")
+        try:
+            db.executemany(sql, rows)
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+
+    def close(self) -> None:
+        """Close the SQLite connection, if open."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    # ------------------------------------------------------------------
+    # Producers
+    # ------------------------------------------------------------------
+
+    def enqueue(
+        self,
+        channel: str,
+        payloads: list[dict[str, Any]],
+        priority: str = "normal",
+        not_before: float | None = None,
+        batch_id: str | None = None,
+    ) -> list[str]:
+        """Queue messages for delivery in one transaction.
+
+        Args:
+            channel: "email", "sms" or "push".
+            payloads: Provider arguments for each message.
+            priority: Priority name from NotificationPriority.
+            not_before: Unix time before which the messages are not sent.
+            batch_id: Groups messages of one bulk request.
+
+        Returns:
+            The message IDs, in payload order.
+        """
+        now = time.time()
+        due = max(now, not_before or 0)
+        rank = PRIORITIES.get(priority, PRIORITIES["normal"])
+        ids = [str(uuid.uuid4()) for _ in payloads]
+        rows = [
+            (message_id, batch_id, channel, json.dumps(payload), rank, due, now, now)
+            for message_id, payload in zip(ids, payloads, strict=True)
+        ]
+        with self._lock:
+            self._write_many(
+                "INSERT INTO outbox (id, batch_id, channel, payload, priority, "
+                "next_attempt_at, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        return ids
+
+    # ------------------------------------------------------------------
+    # Delivery engine
+    # ------------------------------------------------------------------
+
+    def recover(self) -> int:
+        """Requeue messages that were in flight when the process stopped."""
+        with self._lock:
+            cursor = self._conn().execute(
+                "UPDATE outbox SET status = 'pending' WHERE status = 'sending'"
+            )
+            return cursor.rowcount
+
+    def claim(self, channel: str, limit: int, now: float | None = None) -> list[dict[str, Any]]:
+        """Take up to ``limit`` due messages of a channel and mark them sending.
+
+        Returns:
+            ``[{"id", "payload", "attempts"}]`` in delivery order.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            rows = (
+                self._conn()
+                .execute(
+                    "SELECT id, payload, attempts FROM outbox "
+                    "WHERE channel = ? AND status = 'pending' AND next_attempt_at <= ? "
+                    "ORDER BY priority DESC, next_attempt_at LIMIT ?",
+                    (channel, now, limit),
+                )
+                .fetchall()
+            )
+            if rows:
+                self._write_many(
+                    "UPDATE outbox SET status = 'sending', updated_at = ? WHERE id = ?",
+                    [(now, row[0]) for row in rows],
+                )
+        return [{"id": row[0], "payload": json.loads(row[1]), "attempts": row[2]} for row in rows]
+
+    def next_due(self, channel: str) -> float | None:
+        """Time of the earliest pending message of a channel, if any."""
+        with self._lock:
+            row = (
+                self._conn()
+                .execute(
+                    "SELECT MIN(next_attempt_at) FROM outbox WHERE channel = ? AND status = 'pending'",
+                    (channel,),
+                )
+                .fetchone()
+            )
+        return row[0]
+
+    def mark_sent(self, ids: list[str]) -> None:
+        """Record successful deliveries."""
+        if not ids:
+            return
+        now = time.time()
+        with self._lock:
+            self._write_many(
+                "UPDATE outbox SET status = 'sent', attempts = attempts + 1, updated_at = ?, "
+                "last_error = NULL WHERE id = ?",
+                [(now, message_id) for message_id in ids],
+            )
+
+    def mark_failed(self, message_id: str, error: str, retry_at: float | None) -> None:
+        """Record a failed attempt.
+
+        Args:
+            message_id: Message that failed.
+            error: Provider error, kept for inspection.
+            retry_at: When to try again; None gives up on the message.
+        """
+        now = time.time()
+        with self._lock:
+            self._conn().execute(
+                "UPDATE outbox SET status = ?, attempts = attempts + 1, next_attempt_at = ?, "
+                "updated_at = ?, last_error = ? WHERE id = ?",
+                (
+                    "failed" if retry_at is None else "pending",
+                    retry_at if retry_at is not None else now,
+                    now,
+                    error[:500],
+                    message_id,
+                ),
+            )
+
+    def purge(self, before: float) -> int:
+        """Delete sent and permanently failed messages last updated before a time."""
+        with self._lock:
+            cursor = self._conn().execute(
+                "DELETE FROM outbox WHERE status IN ('sent', 'failed') AND updated_at < ?",
+                (before,),
+            )
+            return cursor.rowcount
+
+    # ------------------------------------------------------------------
+    # Inspection
+    # ------------------------------------------------------------------
+
+    def batch_status(self, batch_id: str) -> dict[str, Any] | None:
+        """Counts per status and message IDs of a bulk request."""
+        with self._lock:
+            rows = (
+                self._conn()
+                .execute(
+                    "SELECT id, status FROM outbox WHERE batch_id = ? ORDER BY created_at, rowid",
+                    (batch_id,),
+                )
+                .fetchall()
+            )
+        if not rows:
+            return None
+        counts = {"pending": 0, "sending": 0, "sent": 0, "failed": 0}
+        for _, status in rows:
+            counts[status] += 1
+        return {"ids": [row[0] for row in rows], **counts}
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Message counts per channel and status."""
+        with self._lock:
+            rows = (
+                self._conn()
+                .execute("SELECT channel, status, COUNT(*) FROM outbox GROUP BY channel, status")
+                .fetchall()
+            )
+        stats: dict[str, dict[str, int]] = {}
+        for channel, status, count in rows:
+            stats.setdefault(channel, {})[status] = count
+        return stats
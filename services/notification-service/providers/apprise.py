@@ -1,3 +1,5 @@
+import asyncio
+
 from .base import NotificationProvider
 
 try:
@@ -18,19 +20,20 @@ class AppriseProvider(NotificationProvider):
     async def send_email(self, to: str, subject: str, html: str, text: str | None = None) -> dict:
         if not self.app:
             return {"ok": False, "error": "Apprise not installed"}
-        ok = self.app.notify(body=text or html, title=subject)
+        # notify() blocks on network I/O; keep it off the event loop
+        ok = await asyncio.to_thread(self.app.notify, body=text or html, title=subject)
         return {"ok": ok}
 
     async def send_sms(self, to: str, text: str) -> dict:
         if not self.app:
             return {"ok": False, "error": "Apprise not installed"}
-        ok = self.app.notify(body=text)
+        ok = await asyncio.to_thread(self.app.notify, body=text)
         return {"ok": ok}
 
     async def send_push(self, to: str, title: str, body: str, data: dict | None = None) -> dict:
         if not self.app:
             return {"ok": False, "error": "Apprise not installed"}
-        ok = self.app.notify(body=body, title=title)
+        ok = await asyncio.to_thread(self.app.notify, body=body, title=title)
         return {"ok": ok}
 
     async def get_templates(self) -> list[dict]:
@@ -1,3 +1,6 @@
+import asyncio
+
+
 class NotificationProvider:
     async def send_email(self, to: str, subject: str, html: str, text: str | None = None) -> dict:
         raise NotImplementedError
@@ -8,6 +11,16 @@ class NotificationProvider:
     async def send_push(self, to: str, title: str, body: str, data: dict | None = None) -> dict:
         raise NotImplementedError
 
+    async def send_batch(self, channel: str, messages: list[dict]) -> list:
+        """Send messages of one channel; returns a result or exception per message.
+
+        Providers with a bulk API override this; the default sends concurrently.
+        """
+        send = getattr(self, f"send_{channel}")
+        return await asyncio.gather(
+            *(send(**message) for message in messages), return_exceptions=True
+        )
+
     async def get_templates(self) -> list[dict]:
         raise NotImplementedError
 
@@ -19,3 +32,6 @@ class NotificationProvider:
 
     async def health(self) -> dict:
         raise NotImplementedError
+
+    async def close(self) -> None:
+        """Release pooled connections."""
@@ -0,0 +1,93 @@
+import asyncio
+import os
+import random
+
+from .apprise import AppriseProvider
+from .base import NotificationProvider
+from .novu import NovuProvider
+
+RETRY_ATTEMPTS = int(os.getenv("NOTIFY_RETRY_ATTEMPTS", "2"))
+RETRY_BACKOFF_SEC = float(os.getenv("NOTIFY_RETRY_BACKOFF_SEC", "0.3"))
+
+
+class FallbackProvider(NotificationProvider):
+    def __init__(self, primary: NotificationProvider, fallback: NotificationProvider):
+        self.primary = primary
+        self.fallback = fallback
+
+    async def _try(self, func_name: str, *args, **kwargs):
+        last_error = None
+        for attempt in range(RETRY_ATTEMPTS):
+            try:
+                func = getattr(self.primary, func_name)
+                return await func(*args, **kwargs)
+            except Exception as e:
+                last_error = str(e)
+                # Exponential backoff with jitter so retries from many requests spread out
+                await asyncio.sleep(RETRY_BACKOFF_SEC * 2**attempt * random.uniform(0.5, 1.5))
+        # Fallback
+        func = getattr(self.fallback, func_name)
+        result = await func(*args, **kwargs)
+        # Annotate result to indicate fallback occurred
+        if isinstance(result, dict):
+            result.setdefault("fallback", True)
+            result.setdefault("fallback_reason", last_error)
+        return result
+
+    async def send_email(self, *args, **kwargs):
+        return await self._try("send_email", *args, **kwargs)
+
+    async def send_sms(self, *args, **kwargs):
+        return await self._try("send_sms", *args, **kwargs)
+
+    async def send_push(self, *args, **kwargs):
+        return await self._try("send_push", *args, **kwargs)
+
+    async def send_batch(self, channel: str, messages: list[dict]) -> list:
+        # The delivery engine retries failed messages itself; only fall back on errors
+        try:
+            return await self.primary.send_batch(channel, messages)
+        except Exception:
+            return await self.fallback.send_batch(channel, messages)
+
+    async def get_templates(self, *args, **kwargs):
+        return await self._try("get_templates", *args, **kwargs)
+
+    async def render(self, *args, **kwargs):
+        return await self._try("render", *args, **kwargs)
+
+    async def preferences(self, *args, **kwargs):
+        return await self._try("preferences", *args, **kwargs)
+
+    async def health(self):
+        try:
+            status = await self.primary.health()
+            return {"active": "primary", **status}
+        except Exception as e:
+            fb = await self.fallback.health()
+            return {"active": "fallback", "error": str(e), **fb}
+
+    async def close(self):
+        await self.primary.close()
+        await self.fallback.close()
+
+
+# Environment settings that determine the provider; a change triggers a reload
+PROVIDER_SETTINGS = ("NOTIFY_PROVIDER", "APPRISE_SERVICES", "NOVU_API_URL", "NOVU_API_KEY")
+
+
+def provider_settings() -> dict[str, str]:
+    return {key: os.getenv(key, "") for key in PROVIDER_SETTINGS}
+
+
+def build_provider(settings: dict[str, str] | None = None) -> NotificationProvider:
+    settings = settings if settings is not None else provider_settings()
+    # One Apprise instance (services parsed once) serves as primary or fallback
+    apprise = AppriseProvider(services=settings.get("APPRISE_SERVICES", ""))
+    primary: NotificationProvider = apprise
+    if (settings.get("NOTIFY_PROVIDER") or "apprise").lower() == "novu":
+        primary = NovuProvider(
+            api_url=settings.get("NOVU_API_URL") or None,
+            api_key=settings.get("NOVU_API_KEY") or None,
+        )
+    return FallbackProvider(primary=primary, fallback=apprise)
@@ -4,6 +4,9 @@ import aiohttp
 
 from .base import NotificationProvider
 
+# Novu accepts at most 100 events per bulk trigger
+BULK_TRIGGER_LIMIT = 100
+
 
 class NovuProvider(NotificationProvider):
     def __init__(self, api_url: str | None = None, api_key: str | None = None):
@@ -13,31 +16,81 @@ class NovuProvider(NotificationProvider):
             "Authorization": f"ApiKey {self.api_key}",
             "Content-Type": "application/json",
         }
+        self.timeout = aiohttp.ClientTimeout(total=float(os.getenv("NOVU_TIMEOUT_SEC", "10")))
+        self.max_connections = int(os.getenv("NOVU_MAX_CONNECTIONS", "20"))
+        self._session: aiohttp.ClientSession | None = None
+
+    def _client(self) -> aiohttp.ClientSession:
+        # One pooled session for the provider's lifetime (keep-alive, bounded connections)
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                timeout=self.timeout,
+                connector=aiohttp.TCPConnector(limit=self.max_connections),
+            )
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
 
     async def _post(self, path: str, json: dict) -> dict:
-        async with (
-            aiohttp.ClientSession() as session,
-            session.post(f"{self.api_url}{path}", headers=self.headers, json=json) as resp,
-        ):
+        async with self._client().post(f"{self.api_url}{path}", json=json) as resp:
             return {"status": resp.status, "data": await resp.json()}
 
+    @staticmethod
+    def _event(channel: str, message: dict) -> dict:
+        if channel == "email":
+            payload = {
+                "to": {"email": message["to"]},
+                "subject": message["subject"],
+                "html": message.get("html") or "",
+                "text": message.get("text") or "",
+            }
+        elif channel == "sms":
+            payload = {"to": {"phone": message["to"]}, "text": message["text"]}
+        else:
+            payload = {
+                "to": {"subscriberId": message["to"]},
+                "title": message["title"],
+                "body": message["body"],
+                "data": message.get("data") or {},
+            }
+        return {"name": channel, "payload": payload}
+
     async def send_email(self, to: str, subject: str, html: str, text: str | None = None) -> dict:
-        payload = {"to": {"email": to}, "subject": subject, "html": html, "text": text or ""}
-        return await self._post("/v1/events/trigger", {"name": "email", "payload": payload})
+        message = {"to": to, "subject": subject, "html": html, "text": text}
+        return await self._post("/v1/events/trigger", self._event("email", message))
 
     async def send_sms(self, to: str, text: str) -> dict:
-        payload = {"to": {"phone": to}, "text": text}
-        return await self._post("/v1/events/trigger", {"name": "sms", "payload": payload})
+        return await self._post("/v1/events/trigger", self._event("sms", {"to": to, "text": text}))
 
     async def send_push(self, to: str, title: str, body: str, data: dict | None = None) -> dict:
-        payload = {"to": {"subscriberId": to}, "title": title, "body": body, "data": data or {}}
-        return await self._post("/v1/events/trigger", {"name": "push", "payload": payload})
+        message = {"to": to, "title": title, "body": body, "data": data}
+        return await self._post("/v1/events/trigger", self._event("push", message))
+
+    async def send_batch(self, channel: str, messages: list[dict]) -> list:
+        results: list = []
+        for start in range(0, len(messages), BULK_TRIGGER_LIMIT):
+            chunk = messages[start : start + BULK_TRIGGER_LIMIT]
+            events = [self._event(channel, message) for message in chunk]
+            response = await self._post("/v1/events/trigger/bulk", {"events": events})
+            data = response["data"]
+            items = data.get("data") if isinstance(data, dict) else data
+            if 200 <= response["status"] < 300 and isinstance(items, list):
+                results.extend({"status": response["status"], "data": item} for item in items)
+                # Events the response did not account for are retried
+                results.extend(
+                    {"status": 502, "data": "missing from bulk response"}
+                    for _ in range(len(chunk) - len(items))
+                )
+            else:
+                results.extend(response for _ in chunk)
+        return results[: len(messages)]
 
     async def get_templates(self) -> list[dict]:
-        async with (
-            aiohttp.ClientSession() as session,
-            session.get(f"{self.api_url}/v1/notification-templates", headers=self.headers) as resp,
-        ):
+        async with self._client().get(f"{self.api_url}/v1/notification-templates") as resp:
             data = await resp.json()
             return data.get("data", [])
 
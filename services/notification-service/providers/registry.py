@@ -0,0 +1,189 @@
+import asyncio
+import json
+import logging
+import os
+import time
+from collections.abc import Callable
+
+from .base import NotificationProvider
+from .fallback import build_provider, provider_settings
+
+logger = logging.getLogger(__name__)
+
+CONFIG_CHECK_SEC = float(os.getenv("NOTIFY_CONFIG_CHECK_SEC", "5"))
+HEALTH_INTERVAL_SEC = float(os.getenv("NOTIFY_HEALTH_INTERVAL_SEC", "30"))
+# Replaced providers are closed after this delay so in-flight sends can finish
+RETIRE_GRACE_SEC = 30.0
+
+
+class ProviderRegistry(NotificationProvider):
+    """Long-lived provider that rebuilds itself when its configuration changes.
+
+    The underlying provider is created on first use. Settings come from the
+    environment, overridden by the JSON file named in NOTIFY_PROVIDER_CONFIG
+    if set; they are re-read at most every NOTIFY_CONFIG_CHECK_SEC seconds
+    (the file only when its mtime changes) and the provider is swapped when
+    they differ. Health is probed in the background and served from cache.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[dict[str, str]], NotificationProvider] = build_provider,
+        config_path: str | None = None,
+        check_interval: float = CONFIG_CHECK_SEC,
+        health_interval: float = HEALTH_INTERVAL_SEC,
+    ):
+        self._factory = factory
+        self.config_path = config_path or os.getenv("NOTIFY_PROVIDER_CONFIG") or None
+        self.check_interval = check_interval
+        self.health_interval = health_interval
+        self.generation = 0
+        self._provider: NotificationProvider | None = None
+        self._settings: dict[str, str] | None = None
+        self._checked_at = float("-inf")
+        self._file_mtime: float | None = None
+        self._file_settings: dict[str, str] = {}
+        self._retired: list[NotificationProvider] = []
+        self._reload_callbacks: list[Callable[[], None]] = []
+        self._health: dict | None = None
+        self._health_at = 0.0
+        self._probe_task: asyncio.Task | None = None
+
+    # ------------------------------------------------------------------
+    # Configuration
+    # ------------------------------------------------------------------
+
+    def _read_file(self) -> dict[str, str]:
+        try:
+            mtime = os.path.getmtime(self.config_path)
+        except OSError:
+            self._file_mtime, self._file_settings = None, {}
+            return self._file_settings
+        if mtime != self._file_mtime:
+            try:
+                with open(self.config_path) as f:
+                    data = json.load(f)
+                self._file_settings = {key: str(value) for key, value in data.items()}
+                self._file_mtime = mtime
+            except (OSError, ValueError) as e:
+                # Keep the last good settings while the file is being rewritten
+                logger.warning(f"Ignoring unreadable provider config {self.config_path}: {e}")
+        return self._file_settings
+
+    def settings(self) -> dict[str, str]:
+        settings = provider_settings()
+        if self.config_path:
+            settings.update(
+                {key: value for key, value in self._read_file().items() if key in settings}
+            )
+        return settings
+
+    def on_reload(self, callback: Callable[[], None]) -> None:
+        """Register a callback run after the provider is replaced."""
+        self._reload_callbacks.append(callback)
+
+    def current(self) -> NotificationProvider:
+        """The active provider, rebuilt if the configuration changed."""
+        now = time.monotonic()
+        if self._provider is not None and now - self._checked_at < self.check_interval:
+            return self._provider
+        self._checked_at = now
+        settings = self.settings()
+        if self._provider is None or settings != self._settings:
+            self._swap(settings)
+        return self._provider
+
+    def reload(self) -> NotificationProvider:
+        """Re-read the configuration now and rebuild the provider if it changed."""
+        self._checked_at = float("-inf")
+        return self.current()
+
+    def _swap(self, settings: dict[str, str]) -> None:
+        old = self._provider
+        self._provider = self._factory(settings)
+        self._settings = settings
+        self._health = None
+        self.generation += 1
+        if old is not None:
+            logger.info("Notification provider configuration changed; provider reloaded")
+            self._retire(old)
+            for callback in self._reload_callbacks:
+                callback()
+
+    def _retire(self, provider: NotificationProvider) -> None:
+        self._retired.append(provider)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # closed by close()
+
+        def close_later() -> None:
+            if provider in self._retired:
+                self._retired.remove(provider)
+                loop.create_task(provider.close())
+
+        loop.call_later(RETIRE_GRACE_SEC, close_later)
+
+    # ------------------------------------------------------------------
+    # Health
+    # ------------------------------------------------------------------
+
+    async def _probe(self) -> dict:
+        try:
+            status = await self.current().health()
+        except Exception as e:
+            status = {"ok": False, "error": str(e)}
+        self._health, self._health_at = status, time.monotonic()
+        return status
+
+    async def _probe_loop(self) -> None:
+        while True:
+            await self._probe()
+            await asyncio.sleep(self.health_interval)
+
+    def start(self) -> None:
+        """Start the background health probe."""
+        if self._probe_task is None:
+            self._probe_task = asyncio.create_task(self._probe_loop())
+
+    async def health(self) -> dict:
+        """Last probe result; probes inline only when none is recent enough."""
+        self.current()
+        if self._health is None or time.monotonic() - self._health_at > 2 * self.health_interval:
+            await self._probe()
+        return {**self._health, "probe_age_sec": round(time.monotonic() - self._health_at, 3)}
+
+    async def close(self) -> None:
+        if self._probe_task is not None:
+            self._probe_task.cancel()
+            self._probe_task = None
+        for provider in [*self._retired, self._provider]:
+            if provider is not None:
+                await provider.close()
+        self._retired.clear()
+        self._provider = None
+
+    # ------------------------------------------------------------------
+    # Delegation
+    # ------------------------------------------------------------------
+
+    async def send_email(self, *args, **kwargs) -> dict:
+        return await self.current().send_email(*args, **kwargs)
+
+    async def send_sms(self, *args, **kwargs) -> dict:
+        return await self.current().send_sms(*args, **kwargs)
+
+    async def send_push(self, *args, **kwargs) -> dict:
+        return await self.current().send_push(*args, **kwargs)
+
+    async def send_batch(self, channel: str, messages: list[dict]) -> list:
+        return await self.current().send_batch(channel, messages)
+
+    async def get_templates(self) -> list[dict]:
+        return await self.current().get_templates()
+
+    async def render(self, template_id: str, payload: dict) -> dict:
+        return await self.current().render(template_id, payload)
+
+    async def preferences(self, user_id: str) -> dict:
+        return await self.current().preferences(user_id)
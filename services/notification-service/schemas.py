@@ -86,11 +86,14 @@ class InAppNotificationRequest(BaseModel):
 class BulkNotificationRequest(BaseModel):
     """Bulk notification request"""
 
-    recipients: list[str] = Field(..., min_length=1, max_length=1000)
+    recipients: list[str] = Field(..., min_length=1, max_length=10000)
     notification_type: NotificationType
     template_id: str | None = None
     subject: str | None = None
     message: str = Field(..., min_length=1)
+    html: str | None = None
+    data: dict[str, Any] | None = None
+    locale: str | None = None
     priority: NotificationPriority = NotificationPriority.NORMAL
     scheduled_at: datetime | None = None
 
@@ -114,11 +117,13 @@ class NotificationResponse(BaseModel):
 class BulkNotificationResponse(BaseModel):
     """Bulk notification response"""
 
+    batch_id: str | None = None
     total: int
     sent: int
     failed: int
     pending: int
     notification_ids: list[str]
+    rejected: list[str] = Field(default_factory=list)
 
 
 class NotificationHistoryResponse(BaseModel):
@@ -176,6 +181,13 @@ class TemplateUpdate(BaseModel):
     variables: list[str] | None = None
 
 
+class TemplateRenderRequest(BaseModel):
+    """Variables for rendering a provider template"""
+
+    variables: dict[str, Any] = Field(default_factory=dict)
+    locale: str | None = None
+
+
 class TemplateResponse(TemplateBase):
     """Template response with metadata"""
 
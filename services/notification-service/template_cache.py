@@ -0,0 +1,160 @@
+"""
+Notification Service - Template Cache
+
+Templates are fetched from the provider once per TTL and compiled once per
+``(template_id, locale)``: ``{{ var }}`` placeholders (HTML-escaped in html
+content, ``{{{ var }}}`` for raw values, dotted names for nested payload
+keys) are split out ahead of time so rendering is a join over precomputed
+parts. A template may carry per-locale overrides under ``locales``.
+"""
+
+import asyncio
+import html
+import os
+import re
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+TEMPLATE_TTL_SEC = float(os.getenv("NOTIFY_TEMPLATE_TTL_SEC", "300"))
+
+_PLACEHOLDER = re.compile(r"\{\{\{\s*([\w.]+)\s*\}\}\}|\{\{\s*([\w.]+)\s*\}\}")
+# Template fields that are rendered; html/content are escaped by default
+_FIELDS = ("subject", "title", "text", "body", "html", "content")
+_HTML_FIELDS = {"html", "content"}
+
+
+def _lookup(variables: dict[str, Any], name: str) -> Any:
+    value: Any = variables
+    for part in name.split("."):
+        if not isinstance(value, dict):
+            return ""
+        value = value.get(part, "")
+    return value
+
+
+def compile_text(source: str, escape: bool) -> list[str | tuple[str, bool]]:
+    """Split a template string into literals and ``(name, escape)`` placeholders."""
+    parts: list[str | tuple[str, bool]] = []
+    position = 0
+    for match in _PLACEHOLDER.finditer(source):
+        if match.start() > position:
+            parts.append(source[position : match.start()])
+        raw_name, name = match.groups()
+        parts.append((raw_name, False) if raw_name else (name, escape))
+        position = match.end()
+    if position < len(source):
+        parts.append(source[position:])
+    return parts
+
+
+@dataclass
+class CompiledTemplate:
+    template_id: str
+    locale: str | None
+    fields: dict[str, list[str | tuple[str, bool]]]
+
+    def render(self, variables: dict[str, Any]) -> dict[str, str]:
+        rendered = {}
+        for field, parts in self.fields.items():
+            out = []
+            for part in parts:
+                if isinstance(part, str):
+                    out.append(part)
+                else:
+                    value = str(_lookup(variables, part[0]))
+                    out.append(html.escape(value) if part[1] else value)
+            rendered[field] = "".join(out)
+        return rendered
+
+
+def _template_key(template: dict) -> str | None:
+    return template.get("_id") or template.get("id") or template.get("name")
+
+
+def _template_fields(template: dict) -> dict[str, str]:
+    # Provider templates keep content either at the top level or in the first
+    # step that has any (Novu workflow steps)
+    fields = {f: template[f] for f in _FIELDS if isinstance(template.get(f), str)}
+    for step in template.get("steps") or []:
+        if fields:
+            break
+        body = step.get("template") if isinstance(step, dict) else None
+        if isinstance(body, dict):
+            fields = {f: body[f] for f in _FIELDS if isinstance(body.get(f), str)}
+    return fields
+
+
+class TemplateCache:
+    """TTL cache of provider templates and their compiled forms."""
+
+    def __init__(
+        self,
+        source: Callable[[], Awaitable[list[dict]]],
+        ttl: float = TEMPLATE_TTL_SEC,
+    ):
+        """
+        Args:
+            source: Coroutine function returning the provider's templates.
+            ttl: Seconds before templates are fetched and compiled again.
+        """
+        self._source = source
+        self.ttl = ttl
+        self._templates: list[dict] | None = None
+        self._by_id: dict[str, dict] = {}
+        self._fetched_at = 0.0
+        self._compiled: dict[tuple[str, str | None], tuple[CompiledTemplate, float]] = {}
+        self._lock = asyncio.Lock()
+        self.stats = {"hits": 0, "compiles": 0, "fetches": 0}
+
+    def invalidate(self) -> None:
+        """Drop everything, e.g. after the provider was reloaded."""
+        self._templates = None
+        self._by_id.clear()
+        self._compiled.clear()
+
+    async def list(self) -> list[dict]:
+        """The provider's templates, fetched at most once per TTL."""
+        if self._templates is not None and time.monotonic() - self._fetched_at < self.ttl:
+            return self._templates
+        async with self._lock:
+            # Another request may have refreshed while this one waited
+            if self._templates is None or time.monotonic() - self._fetched_at >= self.ttl:
+                templates = await self._source()
+                self.stats["fetches"] += 1
+                self._templates = templates
+                self._by_id = {
+                    key: template for template in templates if (key := _template_key(template))
+                }
+                self._fetched_at = time.monotonic()
+                self._compiled.clear()
+        return self._templates
+
+    async def get(self, template_id: str, locale: str | None = None) -> CompiledTemplate | None:
+        """Compiled template for an ID and locale, or None if the provider has no such template."""
+        key = (template_id, locale)
+        cached = self._compiled.get(key)
+        if cached is not None and time.monotonic() < cached[1]:
+            self.stats["hits"] += 1
+            return cached[0]
+
+        await self.list()
+        template = self._by_id.get(template_id)
+        if template is None:
+            return None
+        fields = _template_fields(template)
+        overrides = (template.get("locales") or {}).get(locale) if locale else None
+        if isinstance(overrides, dict):
+            fields.update({f: overrides[f] for f in _FIELDS if isinstance(overrides.get(f), str)})
+        compiled = CompiledTemplate(
+            template_id=template_id,
+            locale=locale,
+            fields={
+                field: compile_text(source, escape=field in _HTML_FIELDS)
+                for field, source in fields.items()
+            },
+        )
+        self.stats["compiles"] += 1
+        self._compiled[key] = (compiled, time.monotonic() + self.ttl)
+        return compiled
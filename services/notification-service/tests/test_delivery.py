@@ -0,0 +1,170 @@
+"""
+Tests for the notification outbox, delivery engine and bulk endpoint
+"""
+
+import importlib
+import os
+import sys
+import time
+
+import httpx
+import pytest
+from httpx import ASGITransport
+
+SERVICE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if SERVICE_DIR not in sys.path:
+    sys.path.insert(0, SERVICE_DIR)
+
+from delivery import DeliveryEngine, RateLimiter, delivered  # noqa: E402
+from outbox import Outbox  # noqa: E402
+
+
+class FakeProvider:
+    """Records batches; fails every message whose recipient is in ``failing``."""
+
+    def __init__(self, failing: set[str] | None = None):
+        self.failing = failing or set()
+        self.batches: list[list[dict]] = []
+
+    async def send_batch(self, channel: str, messages: list[dict]) -> list:
+        self.batches.append(messages)
+        return [
+            {"ok": False, "error": "rejected"} if m["to"] in self.failing else {"ok": True}
+            for m in messages
+        ]
+
+
+def _load_main(tmp_path, monkeypatch):
+    monkeypatch.setenv("NOTIFY_OUTBOX_PATH", str(tmp_path / "outbox.db"))
+    spec = importlib.util.spec_from_file_location(
+        "notification_service_main_delivery", os.path.join(SERVICE_DIR, "main.py")
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# ============================================================================
+# OUTBOX
+# ============================================================================
+
+
+class TestOutbox:
+    def test_messages_survive_reopen_and_interrupted_sends_are_requeued(self, tmp_path):
+        path = str(tmp_path / "outbox.db")
+        outbox = Outbox(path)
+        ids = outbox.enqueue("email", [{"to": f"u{i}@example.com"} for i in range(3)])
+        claimed = outbox.claim("email", 2)
+        assert [m["id"] for m in claimed] == ids[:2]
+        outbox.close()
+
+        reopened = Outbox(path)
+        assert reopened.recover() == 2
+        assert len(reopened.claim("email", 10)) == 3
+        reopened.close()
+
+    def test_priority_and_schedule_order_claims(self, tmp_path):
+        outbox = Outbox(str(tmp_path / "outbox.db"))
+        outbox.enqueue("sms", [{"to": "+100"}], priority="low")
+        urgent = outbox.enqueue("sms", [{"to": "+200"}], priority="urgent")
+        outbox.enqueue("sms", [{"to": "+300"}], not_before=time.time() + 3600)
+
+        claimed = outbox.claim("sms", 10)
+        assert [m["id"] for m in claimed][0] == urgent[0]
+        assert len(claimed) == 2
+        outbox.close()
+
+
+# ============================================================================
+# DELIVERY ENGINE
+# ============================================================================
+
+
+class TestDeliveryEngine:
+    @pytest.mark.asyncio
+    async def test_batches_and_retries_failed_messages(self, tmp_path):
+        outbox = Outbox(str(tmp_path / "outbox.db"))
+        provider = FakeProvider(failing={"bad@example.com"})
+        engine = DeliveryEngine(outbox, provider, batch_size=2, max_attempts=2)
+        recipients = ["a@example.com", "bad@example.com", "b@example.com"]
+        batch_id = "batch-1"
+        outbox.enqueue("email", [{"to": r} for r in recipients], batch_id=batch_id)
+
+        assert await engine.flush("email") == 3
+        assert [len(batch) for batch in provider.batches] == [2, 1]
+        status = outbox.batch_status(batch_id)
+        assert status["sent"] == 2
+        assert status["pending"] == 1  # scheduled for a retry with backoff
+
+        # Make the retry due; the second and last attempt fails permanently
+        outbox._conn().execute("UPDATE outbox SET next_attempt_at = 0 WHERE status = 'pending'")
+        await engine.flush("email")
+        status = outbox.batch_status(batch_id)
+        assert status["failed"] == 1
+        assert engine.stats()["email"]["failed"] == 1
+        outbox.close()
+
+    @pytest.mark.asyncio
+    async def test_rate_limiter_spaces_out_sends(self):
+        limiter = RateLimiter(rate=100)
+        started = time.monotonic()
+        await limiter.acquire(5)
+        await limiter.acquire(5)
+        assert time.monotonic() - started >= 0.04
+
+    def test_delivered_interprets_provider_results(self):
+        assert delivered({"ok": True})
+        assert not delivered({"ok": False})
+        assert delivered({"status": 201, "data": {}})
+        assert not delivered({"status": 429, "data": {}})
+        assert not delivered(RuntimeError("boom"))
+
+
+# ============================================================================
+# BULK ENDPOINT
+# ============================================================================
+
+
+class TestBulkEndpoint:
+    @pytest.mark.asyncio
+    async def test_bulk_queues_valid_recipients(self, tmp_path, monkeypatch):
+        main = _load_main(tmp_path, monkeypatch)
+        recipients = [f"candidate{i}@example.com" for i in range(2000)] + ["not-an-email"]
+        async with httpx.AsyncClient(
+            transport=ASGITransport(app=main.app), base_url="http://testserver"
+        ) as client:
+            response = await client.post(
+                "/api/v1/notify/bulk",
+                json={
+                    "recipients": recipients,
+                    "notification_type": "email",
+                    "subject": "Interview invitation",
+                    "message": "You are invited",
+                },
+            )
+            assert response.status_code == 202
+            data = response.json()
+            assert data["pending"] == 2000
+            assert data["rejected"] == ["not-an-email"]
+
+            main.engine.provider = FakeProvider()
+            await main.engine.flush("email")
+            status = await client.get(f"/api/v1/notify/bulk/{data['batch_id']}")
+            assert status.json()["sent"] == 2000
+        main.outbox.close()
+
+    @pytest.mark.asyncio
+    async def test_bulk_requires_subject_for_email(self, tmp_path, monkeypatch):
+        main = _load_main(tmp_path, monkeypatch)
+        async with httpx.AsyncClient(
+            transport=ASGITransport(app=main.app), base_url="http://testserver"
+        ) as client:
+            response = await client.post(
+                "/api/v1/notify/bulk",
+                json={
+                    "recipients": ["a@example.com"],
+                    "notification_type": "email",
+                    "message": "Hi",
+                },
+            )
+        assert response.status_code == 400
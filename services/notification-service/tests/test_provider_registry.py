@@ -0,0 +1,126 @@
+"""
+Tests for the provider registry and template cache
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+SERVICE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if SERVICE_DIR not in sys.path:
+    sys.path.insert(0, SERVICE_DIR)
+
+from providers import ProviderRegistry  # noqa: E402
+from providers.base import NotificationProvider  # noqa: E402
+from template_cache import TemplateCache  # noqa: E402
+
+
+class CountingProvider(NotificationProvider):
+    def __init__(self, settings: dict[str, str]):
+        self.settings = settings
+        self.health_calls = 0
+        self.closed = False
+
+    async def send_email(self, to, subject, html, text=None):
+        return {"ok": True, "provider": self.settings.get("NOTIFY_PROVIDER")}
+
+    async def health(self):
+        self.health_calls += 1
+        return {"provider": "counting", "ok": True}
+
+    async def close(self):
+        self.closed = True
+
+
+# ============================================================================
+# PROVIDER REGISTRY
+# ============================================================================
+
+
+class TestProviderRegistry:
+    @pytest.mark.asyncio
+    async def test_provider_is_built_once_and_reloaded_on_config_change(
+        self, tmp_path, monkeypatch
+    ):
+        monkeypatch.setenv("NOTIFY_PROVIDER", "apprise")
+        config = tmp_path / "provider.json"
+        built = []
+
+        def factory(settings):
+            built.append(CountingProvider(settings))
+            return built[-1]
+
+        registry = ProviderRegistry(factory, config_path=str(config), check_interval=3600)
+        reloads = []
+        registry.on_reload(lambda: reloads.append(registry.generation))
+
+        await registry.send_email("a@example.com", "s", "h")
+        await registry.send_email("b@example.com", "s", "h")
+        assert len(built) == 1
+
+        config.write_text(json.dumps({"NOTIFY_PROVIDER": "novu"}))
+        # Not re-checked before the interval elapses
+        assert registry.current() is built[0]
+        result = await registry.reload().send_email("c@example.com", "s", "h")
+        assert result["provider"] == "novu"
+        assert len(built) == 2
+        assert reloads == [2]
+
+        await registry.close()
+        assert built[0].closed and built[1].closed
+
+    @pytest.mark.asyncio
+    async def test_health_is_served_from_probe_cache(self):
+        provider = CountingProvider({})
+        registry = ProviderRegistry(lambda settings: provider, health_interval=60)
+
+        first = await registry.health()
+        await registry.health()
+        assert first["ok"] is True
+        assert provider.health_calls == 1
+
+
+# ============================================================================
+# TEMPLATE CACHE
+# ============================================================================
+
+
+class TestTemplateCache:
+    @pytest.mark.asyncio
+    async def test_templates_are_fetched_and_compiled_once(self):
+        fetches = []
+
+        async def source():
+            fetches.append(1)
+            return [
+                {
+                    "_id": "invite",
+                    "steps": [
+                        {
+                            "template": {
+                                "subject": "Interview for {{ job.title }}",
+                                "content": "<p>Hi {{name}}</p>{{{signature}}}",
+                            }
+                        }
+                    ],
+                    "locales": {"de": {"subject": "Interview: {{ job.title }}"}},
+                }
+            ]
+
+        cache = TemplateCache(source, ttl=60)
+        variables = {"name": "<Ann>", "job": {"title": "Engineer"}, "signature": "<b>HR</b>"}
+
+        rendered = (await cache.get("invite")).render(variables)
+        assert rendered["subject"] == "Interview for Engineer"
+        assert rendered["content"] == "<p>Hi &lt;Ann&gt;</p><b>HR</b>"
+
+        german = (await cache.get("invite", "de")).render(variables)
+        assert german["subject"] == "Interview: Engineer"
+
+        await cache.get("invite")
+        assert len(fetches) == 1
+        assert cache.stats["compiles"] == 2
+        assert cache.stats["hits"] == 1
+        assert await cache.get("missing") is None
@@ -0,0 +1,63 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+
+def compute_etag(payload: Any) -> str:
+    """Strong ETag over the canonical JSON form of a response body."""
+    body = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return f'"{hashlib.sha256(body.encode()).hexdigest()[:32]}"'
+
+
+def etag_matches(header: str | None, etag: str) -> bool:
+    """Whether an ``If-None-Match``/``If-Match`` header value matches ``etag``."""
+    if not header:
+        return False
+    candidates = {value.strip().removeprefix("W/") for value in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+class JobCache:
+    """Read-through LRU cache of serialized jobs and their ETags.
+
+    Writes through this process invalidate the entry immediately. Entries
+    also expire after ``ttl`` seconds, which bounds staleness when several
+    workers share one database. That is the same window advertised to clients
+    with ``Cache-Control: max-age``.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 60.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any], str]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+    def get(self, job_id: str) -> tuple[dict[str, Any], str] | None:
+        """Cached ``(payload, etag)`` of a job, or None when missing or expired."""
+        with self._lock:
+            entry = self._entries.get(job_id)
+            if entry is None or entry[0] < time.monotonic():
+                self._entries.pop(job_id, None)
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(job_id)
+            self.stats["hits"] += 1
+            return entry[1], entry[2]
+
+    def put(self, job_id: str, payload: dict[str, Any]) -> tuple[dict[str, Any], str]:
+        etag = compute_etag(payload)
+        with self._lock:
+            self._entries[job_id] = (time.monotonic() + self.ttl, payload, etag)
+            self._entries.move_to_end(job_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return payload, etag
+
+    def invalidate(self, job_id: str) -> None:
+        with self._lock:
+            if self._entries.pop(job_id, None) is not None:
+                self.stats["invalidations"] += 1
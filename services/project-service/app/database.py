@@ -1,21 +1,67 @@
 import os
 
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import inspect, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
 
 SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./projects.db")
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Plain driver URLs from existing deployments map to their asyncio drivers
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgres": "postgresql+asyncpg",
+}
+
+
+def _async_url(url: str) -> str:
+    scheme, sep, rest = url.partition("://")
+    return f"{_ASYNC_DRIVERS.get(scheme, scheme)}{sep}{rest}"
+
+
+engine = create_async_engine(_async_url(SQLALCHEMY_DATABASE_URL))
+AsyncSessionLocal = async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
 
 Base = declarative_base()
 
 
+# Static SQL per legacy column: add the JSON column, then copy the ``*_json`` text
+# into it (SQLite stores JSON as text; other backends need an explicit cast)
+_LEGACY_JSON_COLUMNS = {
+    "key_responsibilities": (
+        "ALTER TABLE projects ADD COLUMN key_responsibilities JSON",
+        "UPDATE projects SET key_responsibilities = COALESCE(key_responsibilities_json, '[]')",
+        "UPDATE projects SET key_responsibilities = "
+        "COALESCE(CAST(key_responsibilities_json AS JSON), '[]')",
+    ),
+    "required_skills": (
+        "ALTER TABLE projects ADD COLUMN required_skills JSON",
+        "UPDATE projects SET required_skills = COALESCE(required_skills_json, '[]')",
+        "UPDATE projects SET required_skills = COALESCE(CAST(required_skills_json AS JSON), '[]')",
+    ),
+}
+
+
+def _migrate_json_columns(conn) -> None:
+    """Copy the legacy ``*_json`` text columns into the native JSON columns."""
+    columns = {column["name"] for column in inspect(conn).get_columns("projects")}
+    if "key_responsibilities_json" not in columns or "key_responsibilities" in columns:
+        return
+    sqlite = conn.dialect.name == "sqlite"
+    for add_column, sqlite_copy, cast_copy in _LEGACY_JSON_COLUMNS.values():
+        conn.execute(text(add_column))
+        conn.execute(text(sqlite_copy if sqlite else cast_copy))
+    conn.execute(text("ALTER TABLE projects ADD COLUMN updated_at TIMESTAMP"))
+    conn.execute(text("UPDATE projects SET updated_at = CURRENT_TIMESTAMP"))
+
+
+async def init_db() -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_migrate_json_columns)
+
+
 # Dependency to get DB session
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+async def get_db():
+    async with AsyncSessionLocal() as session:
+        yield session
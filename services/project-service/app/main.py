@@ -1,22 +1,27 @@
+import base64
 import json
+import os
+from contextlib import asynccontextmanager
 
-from fastapi import Depends, FastAPI, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import Depends, FastAPI, Header, HTTPException, Query, Request, Response
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from . import database, models
+from .cache import JobCache, compute_etag, etag_matches
 
-# Initialize database
-models.Base.metadata.create_all(bind=database.engine)
-
-app = FastAPI()
+# Seconds clients (e.g. conversation-service) may reuse a job before revalidating
+JOB_CACHE_MAX_AGE = int(os.getenv("PROJECT_JOB_CACHE_MAX_AGE", "60"))
+job_cache = JobCache(
+    max_entries=int(os.getenv("PROJECT_JOB_CACHE_SIZE", "1024")), ttl=JOB_CACHE_MAX_AGE
+)
 
 
 # Seeding logic: ensure some real data exists on startup
-def seed_data():
-    db = database.SessionLocal()
-    try:
+async def seed_data():
+    async with database.AsyncSessionLocal() as db:
         # Check if we already have jobs
-        if db.query(models.Project).count() == 0:
+        if await db.scalar(select(func.count()).select_from(models.Project)) == 0:
             initial_jobs = [
                 {
                     "id": "project-001",
@@ -46,17 +51,53 @@ def seed_data():
                     id=job_data["id"],
                     title=job_data["title"],
                     description=job_data["description"],
-                    key_responsibilities_json=json.dumps(job_data["key_responsibilities"]),
-                    required_skills_json=json.dumps(job_data["required_skills"]),
+                    key_responsibilities=job_data["key_responsibilities"],
+                    required_skills=job_data["required_skills"],
                 )
                 db.add(job)
-            db.commit()
-    finally:
-        db.close()
+            await db.commit()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Create, migrate and seed the schema once, before the first request
+    await database.init_db()
+    await seed_data()
+    yield
+    await database.engine.dispose()
+
+
+app = FastAPI(lifespan=lifespan)
+
+
+def _job(project: models.Project) -> dict:
+    return models.JobDetails.model_validate(project).model_dump()
+
 
+def _conditional(
+    request: Request, response: Response, payload, etag: str, headers: dict | None = None
+):
+    """Return the payload with an ETag, or a bare 304 when the client already has it."""
+    headers = {"ETag": etag, **(headers or {})}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return payload
 
-# Run seed on startup
-seed_data()
+
+def _encode_cursor(project_id: str) -> str:
+    return base64.urlsafe_b64encode(json.dumps([project_id]).encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> str:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        (project_id,) = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError) as e:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from e
+    if not isinstance(project_id, str):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return project_id
 
 
 @app.get("/")
@@ -70,59 +111,99 @@ async def health_check():
 
 
 @app.get("/jobs", response_model=list[models.JobDetails])
-async def list_jobs(db: Session = Depends(database.get_db)):
-    projects = db.query(models.Project).all()
-    # Manual conversion for Pydantic (using the properties defined in models.py)
-    return [
-        models.JobDetails(
-            id=p.id,
-            title=p.title,
-            description=p.description,
-            key_responsibilities=p.key_responsibilities,
-            required_skills=p.required_skills,
-        )
-        for p in projects
-    ]
+async def list_jobs(
+    request: Request,
+    response: Response,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: str | None = Query(None, description="X-Next-Cursor of the previous page"),
+    db: AsyncSession = Depends(database.get_db),
+):
+    """List jobs ordered by id, one keyset page at a time.
+
+    When a page is full, the X-Next-Cursor response header holds the cursor
+    for the next one.
+    """
+    query = select(models.Project).order_by(models.Project.id).limit(limit)
+    if cursor:
+        query = query.where(models.Project.id > _decode_cursor(cursor))
+    projects = (await db.scalars(query)).all()
+
+    payload = [_job(p) for p in projects]
+    headers = {}
+    if len(projects) == limit:
+        headers["X-Next-Cursor"] = _encode_cursor(projects[-1].id)
+    return _conditional(request, response, payload, compute_etag(payload), headers)
 
 
 @app.get("/jobs/{project_id}", response_model=models.JobDetails)
-async def get_job_details(project_id: str, db: Session = Depends(database.get_db)):
-    project = db.query(models.Project).filter(models.Project.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-
-    return models.JobDetails(
-        id=project.id,
-        title=project.title,
-        description=project.description,
-        key_responsibilities=project.key_responsibilities,
-        required_skills=project.required_skills,
-    )
+async def get_job_details(
+    project_id: str,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(database.get_db),
+):
+    """Fetch one job, served from the read-through cache when possible.
+
+    Responses carry an ETag and ``Cache-Control: max-age``; clients holding
+    a copy revalidate with ``If-None-Match`` and get ``304`` while it is current.
+    """
+    cached = job_cache.get(project_id)
+    if cached is None:
+        project = await db.get(models.Project, project_id)
+        if not project:
+            raise HTTPException(status_code=404, detail="Project not found")
+        cached = job_cache.put(project_id, _job(project))
+
+    payload, etag = cached
+    cache_control = {"Cache-Control": f"max-age={JOB_CACHE_MAX_AGE}"}
+    return _conditional(request, response, payload, etag, cache_control)
 
 
 @app.post("/jobs", response_model=models.JobDetails)
-async def create_job(job_in: models.JobDetails, db: Session = Depends(database.get_db)):
+async def create_job(
+    job_in: models.JobDetails, response: Response, db: AsyncSession = Depends(database.get_db)
+):
     # Check if ID exists
-    if db.query(models.Project).filter(models.Project.id == job_in.id).first():
+    if await db.get(models.Project, job_in.id):
         raise HTTPException(status_code=400, detail="Project ID already exists")
 
-    db_job = models.Project(
-        id=job_in.id,
-        title=job_in.title,
-        description=job_in.description,
-        key_responsibilities_json=json.dumps(job_in.key_responsibilities),
-        required_skills_json=json.dumps(job_in.required_skills),
-    )
+    db_job = models.Project(**job_in.model_dump())
     db.add(db_job)
-    db.commit()
-    db.refresh(db_job)
-    return models.JobDetails(
-        id=db_job.id,
-        title=db_job.title,
-        description=db_job.description,
-        key_responsibilities=db_job.key_responsibilities,
-        required_skills=db_job.required_skills,
-    )
+    await db.commit()
+    job_cache.invalidate(job_in.id)
+    payload = _job(db_job)
+    response.headers["ETag"] = compute_etag(payload)
+    return payload
+
+
+@app.put("/jobs/{project_id}", response_model=models.JobDetails)
+async def update_job(
+    project_id: str,
+    job_in: models.JobDetails,
+    response: Response,
+    if_match: str | None = Header(None),
+    db: AsyncSession = Depends(database.get_db),
+):
+    """Replace a job and invalidate its cached copy.
+
+    An ``If-Match`` header makes the update conditional on the client's ETag
+    still being current (``412`` otherwise).
+    """
+    if job_in.id != project_id:
+        raise HTTPException(status_code=400, detail="Project ID in body does not match URL")
+    project = await db.get(models.Project, project_id)
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+    if if_match and not etag_matches(if_match, compute_etag(_job(project))):
+        raise HTTPException(status_code=412, detail="Project was modified")
+
+    for field, value in job_in.model_dump(exclude={"id"}).items():
+        setattr(project, field, value)
+    await db.commit()
+    job_cache.invalidate(project_id)
+    payload = _job(project)
+    response.headers["ETag"] = compute_etag(payload)
+    return payload
 
 
 if __name__ == "__main__":
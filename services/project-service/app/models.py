@@ -1,27 +1,24 @@
-import json
+from datetime import UTC, datetime
 
 from pydantic import BaseModel
-from sqlalchemy import Column, String, Text
+from sqlalchemy import JSON, Column, DateTime, String, Text
 
 from .database import Base
 
 
+def _utcnow() -> datetime:
+    return datetime.now(UTC)
+
+
 class Project(Base):
     __tablename__ = "projects"
 
     id = Column(String, primary_key=True, index=True)
     title = Column(String, index=True)
     description = Column(Text)
-    key_responsibilities_json = Column(Text)  # Stored as JSON string
-    required_skills_json = Column(Text)  # Stored as JSON string
-
-    @property
-    def key_responsibilities(self):
-        return json.loads(self.key_responsibilities_json) if self.key_responsibilities_json else []
-
-    @property
-    def required_skills(self):
-        return json.loads(self.required_skills_json) if self.required_skills_json else []
+    key_responsibilities = Column(JSON, nullable=False, default=list)
+    required_skills = Column(JSON, nullable=False, default=list)
+    updated_at = Column(DateTime(timezone=True), nullable=False, default=_utcnow, onupdate=_utcnow)
 
 
 class JobDetails(BaseModel):
@@ -1,8 +1,24 @@
 import os
 import sys
+import tempfile
+
+import pytest
 
 # Add the service root directory to sys.path
 # This allows 'from app.main import app' to work in tests
 service_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if service_root not in sys.path:
     sys.path.insert(0, service_root)
+
+# Keep the test database out of the working directory
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{tempfile.mkdtemp()}/projects.db")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def initialized_app():
+    """Run the app lifespan (schema creation and seeding) once for the test session."""
+    from app.main import app
+    from fastapi.testclient import TestClient
+
+    with TestClient(app):
+        yield app
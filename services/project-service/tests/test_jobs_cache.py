@@ -0,0 +1,93 @@
+import asyncio
+import json
+import sqlite3
+import uuid
+
+from app import database
+from app.main import app, job_cache
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import create_async_engine
+
+client = TestClient(app)
+
+
+def _job(job_id, title="Platform Engineer"):
+    return {
+        "id": job_id,
+        "title": title,
+        "description": "Own the deployment platform.",
+        "key_responsibilities": ["Run the CI/CD pipelines"],
+        "required_skills": ["Kubernetes", "Terraform"],
+    }
+
+
+def test_list_jobs_is_keyset_paginated():
+    prefix = f"page-{uuid.uuid4().hex[:8]}"
+    for i in range(3):
+        assert client.post("/jobs", json=_job(f"{prefix}-{i}")).status_code == 200
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        response = client.get("/jobs", params=params)
+        assert response.status_code == 200
+        seen += [job["id"] for job in response.json()]
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+    assert seen == sorted(seen)
+    assert len(seen) == len(set(seen))
+    assert {f"{prefix}-{i}" for i in range(3)} <= set(seen)
+    assert client.get("/jobs", params={"cursor": "not-a-cursor"}).status_code == 400
+
+
+def test_job_etag_revalidation_and_cache_invalidation():
+    job_id = f"etag-{uuid.uuid4().hex[:8]}"
+    created = client.post("/jobs", json=_job(job_id))
+
+    first = client.get(f"/jobs/{job_id}")
+    etag = first.headers["ETag"]
+    assert etag == created.headers["ETag"]
+    assert first.headers["Cache-Control"] == "max-age=60"
+    hits = job_cache.stats["hits"]
+    assert client.get(f"/jobs/{job_id}", headers={"If-None-Match": etag}).status_code == 304
+    assert job_cache.stats["hits"] == hits + 1
+
+    updated = client.put(f"/jobs/{job_id}", json=_job(job_id, "Staff Platform Engineer"))
+    assert updated.status_code == 200
+    assert updated.headers["ETag"] != etag
+    stale = client.get(f"/jobs/{job_id}", headers={"If-None-Match": etag})
+    assert stale.status_code == 200
+    assert stale.json()["title"] == "Staff Platform Engineer"
+
+    conflict = client.put(f"/jobs/{job_id}", json=_job(job_id), headers={"If-Match": etag})
+    assert conflict.status_code == 412
+    assert client.put(f"/jobs/{job_id}", json=_job("other")).status_code == 400
+
+
+def test_legacy_json_text_columns_are_migrated(tmp_path):
+    path = tmp_path / "legacy.db"
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE projects (id VARCHAR PRIMARY KEY, title VARCHAR, description TEXT, "
+        "key_responsibilities_json TEXT, required_skills_json TEXT)"
+    )
+    conn.execute(
+        "INSERT INTO projects VALUES ('p1', 'Engineer', 'Build things', ?, ?)",
+        (json.dumps(["Ship features"]), json.dumps(["Python"])),
+    )
+    conn.commit()
+
+    async def migrate():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        async with engine.begin() as aconn:
+            await aconn.run_sync(database._migrate_json_columns)
+        await engine.dispose()
+
+    asyncio.run(migrate())
+    row = conn.execute(
+        "SELECT key_responsibilities, required_skills, updated_at FROM projects"
+    ).fetchone()
+    assert json.loads(row[0]) == ["Ship features"]
+    assert json.loads(row[1]) == ["Python"]
+    assert row[2] is not None
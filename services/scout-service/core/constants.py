@@ -44,3 +44,52 @@ DEFAULT_TIMEOUT = 30.0
 OLLAMA_TIMEOUT = 300
 GITHUB_API_TIMEOUT = 30.0
 CONTACTOUT_API_TIMEOUT = 20.0
+
+# GitHub Fetching (concurrency and rate-limit pacing)
+GITHUB_MAX_CONCURRENCY = 10
+GITHUB_RATE_LIMIT_PER_SECOND = 20.0
+GITHUB_RATE_LIMIT_BURST = 20
+GITHUB_RATE_LIMIT_LOW_WATERMARK = 10
+GITHUB_MAX_RETRY_AFTER = 60.0
+GITHUB_ETAG_CACHE_SIZE = 2048
+GITHUB_PROFILE_CACHE_TTL = 24 * 3600.0
+
+# Query Translation Cache
+QUERY_CACHE_MAX_ENTRIES = 1024
+QUERY_CACHE_TTL = 6 * 3600.0
+
+# Words the rule-based query formatter understands; queries made only of these
+# (plus languages and companies) skip the LLM entirely
+RULE_BASED_QUERY_TERMS = {
+    "developer",
+    "developers",
+    "engineer",
+    "engineers",
+    "programmer",
+    "dev",
+    "devs",
+    "coder",
+    "software",
+    "backend",
+    "frontend",
+    "full",
+    "stack",
+    "fullstack",
+    "senior",
+    "junior",
+    "mid",
+    "level",
+    "lead",
+    "expert",
+    "entry",
+    "active",
+    "popular",
+    "with",
+    "and",
+    "in",
+    "at",
+    "a",
+    "an",
+    "experience",
+    "of",
+}
@@ -0,0 +1,339 @@
+"""GitHub Fetcher Module
+Bounded-concurrency, rate-limit-aware GitHub API client with conditional requests.
+
+Author: OpenTalent Team
+Updated: December 13, 2025
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Any
+
+import aiohttp
+from core.constants import (
+    GITHUB_ETAG_CACHE_SIZE,
+    GITHUB_MAX_CONCURRENCY,
+    GITHUB_MAX_RETRY_AFTER,
+    GITHUB_PROFILE_CACHE_TTL,
+    GITHUB_RATE_LIMIT_BURST,
+    GITHUB_RATE_LIMIT_LOW_WATERMARK,
+    GITHUB_RATE_LIMIT_PER_SECOND,
+)
+
+# Persistent profile cache shared with the sourcing agents (optional)
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "agents", "shared"))
+try:
+    from profile_cache import ProfileCache
+
+    PROFILE_CACHE_AVAILABLE = True
+except ImportError:
+    ProfileCache = None
+    PROFILE_CACHE_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+GITHUB_API_URL = "https://api.github.com"
+
+# ============================
+# Rate Limiting
+# ============================
+
+
+class TokenBucket:
+    """Async token bucket that also honours GitHub rate-limit response headers."""
+
+    def __init__(
+        self,
+        rate: float = GITHUB_RATE_LIMIT_PER_SECOND,
+        capacity: int = GITHUB_RATE_LIMIT_BURST,
+        low_watermark: int = GITHUB_RATE_LIMIT_LOW_WATERMARK,
+        max_pause: float = GITHUB_MAX_RETRY_AFTER,
+    ):
+        """Initialize token bucket.
+
+        Args:
+            rate: Tokens refilled per second
+            capacity: Maximum burst size
+            low_watermark: Remaining quota below which requests are spread until reset
+            max_pause: Upper bound on any single server-requested pause (seconds)
+        """
+        self.base_rate = rate
+        self.rate = rate
+        # Monotonic time at which a low-quota throttle ends (the rate-limit reset)
+        self.throttled_until = 0.0
+        self.capacity = capacity
+        self.low_watermark = low_watermark
+        self.max_pause = max_pause
+        self.tokens = float(capacity)
+        self.blocked_until = 0.0
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _restore_rate(self, now: float) -> None:
+        if self.throttled_until and now >= self.throttled_until:
+            self.rate = self.base_rate
+            self.throttled_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        self._restore_rate(now)
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self.tokens = min(float(self.capacity), self.tokens + elapsed * self.rate)
+            self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent and consume one token."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.blocked_until:
+                    await asyncio.sleep(self.blocked_until - now)
+                    continue
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+                if self.throttled_until:
+                    # Wake up at the reset rather than sleeping at the throttled rate
+                    wait = min(wait, max(0.0, self.throttled_until - now))
+                await asyncio.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Block all callers for ``seconds`` (capped at ``max_pause``)."""
+        seconds = max(0.0, min(seconds, self.max_pause))
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """Adjust pacing from ``Retry-After`` and ``X-RateLimit-*`` headers.
+
+        Args:
+            headers: Response headers from a GitHub API call
+        """
+        retry_after = headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                self.pause(float(retry_after))
+            except ValueError:
+                pass
+            return
+
+        remaining = headers.get("X-RateLimit-Remaining")
+        if remaining is None:
+            return
+        try:
+            remaining_count = int(remaining)
+            reset_at = float(headers.get("X-RateLimit-Reset", 0))
+        except ValueError:
+            return
+
+        seconds_to_reset = max(0.0, reset_at - time.time())
+        if remaining_count <= 0:
+            self.pause(seconds_to_reset)
+        elif remaining_count <= self.low_watermark and seconds_to_reset > 0:
+            # Spread what is left of this window evenly until it resets
+            self.rate = min(self.base_rate, remaining_count / seconds_to_reset)
+            self.throttled_until = time.monotonic() + seconds_to_reset
+            self.tokens = min(self.tokens, float(remaining_count))
+        else:
+            # Quota is healthy again (or the window has reset)
+            self.rate = self.base_rate
+            self.throttled_until = 0.0
+
+
+# ============================
+# Profile Cache
+# ============================
+
+
+def create_profile_cache() -> "ProfileCache | None":
+    """Open the shared persistent profile cache for GitHub user payloads.
+
+    Returns:
+        A ProfileCache in the ``github`` namespace, or None if it is unavailable
+    """
+    if not PROFILE_CACHE_AVAILABLE:
+        return None
+    try:
+        return ProfileCache(namespace="github", ttl_seconds=GITHUB_PROFILE_CACHE_TTL)
+    except Exception as e:
+        logger.warning(f"Profile cache disabled: {e}")
+        return None
+
+
+# ============================
+# GitHub Fetcher
+# ============================
+
+
+class GitHubFetcher:
+    """Fetches GitHub resources concurrently with ETag revalidation."""
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        token: str,
+        max_concurrency: int = GITHUB_MAX_CONCURRENCY,
+        bucket: TokenBucket | None = None,
+        etag_cache_size: int = GITHUB_ETAG_CACHE_SIZE,
+        profile_cache: "ProfileCache | None" = None,
+    ):
+        """Initialize GitHub fetcher.
+
+        Args:
+            session: Shared aiohttp session
+            token: GitHub API token
+            max_concurrency: Maximum number of in-flight requests
+            bucket: Token bucket used to pace requests
+            etag_cache_size: Number of (ETag, payload) entries kept for revalidation
+            profile_cache: Persistent cache for user profiles (keyed by profile URL)
+        """
+        self.session = session
+        self.token = token
+        self.bucket = bucket or TokenBucket()
+        self.etag_cache_size = etag_cache_size
+        self.profile_cache = profile_cache
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._etags: OrderedDict[str, tuple[str, Any]] = OrderedDict()
+        self.stats = {"requests": 0, "not_modified": 0, "rate_limited": 0, "errors": 0}
+
+    def _remember(self, url: str, etag: str | None, payload: Any) -> None:
+        if not etag:
+            return
+        self._etags[url] = (etag, payload)
+        self._etags.move_to_end(url)
+        while len(self._etags) > self.etag_cache_size:
+            self._etags.popitem(last=False)
+
+    async def _request(
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+        etag: str | None = None,
+        retries: int = 1,
+    ) -> tuple[int, Any, str | None]:
+        """Send a paced GET, retrying rate-limited responses.
+
+        Args:
+            url: Absolute API URL
+            params: Optional query parameters
+            etag: ETag to send as ``If-None-Match``
+            retries: Number of retries after a rate-limited response
+
+        Returns:
+            Tuple of (HTTP status, decoded JSON payload or None, response ETag);
+            the status is 429 when every attempt was rate limited
+        """
+        headers = {"Authorization": f"token {self.token}"}
+        if etag:
+            headers["If-None-Match"] = etag
+
+        for attempt in range(retries + 1):
+            await self.bucket.acquire()
+            async with self._semaphore:
+                self.stats["requests"] += 1
+                async with self.session.get(url, params=params, headers=headers) as response:
+                    self.bucket.update_from_headers(response.headers)
+
+                    if response.status == 304:
+                        self.stats["not_modified"] += 1
+                        return 304, None, etag
+
+                    if response.status == 200:
+                        return 200, await response.json(), response.headers.get("ETag")
+
+                    rate_limited = response.status == 429 or (
+                        response.status == 403
+                        and (
+                            "Retry-After" in response.headers
+                            or response.headers.get("X-RateLimit-Remaining") == "0"
+                        )
+                    )
+                    if not rate_limited:
+                        return response.status, None, None
+
+            self.stats["rate_limited"] += 1
+            if attempt < retries:
+                logger.warning(f"GitHub rate limit hit for {url}, backing off")
+
+        return 429, None, None
+
+    async def get_json(
+        self, url: str, params: dict[str, Any] | None = None, retries: int = 1
+    ) -> tuple[int, Any]:
+        """GET a GitHub resource, revalidating cached copies with ``If-None-Match``.
+
+        A ``304 Not Modified`` answer is served from the local cache and does not
+        count against the GitHub quota. ``403``/``429`` answers carrying rate-limit
+        headers pause the bucket and are retried up to ``retries`` times, after
+        which the status is 429 whichever of the two GitHub sent.
+
+        Args:
+            url: Absolute API URL
+            params: Optional query parameters
+            retries: Number of retries after a rate-limited response
+
+        Returns:
+            Tuple of (HTTP status, decoded JSON payload or None)
+        """
+        cache_key = url if not params else f"{url}?{sorted(params.items())}"
+        cached = self._etags.get(cache_key)
+
+        status, payload, etag = await self._request(
+            url, params=params, etag=cached[0] if cached else None, retries=retries
+        )
+        if status == 304 and cached:
+            self._etags.move_to_end(cache_key)
+            return 200, cached[1]
+        if status == 200:
+            self._remember(cache_key, etag, payload)
+        return status, payload
+
+    async def get_user(self, username: str) -> dict | None:
+        """Fetch a single user profile.
+
+        With a profile cache configured, fresh profiles are served without a
+        request and stale ones are revalidated with their stored ETag.
+
+        Args:
+            username: GitHub login
+
+        Returns:
+            User profile dictionary, or None if the request fails
+        """
+        url = f"{GITHUB_API_URL}/users/{username}"
+
+        async def fetch(etag: str | None) -> tuple[dict | None, str | None]:
+            status, payload, new_etag = await self._request(url, etag=etag)
+            if status not in (200, 304):
+                raise LookupError(f"GitHub API error: {status}")
+            return payload, new_etag
+
+        try:
+            if self.profile_cache is not None:
+                return await self.profile_cache.get_or_fetch(
+                    f"https://github.com/{username}", fetch
+                )
+            status, payload = await self.get_json(url)
+            if status == 200:
+                return payload
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.error(f"Error getting user details for {username}: {e}")
+        return None
+
+    async def get_users(self, usernames: list[str]) -> list[dict | None]:
+        """Fetch many user profiles in parallel, preserving input order.
+
+        Args:
+            usernames: GitHub logins
+
+        Returns:
+            Profiles aligned with ``usernames`` (None for failed lookups)
+        """
+        return await asyncio.gather(*(self.get_user(name) for name in usernames))
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import os
 import re
@@ -11,10 +12,14 @@ from core.constants import (
     COMPANY_KEYWORDS,
     CRITICAL_AGENTS,
     GITHUB_API_TIMEOUT,
+    GITHUB_MAX_CONCURRENCY,
     LANGUAGE_MAPPING,
+    RULE_BASED_QUERY_TERMS,
 )
 from dotenv import load_dotenv
 from fastapi import APIRouter, Depends, FastAPI, HTTPException
+from github_fetcher import GITHUB_API_URL, GitHubFetcher, create_profile_cache
+from query_cache import QueryTranslationCache, normalize_query
 from schemas import (
     CandidateProfile,
     CandidateResponse,
@@ -67,23 +72,32 @@ class GitHubTalentScout:
         self.ollama_url = os.getenv("OLLAMA_URL", "http://localhost:11434")
         self.ollama_model = os.getenv("OLLAMA_MODEL", "granite4:350m-h")
         self.session: aiohttp.ClientSession | None = None
+        self.fetcher: GitHubFetcher | None = None
+        self.profile_cache = create_profile_cache()
+        self.query_cache = QueryTranslationCache()
 
     async def init_session(self):
         """Initialize the shared aiohttp ClientSession for API requests.
 
-        Creates a session if one doesn't exist, with custom headers and timeout.
+        Creates a session if one doesn't exist, with custom headers and timeout,
+        plus the rate-limit-aware GitHub fetcher bound to it.
         """
         if self.session is None:
             self.session = aiohttp.ClientSession(
                 timeout=aiohttp.ClientTimeout(total=GITHUB_API_TIMEOUT),
                 headers={"User-Agent": "TalentScout/1.0"},
             )
+        if self.fetcher is None or self.fetcher.session is not self.session:
+            self.fetcher = GitHubFetcher(
+                self.session, self.github_token, profile_cache=self.profile_cache
+            )
 
     async def close_session(self):
         """Close HTTP session."""
         if self.session:
             await self.session.close()
             self.session = None
+            self.fetcher = None
 
     async def format_query_with_ollama(self, user_query: str, location: str = "Ireland") -> str:
         """Use AI to convert natural language into a structured GitHub search query.
@@ -95,6 +109,16 @@ class GitHubTalentScout:
         Returns:
             A formatted GitHub search query string.
         """
+        cached_query = self.query_cache.get(user_query, location)
+        if cached_query:
+            print(f"[CACHE] Reusing translated query: '{cached_query}'")
+            return cached_query
+
+        formatted = self.rule_based_query(user_query, location)
+        if formatted:
+            self.query_cache.set(user_query, location, formatted, source="rule_based")
+            return formatted
+
         prompt = f"""Convert this job search query into a GitHub API search query.
 
     USER QUERY: "{user_query}"
@@ -211,6 +235,7 @@ class GitHubTalentScout:
                         return self.basic_query_format(user_query, location)
 
                     print(f"[AI] Formatted query: '{actual_query}'")
+                    self.query_cache.set(user_query, location, actual_query, source="llm")
                     return actual_query
                 else:
                     print(f"[ERROR] Ollama API error: {response.status}")
@@ -221,6 +246,38 @@ class GitHubTalentScout:
             print("[INFO] Using basic query formatting as fallback")
             return self.basic_query_format(user_query, location)
 
+    def rule_based_query(self, user_query: str, location: str) -> str | None:
+        """Format a query without the LLM when the rules fully understand it.
+
+        A query qualifies when it names exactly one programming language, every
+        other word is a known role/seniority/company term, and
+        ``basic_query_format`` detects that same language.
+
+        Args:
+            user_query: The natural language search query.
+            location: Geographic location to include in the query.
+
+        Returns:
+            The formatted GitHub search query, or None if the LLM is needed.
+        """
+        tokens = normalize_query(user_query).split()
+        if not tokens:
+            return None
+
+        languages = {LANGUAGE_MAPPING[t] for t in tokens if t in LANGUAGE_MAPPING}
+        if len(languages) != 1:
+            return None
+
+        known_terms = RULE_BASED_QUERY_TERMS.union(LANGUAGE_MAPPING, COMPANY_KEYWORDS)
+        if any(t not in known_terms for t in tokens):
+            return None
+
+        (language,) = languages
+        formatted = self.basic_query_format(user_query, location)
+        if f"language:{language}" not in formatted.split():
+            return None
+        return formatted
+
     def basic_query_format(self, user_query: str, location: str) -> str:
         """Fallback basic query formatting that focuses on GitHub qualifiers.
 
@@ -321,142 +378,156 @@ class GitHubTalentScout:
                 if "location:" not in search_query and location:
                     search_query += f" location:{location}"
 
-            url = "https://api.github.com/search/users"
-            headers = {"Authorization": f"token {self.github_token}"}
+            url = f"{GITHUB_API_URL}/search/users"
             params = {"q": search_query, "per_page": 50, "sort": "repositories", "order": "desc"}
 
             print(f"\n[SEARCH] GitHub API Query: '{search_query}'")
             print("[INFO] Searching for users with these keywords in their profile/bio")
             print("[SEARCH] Searching GitHub...")
 
-            async with self.session.get(url, params=params, headers=headers) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    users = data.get("items", [])
-                    total_count = data.get("total_count", 0)
-
-                    print(f"[SEARCH] Found {total_count} total matches on GitHub")
-                    print(f"[SEARCH] Processing top {len(users)} users...")
-
-                    for user in users:
-                        # Get detailed user info
-                        user_details = await self.get_github_user_details(user["login"])
-
-                        # Only include users with emails
-                        if user_details and user_details.get("email"):
-                            # Extract all social links
-                            social_links = self.extract_social_links(user_details)
-
-                            # Calculate priority score
-                            priority_score = 0.5
-
-                            if social_links["linkedin"]:
-                                priority_score += 0.4
-                            if social_links["twitter"]:
-                                priority_score += 0.2
-                            if social_links["website"]:
-                                priority_score += 0.1
-                            if user_details.get("company"):
-                                priority_score += 0.1
-
-                            candidate = Candidate(
-                                name=user_details.get("name", user["login"]),
-                                location=user_details.get("location", location),
-                                profile_url=user["html_url"],
-                                platform="GitHub",
-                                bio=user_details.get("bio"),
-                                email=user_details.get("email"),
-                                linkedin_url=social_links["linkedin"],
-                                twitter_url=social_links["twitter"],
-                                website_url=social_links["website"],
-                                company=user_details.get("company"),
-                                confidence_score=min(1.0, priority_score),
+            await self.init_session()
+            status, data = await self.fetcher.get_json(url, params=params)
+
+            if status == 200:
+                users = data.get("items", [])
+                total_count = data.get("total_count", 0)
+
+                print(f"[SEARCH] Found {total_count} total matches on GitHub")
+                print(f"[SEARCH] Processing top {len(users)} users...")
+
+                # Fetch all user details in parallel (bounded by the fetcher)
+                details = await self.fetcher.get_users([user["login"] for user in users])
+
+                for user, user_details in zip(users, details, strict=True):
+                    # Only include users with emails
+                    if user_details and user_details.get("email"):
+                        candidates.append(self._build_candidate(user, user_details, location))
+
+                # Enrich LinkedIn profiles concurrently
+                if self.contactout_token:
+                    semaphore = asyncio.Semaphore(GITHUB_MAX_CONCURRENCY)
+
+                    async def enrich(candidate: Candidate) -> None:
+                        async with semaphore:
+                            enriched_data = await self.enrich_linkedin_profile(
+                                candidate.linkedin_url
                             )
+                        if enriched_data:
+                            self._apply_linkedin_enrichment(candidate, enriched_data)
+
+                    await asyncio.gather(*(enrich(c) for c in candidates if c.linkedin_url))
+
+                # Sort by priority
+                candidates.sort(
+                    key=lambda x: (
+                        x.linkedin_url is not None,
+                        (x.twitter_url is not None or x.website_url is not None),
+                        x.confidence_score or 0,
+                    ),
+                    reverse=True,
+                )
 
-                            # Enrich LinkedIn profile if available
-                            if candidate.linkedin_url and self.contactout_token:
-                                enriched_data = await self.enrich_linkedin_profile(
-                                    candidate.linkedin_url
-                                )
-                                if enriched_data:
-                                    candidate.linkedin_enriched = enriched_data
-                                    candidate.work_emails = enriched_data.get("work_email", [])
-                                    candidate.personal_emails = enriched_data.get(
-                                        "personal_email", []
-                                    )
-                                    candidate.phone_numbers = enriched_data.get("phone", [])
-                                    candidate.linkedin_headline = enriched_data.get("headline")
-                                    candidate.linkedin_industry = enriched_data.get("industry")
-                                    candidate.linkedin_summary = enriched_data.get("summary")
-                                    candidate.linkedin_experience = enriched_data.get(
-                                        "experience", []
-                                    )
-                                    candidate.linkedin_education = enriched_data.get(
-                                        "education", []
-                                    )
-                                    candidate.linkedin_skills = enriched_data.get("skills", [])
-                                    candidate.linkedin_followers = enriched_data.get("followers")
-                                    candidate.confidence_score = min(
-                                        1.0, (candidate.confidence_score or 0) + 0.3
-                                    )
-
-                            candidates.append(candidate)
-
-                    # Sort by priority
-                    candidates.sort(
-                        key=lambda x: (
-                            x.linkedin_url is not None,
-                            (x.twitter_url is not None or x.website_url is not None),
-                            x.confidence_score or 0,
-                        ),
-                        reverse=True,
-                    )
-
-                    print(f"\n[RESULTS] Found {len(candidates)} candidates with emails")
-                    linkedin_count = sum(1 for c in candidates if c.linkedin_url)
-                    twitter_count = sum(1 for c in candidates if c.twitter_url)
-                    website_count = sum(1 for c in candidates if c.website_url)
-
-                    print(f"[LINKEDIN] {linkedin_count} with LinkedIn URLs")
-                    print(f"[TWITTER] {twitter_count} with Twitter/X URLs")
-                    print(f"[WEBSITE] {website_count} with website URLs")
-
-                    return candidates[:max_results]
-
-                elif response.status == 403:
-                    print("[ERROR] GitHub API rate limit exceeded")
-                elif response.status == 422:
-                    print("[ERROR] Invalid search query format")
-                    print("[HINT] Check your query syntax")
-                else:
-                    print(f"[ERROR] GitHub API error: {response.status}")
+                print(f"\n[RESULTS] Found {len(candidates)} candidates with emails")
+                linkedin_count = sum(1 for c in candidates if c.linkedin_url)
+                twitter_count = sum(1 for c in candidates if c.twitter_url)
+                website_count = sum(1 for c in candidates if c.website_url)
+
+                print(f"[LINKEDIN] {linkedin_count} with LinkedIn URLs")
+                print(f"[TWITTER] {twitter_count} with Twitter/X URLs")
+                print(f"[WEBSITE] {website_count} with website URLs")
+
+                return candidates[:max_results]
+
+            elif status == 429:
+                print("[ERROR] GitHub API rate limit exceeded")
+            elif status == 403:
+                print("[ERROR] GitHub API access forbidden")
+                print("[HINT] Check GITHUB_TOKEN and its scopes")
+            elif status == 422:
+                print("[ERROR] Invalid search query format")
+                print("[HINT] Check your query syntax")
+            else:
+                print(f"[ERROR] GitHub API error: {status}")
 
         except Exception as e:
             print(f"[ERROR] Search error: {e}")
 
         return candidates
 
+    def _build_candidate(self, user: dict, user_details: dict, location: str) -> Candidate:
+        """Build a scored Candidate from a search hit and its profile details.
+
+        Args:
+            user: The search result item for the user.
+            user_details: The full GitHub profile of the user.
+            location: Fallback location when the profile has none.
+
+        Returns:
+            A Candidate with social links and a priority-based confidence score.
+        """
+        # Extract all social links
+        social_links = self.extract_social_links(user_details)
+
+        # Calculate priority score
+        priority_score = 0.5
+
+        if social_links["linkedin"]:
+            priority_score += 0.4
+        if social_links["twitter"]:
+            priority_score += 0.2
+        if social_links["website"]:
+            priority_score += 0.1
+        if user_details.get("company"):
+            priority_score += 0.1
+
+        return Candidate(
+            name=user_details.get("name", user["login"]),
+            location=user_details.get("location", location),
+            profile_url=user["html_url"],
+            platform="GitHub",
+            bio=user_details.get("bio"),
+            email=user_details.get("email"),
+            linkedin_url=social_links["linkedin"],
+            twitter_url=social_links["twitter"],
+            website_url=social_links["website"],
+            company=user_details.get("company"),
+            confidence_score=min(1.0, priority_score),
+        )
+
+    def _apply_linkedin_enrichment(self, candidate: Candidate, enriched_data: dict) -> None:
+        """Copy ContactOut enrichment data onto a candidate and boost its score.
+
+        Args:
+            candidate: The candidate to update in place.
+            enriched_data: Profile data returned by ContactOut.
+        """
+        candidate.linkedin_enriched = enriched_data
+        candidate.work_emails = enriched_data.get("work_email", [])
+        candidate.personal_emails = enriched_data.get("personal_email", [])
+        candidate.phone_numbers = enriched_data.get("phone", [])
+        candidate.linkedin_headline = enriched_data.get("headline")
+        candidate.linkedin_industry = enriched_data.get("industry")
+        candidate.linkedin_summary = enriched_data.get("summary")
+        candidate.linkedin_experience = enriched_data.get("experience", [])
+        candidate.linkedin_education = enriched_data.get("education", [])
+        candidate.linkedin_skills = enriched_data.get("skills", [])
+        candidate.linkedin_followers = enriched_data.get("followers")
+        candidate.confidence_score = min(1.0, (candidate.confidence_score or 0) + 0.3)
+
     async def get_github_user_details(self, username: str) -> dict | None:
         """Fetch detailed profile information for a specific GitHub user.
 
+        Requests go through the shared fetcher, so they are paced against the
+        GitHub rate limit and revalidated with ETags.
+
         Args:
             username: The GitHub handle (login) of the user.
 
         Returns:
             A dictionary of user profile data, or None if the request fails.
         """
-        try:
-            url = f"https://api.github.com/users/{username}"
-            headers = {"Authorization": f"token {self.github_token}"}
-
-            async with self.session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    return await response.json()
-
-        except Exception as e:
-            print(f"[ERROR] Error getting user details: {e}")
-
-        return None
+        await self.init_session()
+        return await self.fetcher.get_user(username)
 
     def extract_social_links(self, user_details: dict) -> dict[str, str | None]:
         """Parse user profile fields to extract social media and personal website URLs.
@@ -777,6 +848,12 @@ async def create_sourced_list(payload: dict[str, Any]):
     return {"list_id": "list-created", "name": name, "status": "created"}
 
 
+@api_v1.get("/search/query-cache")
+async def query_cache_stats(finder: GitHubTalentScout = Depends(get_finder)):
+    """Query translation cache metrics (hits, misses, rule-based vs LLM)."""
+    return finder.query_cache.snapshot()
+
+
 # Register versioned router
 app.include_router(api_v1)
 
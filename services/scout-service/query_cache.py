@@ -0,0 +1,102 @@
+"""Query Translation Cache Module
+Memoizes natural-language to GitHub search query translations.
+
+Author: OpenTalent Team
+Updated: December 13, 2025
+"""
+
+import re
+import time
+from collections import OrderedDict
+
+from core.constants import QUERY_CACHE_MAX_ENTRIES, QUERY_CACHE_TTL
+
+_NON_WORD = re.compile(r"[^\w+#.\s-]")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_query(text: str | None) -> str:
+    """Normalize a query for cache lookups.
+
+    Lower-cases, drops punctuation that does not change meaning (keeping the
+    ``+``/``#``/``.`` used by ``c++``, ``c#`` and ``5+``) and collapses whitespace.
+
+    Args:
+        text: Raw user query or location
+
+    Returns:
+        The normalized string
+    """
+    if not text:
+        return ""
+    text = _NON_WORD.sub(" ", text.lower())
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+class QueryTranslationCache:
+    """LRU cache with TTL for translated GitHub search queries."""
+
+    def __init__(self, max_entries: int = QUERY_CACHE_MAX_ENTRIES, ttl: float = QUERY_CACHE_TTL):
+        """Initialize query cache.
+
+        Args:
+            max_entries: Maximum number of cached translations
+            ttl: Time-to-live for each translation (seconds)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[tuple[str, str], tuple[str, float]] = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0, "rule_based": 0, "llm": 0, "expired": 0}
+
+    @staticmethod
+    def _key(user_query: str, location: str) -> tuple[str, str]:
+        return normalize_query(user_query), normalize_query(location)
+
+    def get(self, user_query: str, location: str) -> str | None:
+        """Return a cached translation, or None on miss/expiry."""
+        key = self._key(user_query, location)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+        query, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            self.stats["expired"] += 1
+            self.stats["misses"] += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats["hits"] += 1
+        return query
+
+    def set(self, user_query: str, location: str, search_query: str, source: str = "llm") -> None:
+        """Store a translation.
+
+        Args:
+            user_query: Natural language query
+            location: Location filter
+            search_query: Translated GitHub search query
+            source: ``llm`` or ``rule_based`` (for metrics)
+        """
+        key = self._key(user_query, location)
+        self._entries[key] = (search_query, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        if source in self.stats:
+            self.stats[source] += 1
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached translations."""
+        self._entries.clear()
+
+    def snapshot(self) -> dict:
+        """Cache metrics for the stats endpoint."""
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl,
+            "hit_rate": self.stats["hits"] / lookups if lookups else 0.0,
+        }
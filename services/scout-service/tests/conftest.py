@@ -15,6 +15,14 @@ if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
 
+@pytest.fixture(autouse=True)
+def profile_cache_path(tmp_path, monkeypatch):
+    """Keep the shared profile cache out of the developer's ~/.cache"""
+    path = tmp_path / "profile_cache.sqlite3"
+    monkeypatch.setenv("PROFILE_CACHE_PATH", str(path))
+    return path
+
+
 @pytest.fixture
 def client():
     # Set dummy env vars for lifespan
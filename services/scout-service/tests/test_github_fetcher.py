@@ -0,0 +1,178 @@
+import time
+
+import pytest
+from github_fetcher import PROFILE_CACHE_AVAILABLE, GitHubFetcher, ProfileCache, TokenBucket
+
+
+class FakeResponse:
+    def __init__(self, status, payload=None, headers=None):
+        self.status = status
+        self._payload = payload
+        self.headers = headers or {}
+
+    async def json(self):
+        return self._payload
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def get(self, url, params=None, headers=None):
+        self.calls.append({"url": url, "params": params, "headers": headers or {}})
+        return self.responses.pop(0)
+
+
+class TestTokenBucket:
+    def test_retry_after_pauses_bucket(self):
+        bucket = TokenBucket(max_pause=5)
+        bucket.update_from_headers({"Retry-After": "30"})
+        assert 4 < bucket.blocked_until - time.monotonic() <= 5
+
+    def test_exhausted_quota_pauses_until_reset(self):
+        bucket = TokenBucket()
+        reset = int(time.time()) + 3
+        bucket.update_from_headers({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset)})
+        assert bucket.blocked_until > time.monotonic()
+
+    def test_low_quota_slows_refill(self):
+        bucket = TokenBucket(rate=20, capacity=20, low_watermark=10)
+        reset = int(time.time()) + 100
+        bucket.update_from_headers({"X-RateLimit-Remaining": "5", "X-RateLimit-Reset": str(reset)})
+        assert bucket.rate < 1
+        assert bucket.tokens <= 5
+
+    @pytest.mark.asyncio
+    async def test_rate_recovers_after_reset(self):
+        bucket = TokenBucket(rate=20, capacity=20, low_watermark=10)
+        reset = int(time.time()) + 100
+        bucket.update_from_headers({"X-RateLimit-Remaining": "5", "X-RateLimit-Reset": str(reset)})
+        assert bucket.rate < 1
+        # The window resets without any further response headers
+        bucket.throttled_until = time.monotonic() - 1
+        await bucket.acquire()
+        assert bucket.rate == 20
+        assert bucket.throttled_until == 0.0
+
+    def test_rate_recovers_when_quota_is_replenished(self):
+        bucket = TokenBucket(rate=20, capacity=20, low_watermark=10)
+        reset = int(time.time()) + 100
+        bucket.update_from_headers({"X-RateLimit-Remaining": "5", "X-RateLimit-Reset": str(reset)})
+        bucket.update_from_headers(
+            {"X-RateLimit-Remaining": "4999", "X-RateLimit-Reset": str(reset + 3600)}
+        )
+        assert bucket.rate == 20
+        assert bucket.throttled_until == 0.0
+
+    @pytest.mark.asyncio
+    async def test_acquire_consumes_tokens(self):
+        bucket = TokenBucket(rate=1000, capacity=2)
+        await bucket.acquire()
+        await bucket.acquire()
+        assert bucket.tokens < 1
+
+
+class TestGitHubFetcher:
+    @pytest.mark.asyncio
+    async def test_not_modified_served_from_cache(self):
+        session = FakeSession(
+            [
+                FakeResponse(200, {"login": "octocat"}, {"ETag": '"abc"'}),
+                FakeResponse(304),
+            ]
+        )
+        fetcher = GitHubFetcher(session, "token")
+
+        first = await fetcher.get_user("octocat")
+        second = await fetcher.get_user("octocat")
+
+        assert first == second == {"login": "octocat"}
+        assert session.calls[1]["headers"]["If-None-Match"] == '"abc"'
+        assert fetcher.stats["not_modified"] == 1
+
+    @pytest.mark.asyncio
+    async def test_get_users_preserves_order(self):
+        session = FakeSession(
+            [
+                FakeResponse(200, {"login": "a"}),
+                FakeResponse(404),
+                FakeResponse(200, {"login": "c"}),
+            ]
+        )
+        fetcher = GitHubFetcher(session, "token", max_concurrency=1)
+
+        users = await fetcher.get_users(["a", "b", "c"])
+
+        assert users == [{"login": "a"}, None, {"login": "c"}]
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_request_is_retried(self):
+        session = FakeSession(
+            [
+                FakeResponse(429, headers={"Retry-After": "0"}),
+                FakeResponse(200, {"login": "octocat"}),
+            ]
+        )
+        fetcher = GitHubFetcher(session, "token")
+
+        user = await fetcher.get_user("octocat")
+
+        assert user == {"login": "octocat"}
+        assert fetcher.stats["rate_limited"] == 1
+
+    @pytest.mark.asyncio
+    async def test_exhausted_retries_report_rate_limit(self):
+        session = FakeSession(
+            [
+                FakeResponse(403, headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "0"}),
+                FakeResponse(429, headers={"Retry-After": "0"}),
+            ]
+        )
+        fetcher = GitHubFetcher(session, "token")
+
+        assert await fetcher.get_json("https://api.github.com/users/octocat") == (429, None)
+        assert fetcher.stats["rate_limited"] == 2
+
+
+@pytest.mark.skipif(not PROFILE_CACHE_AVAILABLE, reason="shared profile cache not importable")
+class TestProfileCacheIntegration:
+    @pytest.mark.asyncio
+    async def test_fresh_profile_served_without_request(self, tmp_path):
+        cache = ProfileCache(path=str(tmp_path / "cache.sqlite3"), namespace="github")
+        session = FakeSession([FakeResponse(200, {"login": "octocat"}, {"ETag": '"v1"'})])
+        fetcher = GitHubFetcher(session, "token", profile_cache=cache)
+
+        first = await fetcher.get_user("octocat")
+        second = await fetcher.get_user("OctoCat")
+
+        assert first == second == {"login": "octocat"}
+        assert len(session.calls) == 1
+        assert cache.stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_profile_revalidated_with_etag(self, tmp_path):
+        cache = ProfileCache(path=str(tmp_path / "cache.sqlite3"), ttl_seconds=0, stale_seconds=0)
+        cache.set("https://github.com/octocat", {"login": "octocat"}, etag='"v1"')
+        session = FakeSession([FakeResponse(304)])
+        fetcher = GitHubFetcher(session, "token", profile_cache=cache)
+
+        user = await fetcher.get_user("octocat")
+
+        assert user == {"login": "octocat"}
+        assert session.calls[0]["headers"]["If-None-Match"] == '"v1"'
+
+    def test_lru_eviction_bounds_size(self, tmp_path):
+        cache = ProfileCache(path=str(tmp_path / "cache.sqlite3"), max_entries=10)
+        for i in range(25):
+            cache.set(f"https://github.com/user{i}", {"id": i})
+
+        assert len(cache) <= 10
+        assert cache.get("https://github.com/user24") is not None
+        assert cache.get("https://github.com/user0") is None
@@ -0,0 +1,53 @@
+import time
+
+from query_cache import QueryTranslationCache, normalize_query
+
+
+class TestQueryTranslationCache:
+    def test_normalization_shares_entries(self):
+        cache = QueryTranslationCache()
+        cache.set("Senior  Python Developer!", "Ireland", "language:python repos:>20")
+
+        assert cache.get("senior python developer", "ireland") == "language:python repos:>20"
+        assert cache.stats["hits"] == 1
+
+    def test_normalize_keeps_language_symbols(self):
+        assert normalize_query("C++ / C# devs, 5+ years") == "c++ c# devs 5+ years"
+
+    def test_entries_expire(self):
+        cache = QueryTranslationCache(ttl=0.01)
+        cache.set("rust developer", "Dublin", "language:rust")
+        time.sleep(0.02)
+
+        assert cache.get("rust developer", "Dublin") is None
+        assert cache.stats["expired"] == 1
+
+    def test_lru_bound(self):
+        cache = QueryTranslationCache(max_entries=2)
+        cache.set("a", "x", "qa")
+        cache.set("b", "x", "qb")
+        cache.get("a", "x")
+        cache.set("c", "x", "qc")
+
+        assert cache.get("b", "x") is None
+        assert cache.get("a", "x") == "qa"
+        assert cache.snapshot()["size"] == 2
+
+
+class TestRuleBasedFastPath:
+    def test_simple_query_skips_llm(self):
+        from main import GitHubTalentScout
+
+        scout = GitHubTalentScout()
+        query = scout.rule_based_query("senior python developer", "Ireland")
+
+        assert query == "language:python repos:>20 followers:>10 location:Ireland type:user"
+
+    def test_ambiguous_query_needs_llm(self):
+        from main import GitHubTalentScout
+
+        scout = GitHubTalentScout()
+
+        assert scout.rule_based_query("machine learning expert python", "Ireland") is None
+        assert scout.rule_based_query("scala developer", "Ireland") is None
+        assert scout.rule_based_query("python or rust engineer", "Ireland") is None
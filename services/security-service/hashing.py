@@ -0,0 +1,140 @@
+"""
+Security Service - Password Hashing Executor
+
+bcrypt is deliberately slow (hundreds of milliseconds at 12 rounds), so it
+must never run on the event loop. HashingExecutor runs hash/verify calls on
+a thread pool sized to the machine (bcrypt releases the GIL, so threads
+scale with cores) and caps the number of outstanding jobs: once the cap is
+reached new work is rejected immediately instead of queueing, which keeps
+latency bounded and health checks responsive during credential-stuffing
+spikes. Queue wait and hashing time are tracked for the metrics endpoint.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+# Latency samples kept per series for percentile reporting
+LATENCY_WINDOW = 1024
+
+
+class HashingOverloaded(Exception):
+    """Raised when the hashing queue is full; callers should answer 503."""
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(int(fraction * len(ordered)), len(ordered) - 1)
+    return ordered[index]
+
+
+class HashingExecutor:
+    """Bounded thread pool for password hashing with latency and queue metrics."""
+
+    def __init__(self, workers: int | None = None, max_pending: int | None = None):
+        """
+        Args:
+            workers: Pool threads; defaults to HASHING_WORKERS or the CPU count.
+            max_pending: Jobs allowed in flight (running plus queued) before new
+                work is rejected; defaults to HASHING_MAX_PENDING or 16 per worker.
+        """
+        workers = workers or int(os.environ.get("HASHING_WORKERS", "0"))
+        self.workers = workers or os.cpu_count() or 2
+        max_pending = max_pending or int(os.environ.get("HASHING_MAX_PENDING", "0"))
+        self.max_pending = max_pending or self.workers * 16
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="password-hash"
+        )
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._running = 0
+        self._counts = {"submitted": 0, "completed": 0, "failed": 0, "rejected": 0}
+        self._wait_ms: deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._run_ms: deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+    def _acquire(self) -> None:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._counts["rejected"] += 1
+                raise HashingOverloaded(f"Password hashing queue is full ({self._pending} pending)")
+            self._pending += 1
+            self._counts["submitted"] += 1
+
+    def _timed(self, fn: Callable[..., T], queued_at: float, *args: Any) -> T:
+        started = time.perf_counter()
+        with self._lock:
+            self._running += 1
+        ok = False
+        try:
+            result = fn(*args)
+            ok = True
+            return result
+        finally:
+            finished = time.perf_counter()
+            with self._lock:
+                self._running -= 1
+                self._pending -= 1
+                self._counts["completed" if ok else "failed"] += 1
+                self._wait_ms.append((started - queued_at) * 1000)
+                self._run_ms.append((finished - started) * 1000)
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run a hashing function on the pool.
+
+        Args:
+            fn: Blocking function, e.g. hash_password or verify_password.
+            *args: Positional arguments for fn.
+
+        Returns:
+            The function's result.
+
+        Raises:
+            HashingOverloaded: If max_pending jobs are already outstanding.
+        """
+        self._acquire()
+        loop = asyncio.get_running_loop()
+        try:
+            future = loop.run_in_executor(self._pool, self._timed, fn, time.perf_counter(), *args)
+        except BaseException:
+            with self._lock:
+                self._pending -= 1
+            raise
+        return await future
+
+    def shutdown(self) -> None:
+        """Stop accepting work and wait for running jobs."""
+        self._pool.shutdown(wait=True)
+
+    def metrics(self) -> dict[str, Any]:
+        """Queue depth, counters and latency percentiles in milliseconds."""
+        with self._lock:
+            wait = list(self._wait_ms)
+            run = list(self._run_ms)
+            pending = self._pending
+            running = self._running
+            counts = dict(self._counts)
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "in_flight": pending,
+            "running": running,
+            "queue_depth": pending - running,
+            **counts,
+            "queue_wait_ms": {
+                "p50": round(_percentile(wait, 0.5), 3),
+                "p95": round(_percentile(wait, 0.95), 3),
+            },
+            "hash_ms": {
+                "p50": round(_percentile(run, 0.5), 3),
+                "p95": round(_percentile(run, 0.95), 3),
+            },
+        }
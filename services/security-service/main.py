@@ -3,26 +3,29 @@ Security Service - Authentication, Authorization, Permissions, MFA, Encryption
 Port: 8010
 """
 
+import asyncio
 import os
 import secrets
-
-# Ensure local imports work when loaded via spec_from_file_location
 import sys as _sys
-from datetime import datetime, timedelta
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
 from hashlib import sha256
 from typing import Any
 
 import bcrypt
 import jwt
 from cryptography.fernet import Fernet
-from fastapi import Body, Depends, FastAPI, Header, Request
+from fastapi import BackgroundTasks, Body, Depends, FastAPI, Header, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
+# Ensure local imports work when loaded via spec_from_file_location
 _this_dir = os.path.dirname(__file__)
 if _this_dir not in _sys.path:
     _sys.path.append(_this_dir)
 
+from hashing import HashingExecutor, HashingOverloaded
+from revocation_store import RevocationStore
 from schemas import (
     AssignRoleRequest,
     ChangePasswordRequest,
@@ -43,7 +46,18 @@ from slowapi.errors import RateLimitExceeded
 from slowapi.middleware import SlowAPIMiddleware
 from slowapi.util import get_remote_address
 
-app = FastAPI(title="Security Service", version="1.0.0")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the expiry sweeper and release the hashing pool and revocation store on shutdown."""
+    sweeper = asyncio.create_task(sweep_loop())
+    yield
+    sweeper.cancel()
+    hasher.shutdown()
+    revocations.close()
+
+
+app = FastAPI(title="Security Service", version="1.0.0", lifespan=lifespan)
 
 # ============================================================================
 # CONFIGURATION & CONSTANTS
@@ -54,6 +68,9 @@ SECRET_KEY = os.environ.get("SECURITY_SECRET_KEY", "DEV_ONLY_INSECURE_SECRET_CHA
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 PASSWORD_MIN_LENGTH = 8
+REFRESH_TOKEN_EXPIRE_DAYS = 7
+# Seconds between sweeps of expired revocations and sessions
+REVOCATION_SWEEP_INTERVAL = float(os.environ.get("REVOCATION_SWEEP_INTERVAL", "60"))
 RATE_LIMIT_ENABLED = os.environ.get("RATE_LIMIT_ENABLED", "true").lower() == "true"
 RATE_LIMIT_RULE = os.environ.get("RATE_LIMIT_RULE", "5/minute")
 ALLOWED_ORIGINS = [o.strip() for o in os.environ.get("CORS_ALLOW_ORIGINS", "*").split(",")]
@@ -80,8 +97,12 @@ users_db: dict[str, dict[str, Any]] = {
     }
 }
 
-tokens_db: set = set()  # Blacklisted tokens
-sessions_db: dict[str, dict[str, Any]] = {}  # Active sessions
+# Password hashing runs off the event loop on a bounded pool
+hasher = HashingExecutor()
+
+# Revoked token IDs, kept until the token expires; optionally persisted (REVOCATION_STORE_PATH)
+revocations = RevocationStore()
+sessions_db: dict[str, dict[str, Any]] = {}  # Active sessions, pruned after expires_at
 
 # ============================================================================
 # HELPER FUNCTIONS
@@ -125,6 +146,53 @@ def verify_password(password: str, hash_value: str) -> bool:
     return sha256(password.encode()).hexdigest() == hash_value
 
 
+def needs_rehash(hash_value: str) -> bool:
+    """Check whether a stored hash is legacy SHA256 or uses fewer than BCRYPT_ROUNDS.
+
+    Args:
+        hash_value: The hashed password string from the database.
+
+    Returns:
+        True if the hash should be replaced on the next successful login.
+    """
+    if not _is_bcrypt(hash_value):
+        return True
+    try:
+        return int(hash_value.split("$")[2]) < BCRYPT_ROUNDS
+    except (IndexError, ValueError):
+        return True
+
+
+def hashing_unavailable() -> JSONResponse:
+    """503 response returned when the hashing queue is saturated."""
+    return JSONResponse(
+        status_code=503,
+        content={"error": "Authentication is busy, please retry shortly"},
+        headers={"Retry-After": "1"},
+    )
+
+
+async def rehash_password(email: str, password: str, old_hash: str) -> None:
+    """Replace a legacy or low-round hash after a successful login.
+
+    Runs as a background task so the login response is not delayed. The new
+    hash is only stored if the password was not changed in the meantime.
+
+    Args:
+        email: User whose hash is migrated.
+        password: The verified plain-text password.
+        old_hash: The hash that was verified.
+    """
+    try:
+        new_hash = await hasher.run(hash_password, password)
+    except HashingOverloaded:
+        # Try again on a later login
+        return
+    user = users_db.get(email)
+    if user is not None and user["password_hash"] == old_hash:
+        user["password_hash"] = new_hash
+
+
 def create_access_token(email: str, expires_delta: timedelta | None = None) -> str:
     """Generate a signed JWT access token for a user.
 
@@ -153,7 +221,7 @@ def verify_token(token: str) -> str | None:
         email = payload.get("email")
 
         # Check if token is blacklisted
-        if token in tokens_db:
+        if token_id(token) in revocations:
             return None
 
         return email
@@ -163,6 +231,50 @@ def verify_token(token: str) -> str | None:
         return None
 
 
+def token_id(token: str) -> str:
+    """Identifier published in the revocation feed (never the raw token)."""
+    return sha256(token.encode()).hexdigest()
+
+
+def revoke_token(token: str) -> None:
+    """Blacklist a token until it expires and publish it to the revocation feed."""
+    try:
+        exp = jwt.decode(
+            token, SECRET_KEY, algorithms=[ALGORITHM], options={"verify_exp": False}
+        ).get("exp")
+    except jwt.InvalidTokenError:
+        exp = None
+    revocations.revoke(token_id(token), exp)
+
+
+def sweep_expired(now: datetime | None = None) -> dict[str, int]:
+    """Drop revocations of expired tokens and expired refresh sessions.
+
+    Args:
+        now: Reference time (defaults to the current UTC time).
+
+    Returns:
+        Number of revocations and sessions removed.
+    """
+    now = now or datetime.utcnow()
+    removed_revocations = revocations.sweep(now.replace(tzinfo=UTC).timestamp())
+    expired_sessions = [
+        refresh_token
+        for refresh_token, session in sessions_db.items()
+        if datetime.fromisoformat(session["expires_at"]) <= now
+    ]
+    for refresh_token in expired_sessions:
+        del sessions_db[refresh_token]
+    return {"revocations": removed_revocations, "sessions": len(expired_sessions)}
+
+
+async def sweep_loop() -> None:
+    """Periodically sweep expired revocations and sessions."""
+    while True:
+        await asyncio.sleep(REVOCATION_SWEEP_INTERVAL)
+        sweep_expired()
+
+
 def get_current_user(authorization: str | None = Header(None)) -> str | None:
     """Extract and verify token from Authorization header"""
     if not authorization:
@@ -236,6 +348,12 @@ async def health():
     return {"service": "security", "status": "healthy"}
 
 
+@app.get("/api/v1/metrics/hashing")
+async def hashing_metrics():
+    """Password hashing pool queue depth and latency"""
+    return hasher.metrics()
+
+
 # ============================================================================
 # AUTHENTICATION ENDPOINTS
 # ============================================================================
@@ -269,10 +387,19 @@ async def register(request: Request, payload: RegisterRequest = Body(...)):
     if email in users_db:
         return JSONResponse(status_code=409, content={"error": "Email already registered"})
 
+    try:
+        password_hash = await hasher.run(hash_password, password)
+    except HashingOverloaded:
+        return hashing_unavailable()
+
+    # Re-check: another registration may have completed while hashing
+    if email in users_db:
+        return JSONResponse(status_code=409, content={"error": "Email already registered"})
+
     # Create user
     users_db[email] = {
         "email": email,
-        "password_hash": hash_password(password),
+        "password_hash": password_hash,
         "first_name": first_name,
         "last_name": last_name,
         "roles": ["user"],
@@ -290,7 +417,9 @@ async def register(request: Request, payload: RegisterRequest = Body(...)):
 
 @app.post("/api/v1/auth/login")
 @limiter.limit(RATE_LIMIT_RULE) if limiter else (lambda f: f)
-async def login(request: Request, payload: LoginRequest = Body(...)):
+async def login(
+    request: Request, background_tasks: BackgroundTasks, payload: LoginRequest = Body(...)
+):
     """Login and get access token"""
     email = payload.email.strip()
     password = payload.password.strip()
@@ -304,14 +433,19 @@ async def login(request: Request, payload: LoginRequest = Body(...)):
         return JSONResponse(status_code=401, content={"error": "Invalid credentials"})
 
     user = users_db[email]
+    password_hash = user["password_hash"]
 
     # Verify password
-    if not verify_password(password, user["password_hash"]):
+    try:
+        valid = await hasher.run(verify_password, password, password_hash)
+    except HashingOverloaded:
+        return hashing_unavailable()
+    if not valid:
         return JSONResponse(status_code=401, content={"error": "Invalid credentials"})
 
-    # If legacy SHA256 was used, migrate to bcrypt transparently after successful login
-    if not _is_bcrypt(user["password_hash"]):
-        user["password_hash"] = hash_password(password)
+    # Legacy SHA256 and low-round hashes are upgraded after the response is sent
+    if needs_rehash(password_hash):
+        background_tasks.add_task(rehash_password, email, password, password_hash)
 
     # Create tokens
     access_token = create_access_token(email)
@@ -321,7 +455,7 @@ async def login(request: Request, payload: LoginRequest = Body(...)):
     sessions_db[refresh_token] = {
         "email": email,
         "created_at": datetime.utcnow().isoformat(),
-        "expires_at": (datetime.utcnow() + timedelta(days=7)).isoformat(),
+        "expires_at": (datetime.utcnow() + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)).isoformat(),
     }
 
     return JSONResponse(
@@ -337,11 +471,34 @@ async def login(request: Request, payload: LoginRequest = Body(...)):
 
 
 @app.post("/api/v1/auth/logout")
-async def logout(current_user: str | None = Depends(get_current_user)):
+async def logout(
+    authorization: str | None = Header(None),
+    current_user: str | None = Depends(get_current_user),
+):
     """Logout and invalidate token"""
+    if current_user and authorization:
+        revoke_token(authorization.split(" ", 1)[1])
     return JSONResponse(status_code=204, content={"message": "Logged out successfully"})
 
 
+@app.get("/api/v1/auth/revocations")
+async def revocation_feed(since: str | None = None):
+    """Revoked token IDs added after cursor ``since``
+
+    Services verifying tokens locally poll this with the cursor from their last
+    response. No cursor, or one this instance does not know (e.g. after a
+    restart without persistence), returns every unexpired revocation with
+    ``reset`` set.
+    """
+    return revocations.changes_since(since)
+
+
+@app.get("/api/v1/metrics/revocations")
+async def revocation_metrics():
+    """Revocation store and session counts"""
+    return {**revocations.stats(), "sessions": len(sessions_db)}
+
+
 @app.post("/api/v1/auth/verify")
 async def verify(payload: TokenVerifyRequest = Body(...)):
     """Verify if token is valid"""
@@ -369,6 +526,9 @@ async def refresh(payload: TokenRefreshRequest = Body(...)):
         return JSONResponse(status_code=401, content={"error": "Invalid refresh token"})
 
     session = sessions_db[refresh_token]
+    if datetime.fromisoformat(session["expires_at"]) <= datetime.utcnow():
+        del sessions_db[refresh_token]
+        return JSONResponse(status_code=401, content={"error": "Invalid refresh token"})
     email = session["email"]
 
     # Create new access token
@@ -612,16 +772,19 @@ async def change_password(
 
     user = users_db[email]
 
-    # Verify current password
-    if not verify_password(current_password, user["password_hash"]):
-        return JSONResponse(status_code=401, content={"error": "Current password is incorrect"})
-
-    # Check new password strength
-    if not is_strong_password(new_password):
-        return JSONResponse(status_code=422, content={"error": "New password too weak"})
-
-    # Update password
-    user["password_hash"] = hash_password(new_password)
+    try:
+        # Verify current password
+        if not await hasher.run(verify_password, current_password, user["password_hash"]):
+            return JSONResponse(status_code=401, content={"error": "Current password is incorrect"})
+
+        # Check new password strength
+        if not is_strong_password(new_password):
+            return JSONResponse(status_code=422, content={"error": "New password too weak"})
+
+        # Update password
+        user["password_hash"] = await hasher.run(hash_password, new_password)
+    except HashingOverloaded:
+        return hashing_unavailable()
 
     return JSONResponse(status_code=200, content={"message": "Password changed successfully"})
 
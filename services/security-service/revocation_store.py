@@ -0,0 +1,193 @@
+"""
+Security Service - Token Revocation Store
+
+Revoked tokens are kept only until they expire: after ``exp`` a token fails
+signature verification anyway, so its revocation entry is dead weight. Each
+entry is keyed by the token's SHA-256 ID (never the raw token), carries the
+token's ``exp`` and a sequence number. The sequence numbers drive the
+incremental feed other services poll: a client passes the cursor from its
+last response and receives only entries added since.
+
+Cursors have the form ``"<epoch>-<seq>"``. The epoch changes whenever the
+sequence could restart (a new in-memory store), so a client holding a
+cursor from a previous instance gets a full snapshot instead of silently
+missing entries. With ``path`` set, entries, the epoch and the sequence
+counter are persisted to SQLite and survive restarts.
+"""
+
+import bisect
+import os
+import secrets
+import sqlite3
+import threading
+import time
+from typing import Any
+
+
+class RevocationStore:
+    """Revoked token IDs with expiry, a sweeper hook and an incremental feed."""
+
+    def __init__(self, path: str | None = None):
+        """
+        Args:
+            path: SQLite file for persistence; defaults to REVOCATION_STORE_PATH.
+                None or an empty value keeps revocations in memory only.
+        """
+        self.path = path if path is not None else os.environ.get("REVOCATION_STORE_PATH") or None
+        self._lock = threading.Lock()
+        # token_id -> (seq, exp); exp 0 means the token has no expiry
+        self._entries: dict[str, tuple[int, float]] = {}
+        # Sorted (seq, token_id) pairs for cursor lookups
+        self._feed: list[tuple[int, str]] = []
+        self._seq = 0
+        self._epoch = secrets.token_hex(4)
+        self._db: sqlite3.Connection | None = None
+        if self.path:
+            self._open()
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _open(self) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS revocations ("
+            "token_id TEXT PRIMARY KEY, seq INTEGER NOT NULL, exp REAL NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+        )
+        meta = dict(self._db.execute("SELECT key, value FROM meta"))
+        if "epoch" in meta:
+            self._epoch = meta["epoch"]
+            self._seq = int(meta.get("seq", 0))
+        else:
+            self._save_meta()
+
+        now = time.time()
+        self._db.execute("DELETE FROM revocations WHERE exp > 0 AND exp <= ?", (now,))
+        for token_id, seq, exp in self._db.execute(
+            "SELECT token_id, seq, exp FROM revocations ORDER BY seq"
+        ):
+            self._entries[token_id] = (seq, exp)
+            self._feed.append((seq, token_id))
+
+    def _save_meta(self) -> None:
+        self._db.executemany(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            [("epoch", self._epoch), ("seq", str(self._seq))],
+        )
+
+    def close(self) -> None:
+        """Close the SQLite connection, if any."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    # ------------------------------------------------------------------
+    # Revocation
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, token_id: object) -> bool:
+        entry = self._entries.get(token_id)
+        return entry is not None and (not entry[1] or entry[1] > time.time())
+
+    def revoke(self, token_id: str, exp: float | None) -> bool:
+        """Revoke a token until its expiry.
+
+        Args:
+            token_id: SHA-256 ID of the token.
+            exp: The token's ``exp`` as a Unix timestamp; None if it never expires.
+
+        Returns:
+            True if the token was newly revoked, False if it already was or has expired.
+        """
+        exp = float(exp or 0)
+        if exp and exp <= time.time():
+            return False
+        with self._lock:
+            if token_id in self._entries:
+                return False
+            self._seq += 1
+            self._entries[token_id] = (self._seq, exp)
+            self._feed.append((self._seq, token_id))
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO revocations (token_id, seq, exp) VALUES (?, ?, ?)",
+                    (token_id, self._seq, exp),
+                )
+                self._save_meta()
+        return True
+
+    def sweep(self, now: float | None = None) -> int:
+        """Drop entries whose token has expired.
+
+        Args:
+            now: Reference time (defaults to the current time).
+
+        Returns:
+            Number of entries removed.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            expired = [key for key, (_, exp) in self._entries.items() if exp and exp <= now]
+            if not expired:
+                return 0
+            for key in expired:
+                del self._entries[key]
+            self._feed = [(seq, key) for seq, key in self._feed if key in self._entries]
+            if self._db is not None:
+                self._db.execute("DELETE FROM revocations WHERE exp > 0 AND exp <= ?", (now,))
+        return len(expired)
+
+    # ------------------------------------------------------------------
+    # Feed
+    # ------------------------------------------------------------------
+
+    @property
+    def cursor(self) -> str:
+        """Cursor pointing after the newest entry."""
+        return f"{self._epoch}-{self._seq}"
+
+    def _parse_cursor(self, cursor: str | None) -> int | None:
+        epoch, _, seq = (cursor or "").partition("-")
+        if epoch != self._epoch or not seq.isdigit() or int(seq) > self._seq:
+            return None
+        return int(seq)
+
+    def changes_since(self, cursor: str | None) -> dict[str, Any]:
+        """Entries added after a cursor returned by a previous call.
+
+        Args:
+            cursor: Cursor from the last response; None, "0" or a cursor from
+                another store instance yields a full snapshot.
+
+        Returns:
+            ``{"cursor": ..., "reset": bool, "revoked": [{"id": ..., "exp": ...}]}``;
+            with ``reset`` the entries replace everything the client holds.
+        """
+        with self._lock:
+            seq = self._parse_cursor(cursor)
+            start = 0
+            if seq is not None:
+                start = bisect.bisect_right(self._feed, seq, key=lambda item: item[0])
+            revoked = [
+                {"id": key, "exp": self._entries[key][1] or None} for _, key in self._feed[start:]
+            ]
+            return {"cursor": self.cursor, "reset": seq is None, "revoked": revoked}
+
+    def stats(self) -> dict[str, Any]:
+        """Entry count, cursor and backend."""
+        return {
+            "revoked": len(self._entries),
+            "cursor": self.cursor,
+            "persistent": self._db is not None,
+        }
@@ -93,3 +93,78 @@ def test_login_migrates_legacy_hash_to_bcrypt(tmp_path, monkeypatch):
     new_hash = mod.users_db[email]["password_hash"]
     assert new_hash.startswith("$2"), "Expected bcrypt hash after migration"
     assert mod.verify_password(password, new_hash) is True
+
+
+def test_needs_rehash_flags_legacy_and_low_round_hashes():
+    mod = reload_security_module({"BCRYPT_ROUNDS": "12", "PEPPER": ""})
+    assert mod.needs_rehash(mod.sha256(b"x").hexdigest()) is True
+    low = mod.bcrypt.hashpw(b"StrongPassw0rd!", mod.bcrypt.gensalt(rounds=4)).decode()
+    assert mod.needs_rehash(low) is True
+    assert mod.needs_rehash(mod.hash_password("StrongPassw0rd!")) is False
+
+
+def test_login_upgrades_low_round_hash():
+    mod = reload_security_module({"BCRYPT_ROUNDS": "12", "PEPPER": ""})
+    email = "lowrounds@example.com"
+    password = "LowRounds123!"
+    mod.users_db[email] = {
+        "email": email,
+        "password_hash": mod.bcrypt.hashpw(
+            password.encode(), mod.bcrypt.gensalt(rounds=4)
+        ).decode(),
+        "first_name": "Low",
+        "last_name": "Rounds",
+        "roles": ["user"],
+        "permissions": [],
+        "mfa_enabled": False,
+        "mfa_secret": None,
+    }
+
+    import asyncio
+
+    async def _login_via_client():
+        transport = ASGITransport(app=mod.app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://testserver", timeout=5.0
+        ) as client:
+            return await client.post(
+                "/api/v1/auth/login",
+                json={"email": email, "password": password},
+            )
+
+    resp = asyncio.get_event_loop().run_until_complete(_login_via_client())
+    assert resp.status_code == 200
+    new_hash = mod.users_db[email]["password_hash"]
+    assert new_hash.split("$")[2] == "12"
+    assert mod.verify_password(password, new_hash) is True
+
+
+def test_hashing_executor_rejects_when_queue_is_full():
+    import asyncio
+    import threading
+
+    mod = reload_security_module()
+    executor = mod.HashingExecutor(workers=1, max_pending=1)
+    release = threading.Event()
+
+    async def _scenario():
+        first = asyncio.ensure_future(executor.run(release.wait, 5))
+        await asyncio.sleep(0)
+        try:
+            await executor.run(len, "x")
+        except mod.HashingOverloaded:
+            rejected = True
+        else:
+            rejected = False
+        release.set()
+        await first
+        return rejected, await executor.run(len, "abc")
+
+    rejected, result = asyncio.get_event_loop().run_until_complete(_scenario())
+    executor.shutdown()
+    assert rejected is True
+    assert result == 3
+    metrics = executor.metrics()
+    assert metrics["rejected"] == 1
+    assert metrics["completed"] == 2
+    assert metrics["in_flight"] == 0
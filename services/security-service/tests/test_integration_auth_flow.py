@@ -1,3 +1,4 @@
+import hashlib
 import importlib
 import os
 
@@ -6,6 +7,10 @@ from httpx import ASGITransport
 
 
 def load_app():
+    return load_module().app
+
+
+def load_module():
     os.environ.setdefault("SECURITY_SECRET_KEY", "TEST_SECRET_KEY")
     os.environ.setdefault("RATE_LIMIT_ENABLED", "true")
     os.environ.setdefault("RATE_LIMIT_RULE", "5/minute")
@@ -19,7 +24,7 @@ def load_app():
     module = importlib.util.module_from_spec(spec)
     assert spec and spec.loader
     spec.loader.exec_module(module)
-    return module.app
+    return module
 
 
 async def _register(client: httpx.AsyncClient, email: str, password: str):
@@ -117,3 +122,53 @@ async def test_auth_flow_and_rate_limit_behavior():
         if refresh_token:
             ref = await _refresh(client, refresh_token)
             assert ref.status_code in (200, 401)
+
+
+async def test_logout_publishes_to_revocation_feed():
+    email = "revoke@example.com"
+    password = "StrongPassw0rd!"
+
+    app = load_app()
+    transport = ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        await _register(client, email, password)
+        token = (await _login(client, email, password)).json()["access_token"]
+
+        feed = (await client.get("/api/v1/auth/revocations")).json()
+        assert feed["reset"] is True
+        cursor = feed["cursor"]
+
+        out = await _logout(client, token)
+        assert out.status_code in (200, 204)
+
+        verify = await client.post("/api/v1/auth/verify", json={"token": token})
+        assert verify.status_code == 401
+
+        feed = (await client.get("/api/v1/auth/revocations", params={"since": cursor})).json()
+        assert feed["reset"] is False
+        assert feed["cursor"] != cursor
+        assert [entry["id"] for entry in feed["revoked"]] == [
+            hashlib.sha256(token.encode()).hexdigest()
+        ]
+        assert feed["revoked"][0]["exp"] is not None
+
+
+async def test_sweep_prunes_expired_sessions():
+    module = load_module()
+    module.sessions_db["expired-refresh"] = {
+        "email": "user@example.com",
+        "created_at": "2020-01-01T00:00:00",
+        "expires_at": "2020-01-08T00:00:00",
+    }
+
+    transport = ASGITransport(app=module.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        ref = await _refresh(client, "expired-refresh")
+        assert ref.status_code == 401
+
+    module.sessions_db["expired-refresh"] = {
+        "email": "user@example.com",
+        "expires_at": "2020-01-08T00:00:00",
+    }
+    assert module.sweep_expired() == {"revocations": 0, "sessions": 1}
+    assert "expired-refresh" not in module.sessions_db
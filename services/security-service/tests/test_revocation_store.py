@@ -0,0 +1,83 @@
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from revocation_store import RevocationStore
+
+
+def test_revoke_and_contains():
+    store = RevocationStore(path="")
+    assert store.revoke("a" * 64, time.time() + 60) is True
+    assert store.revoke("a" * 64, time.time() + 60) is False
+    assert "a" * 64 in store
+    assert "b" * 64 not in store
+
+
+def test_already_expired_token_is_not_stored():
+    store = RevocationStore(path="")
+    assert store.revoke("expired", time.time() - 1) is False
+    assert len(store) == 0
+
+
+def test_sweep_bounds_memory_to_unexpired_tokens():
+    store = RevocationStore(path="")
+    now = time.time()
+    store.revoke("short", now + 10)
+    store.revoke("long", now + 3600)
+    store.revoke("forever", None)
+
+    assert store.sweep(now + 60) == 1
+    assert len(store) == 2
+    assert "short" not in store
+    assert [entry["id"] for entry in store.changes_since(None)["revoked"]] == ["long", "forever"]
+
+
+def test_changes_since_is_incremental():
+    store = RevocationStore(path="")
+    exp = time.time() + 60
+    store.revoke("first", exp)
+
+    snapshot = store.changes_since(None)
+    assert snapshot["reset"] is True
+    assert [entry["id"] for entry in snapshot["revoked"]] == ["first"]
+
+    store.revoke("second", exp)
+    store.revoke("third", exp)
+    delta = store.changes_since(snapshot["cursor"])
+    assert delta["reset"] is False
+    assert [entry["id"] for entry in delta["revoked"]] == ["second", "third"]
+
+    assert store.changes_since(delta["cursor"])["revoked"] == []
+
+
+def test_unknown_cursor_returns_full_snapshot():
+    store = RevocationStore(path="")
+    store.revoke("first", time.time() + 60)
+    other = RevocationStore(path="")
+
+    feed = store.changes_since(other.cursor)
+    assert feed["reset"] is True
+    assert len(feed["revoked"]) == 1
+    assert store.changes_since("garbage")["reset"] is True
+
+
+def test_persistent_store_survives_restart(tmp_path):
+    path = str(tmp_path / "revocations.sqlite3")
+    exp = time.time() + 60
+    store = RevocationStore(path=path)
+    store.revoke("first", exp)
+    cursor = store.cursor
+    store.revoke("second", exp)
+    store.revoke("stale", time.time() + 0.01)
+    store.close()
+
+    time.sleep(0.02)
+    reopened = RevocationStore(path=path)
+    assert "first" in reopened and "second" in reopened
+    assert len(reopened) == 2
+    delta = reopened.changes_since(cursor)
+    assert delta["reset"] is False
+    assert [entry["id"] for entry in delta["revoked"]] == ["second"]
+    reopened.close()
@@ -0,0 +1,233 @@
+"""
+Local JWT verification shared by services that accept Security Service tokens.
+
+Signatures are checked in-process with the shared secret and the decoded
+claims are kept in a bounded LRU until the token's ``exp``, so a repeated
+token costs one dict lookup instead of an RPC to the Security Service.
+Logouts are learned from the Security Service revocation feed
+(``GET /api/v1/auth/revocations?since=<cursor>``), which is polled in the
+background and returns only the entries added since the last poll. Tokens
+are identified by ``token_id()``, the SHA-256 of the encoded token, so raw
+tokens never travel through the feed.
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Any
+
+import httpx
+import jwt
+
+logger = logging.getLogger(__name__)
+
+REVOCATIONS_PATH = "/api/v1/auth/revocations"
+
+
+class TokenRevoked(jwt.InvalidTokenError):
+    """Raised for a correctly signed token that has been logged out."""
+
+
+def token_id(token: str) -> str:
+    """Identifier used for a token in the revocation feed."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class TokenVerifier:
+    """Verifies JWTs locally with a claims cache and a polled revocation list."""
+
+    def __init__(
+        self,
+        secret_key: str,
+        algorithm: str = "HS256",
+        security_service_url: str | None = None,
+        cache_size: int = 10_000,
+        poll_interval: float = 10.0,
+        timeout: float = 5.0,
+        unknown_exp_retention: float = 7 * 86400,
+    ):
+        """
+        Args:
+            secret_key: Secret the Security Service signs tokens with.
+            algorithm: JWT signing algorithm.
+            security_service_url: Base URL of the Security Service; None disables
+                revocation polling.
+            cache_size: Maximum number of decoded tokens kept.
+            poll_interval: Seconds between revocation feed polls.
+            timeout: HTTP timeout for feed polls.
+            unknown_exp_retention: Seconds a revocation without a known ``exp`` is
+                kept; defaults to the Security Service refresh session lifetime.
+        """
+        self.secret_key = secret_key
+        self.algorithm = algorithm
+        self.security_service_url = (
+            security_service_url.rstrip("/") if security_service_url else None
+        )
+        self.cache_size = cache_size
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.unknown_exp_retention = unknown_exp_retention
+        # token_id -> (claims, exp); exp is None for tokens without an expiry
+        self._claims: OrderedDict[str, tuple[dict[str, Any], float | None]] = OrderedDict()
+        # token_id -> time the revocation may be forgotten (the token's exp when known)
+        self._revoked: dict[str, float] = {}
+        # Opaque cursor from the last feed response
+        self._cursor: Any = 0
+        self._last_sync: float | None = None
+        self._client: httpx.AsyncClient | None = None
+        self._poll_task: asyncio.Task | None = None
+        self._stats = {"hits": 0, "misses": 0, "rejected": 0, "revoked": 0, "sync_errors": 0}
+
+    # ------------------------------------------------------------------
+    # Verification
+    # ------------------------------------------------------------------
+
+    def verify(self, token: str) -> dict[str, Any]:
+        """Return the claims of a valid, unrevoked token.
+
+        Args:
+            token: Encoded JWT from the Authorization header.
+
+        Returns:
+            The decoded claims. Callers must not mutate the returned dict.
+
+        Raises:
+            jwt.ExpiredSignatureError: If the token has expired.
+            TokenRevoked: If the token was logged out.
+            jwt.InvalidTokenError: If the token is malformed or wrongly signed.
+        """
+        key = token_id(token)
+        if key in self._revoked:
+            self._stats["revoked"] += 1
+            self._claims.pop(key, None)
+            raise TokenRevoked("Token has been revoked")
+
+        cached = self._claims.get(key)
+        if cached is not None:
+            claims, exp = cached
+            if exp is None or exp > time.time():
+                self._claims.move_to_end(key)
+                self._stats["hits"] += 1
+                return claims
+            del self._claims[key]
+            raise jwt.ExpiredSignatureError("Signature has expired")
+
+        self._stats["misses"] += 1
+        try:
+            claims = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
+        except jwt.InvalidTokenError:
+            self._stats["rejected"] += 1
+            raise
+
+        exp = claims.get("exp")
+        self._claims[key] = (claims, float(exp) if exp is not None else None)
+        if len(self._claims) > self.cache_size:
+            self._claims.popitem(last=False)
+        return claims
+
+    def is_revoked(self, token: str) -> bool:
+        """Check a token against the revocation list without decoding it."""
+        return token_id(token) in self._revoked
+
+    def revoke(self, token_ids: list[str], exp: float = 0) -> None:
+        """Mark tokens as revoked locally.
+
+        Args:
+            token_ids: ``token_id()`` of each token.
+            exp: The tokens' ``exp``; 0 when unknown, in which case the revocation
+                is kept for ``unknown_exp_retention`` seconds.
+        """
+        for key in token_ids:
+            self._add_revocation(key, exp)
+        self._prune()
+
+    def _add_revocation(self, key: str, exp: float) -> None:
+        self._revoked[key] = exp or time.time() + self.unknown_exp_retention
+        self._claims.pop(key, None)
+
+    # ------------------------------------------------------------------
+    # Revocation feed
+    # ------------------------------------------------------------------
+
+    def apply_feed(self, feed: dict[str, Any]) -> int:
+        """Apply one revocation feed response.
+
+        Args:
+            feed: ``{"cursor": ..., "reset": bool, "revoked": [{"id": ..., "exp": ...}]}``;
+                ``reset`` means the entries are a full snapshot replacing local state.
+
+        Returns:
+            Number of entries applied.
+        """
+        if feed.get("reset"):
+            self._revoked.clear()
+        entries = feed.get("revoked", [])
+        for entry in entries:
+            self._add_revocation(entry["id"], float(entry.get("exp") or 0))
+        self._cursor = feed.get("cursor", self._cursor)
+        self._last_sync = time.time()
+        self._prune()
+        return len(entries)
+
+    def _prune(self) -> None:
+        # Revoked tokens past their expiry fail signature checks anyway
+        now = time.time()
+        expired = [key for key, until in self._revoked.items() if until <= now]
+        for key in expired:
+            del self._revoked[key]
+
+    async def sync(self) -> int:
+        """Fetch revocations added since the last sync.
+
+        Returns:
+            Number of entries applied; 0 when polling is disabled or fails.
+        """
+        if not self.security_service_url:
+            return 0
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=self.timeout)
+        try:
+            response = await self._client.get(
+                f"{self.security_service_url}{REVOCATIONS_PATH}",
+                params={"since": self._cursor},
+            )
+            response.raise_for_status()
+            return self.apply_feed(response.json())
+        except Exception as e:
+            # Keep serving from the last known list; staleness is visible in stats()
+            self._stats["sync_errors"] += 1
+            logger.warning(f"Revocation feed sync failed: {e}")
+            return 0
+
+    async def _poll_loop(self) -> None:
+        while True:
+            await self.sync()
+            await asyncio.sleep(self.poll_interval)
+
+    def start(self) -> None:
+        """Start polling the revocation feed (no-op without a Security Service URL)."""
+        if self.security_service_url and self._poll_task is None:
+            self._poll_task = asyncio.create_task(self._poll_loop())
+
+    async def stop(self) -> None:
+        """Stop polling and close the HTTP client."""
+        if self._poll_task is not None:
+            self._poll_task.cancel()
+            self._poll_task = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def stats(self) -> dict[str, Any]:
+        """Cache and revocation feed statistics."""
+        return {
+            **self._stats,
+            "cached": len(self._claims),
+            "revocations": len(self._revoked),
+            "cursor": self._cursor,
+            "last_sync_age": (
+                round(time.time() - self._last_sync, 3) if self._last_sync is not None else None
+            ),
+        }
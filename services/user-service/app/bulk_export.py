@@ -0,0 +1,213 @@
+"""Streaming export for the bulk user endpoint.
+
+Users are read through a server-side cursor (``stream_scalars`` with
+``yield_per``) and encoded one batch at a time, so the first bytes reach the
+client as soon as the first batch is fetched and memory stays constant no
+matter how many rows match. CSV can optionally be gzip-compressed on the fly;
+Parquet output (one row group per batch) needs ``pyarrow``.
+
+The export opens its own session: the request-scoped one is closed before a
+streaming response body starts. close_when_done releases it as soon as the
+response ends, including when the client disconnects mid-stream.
+"""
+
+import csv
+import io
+import zlib
+from collections.abc import AsyncIterator
+from typing import Any
+
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from .models import User
+
+# Optional Parquet output
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+EXPORT_COLUMNS = [
+    "id",
+    "email",
+    "first_name",
+    "last_name",
+    "role",
+    "status",
+    "phone",
+    "location",
+    "bio",
+    "avatar_url",
+    "tenant_id",
+    "created_at",
+    "updated_at",
+    "last_login",
+]
+
+_TIMESTAMP_COLUMNS = {"created_at", "updated_at", "last_login"}
+
+
+def csv_row(user: User) -> list[str]:
+    """One user as a CSV row (empty strings for missing values)."""
+    return [
+        str(user.id),
+        user.email,
+        user.first_name or "",
+        user.last_name or "",
+        user.role.value,
+        user.status.value,
+        user.phone or "",
+        user.location or "",
+        user.bio or "",
+        user.avatar_url or "",
+        user.tenant_id or "",
+        user.created_at.isoformat(),
+        user.updated_at.isoformat(),
+        user.last_login.isoformat() if user.last_login else "",
+    ]
+
+
+async def user_batches(
+    session_factory: async_sessionmaker[AsyncSession], query: Select, batch_size: int
+) -> AsyncIterator[list[User]]:
+    """Yield the users selected by a query in batches from a server-side cursor.
+
+    Args:
+        session_factory: Factory for the session that owns the cursor.
+        query: ``select(User)`` with filters and ordering applied.
+        batch_size: Rows fetched per round trip.
+
+    Yields:
+        Lists of at most batch_size users.
+    """
+    async with session_factory() as session:
+        result = await session.stream_scalars(query.execution_options(yield_per=batch_size))
+        # The identity map holds objects weakly, so consumed batches are freed
+        async for batch in result.partitions():
+            yield batch
+
+
+async def close_when_done(
+    body: AsyncIterator[bytes], batches: AsyncIterator[list[User]]
+) -> AsyncIterator[bytes]:
+    """Stream an encoded export, then close it and its batches however it ends.
+
+    A client disconnect cancels the response mid-stream and leaves the body
+    unfinished; closing this stream (e.g. from a background task) closes
+    user_batches too, ending its session instead of leaving the cursor open
+    until the generators are garbage collected.
+
+    Args:
+        body: Output of csv_chunks or parquet_chunks.
+        batches: The user_batches iterator feeding body.
+    """
+    try:
+        async for chunk in body:
+            yield chunk
+    finally:
+        await body.aclose()
+        await batches.aclose()
+
+
+async def csv_chunks(
+    batches: AsyncIterator[list[User]], compress: bool = False
+) -> AsyncIterator[bytes]:
+    """Encode user batches as CSV, one chunk per batch.
+
+    Args:
+        batches: Output of user_batches.
+        compress: Emit a gzip stream instead of plain CSV.
+
+    Yields:
+        Encoded chunks, starting with the header row.
+    """
+    gzip = zlib.compressobj(wbits=31) if compress else None
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def take() -> bytes:
+        data = buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+        return gzip.compress(data) if gzip else data
+
+    writer.writerow(EXPORT_COLUMNS)
+    yield take()
+    async for batch in batches:
+        writer.writerows(csv_row(user) for user in batch)
+        chunk = take()
+        if chunk:
+            yield chunk
+    if gzip:
+        yield gzip.flush()
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file that hands out whatever was written since the last drain."""
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _parquet_schema() -> Any:
+    return pa.schema(
+        [
+            pa.field(name, pa.timestamp("us") if name in _TIMESTAMP_COLUMNS else pa.string())
+            for name in EXPORT_COLUMNS
+        ]
+    )
+
+
+async def parquet_chunks(
+    batches: AsyncIterator[list[User]], compression: str = "snappy"
+) -> AsyncIterator[bytes]:
+    """Encode user batches as a Parquet file, one row group per batch.
+
+    Args:
+        batches: Output of user_batches.
+        compression: Parquet column compression codec.
+
+    Yields:
+        Parquet bytes as each row group is written; the footer comes last.
+    """
+    sink = _ChunkSink()
+    schema = _parquet_schema()
+    writer = pq.ParquetWriter(sink, schema, compression=compression)
+    try:
+        async for batch in batches:
+            columns = {
+                "id": [str(user.id) for user in batch],
+                "role": [user.role.value for user in batch],
+                "status": [user.status.value for user in batch],
+            }
+            for name in EXPORT_COLUMNS:
+                if name not in columns:
+                    columns[name] = [getattr(user, name) for user in batch]
+            writer.write_table(pa.Table.from_pydict(columns, schema=schema))
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    finally:
+        writer.close()
+    yield sink.drain()
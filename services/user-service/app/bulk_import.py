@@ -0,0 +1,207 @@
+"""Streaming CSV import for the bulk user endpoint.
+
+The upload is parsed incrementally from Starlette's spooled temporary file,
+``chunk_size`` rows at a time, so memory stays constant regardless of file
+size. Each chunk costs one ``SELECT email ... WHERE email IN (...)`` to
+classify duplicates, one ``INSERT ... ON CONFLICT (email) DO NOTHING`` batch
+(which also absorbs rows inserted concurrently by another import) and one
+commit. Progress is recorded on an ``ImportJob`` that clients can poll.
+"""
+
+import asyncio
+import csv
+import io
+import uuid
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from itertools import islice
+from typing import IO, Any
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .models import User, UserRole, UserStatus
+
+# Row-level error messages kept per job; the rest are only counted
+MAX_JOB_ERRORS = 100
+# Finished jobs kept for polling before the oldest are forgotten
+MAX_TRACKED_JOBS = 200
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+@dataclass
+class ImportJob:
+    """Progress and outcome of one CSV import."""
+
+    id: str
+    owner: str
+    tenant_id: str | None
+    filename: str
+    status: str = "pending"
+    rows: int = 0
+    created: int = 0
+    skipped: int = 0
+    error_count: int = 0
+    errors: list[str] = field(default_factory=list)
+    started_at: datetime = field(default_factory=_utcnow)
+    finished_at: datetime | None = None
+
+    def add_error(self, message: str) -> None:
+        self.error_count += 1
+        if len(self.errors) < MAX_JOB_ERRORS:
+            self.errors.append(message)
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["started_at"] = self.started_at.isoformat()
+        data["finished_at"] = self.finished_at.isoformat() if self.finished_at else None
+        return data
+
+
+import_jobs: OrderedDict[str, ImportJob] = OrderedDict()
+
+
+def create_job(owner: str, tenant_id: str | None, filename: str) -> ImportJob:
+    """Register a new import job, forgetting the oldest finished jobs when full."""
+    job = ImportJob(id=str(uuid.uuid4()), owner=owner, tenant_id=tenant_id, filename=filename)
+    import_jobs[job.id] = job
+    while len(import_jobs) > MAX_TRACKED_JOBS:
+        oldest = next(
+            (key for key, value in import_jobs.items() if value.status in ("completed", "failed")),
+            None,
+        )
+        if oldest is None:
+            break
+        del import_jobs[oldest]
+    return job
+
+
+def _text(row: dict[str, str | None], key: str) -> str:
+    return (row.get(key) or "").strip()
+
+
+def parse_row(row: dict[str, str | None], tenant_id: str | None) -> dict[str, Any]:
+    """Convert one CSV row into User column values.
+
+    Args:
+        row: Row from csv.DictReader.
+        tenant_id: Tenant to import into (already resolved for RLS).
+
+    Returns:
+        Column values for an INSERT.
+
+    Raises:
+        ValueError: If the email is missing or role/status are not valid values.
+    """
+    email = _text(row, "email")
+    if not email:
+        raise ValueError("Missing email")
+    return {
+        "email": email,
+        "first_name": _text(row, "first_name") or None,
+        "last_name": _text(row, "last_name") or None,
+        "phone": _text(row, "phone") or None,
+        "role": UserRole(_text(row, "role") or "candidate"),
+        "status": UserStatus(_text(row, "status") or "active"),
+        "location": _text(row, "location") or None,
+        "tenant_id": tenant_id,
+    }
+
+
+def _insert_ignoring_duplicates(session: AsyncSession):
+    dialect = session.bind.dialect.name if session.bind is not None else "postgresql"
+    insert = sqlite_insert if dialect == "sqlite" else pg_insert
+    return insert(User).on_conflict_do_nothing(index_elements=[User.email])
+
+
+async def _import_chunk(
+    session: AsyncSession,
+    job: ImportJob,
+    chunk: list[tuple[int, dict[str, str | None]]],
+    is_admin: bool,
+) -> None:
+    rows: dict[str, dict[str, Any]] = {}
+    for row_num, row in chunk:
+        try:
+            # RLS: Override tenant_id from CSV with the caller's tenant unless admin
+            tenant_id = (_text(row, "tenant_id") or None) if is_admin else job.tenant_id
+            values = parse_row(row, tenant_id)
+        except ValueError as e:
+            job.add_error(f"Row {row_num}: {e}")
+            job.skipped += 1
+            continue
+        if values["email"] in rows:
+            # Duplicate within the file: the first occurrence wins
+            job.skipped += 1
+            continue
+        rows[values["email"]] = values
+
+    if rows:
+        existing = await session.execute(select(User.email).where(User.email.in_(list(rows))))
+        for email in existing.scalars():
+            del rows[email]
+            job.skipped += 1
+
+    if rows:
+        now = _utcnow()
+        batch = [
+            {"id": uuid.uuid4(), "created_at": now, "updated_at": now, **row}
+            for row in rows.values()
+        ]
+        result = await session.execute(
+            _insert_ignoring_duplicates(session).returning(User.email), batch
+        )
+        inserted = len(result.all())
+        job.created += inserted
+        # Lost a race with another import for these emails
+        job.skipped += len(batch) - inserted
+
+    await session.commit()
+    job.rows += len(chunk)
+
+
+async def run_import(
+    session: AsyncSession,
+    job: ImportJob,
+    stream: IO[bytes],
+    is_admin: bool,
+    chunk_size: int,
+) -> ImportJob:
+    """Import a CSV byte stream chunk by chunk, updating the job as it goes.
+
+    Args:
+        session: Database session used for every chunk.
+        job: Job to report progress on.
+        stream: Binary file object positioned at the start of the CSV.
+        is_admin: Whether tenant_id may be taken from the CSV.
+        chunk_size: Rows per query batch and commit.
+
+    Returns:
+        The finished job.
+    """
+    job.status = "running"
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    rows = enumerate(csv.DictReader(text), start=2)
+    try:
+        while True:
+            # File reads are blocking; parse the next chunk off the event loop
+            chunk = await asyncio.to_thread(lambda: list(islice(rows, chunk_size)))
+            if not chunk:
+                break
+            await _import_chunk(session, job, chunk, is_admin)
+        job.status = "completed"
+    except Exception as e:
+        await session.rollback()
+        job.add_error(f"Import aborted after {job.rows} rows: {e}")
+        job.status = "failed"
+    finally:
+        # Hand the stream back to its owner rather than closing it with the wrapper
+        text.detach()
+        job.finished_at = _utcnow()
+    return job
@@ -27,6 +27,16 @@ class Settings(BaseModel):
     )
     jwt_algorithm: str = "HS256"
 
+    # Local token verification: decoded claims cache and revocation feed polling
+    jwt_claims_cache_size: int = int(os.getenv("JWT_CLAIMS_CACHE_SIZE", "10000"))
+    revocation_poll_interval: float = float(os.getenv("REVOCATION_POLL_INTERVAL", "10"))
+
+    # Bulk CSV import: rows per duplicate-check query, insert batch and commit
+    bulk_import_chunk_size: int = int(os.getenv("USER_IMPORT_CHUNK_SIZE", "1000"))
+
+    # Bulk export: rows fetched per server-side cursor round trip and encoded per chunk
+    bulk_export_batch_size: int = int(os.getenv("USER_EXPORT_BATCH_SIZE", "1000"))
+
     # Testing convenience: allow insecure tokens for external black-box tests
     allow_unsafe_test_tokens: bool = (
         os.getenv("ALLOW_UNSAFE_TEST_TOKENS", "false").lower() == "true"
@@ -14,6 +14,14 @@ async def get_session() -> AsyncSession:
         yield session
 
 
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """
+    Session factory for work that outlives the request, e.g. background jobs
+    and streamed responses, which cannot use the request-scoped get_session.
+    """
+    return AsyncSessionLocal
+
+
 async def get_session_with_rls(
     user_email: str | None = None,
     user_role: str | None = None,
@@ -42,5 +50,9 @@ async def get_session_with_rls(
 
 
 async def init_db() -> None:
+    # Imported here: search imports the models, which import Base from this module
+    from .search import ensure_search_index
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(ensure_search_index)
@@ -6,13 +6,15 @@ from fastapi.middleware.cors import CORSMiddleware
 from .config import settings
 from .database import init_db
 from .routers import router
+from .utils import token_verifier
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager for the User Service.
 
-    Handles database initialization on startup and cleanup on shutdown.
+    Handles database initialization and revocation feed polling on startup
+    and cleanup on shutdown.
 
     Args:
         app: The FastAPI application instance.
@@ -22,10 +24,14 @@ async def lifespan(app: FastAPI):
         await init_db()
         # Continue startup even if DB init fails (in dev/test mode)
 
+    if token_verifier is not None:
+        token_verifier.start()
+
     yield
 
     # Shutdown
-    pass
+    if token_verifier is not None:
+        await token_verifier.stop()
 
 
 def create_app() -> FastAPI:
@@ -50,6 +56,8 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        # Browsers only let scripts read non-safelisted headers that are exposed
+        expose_headers=["X-Next-Cursor"],
     )
 
     # Include the main router
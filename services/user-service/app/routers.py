@@ -1,19 +1,39 @@
-import csv
-import io
+import asyncio
 import os
+import shutil
 
 # Import comprehensive schemas from root schemas.py
 import sys
+import tempfile
 from datetime import UTC, datetime
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Response,
+    UploadFile,
+    status,
+)
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from sqlalchemy import and_, func, or_, select
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from .database import get_session
+from sqlalchemy import and_, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from .bulk_export import (
+    PARQUET_AVAILABLE,
+    close_when_done,
+    csv_chunks,
+    parquet_chunks,
+    user_batches,
+)
+from .bulk_import import create_job, import_jobs, run_import
+from .config import settings
+from .database import get_session, get_session_factory
 from .models import (
     User,
     UserActivity,
@@ -23,6 +43,7 @@ from .models import (
     UserSession,
     UserStatus,
 )
+from .search import apply_keyset, apply_search, encode_cursor
 from .utils import JWTClaims, get_jwt_claims, require_role
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -75,6 +96,9 @@ class SimpleHealthResponse(BaseModel):
 
 router = APIRouter()
 
+# Detached bulk import tasks (referenced so they are not garbage collected)
+_import_tasks: set[asyncio.Task] = set()
+
 
 @router.get("/", response_model=RootResponse)
 async def root() -> RootResponse:
@@ -103,8 +127,10 @@ async def health() -> SimpleHealthResponse:
 
 @router.get("/api/v1/users", response_model=list[UserRead])
 async def list_users(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    cursor: str | None = Query(None, description="X-Next-Cursor of the previous page"),
     email: str | None = Query(None, description="Filter by email (partial match)"),
     role: UserRole | None = Query(None, description="Filter by role"),
     status: UserStatus | None = Query(None, description="Filter by status"),
@@ -113,7 +139,12 @@ async def list_users(
     session: AsyncSession = Depends(get_session),
     claims: JWTClaims = Depends(get_jwt_claims),
 ) -> list[UserRead]:
-    """List users with pagination and filtering. Enforces RLS by tenant_id."""
+    """List users with pagination and filtering. Enforces RLS by tenant_id.
+
+    Search results are ranked by relevance, everything else is newest first.
+    When a page is full, the X-Next-Cursor response header holds the cursor
+    for the next one; ``skip`` is still honoured when no cursor is given.
+    """
     query = select(User)
 
     filters = []
@@ -136,23 +167,32 @@ async def list_users(
         filters.append(User.role == role)
     if status:
         filters.append(User.status == status)
-    if search:
-        search_filter = or_(
-            User.email.ilike(f"%{search}%"),
-            User.first_name.ilike(f"%{search}%"),
-            User.last_name.ilike(f"%{search}%"),
-            User.location.ilike(f"%{search}%"),
-        )
-        filters.append(search_filter)
 
     if filters:
         query = query.where(and_(*filters))
 
-    query = query.offset(skip).limit(limit).order_by(User.created_at.desc())
+    rank = None
+    if search and search.strip():
+        dialect = session.bind.dialect.name if session.bind is not None else "postgresql"
+        query, rank = apply_search(query, search, dialect)
+
+    try:
+        query = apply_keyset(query, rank, cursor, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not cursor and skip:
+        query = query.offset(skip)
+
     result = await session.execute(query)
-    users = result.scalars().all()
+    rows = result.all()
 
-    return [UserRead.model_validate(user) for user in users]
+    if len(rows) == limit:
+        last = rows[-1]
+        # Ranked rows are (User, rank)
+        key = [last[0].created_at, last[0].id]
+        response.headers["X-Next-Cursor"] = encode_cursor(key if rank is None else [last[1], *key])
+
+    return [UserRead.model_validate(row[0]) for row in rows]
 
 
 @router.get("/api/v1/users/count", response_model=dict)
@@ -817,66 +857,69 @@ async def revoke_user_session(
 
 @router.post("/api/v1/users/bulk/import", response_model=dict)
 async def bulk_import_users(
+    response: Response,
     file: UploadFile = File(..., description="CSV file with user data"),
+    wait: bool = Query(True, description="Return the result instead of a job id"),
     session: AsyncSession = Depends(get_session),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory),
     claims: JWTClaims = Depends(require_role("admin", "recruiter")),
 ) -> dict:
     """Bulk import users from CSV file. RLS: Imports into claims tenant_id.
 
     CSV format: email,first_name,last_name,role,status,phone,location,tenant_id
+
+    The file is streamed in chunks (USER_IMPORT_CHUNK_SIZE rows per duplicate
+    check, insert batch and commit). With ``wait=false`` the import runs in
+    the background and 202 is returned with a ``job_id`` to poll at
+    ``/api/v1/users/bulk/import/{job_id}``.
     """
     if not file.filename.endswith(".csv"):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="File must be CSV")
 
-    content = await file.read()
-    csv_text = content.decode("utf-8")
-    csv_reader = csv.DictReader(io.StringIO(csv_text))
+    job = create_job(claims.email, claims.tenant_id, file.filename)
+    is_admin = claims.role == "admin"
+    chunk_size = settings.bulk_import_chunk_size
+
+    if wait:
+        await run_import(session, job, file.file, is_admin, chunk_size)
+        return {
+            "job_id": job.id,
+            "status": job.status,
+            "created": job.created,
+            "skipped": job.skipped,
+            "errors": job.errors,
+        }
+
+    # The upload is discarded when the request ends; keep a private copy for the job
+    spool = tempfile.TemporaryFile()
+    await asyncio.to_thread(shutil.copyfileobj, file.file, spool)
+    spool.seek(0)
+
+    async def _run_detached() -> None:
+        try:
+            async with session_factory() as job_session:
+                await run_import(job_session, job, spool, is_admin, chunk_size)
+        finally:
+            spool.close()
 
-    created = 0
-    skipped = 0
-    errors = []
+    task = asyncio.create_task(_run_detached())
+    _import_tasks.add(task)
+    task.add_done_callback(_import_tasks.discard)
 
-    for row_num, row in enumerate(csv_reader, start=2):
-        try:
-            email = row.get("email", "").strip()
-            if not email:
-                errors.append(f"Row {row_num}: Missing email")
-                skipped += 1
-                continue
-
-            # Check if user exists
-            existing = await session.execute(select(User).where(User.email == email))
-            if existing.scalar_one_or_none():
-                skipped += 1
-                continue
-
-            # RLS: Override tenant_id from CSV with claims tenant_id unless admin
-            csv_tenant_id = row.get("tenant_id", "").strip() or None
-            tenant_id = csv_tenant_id if claims.role == "admin" else claims.tenant_id
-
-            user = User(
-                email=email,
-                first_name=row.get("first_name", "").strip() or None,
-                last_name=row.get("last_name", "").strip() or None,
-                phone=row.get("phone", "").strip() or None,
-                role=UserRole(row.get("role", "candidate").strip()),
-                status=UserStatus(row.get("status", "active").strip()),
-                location=row.get("location", "").strip() or None,
-                tenant_id=tenant_id,
-            )
-            session.add(user)
-            created += 1
-        except Exception as e:
-            errors.append(f"Row {row_num}: {str(e)}")
-            skipped += 1
+    response.status_code = status.HTTP_202_ACCEPTED
+    return {"job_id": job.id, "status": job.status}
 
-    await session.commit()
 
-    return {
-        "created": created,
-        "skipped": skipped,
-        "errors": errors,
-    }
+@router.get("/api/v1/users/bulk/import/{job_id}", response_model=dict)
+async def get_bulk_import_job(
+    job_id: str,
+    claims: JWTClaims = Depends(require_role("admin", "recruiter")),
+) -> dict:
+    """Progress of a bulk import. Recruiters can only see their own imports."""
+    job = import_jobs.get(job_id)
+    if job is None or (claims.role != "admin" and job.owner != claims.email):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Import job not found")
+    return job.to_dict()
 
 
 @router.get("/api/v1/users/bulk/export")
@@ -884,10 +927,20 @@ async def bulk_export_users(
     role: UserRole | None = Query(None),
     status: UserStatus | None = Query(None),
     tenant_id: str | None = Query(None, description="Filter by tenant (admin only)"),
-    session: AsyncSession = Depends(get_session),
+    format: str = Query("csv", pattern="^(csv|parquet)$", description="csv or parquet"),
+    gzip: bool = Query(False, description="gzip the CSV (Parquet: gzip column compression)"),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory),
     claims: JWTClaims = Depends(get_jwt_claims),
 ) -> StreamingResponse:
-    """Bulk export users to CSV file. Enforces RLS by tenant_id."""
+    """Bulk export users to a CSV or Parquet file. Enforces RLS by tenant_id.
+
+    Rows are streamed from a server-side cursor as they are fetched.
+    """
+    if format == "parquet" and not PARQUET_AVAILABLE:
+        raise HTTPException(
+            status_code=503, detail="Parquet export unavailable: pyarrow is not installed"
+        )
+
     query = select(User)
 
     filters = []
@@ -909,55 +962,30 @@ async def bulk_export_users(
     if filters:
         query = query.where(and_(*filters))
 
-    result = await session.execute(query.order_by(User.created_at))
-    users = result.scalars().all()
-
-    # Generate CSV
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow(
-        [
-            "id",
-            "email",
-            "first_name",
-            "last_name",
-            "role",
-            "status",
-            "phone",
-            "location",
-            "bio",
-            "avatar_url",
-            "tenant_id",
-            "created_at",
-            "updated_at",
-            "last_login",
-        ]
+    batches = user_batches(
+        session_factory, query.order_by(User.created_at), settings.bulk_export_batch_size
     )
+    if format == "parquet":
+        body = parquet_chunks(batches, compression="gzip" if gzip else "snappy")
+        media_type, filename = "application/vnd.apache.parquet", "users_export.parquet"
+    elif gzip:
+        body = csv_chunks(batches, compress=True)
+        media_type, filename = "application/gzip", "users_export.csv.gz"
+    else:
+        body = csv_chunks(batches)
+        media_type, filename = "text/csv", "users_export.csv"
 
-    for user in users:
-        writer.writerow(
-            [
-                str(user.id),
-                user.email,
-                user.first_name or "",
-                user.last_name or "",
-                user.role.value,
-                user.status.value,
-                user.phone or "",
-                user.location or "",
-                user.bio or "",
-                user.avatar_url or "",
-                user.tenant_id or "",
-                user.created_at.isoformat(),
-                user.updated_at.isoformat(),
-                user.last_login.isoformat() if user.last_login else "",
-            ]
-        )
+    # The server abandons the body when the client disconnects; close it afterwards
+    stream = close_when_done(body, batches)
 
-    output.seek(0)
+    async def _close_stream() -> None:
+        await stream.aclose()
 
+    cleanup = BackgroundTasks()
+    cleanup.add_task(_close_stream)
     return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
-        headers={"Content-Disposition": "attachment; filename=users_export.csv"},
+        stream,
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+        background=cleanup,
     )
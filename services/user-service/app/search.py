@@ -0,0 +1,237 @@
+"""Indexed user directory search with keyset pagination.
+
+PostgreSQL matches a prefix ``tsquery`` against a ``tsvector`` of email,
+name and location, OR-ed with a substring match that a ``pg_trgm`` GIN
+index can serve; both indexes are created by migration 0003 over exactly
+the expressions below, so the planner can use them. Results are ranked
+with ``ts_rank`` (exact email matches first). SQLite (local runs) ranks
+prefix matches from an FTS5 external-content table kept in sync by triggers
+(bm25) and ORs in the same substring match as PostgreSQL, so both backends
+return the same rows; the substring scan is unindexed, which is fine for
+local data. Any other backend, or SQLite without FTS5, falls back to ILIKE.
+
+Pages are addressed with an opaque cursor encoding the sort key of the
+last row, ``(rank, created_at, id)`` when searching and ``(created_at, id)``
+otherwise, so deep pages cost the same as the first one.
+"""
+
+import base64
+import json
+import logging
+import re
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import (
+    Float,
+    Select,
+    case,
+    cast,
+    column,
+    func,
+    literal,
+    literal_column,
+    or_,
+    select,
+    table,
+    text,
+    tuple_,
+)
+from sqlalchemy.exc import OperationalError
+
+from .models import User
+
+logger = logging.getLogger(__name__)
+
+# Searchable text of a user. Migration 0003 indexes these exact expressions;
+# keep them in sync, or PostgreSQL will not pick the indexes.
+SEARCH_DOCUMENT_SQL = (
+    "lower(coalesce(email, '') || ' ' || coalesce(first_name, '') || ' ' || "
+    "coalesce(last_name, '') || ' ' || coalesce(location, ''))"
+)
+SEARCH_VECTOR_SQL = (
+    "to_tsvector('simple'::regconfig, "
+    f"regexp_replace({SEARCH_DOCUMENT_SQL}, '[^[:alnum:]]+', ' ', 'g'))"
+)
+
+# Longer inputs are truncated to this many terms
+MAX_SEARCH_TERMS = 8
+
+# Set once the SQLite FTS5 table exists (see ensure_search_index)
+sqlite_fts_ready = False
+
+_SQLITE_FTS_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS users_fts USING fts5("
+    "email, first_name, last_name, location, content='users', content_rowid='rowid')",
+    "CREATE TRIGGER IF NOT EXISTS users_fts_ai AFTER INSERT ON users BEGIN "
+    "INSERT INTO users_fts(rowid, email, first_name, last_name, location) "
+    "VALUES (new.rowid, new.email, new.first_name, new.last_name, new.location); END",
+    "CREATE TRIGGER IF NOT EXISTS users_fts_ad AFTER DELETE ON users BEGIN "
+    "INSERT INTO users_fts(users_fts, rowid, email, first_name, last_name, location) "
+    "VALUES ('delete', old.rowid, old.email, old.first_name, old.last_name, old.location); END",
+    "CREATE TRIGGER IF NOT EXISTS users_fts_au AFTER UPDATE ON users BEGIN "
+    "INSERT INTO users_fts(users_fts, rowid, email, first_name, last_name, location) "
+    "VALUES ('delete', old.rowid, old.email, old.first_name, old.last_name, old.location); "
+    "INSERT INTO users_fts(rowid, email, first_name, last_name, location) "
+    "VALUES (new.rowid, new.email, new.first_name, new.last_name, new.location); END",
+]
+
+
+def ensure_search_index(connection) -> None:
+    """Create the SQLite FTS5 index (PostgreSQL indexes come from migrations).
+
+    Args:
+        connection: Synchronous connection, e.g. from ``AsyncConnection.run_sync``.
+    """
+    global sqlite_fts_ready
+    if connection.dialect.name != "sqlite":
+        return
+    try:
+        exists = connection.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'users_fts'"
+        ).first()
+        for statement in _SQLITE_FTS_DDL:
+            connection.exec_driver_sql(statement)
+        if not exists:
+            # Index rows that predate the FTS table
+            connection.exec_driver_sql("INSERT INTO users_fts(users_fts) VALUES ('rebuild')")
+        sqlite_fts_ready = True
+    except OperationalError as e:
+        logger.warning(f"SQLite FTS5 unavailable, user search falls back to LIKE: {e}")
+
+
+def search_terms(search: str) -> list[str]:
+    """Split a search box value into lower-case alphanumeric terms."""
+    return re.findall(r"[^\W_]+", search.lower())[:MAX_SEARCH_TERMS]
+
+
+def _like_pattern(search: str) -> str:
+    escaped = search.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def apply_search(query: Select, search: str, dialect: str) -> tuple[Select, Any]:
+    """Restrict a ``select(User)`` to users matching a search string.
+
+    Args:
+        query: Query selecting User.
+        search: Raw search box value.
+        dialect: SQLAlchemy dialect name of the session's engine.
+
+    Returns:
+        The filtered query and a rank expression (higher is more relevant).
+    """
+    terms = search_terms(search)
+    exact_email = case((func.lower(User.email) == search.strip().lower(), 1.0), else_=0.0)
+
+    substring = literal_column(SEARCH_DOCUMENT_SQL).like(_like_pattern(search.strip()), escape="\\")
+
+    if dialect == "postgresql":
+        vector = literal_column(SEARCH_VECTOR_SQL)
+        matches = [substring]
+        rank = exact_email
+        if terms:
+            tsquery = func.to_tsquery(
+                literal_column("'simple'::regconfig"), " & ".join(f"{term}:*" for term in terms)
+            )
+            matches.append(vector.op("@@")(tsquery))
+            rank = rank + cast(func.ts_rank(vector, tsquery), Float)
+        return query.where(or_(*matches)), rank
+
+    if dialect == "sqlite" and sqlite_fts_ready and terms:
+        fts = table("users_fts", column("rowid"), column("rank"))
+        hits = (
+            select(fts.c.rowid, fts.c.rank)
+            .where(text("users_fts MATCH :fts_query"))
+            .params(fts_query=" ".join(f'"{term}"*' for term in terms))
+            .subquery()
+        )
+        query = query.outerjoin(hits, hits.c.rowid == literal_column("users.rowid")).where(
+            or_(hits.c.rowid.is_not(None), substring)
+        )
+        # bm25 is lower for better matches; substring-only matches rank 0
+        return query, exact_email - cast(func.coalesce(hits.c.rank, 0.0), Float)
+
+    pattern = f"%{search.strip()}%"
+    query = query.where(
+        or_(
+            User.email.ilike(pattern),
+            User.first_name.ilike(pattern),
+            User.last_name.ilike(pattern),
+            User.location.ilike(pattern),
+        )
+    )
+    return query, exact_email
+
+
+# ============================================================================
+# KEYSET PAGINATION
+# ============================================================================
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def encode_cursor(values: list[Any]) -> str:
+    """Opaque cursor for the sort key of the last row on a page."""
+    plain = [_plain(value) for value in values]
+    return base64.urlsafe_b64encode(json.dumps(plain).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, ranked: bool) -> list[Any]:
+    """Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor from a previous page.
+        ranked: Whether the cursor includes a rank (search queries).
+
+    Returns:
+        ``[rank, created_at, id]`` or ``[created_at, id]`` with native types.
+
+    Raises:
+        ValueError: If the cursor is malformed or does not match the query.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        expected = 3 if ranked else 2
+        if not isinstance(values, list) or len(values) != expected:
+            raise ValueError("cursor does not match this query")
+        key = [datetime.fromisoformat(values[-2]), UUID(values[-1])]
+        return [float(values[0]), *key] if ranked else key
+    except (TypeError, ValueError, json.JSONDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {e}") from e
+
+
+def apply_keyset(query: Select, rank: Any | None, cursor: str | None, limit: int) -> Select:
+    """Order a user query newest-first (best match first when ranked) and page it.
+
+    Args:
+        query: Filtered ``select(User)``.
+        rank: Rank expression from apply_search, or None when not searching.
+        cursor: Cursor of the previous page, if any.
+        limit: Page size.
+
+    Returns:
+        The paged query, selecting User and, when ranked, the rank as a second
+        column.
+
+    Raises:
+        ValueError: If the cursor is invalid.
+    """
+    keys = [User.created_at, User.id]
+    if rank is not None:
+        rank = rank.label("search_rank")
+        keys = [rank, *keys]
+        query = query.add_columns(rank)
+    if cursor:
+        values = decode_cursor(cursor, ranked=rank is not None)
+        bound = [literal(value, type_=key.type) for key, value in zip(keys, values, strict=True)]
+        query = query.where(tuple_(*keys) < tuple_(*bound))
+    return query.order_by(*(key.desc() for key in keys)).limit(limit)
@@ -1,3 +1,5 @@
+import os
+import sys
 from datetime import UTC, datetime
 from typing import Any
 
@@ -8,6 +10,32 @@ from pydantic import BaseModel
 
 from .config import settings
 
+# Local JWT verification shared with other services (optional)
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "shared"))
+try:
+    from token_verifier import TokenRevoked, TokenVerifier
+
+    TOKEN_VERIFIER_AVAILABLE = True
+except ImportError:
+    TokenRevoked = None
+    TokenVerifier = None
+    TOKEN_VERIFIER_AVAILABLE = False
+
+# Verifies signatures in-process and caches claims until exp; logouts arrive via
+# the Security Service revocation feed. Without it every request is checked over HTTP.
+token_verifier = (
+    TokenVerifier(
+        settings.jwt_secret_key,
+        algorithm=settings.jwt_algorithm,
+        security_service_url=settings.security_service_url,
+        cache_size=settings.jwt_claims_cache_size,
+        poll_interval=settings.revocation_poll_interval,
+        timeout=settings.security_service_timeout,
+    )
+    if TOKEN_VERIFIER_AVAILABLE
+    else None
+)
+
 
 class JWTClaims(BaseModel):
     """JWT claims extracted from verified token."""
@@ -59,28 +87,52 @@ def verify_jwt_locally(token: str) -> dict[str, Any] | None:
         )
 
 
-async def get_jwt_claims(authorization: str | None = Header(None)) -> JWTClaims:
-    """Extract and verify JWT token, return claims."""
-    if not authorization:
+def _unsafe_test_payload(token: str) -> dict[str, Any]:
+    """Claims for black-box tests: read the token without verifying it."""
+    # For testing, we can try to decode without verification to get the email
+    try:
+        unverified_payload = jwt.decode(token, options={"verify_signature": False})
+        email = unverified_payload.get("email", "test@example.com")
+        role = unverified_payload.get("role", "admin")
+        tenant_id = unverified_payload.get("tenant_id", "test-tenant")
+    except:
+        email = "test@example.com"
+        role = "admin"
+        tenant_id = "test-tenant"
+
+    return {
+        "email": email,
+        "role": role,
+        "tenant_id": tenant_id,
+        "iat": int(datetime.now(UTC).replace(tzinfo=None).timestamp()),
+    }
+
+
+def _verify_with_local_verifier(token: str) -> dict[str, Any]:
+    """Verify a token in-process against the claims cache and revocation list."""
+    try:
+        return token_verifier.verify(token)
+    except jwt.ExpiredSignatureError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Missing Authorization header",
+            detail="Token has expired",
         )
-
-    try:
-        scheme, token = authorization.split(" ", 1)
-    except ValueError:
+    except TokenRevoked:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid Authorization header",
+            detail="Token has been revoked",
         )
-
-    if scheme.lower() != "bearer" or not token:
+    except jwt.InvalidTokenError:
+        if settings.allow_unsafe_test_tokens:
+            return _unsafe_test_payload(token)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token scheme",
+            detail="Invalid or expired token",
         )
 
+
+async def _verify_with_security_service(token: str) -> dict[str, Any]:
+    """Verify a token with one Security Service round trip (no local verifier)."""
     # Try Security Service first
     verification = await verify_jwt_with_security_service(token)
 
@@ -104,29 +156,43 @@ async def get_jwt_claims(authorization: str | None = Header(None)) -> JWTClaims:
     else:
         # If explicitly allowed for black-box external tests, accept any token
         if settings.allow_unsafe_test_tokens:
-            # For testing, we can try to decode without verification to get the email
-            try:
-                unverified_payload = jwt.decode(token, options={"verify_signature": False})
-                email = unverified_payload.get("email", "test@example.com")
-                role = unverified_payload.get("role", "admin")
-                tenant_id = unverified_payload.get("tenant_id", "test-tenant")
-            except:
-                email = "test@example.com"
-                role = "admin"
-                tenant_id = "test-tenant"
-
-            payload = {
-                "email": email,
-                "role": role,
-                "tenant_id": tenant_id,
-                "iat": int(datetime.now(UTC).replace(tzinfo=None).timestamp()),
-            }
+            payload = _unsafe_test_payload(token)
         else:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid or expired token",
             )
 
+    return payload
+
+
+async def get_jwt_claims(authorization: str | None = Header(None)) -> JWTClaims:
+    """Extract and verify JWT token, return claims."""
+    if not authorization:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Missing Authorization header",
+        )
+
+    try:
+        scheme, token = authorization.split(" ", 1)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid Authorization header",
+        )
+
+    if scheme.lower() != "bearer" or not token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token scheme",
+        )
+
+    if token_verifier is not None:
+        payload = _verify_with_local_verifier(token)
+    else:
+        payload = await _verify_with_security_service(token)
+
     # Extract claims for RLS (Row-Level Security)
     claims = JWTClaims(
         email=payload.get("email", ""),
@@ -0,0 +1,57 @@
+"""add user search and keyset pagination indexes
+
+Revision ID: 0003_user_search_indexes
+Revises: 0002_add_rls_policies
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0003_user_search_indexes"
+down_revision = "0002_add_rls_policies"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """
+    Index the expressions used by app.search.
+
+    - users_search_vector_idx: GIN over the tsvector of email, name and location
+      (prefix term matches, ranking)
+    - users_search_trgm_idx: GIN trigram index over the same text (substring matches)
+    - users_created_id_idx / users_tenant_created_id_idx: keyset pagination on
+      (created_at, id), globally and within a tenant
+    """
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+
+    # Index expressions are spelled out so this revision does not change if
+    # app.search does; they must match SEARCH_DOCUMENT_SQL / SEARCH_VECTOR_SQL.
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS users_search_vector_idx ON users "
+        "USING gin ((to_tsvector('simple'::regconfig, regexp_replace("
+        "lower(coalesce(email, '') || ' ' || coalesce(first_name, '') || ' ' || "
+        "coalesce(last_name, '') || ' ' || coalesce(location, '')), "
+        "'[^[:alnum:]]+', ' ', 'g'))));"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS users_search_trgm_idx ON users "
+        "USING gin ((lower(coalesce(email, '') || ' ' || coalesce(first_name, '') || ' ' || "
+        "coalesce(last_name, '') || ' ' || coalesce(location, ''))) gin_trgm_ops);"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS users_created_id_idx ON users (created_at DESC, id DESC);"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS users_tenant_created_id_idx "
+        "ON users (tenant_id, created_at DESC, id DESC);"
+    )
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS users_tenant_created_id_idx;")
+    op.execute("DROP INDEX IF EXISTS users_created_id_idx;")
+    op.execute("DROP INDEX IF EXISTS users_search_trgm_idx;")
+    op.execute("DROP INDEX IF EXISTS users_search_vector_idx;")
+    # pg_trgm is left installed; other schemas may depend on it
@@ -23,7 +23,7 @@ TestAsyncSessionLocal = async_sessionmaker(
 @pytest.fixture
 async def client(test_db, seed_users):
     """Create a truly async test client with dependency overrides and seeded users."""
-    from app.database import get_session
+    from app.database import get_session, get_session_factory
     from app.main import app
     from app.utils import get_jwt_claims
     from httpx import ASGITransport, AsyncClient
@@ -57,6 +57,7 @@ async def client(test_db, seed_users):
             yield session
 
     app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_session_factory] = lambda: TestAsyncSessionLocal
     app.dependency_overrides[get_jwt_claims] = override_get_jwt_claims
     from app.database import get_session_with_rls
 
@@ -2,7 +2,10 @@
 Integration tests for User Service API endpoints.
 """
 
-from unittest.mock import patch
+import asyncio
+import csv
+import gzip
+import io
 from uuid import uuid4
 
 import pytest
@@ -36,16 +39,12 @@ class TestUserEndpoints:
         assert response.status_code == 401
         assert "unauthorized" in response.json()["detail"].lower()
 
-    @patch("app.utils.verify_jwt_with_security_service")
     async def test_list_users_with_auth(
         self,
-        mock_verify,
         test_client: AsyncClient,
         admin_token: str,
     ):
         """Admin can list users."""
-        mock_verify.return_value = {"valid": True, "email": "admin@example.com"}
-
         response = await test_client.get(
             "/api/v1/users", headers={"Authorization": f"Bearer {admin_token}"}
         )
@@ -54,17 +53,13 @@ class TestUserEndpoints:
         data = response.json()
         assert isinstance(data, list)
 
-    @patch("app.utils.verify_jwt_with_security_service")
     async def test_create_user(
         self,
-        mock_verify,
         test_client: AsyncClient,
         admin_token: str,
         sample_user_data: dict,
     ):
         """Admin can create users."""
-        mock_verify.return_value = {"valid": True, "email": "admin@example.com"}
-
         response = await test_client.post(
             "/api/v1/users",
             json=sample_user_data,
@@ -78,17 +73,13 @@ class TestUserEndpoints:
         assert "id" in data
         assert "created_at" in data
 
-    @patch("app.utils.verify_jwt_with_security_service")
     async def test_get_user_by_id(
         self,
-        mock_verify,
         test_client: AsyncClient,
         admin_token: str,
         sample_user_data: dict,
     ):
         """Get user by ID."""
-        mock_verify.return_value = {"valid": True, "email": "admin@example.com"}
-
         # Create user first
         create_response = await test_client.post(
             "/api/v1/users",
@@ -107,16 +98,12 @@ class TestUserEndpoints:
         assert data["id"] == user_id
         assert data["email"] == sample_user_data["email"]
 
-    @patch("app.utils.verify_jwt_with_security_service")
     async def test_get_nonexistent_user(
         self,
-        mock_verify,
         test_client: AsyncClient,
         admin_token: str,
     ):
         """Get nonexistent user returns 404."""
-        mock_verify.return_value = {"valid": True, "email": "admin@example.com"}
-
         fake_id = str(uuid4())
         response = await test_client.get(
             f"/api/v1/users/{fake_id}", headers={"Authorization": f"Bearer {admin_token}"}
@@ -124,17 +111,13 @@ class TestUserEndpoints:
 
         assert response.status_code == 404
 
-    @patch("app.utils.verify_jwt_with_security_service")
     async def test_update_user(
         self,
-        mock_verify,
         test_client: AsyncClient,
         admin_token: str,
         sample_user_data: dict,
     ):
         """Admin can update users."""
-        mock_verify.return_value = {"valid": True, "email": "admin@example.com"}
-
         # Create user first
         create_response = await test_client.post(
             "/api/v1/users",
@@ -156,17 +139,13 @@ class TestUserEndpoints:
         assert data["last_name"] == "Name"
         assert data["status"] == "inactive"
 
-    @patch("app.utils.verify_jwt_with_security_service")
     async def test_delete_user(
         self,
-        mock_verify,
         test_client: AsyncClient,
         admin_token: str,
         sample_user_data: dict,
     ):
         """Admin can delete users."""
-        mock_verify.return_value = {"valid": True, "email": "admin@example.com"}
-
         # Create user first
         create_response = await test_client.post(
             "/api/v1/users",
@@ -189,17 +168,12 @@ class TestUserEndpoints:
         assert get_response.status_code == 200
         assert get_response.json()["status"] in ["inactive", "UserStatus.INACTIVE"]
 
-    @patch("app.utils.verify_jwt_with_security_service")
     async def test_recruiter_tenant_isolation(
         self,
-        mock_verify,
         test_client: AsyncClient,
         recruiter_token: str,
     ):
         """Recruiter can only see users in their tenant."""
-        # Mock recruiter JWT claims
-        mock_verify.return_value = {"valid": True, "email": "recruiter@tenant1.com"}
-
         response = await test_client.get(
             "/api/v1/users", headers={"Authorization": f"Bearer {recruiter_token}"}
         )
@@ -217,18 +191,14 @@ class TestUserEndpoints:
 class TestUserProfileEndpoints:
     """Test user profile endpoints."""
 
-    @patch("app.utils.verify_jwt_with_security_service")
     async def test_create_user_profile(
         self,
-        mock_verify,
         test_client: AsyncClient,
         admin_token: str,
         sample_user_data: dict,
         sample_profile_data: dict,
     ):
         """Create user profile."""
-        mock_verify.return_value = {"valid": True, "email": "admin@example.com"}
-
         # Create user first
         user_response = await test_client.post(
             "/api/v1/users",
@@ -249,18 +219,14 @@ class TestUserProfileEndpoints:
         assert data["phone"] == sample_profile_data["phone"]
         assert data["location"] == sample_profile_data["location"]
 
-    @patch("app.utils.verify_jwt_with_security_service")
     async def test_get_user_profile(
         self,
-        mock_verify,
         test_client: AsyncClient,
         admin_token: str,
         sample_user_data: dict,
         sample_profile_data: dict,
     ):
         """Get user profile."""
-        mock_verify.return_value = {"valid": True, "email": "admin@example.com"}
-
         # Create user and profile
         user_response = await test_client.post(
             "/api/v1/users",
@@ -290,18 +256,14 @@ class TestUserProfileEndpoints:
 class TestUserPreferencesEndpoints:
     """Test user preferences endpoints."""
 
-    @patch("app.utils.verify_jwt_with_security_service")
     async def test_create_user_preferences(
         self,
-        mock_verify,
         test_client: AsyncClient,
         candidate_token: str,
         sample_user_data: dict,
         sample_preferences_data: dict,
     ):
         """Candidate can create their own preferences."""
-        mock_verify.return_value = {"valid": True, "email": "candidate@example.com"}
-
         # Create user first (as admin)
         admin_token = candidate_token  # Reuse for simplicity
         user_response = await test_client.post(
@@ -330,16 +292,12 @@ class TestUserPreferencesEndpoints:
 class TestSearchAndFilters:
     """Test search and filter functionality."""
 
-    @patch("app.utils.verify_jwt_with_security_service")
     async def test_search_users_by_email(
         self,
-        mock_verify,
         test_client: AsyncClient,
         admin_token: str,
     ):
         """Search users by email."""
-        mock_verify.return_value = {"valid": True, "email": "admin@example.com"}
-
         # Create test users
         await test_client.post(
             "/api/v1/users",
@@ -365,16 +323,12 @@ class TestSearchAndFilters:
         assert len(data) >= 1
         assert any("john.doe" in user["email"].lower() for user in data)
 
-    @patch("app.utils.verify_jwt_with_security_service")
     async def test_filter_users_by_role(
         self,
-        mock_verify,
         test_client: AsyncClient,
         admin_token: str,
     ):
         """Filter users by role."""
-        mock_verify.return_value = {"valid": True, "email": "admin@example.com"}
-
         response = await test_client.get(
             "/api/v1/users?role=candidate", headers={"Authorization": f"Bearer {admin_token}"}
         )
@@ -386,16 +340,12 @@ class TestSearchAndFilters:
         for user in data:
             assert user["role"] == "candidate"
 
-    @patch("app.utils.verify_jwt_with_security_service")
     async def test_pagination(
         self,
-        mock_verify,
         test_client: AsyncClient,
         admin_token: str,
     ):
         """Test pagination parameters."""
-        mock_verify.return_value = {"valid": True, "email": "admin@example.com"}
-
         response = await test_client.get(
             "/api/v1/users?skip=0&limit=5", headers={"Authorization": f"Bearer {admin_token}"}
         )
@@ -404,6 +354,240 @@ class TestSearchAndFilters:
         data = response.json()
         assert len(data) <= 5
 
+    async def test_cursor_pagination(
+        self,
+        test_client: AsyncClient,
+        admin_token: str,
+    ):
+        """Following X-Next-Cursor visits every user exactly once."""
+        headers = {"Authorization": f"Bearer {admin_token}"}
+
+        for i in range(5):
+            await test_client.post(
+                "/api/v1/users",
+                json={
+                    "email": f"page{i}@example.com",
+                    "first_name": "Page",
+                    "last_name": f"User{i}",
+                    "password": "Password123!",
+                    "role": "candidate",
+                    "status": "active",
+                    "tenant_id": "tenant1",
+                },
+                headers=headers,
+            )
+
+        seen = []
+        params = {"limit": 2}
+        while True:
+            response = await test_client.get("/api/v1/users", params=params, headers=headers)
+            assert response.status_code == 200
+            seen.extend(user["email"] for user in response.json())
+            next_cursor = response.headers.get("X-Next-Cursor")
+            if not next_cursor:
+                break
+            params = {"limit": 2, "cursor": next_cursor}
+
+        assert len(seen) == len(set(seen))
+        assert {f"page{i}@example.com" for i in range(5)} <= set(seen)
+
+    async def test_ranked_search_cursor_pagination(
+        self,
+        test_client: AsyncClient,
+        admin_token: str,
+    ):
+        """Following X-Next-Cursor through ranked search results skips and repeats nothing."""
+        headers = {"Authorization": f"Bearer {admin_token}"}
+
+        # Matches in more fields rank higher, so pages cross several rank values
+        users = [
+            ("rankpage@example.com", "Rankpage", "Rankpage", "Rankpage"),
+            ("rankpage.one@example.com", "Rankpage", "One", "Rankpage"),
+            ("rankpage.two@example.com", "Rankpage", "Two", "Berlin"),
+            ("rankpage.three@example.com", "Ada", "Three", "Berlin"),
+            ("rankpage.four@example.com", "Ada", "Four", "Berlin"),
+            ("five@example.com", "Rankpage", "Five", "Berlin"),
+            ("six@example.com", "Ada", "Six", "Rankpage"),
+        ]
+        for email, first_name, last_name, location in users:
+            response = await test_client.post(
+                "/api/v1/users",
+                json={
+                    "email": email,
+                    "first_name": first_name,
+                    "last_name": last_name,
+                    "location": location,
+                    "password": "Password123!",
+                    "role": "candidate",
+                    "status": "active",
+                    "tenant_id": "tenant1",
+                },
+                headers=headers,
+            )
+            assert response.status_code == 201
+
+        response = await test_client.get(
+            "/api/v1/users", params={"search": "rankpage", "limit": 100}, headers=headers
+        )
+        assert response.status_code == 200
+        single_page = [user["email"] for user in response.json()]
+        assert set(single_page) == {email for email, *_ in users}
+
+        seen = []
+        params = {"search": "rankpage", "limit": 2}
+        while True:
+            response = await test_client.get("/api/v1/users", params=params, headers=headers)
+            assert response.status_code == 200
+            seen.extend(user["email"] for user in response.json())
+            next_cursor = response.headers.get("X-Next-Cursor")
+            if not next_cursor:
+                break
+            params = {"search": "rankpage", "limit": 2, "cursor": next_cursor}
+
+        assert seen == single_page
+
+    async def test_invalid_cursor_rejected(
+        self,
+        test_client: AsyncClient,
+        admin_token: str,
+    ):
+        """A malformed cursor is a client error."""
+        response = await test_client.get(
+            "/api/v1/users?cursor=not-a-cursor",
+            headers={"Authorization": f"Bearer {admin_token}"},
+        )
+
+        assert response.status_code == 400
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestBulkImport:
+    """Test streaming CSV import."""
+
+    CSV = (
+        "email,first_name,last_name,role,status,phone,location,tenant_id\n"
+        "bulk1@example.com,Bulk,One,candidate,active,,Berlin,tenant1\n"
+        "bulk2@example.com,Bulk,Two,recruiter,active,,Paris,tenant1\n"
+        "bulk1@example.com,Duplicate,Row,candidate,active,,,tenant1\n"
+        "admin@example.com,Existing,User,admin,active,,,tenant1\n"
+        ",Missing,Email,candidate,active,,,tenant1\n"
+    )
+
+    async def test_bulk_import_skips_duplicates_and_bad_rows(
+        self, test_client: AsyncClient, admin_token: str
+    ):
+        """Duplicates in the file or database are skipped, invalid rows reported."""
+        response = await test_client.post(
+            "/api/v1/users/bulk/import",
+            files={"file": ("users.csv", self.CSV, "text/csv")},
+            headers={"Authorization": f"Bearer {admin_token}"},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "completed"
+        assert data["created"] == 2
+        assert data["skipped"] == 3
+        assert data["errors"] == ["Row 6: Missing email"]
+
+    async def test_bulk_import_job_can_be_polled(self, test_client: AsyncClient, admin_token: str):
+        """wait=false returns a job id whose progress can be polled."""
+        headers = {"Authorization": f"Bearer {admin_token}"}
+        response = await test_client.post(
+            "/api/v1/users/bulk/import?wait=false",
+            files={"file": ("users.csv", self.CSV, "text/csv")},
+            headers=headers,
+        )
+
+        assert response.status_code == 202
+        job_id = response.json()["job_id"]
+
+        for _ in range(50):
+            job = await test_client.get(f"/api/v1/users/bulk/import/{job_id}", headers=headers)
+            if job.json()["status"] in ("completed", "failed"):
+                break
+            await asyncio.sleep(0.1)
+
+        assert job.status_code == 200
+        assert job.json()["status"] == "completed"
+        assert job.json()["created"] == 2
+        assert job.json()["rows"] == 5
+
+    async def test_unknown_import_job(self, test_client: AsyncClient, admin_token: str):
+        """Unknown job ids return 404."""
+        response = await test_client.get(
+            f"/api/v1/users/bulk/import/{uuid4()}",
+            headers={"Authorization": f"Bearer {admin_token}"},
+        )
+
+        assert response.status_code == 404
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestBulkExport:
+    """Test streaming export."""
+
+    async def test_export_csv(self, test_client: AsyncClient, admin_token: str):
+        """CSV export has a header row and one row per user."""
+        response = await test_client.get(
+            "/api/v1/users/bulk/export", headers={"Authorization": f"Bearer {admin_token}"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        rows = list(csv.reader(io.StringIO(response.text)))
+        assert rows[0][:2] == ["id", "email"]
+        assert any(row[1] == "admin@example.com" for row in rows[1:])
+
+    async def test_export_csv_gzip(self, test_client: AsyncClient, admin_token: str):
+        """gzip=true returns the same CSV compressed."""
+        headers = {"Authorization": f"Bearer {admin_token}"}
+        plain = await test_client.get("/api/v1/users/bulk/export", headers=headers)
+        response = await test_client.get("/api/v1/users/bulk/export?gzip=true", headers=headers)
+
+        assert response.status_code == 200
+        assert "users_export.csv.gz" in response.headers["content-disposition"]
+        assert gzip.decompress(response.content).decode() == plain.text
+
+    async def test_export_closes_batches_on_disconnect(self):
+        """Closing an abandoned export stream closes its batches and their session."""
+        from datetime import datetime
+
+        from app.bulk_export import close_when_done, csv_chunks
+        from app.models import User, UserRole, UserStatus
+
+        now = datetime.now()
+        user = User(
+            id=uuid4(),
+            email="stream@example.com",
+            first_name="Stream",
+            last_name="User",
+            role=UserRole.CANDIDATE,
+            status=UserStatus.ACTIVE,
+            created_at=now,
+            updated_at=now,
+        )
+        closed = []
+
+        async def batches():
+            try:
+                while True:
+                    yield [user]
+            finally:
+                closed.append(True)
+
+        source = batches()
+        stream = close_when_done(csv_chunks(source), source)
+        await anext(stream)  # header
+        assert b"stream@example.com" in await anext(stream)
+
+        # The client went away: the response stops iterating and the background task closes
+        await stream.aclose()
+
+        assert closed == [True]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-m", "integration"])
@@ -6,6 +6,7 @@ Tests:
 - JWT local verification fallback
 - Claims extraction and validation
 - RBAC role enforcement
+- Local verifier claims cache and revocation feed
 """
 
 from datetime import UTC, datetime, timedelta
@@ -15,9 +16,11 @@ import jwt
 import pytest
 from app.config import settings
 from app.utils import (
+    TOKEN_VERIFIER_AVAILABLE,
     JWTClaims,
     get_jwt_claims,
     require_role,
+    token_verifier,
     verify_jwt_locally,
     verify_jwt_with_security_service,
 )
@@ -159,6 +162,7 @@ class TestLocalJWTVerification:
 class TestGetJWTClaims:
     """Test JWT claims extraction from Authorization header."""
 
+    @pytest.mark.skipif(not TOKEN_VERIFIER_AVAILABLE, reason="shared token verifier not importable")
     async def test_get_jwt_claims_valid_token(self):
         """Test successful claims extraction."""
         payload = {
@@ -170,11 +174,10 @@ class TestGetJWTClaims:
         }
         token = jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
 
-        with patch("app.utils.verify_jwt_with_security_service") as mock_verify:
-            mock_verify.return_value = {"valid": True, "email": "user@example.com"}
-
+        with patch("app.utils.token_verifier.verify", wraps=token_verifier.verify) as mock_verify:
             claims = await get_jwt_claims(authorization=f"Bearer {token}")
 
+            mock_verify.assert_called_once_with(token)
             assert claims.email == "user@example.com"
             assert claims.role == "recruiter"
             assert claims.tenant_id == "tenant1"
@@ -201,6 +204,7 @@ class TestGetJWTClaims:
 
         assert exc.value.status_code == 401
 
+    @pytest.mark.skipif(not TOKEN_VERIFIER_AVAILABLE, reason="shared token verifier not importable")
     async def test_get_jwt_claims_missing_email(self):
         """Test token without email claim."""
         payload = {
@@ -209,12 +213,11 @@ class TestGetJWTClaims:
         }
         token = jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
 
-        with patch("app.utils.verify_jwt_with_security_service") as mock_verify:
-            mock_verify.return_value = {"valid": True}
-
+        with patch("app.utils.token_verifier.verify", wraps=token_verifier.verify) as mock_verify:
             with pytest.raises(HTTPException) as exc:
                 await get_jwt_claims(authorization=f"Bearer {token}")
 
+            mock_verify.assert_called_once_with(token)
             assert exc.value.status_code == 401
             assert "email" in exc.value.detail.lower()
 
@@ -273,5 +276,76 @@ class TestRequireRole:
         assert exc.value.status_code == 403
 
 
+@pytest.mark.asyncio
+@pytest.mark.skipif(not TOKEN_VERIFIER_AVAILABLE, reason="shared token verifier not importable")
+class TestLocalTokenVerifier:
+    """Test in-process verification with the claims cache and revocation feed."""
+
+    def _token(self, email: str) -> str:
+        payload = {
+            "email": email,
+            "role": "recruiter",
+            "exp": datetime.now(UTC).replace(tzinfo=None) + timedelta(minutes=30),
+        }
+        return jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+
+    async def test_claims_are_cached_without_security_service_call(self):
+        """Repeated tokens are served from the cache with no RPC."""
+        token = self._token("cached@example.com")
+
+        with patch("app.utils.verify_jwt_with_security_service") as mock_verify:
+            first = await get_jwt_claims(authorization=f"Bearer {token}")
+            hits = token_verifier.stats()["hits"]
+            second = await get_jwt_claims(authorization=f"Bearer {token}")
+
+            mock_verify.assert_not_called()
+
+        assert first.email == second.email == "cached@example.com"
+        assert token_verifier.stats()["hits"] == hits + 1
+
+    async def test_revoked_token_rejected_after_feed_update(self):
+        """A token listed in the revocation feed is rejected even if cached."""
+        from token_verifier import token_id
+
+        token = self._token("revoked@example.com")
+        await get_jwt_claims(authorization=f"Bearer {token}")
+
+        token_verifier.apply_feed(
+            {"cursor": 1, "reset": False, "revoked": [{"id": token_id(token), "exp": None}]}
+        )
+
+        with pytest.raises(HTTPException) as exc:
+            await get_jwt_claims(authorization=f"Bearer {token}")
+
+        assert exc.value.status_code == 401
+        assert "revoked" in exc.value.detail.lower()
+
+    async def test_feed_reset_replaces_revocations(self):
+        """A reset snapshot drops revocations that are no longer listed."""
+        from token_verifier import token_id
+
+        token = self._token("restored@example.com")
+        token_verifier.revoke([token_id(token)])
+
+        token_verifier.apply_feed({"cursor": 0, "reset": True, "revoked": []})
+
+        claims = await get_jwt_claims(authorization=f"Bearer {token}")
+        assert claims.email == "restored@example.com"
+
+    def test_revocations_without_exp_are_eventually_pruned(self):
+        """Entries with an unknown exp are kept for a bounded time, not forever."""
+        from token_verifier import TokenVerifier
+
+        verifier = TokenVerifier(settings.jwt_secret_key, unknown_exp_retention=60)
+        with patch("token_verifier.time.time", return_value=1_000.0):
+            verifier.apply_feed({"cursor": 1, "revoked": [{"id": "a" * 64, "exp": None}]})
+        assert verifier.stats()["revocations"] == 1
+
+        with patch("token_verifier.time.time", return_value=1_061.0):
+            verifier.revoke(["b" * 64], exp=2_000.0)
+        assert "a" * 64 not in verifier._revoked
+        assert verifier.stats()["revocations"] == 1
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])